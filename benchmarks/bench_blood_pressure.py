@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark della classificazione pressoria AAP 2017 (utils/blood_pressure.py)
+- costruzione della tabella densa dal modello di regressione
+- classificazione di una coorte di misurazioni: una chiamata per misurazione
+  (come l'handler del tool) contro una sola chiamata vettoriale, verificando
+  che le classificazioni coincidano
+
+Uso: python benchmarks/bench_blood_pressure.py [--readings N] [--seed S]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from utils import blood_pressure
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readings", type=int, default=100000, help="Misurazioni nella coorte")
+    parser.add_argument("--seed", type=int, default=0, help="Seme del generatore casuale")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = blood_pressure.build_table()
+    print(f"Tabella {table.shape}: costruzione {(time.perf_counter() - start) * 1e3:.2f} ms ({table.nbytes} byte)")
+
+    rng = np.random.default_rng(args.seed)
+    is_male = rng.random(args.readings) < 0.5
+    age_years = np.round(rng.uniform(1, 18, args.readings), 1)
+    height_percentile = rng.integers(1, 100, args.readings).astype(np.float64)
+    systolic = rng.integers(80, 160, args.readings).astype(np.float64)
+    diastolic = rng.integers(40, 100, args.readings).astype(np.float64)
+
+    # Il ciclo scalare su tutta la coorte richiederebbe minuti: si misura un campione e si proietta
+    sample = min(args.readings, 5000)
+    start = time.perf_counter()
+    scalar_stages = [int(blood_pressure.classify(*values)['stage']) for values in zip(
+        is_male[:sample].tolist(), age_years[:sample].tolist(), systolic[:sample].tolist(),
+        diastolic[:sample].tolist(), height_percentile[:sample].tolist())]
+    scalar_seconds = (time.perf_counter() - start) * args.readings / sample
+    start = time.perf_counter()
+    result = blood_pressure.classify(is_male, age_years, systolic, diastolic, height_percentile)
+    vector_seconds = time.perf_counter() - start
+
+    errors = int(np.sum(np.array(scalar_stages) != result['stage'][:sample]))
+    print(f"{args.readings} misurazioni: una chiamata per misurazione {scalar_seconds * 1e3:9.1f} ms (stimato)"
+          f"   vettoriale {vector_seconds * 1e3:7.1f} ms   x{scalar_seconds / vector_seconds:6.1f}"
+          f"   differenze {errors}")
+    stages, counts = np.unique(result['stage'], return_counts=True)
+    for stage, count in zip(stages.tolist(), counts.tolist()):
+        print(f"  {blood_pressure.STAGES.records[stage]['status']:<24} {count:8d}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
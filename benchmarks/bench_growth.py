@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark del motore dei riferimenti di crescita (utils/growth.py)
+- caricamento delle tabelle: compilazione dai CSV e apertura del file binario
+  mappato in memoria (il costo pagato da ogni processo dopo il primo)
+- z-score di una coorte: ciclo scalare (bisect per bambino) contro il percorso
+  vettoriale (np.searchsorted), verificando che i risultati coincidano
+
+Uso: python benchmarks/bench_growth.py [--children N] [--seed S]
+"""
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from utils import growth, vectorized
+
+# Indicatore -> (misura: minimo, massimo; x: minimo, massimo) della coorte sintetica
+COHORT = {
+    "weight_for_age": ((2, 80), (0, 7000)),
+    "length_for_age": ((45, 190), (0, 7000)),
+    "bmi_for_age": ((11, 35), (0, 7000)),
+    "head_circumference_for_age": ((30, 55), (0, 1856)),
+    "weight_for_length": ((2, 20), (45, 110)),
+    "weight_for_height": ((6, 30), (65, 120)),
+}
+
+
+def load_times(repeat: int = 5) -> tuple[float, float]:
+    """Secondi per compilare le tabelle dai CSV e per aprire il file binario già compilato"""
+    start = time.perf_counter()
+    data = growth.compile_tables()
+    compile_seconds = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "growth_tables.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+        best = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            index, block = growth._parse(growth._map(path))
+            tables = [growth.GrowthTable(block[offset:offset + rows * 32], rows) for offset, rows in index.values()]
+            best = min(best, time.perf_counter() - start)
+            del tables, block
+    return compile_seconds, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--children", type=int, default=100000, help="Bambini nella coorte per indicatore")
+    parser.add_argument("--seed", type=int, default=0, help="Seme del generatore casuale")
+    args = parser.parse_args()
+
+    compile_seconds, map_seconds = load_times()
+    print(f"Tabelle: compilazione dai CSV {compile_seconds * 1e3:.1f} ms, "
+          f"apertura del file mappato {map_seconds * 1e3:.2f} ms ({len(growth.compile_tables()) / 1024:.0f} KiB)")
+    growth.get_tables()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"Coorte di {args.children} bambini per indicatore e riferimento")
+    failed = False
+    for indicator, ((low, high), (x_low, x_high)) in COHORT.items():
+        for reference in growth.REFERENCES:
+            is_male = rng.random(args.children) < 0.5
+            value = np.round(rng.uniform(low, high, args.children), 1)
+            x = np.round(rng.uniform(x_low, x_high, args.children), 1)
+            rows = list(zip(is_male.tolist(), value.tolist(), x.tolist()))
+
+            start = time.perf_counter()
+            scalar_results = []
+            for male, measure, position in rows:
+                if growth.covers(indicator, reference, position):
+                    scalar_results.append(growth.calculate_growth_zscore(indicator, male, measure, position, reference))
+                else:
+                    scalar_results.append(None)
+            scalar_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            vector_result = vectorized.calculate_growth_zscore(indicator, is_male, value, x, reference)
+            vector_seconds = time.perf_counter() - start
+
+            zscores = vector_result['zscore'].tolist()
+            percentiles = vector_result['percentile'].tolist()
+            errors = sum(
+                1 for expected, z, p in zip(scalar_results, zscores, percentiles)
+                if (expected is None and not math.isnan(z))
+                or (expected is not None and (expected['zscore'] != z or expected['percentile'] != p))
+            )
+            failed |= errors > 0
+            print(f"{indicator + ' (' + reference + ')':<34} scalare {scalar_seconds * 1e3:8.1f} ms"
+                  f"   vettoriale {vector_seconds * 1e3:7.1f} ms   x{scalar_seconds / vector_seconds:6.1f}"
+                  f"   differenze {errors}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark di tools/list: catalogo ricostruito ad ogni richiesta (prima)
+contro catalogo precalcolato con forma serializzata in cache (dopo)
+
+Uso: python benchmarks/bench_list_tools.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mcp.types as types
+
+import server  # noqa: F401 - registra tutti i tool
+from tools.catalog import get_catalog
+from tools.registry import get_registered_tools
+
+_WIRE_DUMP_ARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+def list_tools_before(tool_dicts: list[dict]) -> dict:
+    """Come prima: types.Tool ricostruiti dai loro dict e risposta riserializzata"""
+    tools = [types.Tool(**tool) for tool in tool_dicts]
+    result = types.ServerResult(types.ListToolsResult(tools=tools))
+    return result.model_dump(**_WIRE_DUMP_ARGS)
+
+
+def list_tools_after() -> dict:
+    """Ora: risposta e forma serializzata riutilizzate dal catalogo"""
+    return get_catalog().result.model_dump(**_WIRE_DUMP_ARGS)
+
+
+def measure(label: str, func, repeat: int) -> None:
+    func()  # riscaldamento (costruzione lazy del catalogo)
+    seconds = min(timeit.repeat(func, number=repeat, repeat=5)) / repeat
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+
+    print(f"{label:<8} latenza {seconds * 1e6:10.1f} µs   picco memoria {peak / 1024:9.1f} KiB   blocchi trattenuti {blocks}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="Chiamate per misura")
+    args = parser.parse_args()
+
+    tool_dicts = [tool.model_dump() for tool in get_registered_tools()]
+    print(f"tools/list con {len(tool_dicts)} tool, {len(get_catalog().wire_json)} byte serializzati")
+    measure("prima", lambda: list_tools_before(tool_dicts), args.repeat)
+    measure("dopo", list_tools_after, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
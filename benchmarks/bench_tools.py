@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Benchmark di tutti i tool registrati
+Per ogni tool del catalogo genera set di argomenti rappresentativi dal suo
+inputSchema (minimi, massimi, punti medi, primo/ultimo valore degli enum) e
+misura, sia per la funzione di calcolo (_calculate_*/_assess_*, senza
+referto) sia per il percorso completo di call_tool (esecutore, validazione,
+referto, serializzazione MCP):
+latenza per chiamata, picco di memoria allocata e dimensione dell'output.
+
+I risultati sono salvati in JSON e confrontabili tra commit:
+  python benchmarks/bench_tools.py --output base.json
+  python benchmarks/bench_tools.py --compare base.json --threshold 0.2
+Con --compare l'uscita è 1 se un tool peggiora oltre le soglie.
+La configurazione (cache, verbosity...) è quella dell'ambiente, come nel server
+
+Uso: python benchmarks/bench_tools.py [--tools T1,T2] [--repeat N] [--output FILE] [--compare FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mcp.types as types
+
+import server  # noqa: F401 - registra tutti i tool
+from tools.executor import get_executor
+from tools.manifest import load_all_tools
+from tools.registry import get_registered_tool, get_registered_tools
+from tools.results import ToolResult
+from utils import config
+
+from schema_args import schema_argument_sets
+
+_WIRE_DUMP_ARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+# Argomenti del tool batch (non ricavabili dal suo schema): tool eseguito e pazienti per chiamata
+BATCH_EXAMPLE = ("calculate_bsa", 100)
+# Tool il cui output dipende dallo stato del server: dimensione esclusa dal confronto
+VARIABLE_OUTPUT = {"server_stats"}
+# Durata minima di ogni campione: i set vengono ripetuti finché la misura supera la risoluzione del timer
+SAMPLE_SECONDS = 0.001
+
+
+def argument_sets(name: str) -> list[dict]:
+    """Set di argomenti rappresentativi del tool, ricavati dal suo inputSchema"""
+    if name == "batch":
+        tool, patients = BATCH_EXAMPLE
+        items = argument_sets(tool)
+        return [{"tool": tool, "items": (items * patients)[:patients]}]
+    try:
+        return schema_argument_sets(get_registered_tool(name).definition.inputSchema)
+    except ValueError as e:
+        raise ValueError(f"{name}: {e}")
+
+
+def _output_size(result) -> int:
+    """Byte dell'output: referto per la funzione di calcolo, risposta MCP serializzata per call_tool"""
+    if isinstance(result, ToolResult):
+        return len(result.text.encode("utf-8"))
+    if isinstance(result, list):
+        result = types.CallToolResult(content=result)
+    return len(json.dumps(types.ServerResult(result).model_dump(**_WIRE_DUMP_ARGS), ensure_ascii=False).encode("utf-8"))
+
+
+def _is_error(result) -> bool:
+    return isinstance(result, types.CallToolResult) and bool(result.isError)
+
+
+def _loops(seconds: float) -> int:
+    """Ripetizioni dei set per campione, dalla durata di un passaggio"""
+    return max(1, int(SAMPLE_SECONDS / seconds)) if seconds > 0 else 1
+
+
+def _summary(samples: list[float], peaks: list[int], sizes: list[int], errors: int) -> dict:
+    return {
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+        "peak_alloc_bytes": max(peaks),
+        "output_bytes": round(statistics.mean(sizes)),
+        "errors": errors
+    }
+
+
+class RawLayer:
+    """Funzione di calcolo registrata (per gli score tabellati l'handler originale), senza referto"""
+
+    def __init__(self, name: str, sets: list[dict]):
+        entry = get_registered_tool(name)
+        self.handler = getattr(entry.handler, "handler", entry.handler)
+        # I set rifiutati dall'handler (es. combinazioni di facoltativi incomplete) sono errori, non misure
+        arguments = [entry.validate(dict(args)) for args in sets]
+        self.arguments = [args for args in arguments if self._accepts(args)]
+        self.errors = len(arguments) - len(self.arguments)
+        self.calls = self.arguments * _loops(self._time(self.arguments))
+        self.samples = []
+
+    def _accepts(self, args: dict) -> bool:
+        try:
+            self.handler(dict(args))
+        except ValueError:
+            return False
+        return True
+
+    def _time(self, calls: list[dict]) -> float:
+        handler = self.handler
+        start = time.perf_counter()
+        for args in calls:
+            handler(args)
+        return time.perf_counter() - start
+
+    async def sample(self) -> None:
+        self.samples.append(self._time(self.calls) / len(self.calls))
+
+    async def profile(self) -> tuple[list[int], list[int], int]:
+        """Picco di memoria allocata e dimensione dell'output per ogni set, ed errori"""
+        peaks, sizes = [], []
+        for args in self.arguments:
+            tracemalloc.start()
+            self.handler(args)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            sizes.append(_output_size(self.handler(args)))
+        return peaks, sizes, self.errors
+
+
+class CallToolLayer:
+    """Percorso completo di call_tool: esecutore, validazione, handler e referto, serializzazione per l'output"""
+
+    def __init__(self, name: str, sets: list[dict]):
+        self.name = name
+        self.arguments = sets
+        self.calls = None
+        self.samples = []
+
+    async def _time(self, calls: list[dict]) -> float:
+        executor = get_executor()
+        start = time.perf_counter()
+        for args in calls:
+            await executor.run(self.name, dict(args))
+        return time.perf_counter() - start
+
+    async def sample(self) -> None:
+        if self.calls is None:
+            self.calls = self.arguments * _loops(await self._time(self.arguments))
+        self.samples.append(await self._time(self.calls) / len(self.calls))
+
+    async def profile(self) -> tuple[list[int], list[int], int]:
+        peaks, sizes, errors = [], [], 0
+        for args in self.arguments:
+            tracemalloc.start()
+            result = await get_executor().run(self.name, dict(args))
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            sizes.append(_output_size(result))
+            errors += _is_error(result)
+        return peaks, sizes, errors
+
+
+def _calibration_workload() -> float:
+    """Carico Python fisso (dict, stringhe, aritmetica): secondi di un'esecuzione"""
+    start = time.perf_counter()
+    data = {}
+    for index in range(2000):
+        data[f"k{index}"] = index * 1.5
+    sum(value for key, value in data.items() if key.endswith("7"))
+    return time.perf_counter() - start
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(names: list[str], repeat: int) -> dict:
+    layers = {}
+    for name in names:
+        sets = argument_sets(name)
+        # Riscaldamento: import differiti, tabelle, pool dell'esecutore
+        await get_executor().run(name, dict(sets[0]))
+        layers[name] = {"raw": RawLayer(name, sets), "call_tool": CallToolLayer(name, sets)}
+
+    # Campioni intercalati tra i tool: un rallentamento temporaneo della macchina
+    # colpisce tutti i tool allo stesso modo invece di falsare le misure di uno solo.
+    # Ad ogni passaggio si misura anche un carico fisso: il rapporto tra le calibrazioni
+    # di due esecuzioni è il rapporto di velocità della macchina, usato dal confronto
+    calibration = []
+    for _ in range(repeat):
+        calibration.append(_calibration_workload())
+        for name, tool_layers in layers.items():
+            for layer in tool_layers.values():
+                await layer.sample()
+
+    results = {}
+    for name, tool_layers in layers.items():
+        results[name] = {"argument_sets": len(tool_layers["raw"].arguments)}
+        for label, layer in tool_layers.items():
+            peaks, sizes, errors = await layer.profile()
+            results[name][label] = _summary(layer.samples, peaks, sizes, errors)
+        raw = results[name]["raw"]
+        call = results[name]["call_tool"]
+        print(f"{name:<42} calcolo {raw['median_us']:9.1f} µs"
+              f"   call_tool {call['median_us']:9.1f} µs   picco {call['peak_alloc_bytes'] / 1024:7.1f} KiB"
+              f"   output {call['output_bytes']:6d} B" + (f"   errori {call['errors']}" if call["errors"] else ""))
+    return {
+        "meta": {
+            "commit": _commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "calibration_us": round(min(calibration) * 1e6, 3),
+            "verbosity": config.OUTPUT_VERBOSITY,
+            "result_cache_size": config.RESULT_CACHE_SIZE,
+            "executor_pool": config.EXECUTOR_POOL
+        },
+        "tools": results
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float, size_threshold: float, min_delta_us: float) -> int:
+    """Stampa i peggioramenti rispetto al baseline; restituisce il loro numero"""
+    # Latenze del baseline riportate alla velocità attuale della macchina
+    speed = 1.0
+    if current["meta"].get("calibration_us") and baseline["meta"].get("calibration_us"):
+        speed = current["meta"]["calibration_us"] / baseline["meta"]["calibration_us"]
+        print(f"Velocità della macchina rispetto al baseline: x{1 / speed:.2f} (latenze del baseline scalate)")
+    regressions = 0
+    for name, layers in current["tools"].items():
+        previous = baseline["tools"].get(name)
+        if previous is None:
+            continue
+        for layer in ("raw", "call_tool"):
+            now, before = layers.get(layer), previous.get(layer)
+            if not now or not before:
+                continue
+            problems = []
+            expected = before["min_us"] * speed
+            delta = now["min_us"] - expected
+            if delta > min_delta_us and delta > expected * threshold:
+                problems.append(f"latenza {expected:.1f} -> {now['min_us']:.1f} µs")
+            if name not in VARIABLE_OUTPUT and now["output_bytes"] > before["output_bytes"] * (1 + size_threshold):
+                problems.append(f"output {before['output_bytes']} -> {now['output_bytes']} B")
+            if now["errors"] > before["errors"]:
+                problems.append(f"errori {before['errors']} -> {now['errors']}")
+            if problems:
+                regressions += 1
+                print(f"PEGGIORAMENTO {name} [{layer}]: " + ", ".join(problems))
+    print(f"Confronto con {baseline['meta'].get('commit') or 'baseline'}: {regressions} peggioramenti")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tools", help="Tool da misurare, separati da virgola (default: tutti)")
+    parser.add_argument("--repeat", type=int, default=50, help="Campioni di latenza per ogni tool (intercalati tra i tool)")
+    parser.add_argument("--output", help="File JSON in cui salvare i risultati")
+    parser.add_argument("--compare", help="File JSON di un'esecuzione precedente da confrontare")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Aumento relativo di latenza mediana considerato peggioramento")
+    parser.add_argument("--size-threshold", type=float, default=0.0,
+                        help="Aumento relativo della dimensione dell'output considerato peggioramento")
+    parser.add_argument("--min-delta-us", type=float, default=1.0,
+                        help="Aumenti di latenza sotto questa soglia assoluta (µs) sono ignorati come rumore")
+    args = parser.parse_args()
+
+    load_all_tools()
+    names = [tool.name for tool in get_registered_tools()]
+    if args.tools:
+        selected = set(args.tools.split(","))
+        unknown = selected - set(names)
+        if unknown:
+            parser.error(f"Tool sconosciuti: {', '.join(sorted(unknown))}")
+        names = [name for name in names if name in selected]
+
+    results = asyncio.run(run(names, args.repeat))
+    get_executor().shutdown()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Risultati salvati in {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        sys.exit(1 if compare(results, baseline, args.threshold, args.size_threshold, args.min_delta_us) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Confronto formule scalari (ciclo Python) e kernel vettoriali NumPy su una coorte
+Verifica anche che i risultati coincidano bit a bit, arrotondamenti compresi
+
+Uso: python benchmarks/bench_vectorized.py [--patients N] [--seed S]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from utils import medical_formulas, vectorized
+
+
+def cohort(patients: int, seed: int) -> dict:
+    """Coorte sintetica con valori a 1-2 decimali, come inseriti in reparto (molti pareggi di arrotondamento)"""
+    rng = np.random.default_rng(seed)
+    return {
+        "weight_kg": np.round(rng.uniform(0.5, 150, patients), 2),
+        "height_cm": np.round(rng.uniform(30, 200, patients), 1),
+        "age_years": np.round(rng.uniform(0, 18, patients), 1),
+        "age_months": rng.integers(0, 216, patients).astype(np.float64),
+        "creatinine_mg_dl": np.round(rng.uniform(0.1, 10, patients), 2),
+        "wbc_count": np.round(rng.uniform(0.1, 50, patients), 1),
+        "neutrophil_percent": np.round(rng.uniform(0, 100, patients)),
+        "bands_percent": np.round(rng.uniform(0, 10, patients))
+    }
+
+
+# Nome formula -> colonne della coorte usate come argomenti
+FORMULAS = {
+    "calculate_bsa_dubois": ("weight_kg", "height_cm"),
+    "calculate_bsa_mosteller": ("weight_kg", "height_cm"),
+    "calculate_holiday_segar_fluids": ("weight_kg",),
+    "calculate_schwartz_creatinine_clearance": ("creatinine_mg_dl", "height_cm", "age_years"),
+    "calculate_bmi_pediatric": ("weight_kg", "height_cm"),
+    "calculate_daily_calories_pediatric": ("weight_kg", "age_months"),
+    "calculate_normal_bp_pediatric": ("age_years",),
+    "calculate_anc": ("wbc_count", "neutrophil_percent", "bands_percent")
+}
+
+
+def mismatches(scalar_results: list, vector_result) -> int:
+    """Elementi in cui valore o tipo differiscono dal risultato scalare"""
+    if isinstance(vector_result, dict):
+        columns = {key: values.tolist() for key, values in vector_result.items()}
+        return sum(
+            1 for index, expected in enumerate(scalar_results)
+            for key, value in expected.items()
+            if columns[key][index] != value or type(columns[key][index]) is not type(value)
+        )
+    values = vector_result.tolist()
+    return sum(1 for value, expected in zip(values, scalar_results) if value != expected or type(value) is not type(expected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--patients", type=int, default=100000, help="Pazienti nella coorte")
+    parser.add_argument("--seed", type=int, default=0, help="Seme del generatore casuale")
+    args = parser.parse_args()
+
+    data = cohort(args.patients, args.seed)
+    print(f"Coorte di {args.patients} pazienti")
+    failed = False
+    for name, columns in FORMULAS.items():
+        scalar = getattr(medical_formulas, name)
+        vector = getattr(vectorized, name)
+        inputs = [data[column] for column in columns]
+        rows = list(zip(*(values.tolist() for values in inputs)))
+
+        start = time.perf_counter()
+        scalar_results = [scalar(*row) for row in rows]
+        scalar_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        vector_result = vector(*inputs)
+        vector_seconds = time.perf_counter() - start
+
+        errors = mismatches(scalar_results, vector_result)
+        failed |= errors > 0
+        print(f"{name:<42} scalare {scalar_seconds * 1e3:8.1f} ms   vettoriale {vector_seconds * 1e3:7.1f} ms"
+              f"   x{scalar_seconds / vector_seconds:6.1f}   differenze {errors}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
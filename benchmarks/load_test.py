@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Generatore di carico MCP end-to-end su stdio e HTTP
+Avvia server.py come vero sottoprocesso MCP e apre N sessioni client, come
+N agenti: con stdio ogni sessione ha il proprio processo server (come nei
+client desktop), con HTTP tutte le sessioni condividono un solo server
+(avviato qui, oppure già in esecuzione con --url).
+
+Le richieste sono un mix configurabile di tools/list e tools/call, con tool
+e argomenti ricavati dagli schemi ricevuti da tools/list:
+- carico chiuso (default): ogni client invia la richiesta successiva appena
+  riceve la risposta;
+- carico aperto (--rate R): R richieste al secondo a intervalli fissi,
+  distribuite tra le sessioni; la latenza è misurata dall'istante previsto
+  di invio, così che un server in ritardo non riduca il carico misurato.
+Ad ogni intervallo stampa throughput, latenze p50/p95/p99, errori e RSS
+totale dei processi server (Linux); il riepilogo finale può essere salvato in JSON
+
+Uso: python benchmarks/load_test.py [--transport stdio|http] [--clients N] [--rate R]
+     [--duration S] [--mix call=9,list=1] [--tools T1,T2] [--url URL] [--output FILE]
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from tools.metrics import LatencyHistogram
+
+from schema_args import schema_argument_sets
+
+SERVER = os.path.join(PROJECT_DIR, "server.py")
+# Tool esclusi dal mix predefinito: argomenti non ricavabili dallo schema o output dipendente dal carico
+DEFAULT_EXCLUDED = {"batch", "server_stats"}
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """'call=9,list=1' -> pesi delle operazioni"""
+    mix = {}
+    for part in text.split(","):
+        operation, _, weight = part.partition("=")
+        if operation.strip() not in ("call", "list"):
+            raise argparse.ArgumentTypeError(f"Operazione sconosciuta nel mix: {operation!r} (ammesse: call, list)")
+        mix[operation.strip()] = int(weight or 1)
+    return mix
+
+
+def _rss_bytes(pid: int) -> int:
+    """RSS di un processo da /proc (0 se terminato)"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _descendants(root: int) -> list[int]:
+    """Processi discendenti di root (Linux, da /proc)"""
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # Il nome del comando può contenere spazi: i campi seguono l'ultima parentesi
+                    parent = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, ValueError, IndexError):
+                continue
+            children.setdefault(parent, []).append(int(entry))
+    found, stack = [], [root]
+    while stack:
+        for child in children.get(stack.pop(), ()):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def server_rss(root: int | None, include_root: bool) -> int | None:
+    """RSS totale dei processi server: root (se incluso) e tutti i suoi discendenti; None fuori da Linux"""
+    if root is None or not os.path.isdir("/proc"):
+        return None
+    pids = _descendants(root) + ([root] if include_root else [])
+    return sum(_rss_bytes(pid) for pid in pids)
+
+
+class Stats:
+    """Latenze, errori e contatori per intervallo e complessivi"""
+
+    def __init__(self):
+        self.total = LatencyHistogram()
+        self.interval = LatencyHistogram()
+        self.errors = 0
+        self.interval_errors = 0
+        self.by_operation: dict[str, int] = {}
+        self.timeline = []
+
+    def record(self, operation: str, seconds: float, error: bool) -> None:
+        self.total.record(seconds)
+        self.interval.record(seconds)
+        self.by_operation[operation] = self.by_operation.get(operation, 0) + 1
+        if error:
+            self.errors += 1
+            self.interval_errors += 1
+
+    def flush(self, elapsed: float, period: float, rss: int | None) -> dict:
+        """Chiude l'intervallo corrente: riga della serie temporale"""
+        point = {
+            "t": round(elapsed, 1),
+            "requests": self.interval.count,
+            "throughput": round(self.interval.count / period, 1),
+            "p50_ms": _ms(self.interval.percentile(50)),
+            "p95_ms": _ms(self.interval.percentile(95)),
+            "p99_ms": _ms(self.interval.percentile(99)),
+            "errors": self.interval_errors,
+            "rss_mb": round(rss / 2**20, 1) if rss is not None else None
+        }
+        self.timeline.append(point)
+        self.interval = LatencyHistogram()
+        self.interval_errors = 0
+        return point
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+class Workload:
+    """Mix di operazioni e argomenti dei tool, ricavati dal catalogo ricevuto"""
+
+    def __init__(self, tools, mix: dict[str, int], selected: set[str] | None, verbosity: str | None, seed: int):
+        self.random = random.Random(seed)
+        self.operations = list(mix)
+        self.weights = [mix[operation] for operation in self.operations]
+        self.calls = []
+        for tool in tools:
+            if (selected is None and tool.name in DEFAULT_EXCLUDED) or (selected is not None and tool.name not in selected):
+                continue
+            try:
+                sets = schema_argument_sets(tool.inputSchema, skip=("verbosity",))
+            except ValueError:
+                continue
+            accepts_verbosity = "verbosity" in tool.inputSchema.get("properties", {})
+            for args in sets:
+                if verbosity and accepts_verbosity:
+                    args["verbosity"] = verbosity
+                self.calls.append((tool.name, args))
+        if "call" in mix and not self.calls:
+            raise ValueError("Nessun tool utilizzabile per tools/call")
+
+    def next(self) -> tuple[str, str | None, dict | None]:
+        operation = self.random.choices(self.operations, self.weights)[0]
+        if operation == "list":
+            return operation, None, None
+        name, args = self.random.choice(self.calls)
+        return operation, name, args
+
+
+async def execute(session: ClientSession, workload: Workload, stats: Stats, timeout: float,
+                  started: float | None = None) -> None:
+    """Una richiesta; started = istante previsto di invio (carico aperto)"""
+    operation, name, args = workload.next()
+    start = time.perf_counter() if started is None else started
+    error = False
+    try:
+        # Una richiesta rifiutata dal server (es. oltre HTTP_MAX_CONCURRENCY) può restare senza risposta
+        if operation == "list":
+            await asyncio.wait_for(session.list_tools(), timeout)
+        else:
+            result = await asyncio.wait_for(session.call_tool(name, args), timeout)
+            error = bool(result.isError)
+    except Exception:
+        error = True
+    stats.record(operation, time.perf_counter() - start, error)
+
+
+@contextlib.asynccontextmanager
+async def open_session(url: str | None):
+    """Sessione MCP inizializzata: un processo server per sessione (stdio) o una connessione al server HTTP"""
+    if url is None:
+        params = StdioServerParameters(command=sys.executable, args=[SERVER], cwd=PROJECT_DIR, env=dict(os.environ))
+        async with stdio_client(params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+    else:
+        from mcp.client import streamable_http
+        client = getattr(streamable_http, "streamable_http_client", None) or streamable_http.streamablehttp_client
+        async with client(url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+async def hold_session(url: str | None, clients: int, sessions: list, ready: asyncio.Event,
+                       release: asyncio.Event) -> None:
+    """Apre una sessione e la tiene aperta fino a release (i client MCP vanno chiusi nel task che li ha aperti)"""
+    async with open_session(url) as session:
+        sessions.append(session)
+        if len(sessions) == clients:
+            ready.set()
+        await release.wait()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_http_server(workers: int, stateless: bool) -> tuple[subprocess.Popen, str]:
+    """Avvia server.py con il trasporto HTTP su una porta libera e attende che accetti connessioni"""
+    port = _free_port()
+    command = [sys.executable, SERVER, "--transport", "http", "--port", str(port), "--workers", str(workers)]
+    if stateless:
+        command.append("--stateless")
+    process = subprocess.Popen(command, cwd=PROJECT_DIR)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Il server HTTP è terminato all'avvio (codice {process.returncode})")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process, f"http://127.0.0.1:{port}/mcp"
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("Il server HTTP non ha aperto la porta entro 30 s")
+
+
+async def monitor(stats: Stats, started: float, period: float, rss_root: int | None, include_root: bool) -> None:
+    print(f"{'t (s)':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errori':>7} {'RSS MB':>8}")
+    while True:
+        await asyncio.sleep(period)
+        point = stats.flush(time.perf_counter() - started, period, server_rss(rss_root, include_root))
+        print(f"{point['t']:6.1f} {point['throughput']:8.1f} {point['p50_ms'] or 0:8.2f} {point['p95_ms'] or 0:8.2f}"
+              f" {point['p99_ms'] or 0:8.2f} {point['errors']:7d} {point['rss_mb'] or 0:8.1f}")
+
+
+async def run(args) -> dict:
+    process = None
+    url = args.url
+    if args.transport == "http" and url is None:
+        process, url = start_http_server(args.workers, args.stateless)
+    # RSS: processi figli di questo processo (stdio) o il server HTTP avviato con i suoi worker
+    rss_root, include_root = (process.pid, True) if process is not None else (os.getpid(), False)
+    if args.transport == "http" and process is None:
+        rss_root = None
+    stats = Stats()
+    sessions = []
+    ready, release = asyncio.Event(), asyncio.Event()
+    holders = []
+    try:
+        connect_started = time.perf_counter()
+        holders = [asyncio.create_task(hold_session(url if args.transport == "http" else None, args.clients,
+                                                    sessions, ready, release))
+                   for _ in range(args.clients)]
+        waiting = asyncio.create_task(ready.wait())
+        await asyncio.wait([waiting, *holders], return_when=asyncio.FIRST_COMPLETED)
+        if not ready.is_set():
+            # Una sessione non si è aperta: propaga il suo errore
+            waiting.cancel()
+            for holder in holders:
+                if holder.done():
+                    holder.result()
+        connect_seconds = time.perf_counter() - connect_started
+        catalog = await sessions[0].list_tools()
+        workload = Workload(catalog.tools, args.mix, set(args.tools.split(",")) if args.tools else None,
+                            args.verbosity, args.seed)
+        print(f"{args.clients} sessioni {args.transport} aperte in {connect_seconds:.2f} s, "
+              f"{len(workload.calls)} chiamate nel mix, carico {'aperto a %g req/s' % args.rate if args.rate else 'chiuso'}")
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        reporter = asyncio.create_task(monitor(stats, started, args.interval, rss_root, include_root))
+        if args.rate:
+            pending = set()
+            for index in range(int(args.duration * args.rate)):
+                scheduled = started + index / args.rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                task = asyncio.create_task(execute(sessions[index % len(sessions)], workload, stats, args.timeout, scheduled))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+        else:
+            async def client(session):
+                while time.perf_counter() < deadline:
+                    await execute(session, workload, stats, args.timeout)
+            await asyncio.gather(*(client(session) for session in sessions))
+        elapsed = time.perf_counter() - started
+        reporter.cancel()
+        rss = server_rss(rss_root, include_root)
+    finally:
+        release.set()
+        await asyncio.gather(*holders, return_exceptions=True)
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    total = stats.total
+    summary = {
+        "transport": args.transport,
+        "clients": args.clients,
+        "rate": args.rate,
+        "duration_seconds": round(elapsed, 2),
+        "connect_seconds": round(connect_seconds, 2),
+        "requests": total.count,
+        "by_operation": stats.by_operation,
+        "throughput": round(total.count / elapsed, 1),
+        "errors": stats.errors,
+        "p50_ms": _ms(total.percentile(50)),
+        "p95_ms": _ms(total.percentile(95)),
+        "p99_ms": _ms(total.percentile(99)),
+        "max_ms": _ms(total.maximum if total.count else None),
+        "server_rss_mb": round(rss / 2**20, 1) if rss is not None else None,
+        "timeline": stats.timeline
+    }
+    print(f"Totale: {summary['requests']} richieste in {summary['duration_seconds']} s = {summary['throughput']} req/s, "
+          f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, p99 {summary['p99_ms']} ms, "
+          f"errori {summary['errors']}, RSS server {summary['server_rss_mb']} MB")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transport", choices=("stdio", "http"), default="stdio")
+    parser.add_argument("--clients", type=int, default=4, help="Sessioni MCP concorrenti (agenti)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Richieste al secondo (carico aperto); 0 = carico chiuso")
+    parser.add_argument("--duration", type=float, default=10.0, help="Durata della misura in secondi")
+    parser.add_argument("--interval", type=float, default=1.0, help="Secondi tra le righe della serie temporale")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Secondi oltre i quali una richiesta è contata come errore")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("call=9,list=1"), help="Pesi di tools/call e tools/list")
+    parser.add_argument("--tools", help="Tool usati per tools/call, separati da virgola (default: tutti tranne batch e server_stats)")
+    parser.add_argument("--verbosity", choices=("minimal", "standard", "full"), help="Verbosity passata ai tool (default del server)")
+    parser.add_argument("--url", help="Server HTTP già in esecuzione (es. http://127.0.0.1:8000/mcp); RSS non misurato")
+    parser.add_argument("--workers", type=int, default=1, help="Worker del server HTTP avviato")
+    parser.add_argument("--stateless", action="store_true", help="Server HTTP avviato senza sessioni")
+    parser.add_argument("--seed", type=int, default=0, help="Seme per la scelta delle richieste")
+    parser.add_argument("--output", help="File JSON in cui salvare riepilogo e serie temporale")
+    args = parser.parse_args()
+    if args.url and args.transport != "http":
+        parser.error("--url richiede --transport http")
+    if args.clients < 1:
+        parser.error("Serve almeno un client")
+
+    summary = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"Risultati salvati in {args.output}")
+    sys.exit(1 if summary["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
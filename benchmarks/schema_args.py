@@ -0,0 +1,73 @@
+"""
+Argomenti rappresentativi ricavati dall'inputSchema di un tool
+Per ogni tool tre set: minimo (solo i campi obbligatori, ai loro minimi),
+punto medio e massimo (tutti i campi); per gli enum il primo, il valore
+centrale e l'ultimo. Usato dal benchmark dei tool e dal generatore di carico,
+che lavora sugli schemi ricevuti da tools/list
+"""
+
+
+def _value(spec: dict, mode: str):
+    """Valore di un campo per il set min/max/mid (None = campo non generabile)"""
+    kind = spec.get("type")
+    if "enum" in spec:
+        values = spec["enum"]
+        return {"min": values[0], "max": values[-1]}.get(mode, values[len(values) // 2])
+    if kind == "boolean":
+        return mode != "min"
+    if kind in ("integer", "number"):
+        lower = spec.get("minimum", 0)
+        upper = spec.get("maximum", lower + 100)
+        value = {"min": lower, "max": upper}.get(mode, (lower + upper) / 2)
+        return int(value) if kind == "integer" else value
+    if kind == "array" and "enum" in spec.get("items", {}):
+        values = spec["items"]["enum"]
+        return {"min": [], "max": list(values)}.get(mode, values[:len(values) // 2])
+    if kind == "array" and spec.get("items", {}).get("type") == "object":
+        # Liste di oggetti (es. visite): un elemento nel set minimo, due negli altri
+        item = _arguments(spec["items"], mode, ())
+        return [item] if mode == "min" else [item, dict(item)]
+    return None
+
+
+def _arguments(schema: dict, mode: str, skip: tuple[str, ...]) -> dict:
+    """Argomenti del set min/mid/max per uno schema di tipo object"""
+    required = set(schema.get("required", ()))
+    args = {}
+    for field, spec in schema.get("properties", {}).items():
+        if field in skip:
+            continue
+        value = _value(spec, mode)
+        if value is not None:
+            args[field] = value
+        elif field in required:
+            raise ValueError(f"Campo obbligatorio non generabile dallo schema: {field}")
+    # I facoltativi sono omessi nel set minimo, così da coprire anche i default dell'handler
+    if mode == "min":
+        args = {field: value for field, value in args.items() if field in required}
+    # Gruppi di alternative (allOf/anyOf): se nessuna è presente si aggiungono i campi della prima
+    for group in schema.get("allOf", ()):
+        alternatives = [alternative.get("required", ()) for alternative in group.get("anyOf", ())]
+        if alternatives and not any(all(field in args for field in fields) for fields in alternatives):
+            for field in alternatives[0]:
+                value = _value(schema["properties"][field], mode)
+                if value is None:
+                    raise ValueError(f"Campo alternativo non generabile dallo schema: {field}")
+                args[field] = value
+    return args
+
+
+def schema_argument_sets(schema: dict, skip: tuple[str, ...] = ()) -> list[dict]:
+    """
+    Set di argomenti distinti per lo schema (ValueError se un campo obbligatorio non è generabile)
+
+    Args:
+        schema: inputSchema del tool
+        skip: Campi da non generare (es. verbosity, lasciata al default del server)
+    """
+    sets = []
+    for mode in ("min", "mid", "max"):
+        args = _arguments(schema, mode, skip)
+        if args not in sets:
+            sets.append(args)
+    return sets
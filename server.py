@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
+import time
+
+# Inizio dell'avvio, per --import-profile
+_STARTED = time.perf_counter()
+
+import argparse
 import asyncio
+import contextlib
+import logging
 import sys
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 import mcp.types as types
 
-# Import dei moduli tools
-from tools.scores import get_score_tools, handle_score_tools
-from tools.calculations import get_calculation_tools, handle_calculation_tools
-from tools.assessments import get_assessment_tools, handle_assessment_tools
+_MCP_IMPORTED = time.perf_counter()
+
+from tools.audit import close_audit_log
+from tools.executor import get_executor
+from tools.catalog import get_catalog, install_catalog
+from tools.manifest import load_all_tools, load_tools
+from tools.metrics import prometheus_text
+from tools.references import REFERENCE_TEMPLATE, get_reference_resources, read_reference
+from tools.registry import add_load_hook, import_times, set_import_profile
+from tools.score_tables import install_score_tables
+from utils import config
+
+# Score a input discreti serviti da tabelle precalcolate, costruite all'import del modulo degli score
+add_load_hook(install_score_tables)
+
+# Ogni handler si registra all'import del suo modulo: con il manifest del catalogo
+# i moduli vengono importati alla prima chiamata di uno dei loro tool
+TOOLS_SOURCE = load_tools(lazy=bool(config.LAZY_TOOL_IMPORT))
+_TOOLS_LOADED = time.perf_counter()
 
 # Fix per Windows
 if sys.platform == "win32":
@@ -18,56 +41,174 @@ app = Server("NOME_SERVER")
 
 @app.list_tools()
 async def list_tools() -> list[types.Tool]:
-    """Combina tutti i tool dai moduli"""
-    tools = []
-    tools.extend(get_score_tools())        # PEWS, PAS, etc
-    tools.extend(get_calculation_tools())  # BSA, fluidi
-    tools.extend(get_assessment_tools())   # Altri assessment
-    return tools
-
-@app.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-    """Routing delle chiamate ai moduli appropriati"""
-    
-    # Score medici
-    if name in ['calculate_pews', 'calculate_pas', 'calculate_apgar', 'calculate_gcs_pediatric', 'calculate_mchat',
-               'calculate_pediatric_trauma_score', 'calculate_catch_score', 'calculate_westley_croup_score',
-               'calculate_centor_score_pediatric', 'calculate_wells_score_pediatric',
-               'calculate_pas_asthma', 'calculate_pass_asthma', 'calculate_bacterial_meningitis_score',
-               'calculate_kocher_criteria', 'calculate_kawasaki_criteria', 'calculate_jones_criteria',
-               'calculate_bops', 'calculate_lansky_score', 'calculate_sickle_cell_complication_risk',
-               'calculate_pnhs']:
-        return handle_score_tools(name, arguments)
-    
-    # Calcoli medici
-    elif name in ['calculate_bsa', 'calculate_maintenance_fluids', 'calculate_creatinine_clearance', 
-                 'calculate_bmi_pediatric', 'calculate_daily_calories', 'calculate_normal_blood_pressure',
-                 'calculate_predicted_height', 'calculate_burned_surface_area', 'calculate_anc',
-                 'calculate_pnfs', 'calculate_pediatric_bone_health']:
-        return handle_calculation_tools(name, arguments)
-    
-    # Assessment clinici
-    elif name in ['assess_dehydration', 'assess_pain_scale', 'assess_nutritional_status', 
-                 'assess_developmental_milestones', 'assess_asthma_control',
-                 'assess_heads_ed', 'assess_pediatric_sleep',
-                 'assess_rome4_abdominal_migraine', 'assess_rome4_aerophagia', 'assess_rome4_constipation',
-                 'assess_rome4_cyclic_vomiting', 'assess_rome4_functional_abdominal_pain',
-                 'assess_rome4_functional_dyspepsia', 'assess_rome4_functional_nausea_vomiting',
-                 'assess_rome4_ibs', 'assess_rome4_nonretentive_fecal_incontinence',
-                 'assess_rome4_rumination_syndrome', 'assess_brue_criteria']:
-        return handle_assessment_tools(name, arguments)
-    
-    else:
-        raise ValueError(f"Strumento sconosciuto: {name}")
+    """Catalogo di tutti i tool registrati"""
+    return list(get_catalog().tools)
+
+# tools/list servito dalla risposta precalcolata del catalogo
+install_catalog(app)
+
+@app.list_resources()
+async def list_resources() -> list[types.Resource]:
+    """Materiale di riferimento statico dei tool (pediatric://reference/{tool})"""
+    return list(get_reference_resources())
+
+@app.list_resource_templates()
+async def list_resource_templates() -> list[types.ResourceTemplate]:
+    return [REFERENCE_TEMPLATE]
+
+@app.read_resource()
+async def read_resource(uri) -> str:
+    """Testo del materiale di riferimento di un tool"""
+    return read_reference(str(uri))
+
+# La validazione degli argomenti è fatta dai validatori compilati del registro
+@app.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict) -> list[types.TextContent] | types.CallToolResult:
+    """Routing tramite registro; i tool costosi sono eseguiti nel pool di worker"""
+    return await get_executor().run(name, arguments)
 
 async def main():
-    """Main entry point per il server"""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream, 
-            write_stream,
-            app.create_initialization_options()
-        )
+    """Main entry point per il server (stdio: un processo per client)"""
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream, 
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        get_executor().shutdown()
+        # Le chiamate ancora in coda nel registro di audit vengono scritte prima di uscire
+        close_audit_log()
+
+class _MCPEndpoint:
+    """Endpoint ASGI /mcp: ogni richiesta è instradata al gestore delle sessioni"""
+
+    def __init__(self, session_manager):
+        self.session_manager = session_manager
+
+    async def __call__(self, scope, receive, send):
+        await self.session_manager.handle_request(scope, receive, send)
+
+async def _metrics_endpoint(_request):
+    """Metriche per tool del processo nel formato testuale di Prometheus"""
+    from starlette.responses import PlainTextResponse
+
+    gauges = {"executor_in_flight": get_executor().stats()["in_flight"]}
+    return PlainTextResponse(prometheus_text(gauges), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def create_http_app(stateless: bool = False, metrics: bool = False):
+    """
+    Applicazione ASGI con il trasporto MCP streamable HTTP su /mcp
+
+    Tutte le sessioni condividono lo stesso processo, gli stessi tool registrati,
+    le tabelle precalcolate e la cache. Con stateless=True ogni richiesta è
+    indipendente (nessun ID di sessione), come serve a più worker dietro la stessa porta.
+    Con metrics=True le metriche per tool sono esposte anche su /metrics (Prometheus).
+    """
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+
+    session_manager = StreamableHTTPSessionManager(app=app, stateless=stateless)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_starlette):
+        async with session_manager.run():
+            try:
+                yield
+            finally:
+                get_executor().shutdown()
+                close_audit_log()
+
+    routes = [Route("/mcp", endpoint=_MCPEndpoint(session_manager))]
+    if metrics:
+        routes.append(Route("/metrics", endpoint=_metrics_endpoint, methods=["GET"]))
+    return Starlette(routes=routes, lifespan=lifespan)
+
+async def main_http(host: str, port: int, max_concurrency: int, keep_alive: float,
+                    stateless: bool = False, sockets=None, metrics: bool = False):
+    """Server HTTP: molte sessioni MCP concorrenti da un solo processo"""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(
+        create_http_app(stateless, metrics),
+        host=host,
+        port=port,
+        # Oltre il limite di connessioni/richieste concorrenti uvicorn risponde 503
+        limit_concurrency=max_concurrency if max_concurrency > 0 else None,
+        timeout_keep_alive=keep_alive,
+        log_level=config.LOG_LEVEL,
+        # Una riga di log per richiesta solo in debug: sul percorso caldo costerebbe più della chiamata
+        access_log=config.LOG_LEVEL == "debug",
+    ))
+    await server.serve(sockets=sockets)
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Server MCP per calcoli medici pediatrici")
+    parser.add_argument("--transport", choices=("stdio", "http"), default=config.MCP_TRANSPORT,
+                        help="stdio (un processo per client) oppure http (streamable HTTP, sessioni concorrenti)")
+    parser.add_argument("--host", default=config.HTTP_HOST, help="Indirizzo di ascolto HTTP")
+    parser.add_argument("--port", type=int, default=config.HTTP_PORT, help="Porta HTTP")
+    parser.add_argument("--max-concurrency", type=int, default=config.HTTP_MAX_CONCURRENCY,
+                        help="Connessioni/richieste HTTP concorrenti (0 = nessun limite)")
+    parser.add_argument("--keep-alive", type=float, default=config.HTTP_KEEP_ALIVE,
+                        help="Secondi di keep-alive delle connessioni HTTP inattive")
+    parser.add_argument("--stateless", action="store_true", help="HTTP senza sessioni (ogni richiesta indipendente)")
+    parser.add_argument("--workers", type=int, default=config.HTTP_WORKERS,
+                        help="Processi worker HTTP pre-fork che condividono tool e tabelle già caricati (>1 implica --stateless)")
+    parser.add_argument("--metrics", action=argparse.BooleanOptionalAction, default=bool(config.HTTP_METRICS),
+                        help="Espone le metriche per tool su /metrics (formato Prometheus, solo trasporto HTTP)")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="Stampa su stderr i tempi di avvio e di import di ogni modulo dei tool")
+    return parser.parse_args(argv)
+
+def print_import_profile() -> None:
+    """Tempi delle fasi di avvio; i moduli differiti sono riportati quando vengono importati"""
+    print(f"import mcp: {(_MCP_IMPORTED - _STARTED) * 1000:.1f} ms", file=sys.stderr)
+    for module, seconds in import_times().items():
+        print(f"import {module}: {seconds * 1000:.1f} ms", file=sys.stderr)
+    print(f"tool registrati ({TOOLS_SOURCE}): {(_TOOLS_LOADED - _MCP_IMPORTED) * 1000:.1f} ms", file=sys.stderr)
+    print(f"avvio server.py: {(time.perf_counter() - _STARTED) * 1000:.1f} ms", file=sys.stderr)
+    set_import_profile(True)
+
+def serve_http_workers(args: argparse.Namespace) -> None:
+    """
+    Trasporto HTTP su più processi: socket e dati caricati una volta nel padre, poi fork dei worker
+
+    Le sessioni MCP vivono nella memoria di un singolo processo e il kernel non
+    garantisce che le richieste successive arrivino allo stesso worker: con più
+    worker il trasporto è quindi sempre stateless.
+    """
+    import uvicorn  # noqa: F401 - importati prima del fork, così da essere condivisi
+    import mcp.server.streamable_http_manager  # noqa: F401
+    import starlette.applications  # noqa: F401
+    from utils.prefork import bind_socket, run_prefork
+
+    sock = bind_socket(args.host, args.port)
+    # Moduli dei tool, catalogo e risorse caricati prima del fork, così da essere condivisi
+    load_all_tools()
+    get_catalog()
+    get_reference_resources()
+    print(f"Server HTTP su {args.host}:{args.port} con {args.workers} worker (stateless)", file=sys.stderr)
+    run_prefork(args.workers, lambda: asyncio.run(
+        main_http(args.host, args.port, args.max_concurrency, args.keep_alive,
+                  stateless=True, sockets=[sock], metrics=args.metrics)
+    ))
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    logging.basicConfig(level=config.LOG_LEVEL.upper(), stream=sys.stderr,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # L'SDK MCP registra ogni richiesta a livello INFO: come l'access log, solo in debug
+    if config.LOG_LEVEL != "debug":
+        logging.getLogger("mcp").setLevel(max(logging.WARNING, logging.getLogger().level))
+    if args.import_profile:
+        print_import_profile()
+    if args.transport == "http" and args.workers > 1:
+        serve_http_workers(args)
+    elif args.transport == "http":
+        asyncio.run(main_http(args.host, args.port, args.max_concurrency, args.keep_alive,
+                              args.stateless, metrics=args.metrics))
+    else:
+        asyncio.run(main())
\ No newline at end of file
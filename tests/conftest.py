@@ -0,0 +1,35 @@
+"""
+Configurazione comune dei test
+I test girano sul registro del server: import di server.py (hook delle tabelle
+degli score) e di tutti i moduli dei tool, come all'avvio senza manifest
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server  # noqa: E402,F401 - registra l'hook delle tabelle degli score
+from tools.manifest import load_all_tools  # noqa: E402
+from tools.registry import get_registered_tool  # noqa: E402
+
+load_all_tools()
+
+
+def _canonical(data) -> str:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+@pytest.fixture
+def batch_mismatches():
+    """Indici degli elementi per cui il kernel batch del tool non coincide con i dati dell'handler"""
+    def check(name: str, items: list[dict]) -> list[int]:
+        entry = get_registered_tool(name)
+        items = [entry.validate(dict(args)) for args in items]
+        results = entry.batch(items)
+        assert len(results) == len(items)
+        return [index for index, (args, result) in enumerate(zip(items, results))
+                if _canonical(result) != _canonical(entry.handler(dict(args)).data)]
+    return check
@@ -0,0 +1,93 @@
+"""Registro di audit: ogni chiamata accodata è scritta, a blocchi, con rotazione e limite della coda"""
+import asyncio
+import glob
+import json
+
+import mcp.types as types
+import pytest
+
+from tools import audit
+from tools.audit import AuditLog
+from tools.executor import ToolExecutor
+from tools.registry import call_registered_tool
+from utils import config
+
+
+def _lines(pattern: str) -> list[dict]:
+    lines = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            lines.extend(json.loads(line) for line in f)
+    return lines
+
+
+def _result(weight_kg: int):
+    return call_registered_tool("calculate_bsa", {"weight_kg": weight_kg, "height_cm": 110, "verbosity": "minimal"})
+
+
+def test_every_call_is_written_in_order(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLog(path, batch_size=10, flush_interval=0.05, max_bytes=0, backups=0, queue_limit=1000)
+    for weight in range(1, 26):
+        log.record("calculate_bsa", {"weight_kg": weight, "height_cm": 110}, 0.001, False, _result(weight))
+    log.close()
+    lines = _lines(path)
+    assert [line["args"]["weight_kg"] for line in lines] == list(range(1, 26))
+    assert set(lines[0]) == {"ts", "tool", "args", "ms", "error", "result"}
+    assert lines[0]["result"]["data"] == _result(1).structuredContent
+    assert log.stats()["written"] == 25 and log.stats()["batches"] >= 3
+
+
+def test_large_results_and_text_only_results_are_summarized(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLog(path, batch_size=10, flush_interval=0.05, max_bytes=0, backups=0, queue_limit=1000)
+    items = [{"weight_kg": weight, "height_cm": 110} for weight in range(1, 60)]
+    log.record("batch", {}, 0.01, False, call_registered_tool("batch", {"tool": "calculate_bsa", "items": items}))
+    log.record("server_stats", {}, 0.0, False, [types.TextContent(type="text", text="Prima riga\nSeconda riga")])
+    log.close()
+    large, text = _lines(path)
+    assert large["result"]["data_bytes"] > audit.SUMMARY_MAX_BYTES
+    assert text["result"] == {"text": "Prima riga"}
+
+
+def test_rotation_keeps_every_line(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLog(path, batch_size=5, flush_interval=0.05, max_bytes=2000, backups=50, queue_limit=1000)
+    for weight in range(1, 101):
+        log.record("calculate_bsa", {"weight_kg": weight}, 0.001, False, None)
+    log.close()
+    assert log.rotations > 0
+    assert sorted(line["args"]["weight_kg"] for line in _lines(path + "*")) == list(range(1, 101))
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLog(path, batch_size=1000, flush_interval=60, max_bytes=0, backups=0, queue_limit=5)
+    for weight in range(1, 9):
+        log.record("calculate_bsa", {"weight_kg": weight}, 0.001, False, None)
+    log.close()
+    assert log.dropped == 3
+    assert len(_lines(path)) == 5
+
+
+@pytest.fixture
+def audit_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "AUDIT_LOG", str(tmp_path / "audit.jsonl"))
+    monkeypatch.setattr(audit, "_audit", None)
+    yield str(tmp_path / "audit.jsonl")
+    audit.close_audit_log()
+
+
+def test_executor_records_every_call(audit_log):
+    async def calls():
+        pool = ToolExecutor("thread", 2, 16, 10.0)
+        try:
+            for weight in (10, 20, 30):
+                await pool.run("calculate_bsa", {"weight_kg": weight, "height_cm": 110})
+            await pool.run("batch", {"tool": "calculate_bsa", "items": [{"weight_kg": 40, "height_cm": 110}]})
+        finally:
+            pool.shutdown()
+
+    asyncio.run(calls())
+    audit.close_audit_log()
+    assert [line["tool"] for line in _lines(audit_log)] == ["calculate_bsa"] * 3 + ["batch"]
@@ -0,0 +1,70 @@
+"""Tool batch: limite di elementi, errori per elemento, ripiego elemento per elemento e tool senza kernel"""
+import pytest
+
+from tools import batch
+from tools.registry import call_registered_tool, get_registered_tool
+
+
+def _batch(tool: str, items: list) -> dict:
+    result = call_registered_tool("batch", {"tool": tool, "items": items})
+    assert not result.isError, result.content[0].text
+    return result.structuredContent
+
+
+def test_item_limit():
+    result = call_registered_tool("batch", {"tool": "calculate_bsa", "items": [{}] * (batch.MAX_BATCH_ITEMS + 1)})
+    assert result.isError
+    assert result.structuredContent["details"] == [
+        {"field": "items", "message": f"items: al massimo {batch.MAX_BATCH_ITEMS} elementi"}
+    ]
+
+
+@pytest.mark.parametrize("tool", ["batch", "no_such_tool"])
+def test_unusable_tools(tool):
+    result = call_registered_tool("batch", {"tool": tool, "items": []})
+    assert result.isError and "non utilizzabile in batch" in result.content[0].text
+
+
+def test_validation_errors_do_not_abort_batch():
+    items = [{"weight_kg": 20, "height_cm": 115}, {"weight_kg": 20}, {"weight_kg": "20", "height_cm": 115},
+             {"weight_kg": 30, "height_cm": 130}]
+    structured = _batch("calculate_bsa", items)
+    assert (structured["count"], structured["succeeded"], structured["failed"]) == (4, 2, 2)
+    assert [item["index"] for item in structured["items"]] == [0, 1, 2, 3]
+    assert structured["items"][1]["error"] == [{"field": "height_cm", "message": "height_cm: campo obbligatorio mancante"}]
+    assert structured["items"][2]["error"] == [{"field": "weight_kg", "message": "weight_kg: deve essere un numero"}]
+    for index in (0, 3):
+        assert structured["items"][index]["result"] == call_registered_tool("calculate_bsa", items[index]).structuredContent
+
+
+def test_kernel_failure_falls_back_per_item(monkeypatch):
+    entry = get_registered_tool("calculate_bsa")
+    kernel = entry.batch
+
+    def failing(items):
+        if any(args["weight_kg"] == 13 for args in items):
+            raise ValueError("peso non gestito")
+        return kernel(items)
+
+    monkeypatch.setattr(entry, "batch", failing)
+    items = [{"weight_kg": weight, "height_cm": 100} for weight in (12, 13, 14)]
+    structured = _batch("calculate_bsa", items)
+    assert (structured["succeeded"], structured["failed"]) == (2, 1)
+    assert structured["items"][1] == {"index": 1, "error": [{"message": f"{entry.error_prefix}: peso non gestito"}]}
+    assert [structured["items"][index]["result"] for index in (0, 2)] == kernel([items[0], items[2]])
+
+
+@pytest.mark.parametrize("tool, items", [
+    ("calculate_predicted_height", [{"father_height_cm": 180, "mother_height_cm": 165, "is_male": male}
+                                    for male in (True, False)]),
+    ("calculate_gcs_pediatric", [{"eye_opening": 3, "verbal_response": 4, "motor_response": 5, "age_months": 30},
+                                 {"eye_opening": 1, "verbal_response": 1, "motor_response": 2, "age_months": 12,
+                                  "heart_rate": 60, "systolic_bp": 120}]),
+])
+def test_tool_without_kernel_matches_single_calls(tool, items):
+    assert get_registered_tool(tool).batch is None
+    structured = _batch(tool, items)
+    assert structured["failed"] == 0
+    assert [item["result"] for item in structured["items"]] == [
+        call_registered_tool(tool, dict(args)).structuredContent for args in items
+    ]
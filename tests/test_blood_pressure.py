@@ -0,0 +1,76 @@
+"""Pressione arteriosa: tabelle NHBPEP 2004, stadiazione AAP 2017 vettoriale e kernel batch"""
+import numpy as np
+import pytest
+
+from utils import blood_pressure
+
+
+def _reference_stage(is_male: bool, age: int, height: int, systolic: int, diastolic: int) -> int:
+    """Stadiazione AAP 2017 riletta dalle regole, su età e percentile di altezza presenti in tabella"""
+    row = blood_pressure.TABLE[0 if is_male else 1, age - 1, list(blood_pressure.HEIGHT_PERCENTILES).index(height)]
+    stage = 0
+    for index, (measure, reading) in enumerate(zip(blood_pressure.MEASURES, (systolic, diastolic))):
+        limits = blood_pressure.ADULT_LIMITS[measure]
+        thresholds = limits if age >= 13 else [min(int(value), limit) for value, limit in zip(row[index, 1:], limits)]
+        stage = max(stage, sum(reading >= threshold for threshold in thresholds))
+    return stage
+
+
+def test_printed_rows():
+    # Fourth Report, tabelle 3 e 4: 1 anno, 5° percentile di altezza (50°, 90°, 95°, 95° + 12)
+    assert blood_pressure.TABLE[0, 0, 0].tolist() == [[80, 94, 98, 110], [34, 49, 54, 66]]
+    assert blood_pressure.TABLE[1, 0, 0].tolist() == [[83, 97, 100, 112], [38, 52, 56, 68]]
+
+
+def test_percentiles_on_grid_and_clipped():
+    sexes, ages, heights = np.meshgrid([1, 0], blood_pressure.AGES, blood_pressure.HEIGHT_PERCENTILES, indexing="ij")
+    assert np.array_equal(blood_pressure.percentiles(sexes, ages, heights), blood_pressure.TABLE)
+    assert np.array_equal(blood_pressure.percentiles(True, 6, 1), blood_pressure.percentiles(True, 6, 5))
+    assert np.array_equal(blood_pressure.percentiles(False, 18, 99), blood_pressure.TABLE[1, -1, -1])
+
+
+def test_vectorized_classify_matches_rules():
+    rng = np.random.default_rng(24)
+    count = 5000
+    is_male = rng.random(count) < 0.5
+    ages = rng.integers(1, 18, count)
+    heights = rng.choice(blood_pressure.HEIGHT_PERCENTILES.astype(int), count)
+    systolic = rng.integers(70, 160, count)
+    diastolic = rng.integers(30, 105, count)
+    result = blood_pressure.classify(is_male, ages, systolic, diastolic, heights)
+    expected = [_reference_stage(*values) for values in zip(is_male.tolist(), ages.tolist(), heights.tolist(),
+                                                             systolic.tolist(), diastolic.tolist())]
+    assert result['stage'].tolist() == expected
+    assert result['status'].tolist() == [blood_pressure.STAGES.records[stage]['status'] for stage in expected]
+
+
+def test_classify_rejects_infants():
+    with pytest.raises(ValueError):
+        blood_pressure.classify([True, True], [0.5, 3], 90, 50)
+
+
+def test_classify_batch_matches_handler(batch_mismatches):
+    rng = np.random.default_rng(17)
+    items = []
+    for index in range(500):
+        args = {"is_male": bool(index % 2), "age_years": round(float(rng.uniform(1, 18)), 1),
+                "systolic_bp": int(rng.integers(70, 170)), "diastolic_bp": int(rng.integers(30, 110))}
+        if index % 3 == 1:
+            args["height_percentile"] = round(float(rng.uniform(1, 99)), 1)
+        elif index % 3 == 2:
+            args["height_cm"] = round(float(rng.uniform(75, 190)), 1)
+        items.append(args)
+    assert batch_mismatches("classify_blood_pressure", items) == []
+
+
+def test_normal_blood_pressure_batch_matches_handler(batch_mismatches):
+    rng = np.random.default_rng(4)
+    items = []
+    for index in range(300):
+        args = {"age_years": round(float(rng.uniform(0, 18)), 1)}
+        if index % 2:
+            args["is_male"] = bool(index % 4 == 1)
+        if index % 3 == 0:
+            args["height_percentile"] = int(rng.integers(5, 96))
+        items.append(args)
+    assert batch_mismatches("calculate_normal_blood_pressure", items) == []
@@ -0,0 +1,84 @@
+"""Cache dei risultati: chiave canonica, LRU, scadenza, contatori e hit senza handler"""
+import time
+
+import pytest
+
+from tools.cache import ResultCache, canonical_key
+from tools.registry import call_registered_tool, get_registered_tool
+
+ARGS = {"weight_kg": 20, "height_cm": 115}
+
+
+def test_key_ignores_order_and_keeps_types():
+    assert canonical_key({"a": 1, "b": 2.5}) == canonical_key({"b": 2.5, "a": 1})
+    assert len({canonical_key({"a": value}) for value in (10, 10.0, True, "10")}) == 4
+    nested = {"items": [{"x": 1, "y": 2}], "tool": "t"}
+    assert canonical_key(nested) == canonical_key({"tool": "t", "items": [{"y": 2, "x": 1}]})
+    assert canonical_key(nested) != canonical_key({"tool": "t", "items": [{"x": 1.0, "y": 2}]})
+    hash(canonical_key(nested))
+
+
+def test_lru_eviction_and_counters():
+    cache = ResultCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" diventa il meno recente
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == {"size": 2, "max_size": 2, "ttl_seconds": 0.0, "hits": 3, "misses": 1,
+                             "evictions": 1, "expirations": 0}
+
+
+def test_ttl_expiry():
+    cache = ResultCache(4, ttl=0.05)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["expirations"]) == (0, 1, 1, 1)
+
+
+@pytest.fixture
+def cached_bsa(monkeypatch):
+    """calculate_bsa con una cache nuova e il conteggio delle esecuzioni dell'handler"""
+    entry = get_registered_tool("calculate_bsa")
+    calls = []
+    handler = entry.handler
+
+    def counting(arguments):
+        calls.append(arguments)
+        return handler(arguments)
+
+    monkeypatch.setattr(entry, "cache", ResultCache(8))
+    monkeypatch.setattr(entry, "handler", counting)
+    return entry, calls
+
+
+def test_hit_skips_handler(cached_bsa):
+    entry, calls = cached_bsa
+    first = call_registered_tool("calculate_bsa", dict(ARGS))
+    second = call_registered_tool("calculate_bsa", {"height_cm": 115, "weight_kg": 20})
+    assert len(calls) == 1
+    assert second.content == first.content
+    assert (entry.cache.hits, entry.cache.misses) == (1, 1)
+    # Stesso valore con un altro tipo: chiave distinta, l'handler viene eseguito
+    call_registered_tool("calculate_bsa", dict(ARGS, weight_kg=20.0))
+    assert len(calls) == 2
+
+
+def test_verbosity_is_part_of_key(cached_bsa):
+    entry, calls = cached_bsa
+    full = call_registered_tool("calculate_bsa", dict(ARGS, verbosity="full"))
+    minimal = call_registered_tool("calculate_bsa", dict(ARGS, verbosity="minimal"))
+    assert len(calls) == 2 and full.content != minimal.content
+    assert call_registered_tool("calculate_bsa", dict(ARGS, verbosity="minimal")).content == minimal.content
+    assert len(calls) == 2
+
+
+def test_errors_not_cached(cached_bsa):
+    entry, calls = cached_bsa
+    assert call_registered_tool("calculate_bsa", {"weight_kg": 20}).isError
+    assert call_registered_tool("calculate_bsa", {"weight_kg": 20}).isError
+    assert entry.cache.stats()["size"] == 0
@@ -0,0 +1,95 @@
+"""Esecutore dei tool: worker del pool di processi e condivisione delle chiamate identiche in corso"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from tools import executor
+from tools.executor import ToolExecutor, _init_process_worker
+from tools.registry import get_load_hooks, get_registered_tool, get_tool_modules
+from tools.score_tables import SCORE_TABLES
+
+
+def _tabulated_scores() -> list[str]:
+    return sorted(name for name in SCORE_TABLES if type(get_registered_tool(name).handler).__name__ == "ScoreTable")
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_process_workers_use_score_tables(method):
+    context = multiprocessing.get_context(method)
+    with ProcessPoolExecutor(1, context, _init_process_worker, (get_tool_modules(), get_load_hooks())) as pool:
+        assert pool.submit(_tabulated_scores).result() == _tabulated_scores() == sorted(SCORE_TABLES)
+
+
+BATCH = {"tool": "calculate_bsa", "items": [{"weight_kg": 20, "height_cm": 110}]}
+
+
+@pytest.fixture
+def executions(monkeypatch):
+    """Conta le esecuzioni nel pool, ciascuna abbastanza lunga da sovrapporsi alle chiamate concorrenti"""
+    calls = []
+    lock = threading.Lock()
+    call_tool = executor.call_registered_tool
+
+    def counted(name, arguments):
+        with lock:
+            calls.append(name)
+        time.sleep(0.1)
+        return call_tool(name, arguments)
+
+    monkeypatch.setattr(executor, "call_registered_tool", counted)
+    return calls
+
+
+async def _concurrent(pool: ToolExecutor, arguments: list[dict]) -> list:
+    try:
+        return await asyncio.gather(*(pool.run("batch", dict(args)) for args in arguments))
+    finally:
+        pool.shutdown()
+
+
+def test_identical_calls_share_one_execution(executions):
+    pool = ToolExecutor("thread", 4, 16, 10.0, coalesce=True)
+    results = asyncio.run(_concurrent(pool, [BATCH] * 8))
+    assert len(executions) == 1
+    assert pool.coalesced == 7
+    assert all(result is results[0] for result in results)
+    assert not results[0].isError
+
+
+def test_different_calls_are_not_shared(executions):
+    other = {"tool": "calculate_bsa", "items": [{"weight_kg": 30, "height_cm": 130}]}
+    pool = ToolExecutor("thread", 4, 16, 10.0, coalesce=True)
+    first, second = asyncio.run(_concurrent(pool, [BATCH, other]))
+    assert len(executions) == 2
+    assert first.structuredContent != second.structuredContent
+
+
+def test_coalescing_disabled(executions):
+    pool = ToolExecutor("thread", 4, 16, 10.0, coalesce=False)
+    results = asyncio.run(_concurrent(pool, [BATCH] * 4))
+    assert len(executions) == 4
+    assert pool.coalesced == 0
+    assert all(result.structuredContent == results[0].structuredContent for result in results)
+
+
+def test_cancelled_waiter_keeps_shared_execution(executions):
+    async def scenario():
+        pool = ToolExecutor("thread", 2, 16, 10.0, coalesce=True)
+        try:
+            first = asyncio.ensure_future(pool.run("batch", dict(BATCH)))
+            second = asyncio.ensure_future(pool.run("batch", dict(BATCH)))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            result = await second
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return result
+        finally:
+            pool.shutdown()
+
+    assert not asyncio.run(scenario()).isError
+    assert len(executions) == 1
@@ -0,0 +1,115 @@
+"""Motore LMS WHO/CDC: segmenti entro le tabelle, percorso vettoriale identico a quello scalare"""
+import math
+
+import numpy as np
+import pytest
+
+from tools.registry import get_registered_tool
+from tools.validation import SchemaValidationError
+from utils import growth, vectorized
+
+# Indicatore -> intervallo di x (giorni o cm) e di misura per i campioni casuali
+CASES = {
+    "weight_for_age": ((0, 7000), (1.5, 90)),
+    "length_for_age": ((0, 7000), (45, 195)),
+    "bmi_for_age": ((0, 7000), (10, 38)),
+    "head_circumference_for_age": ((0, 1856), (30, 56)),
+    "weight_for_length": ((45, 110), (1.5, 25)),
+    "weight_for_height": ((65, 120), (5, 35)),
+}
+
+
+@pytest.mark.parametrize("key", sorted(growth.SEGMENTS))
+def test_segments_inside_their_tables(key):
+    tables = growth.get_tables()
+    for segment in growth.SEGMENTS[key]:
+        for sex in (1, 2):
+            x = tables[(segment.table, sex)].x
+            # Nessuna estrapolazione: gli estremi del segmento cadono entro le righe della tabella
+            assert x[0] <= segment.lower / segment.scale + 1e-9
+            assert segment.upper / segment.scale <= x[-1] + 1e-9
+
+
+def test_cdc_uses_who_standards_before_its_first_row():
+    for months in (24.0, 24.2, 24.49):
+        age = months * growth.DAYS_PER_MONTH
+        assert (growth.assess("bmi_for_age", True, 16.5, age, age, "cdc")
+                == growth.assess("bmi_for_age", True, 16.5, age, age, "who"))
+    age = growth.CDC_FIRST_DAY
+    assert growth.classification("bmi_for_age", age, "cdc") == (growth.BMI_CDC_BANDS, "percentile")
+
+
+def test_vectorized_erf_error_bound():
+    x = np.linspace(-6, 6, 200001)
+    expected = np.array([math.erf(value) for value in x.tolist()])
+    assert np.max(np.abs(vectorized._erf(x) - expected)) <= 1.5e-7
+    assert np.isnan(vectorized._erf(np.array([np.nan])))[0]
+
+
+@pytest.mark.parametrize("reference", growth.REFERENCES)
+@pytest.mark.parametrize("indicator", sorted(CASES))
+def test_vectorized_matches_scalar(indicator, reference):
+    if (indicator, reference) not in growth.SEGMENTS:
+        pytest.skip("indicatore senza riferimento")
+    rng = np.random.default_rng(hash((indicator, reference)) % 2**32)
+    (x_low, x_high), (value_low, value_high) = CASES[indicator]
+    count = 3000
+    is_male = rng.random(count) < 0.5
+    x = np.round(rng.uniform(x_low, x_high, count), 1)
+    value = np.round(rng.uniform(value_low, value_high, count), 1)
+    # Limiti dei segmenti compresi
+    edges = [edge for segment in growth.SEGMENTS[(indicator, reference)] for edge in (segment.lower, segment.upper)]
+    x[:len(edges)] = edges
+    age = x if indicator.endswith("_for_age") else np.full(count, 365.0)
+    scores = vectorized.calculate_growth_zscore(indicator, is_male, value, x, reference)
+    statuses = vectorized.classify_growth(indicator, age, reference, scores)
+    for index in range(count):
+        args = (indicator, bool(is_male[index]), float(value[index]), float(x[index]))
+        if not growth.covers(indicator, reference, args[3]):
+            assert math.isnan(scores['zscore'][index])
+            continue
+        expected = growth.assess(*args, float(age[index]), reference)
+        assert (scores['zscore'][index], scores['percentile'][index], statuses[index]) == \
+            (expected['zscore'], expected['percentile'], expected['status']), args
+
+
+def test_batch_kernel_matches_handler(batch_mismatches):
+    rng = np.random.default_rng(7)
+    items = []
+    for index in range(400):
+        args = {"is_male": bool(index % 2), "age_months": int(rng.integers(0, 240)),
+                "reference": ("who", "cdc")[index % 3 == 0]}
+        if rng.random() < 0.8:
+            args["weight_kg"] = round(float(rng.uniform(2, 80)), 1)
+        if rng.random() < 0.8:
+            args["length_cm"] = round(float(rng.uniform(45, 190)), 1)
+        if args["age_months"] < 60 and rng.random() < 0.6:
+            args["head_circumference_cm"] = round(float(rng.uniform(32, 54)), 1)
+        items.append(args)
+    assert batch_mismatches("calculate_growth_zscores", items) == []
+
+
+def test_head_circumference_batch_matches_handler(batch_mismatches):
+    rng = np.random.default_rng(22)
+    items = []
+    for index in range(500):
+        args = {"head_circumference_cm": round(float(rng.uniform(30, 54)), 1),
+                "gender": ("m", "f", "male", "female")[index % 4]}
+        if index % 3 != 1:
+            args["age_months"] = round(float(rng.uniform(0, 60)), 1)
+        if index % 3 != 2:
+            args["age_days"] = int(rng.integers(0, 1857))
+        items.append(args)
+    assert batch_mismatches("calculate_head_circumference_growth", items) == []
+
+
+def test_head_circumference_age_in_days_or_months():
+    entry = get_registered_tool("calculate_head_circumference_growth")
+    by_days = entry.handler(entry.validate({"age_days": 365, "head_circumference_cm": 46, "gender": "f"}))
+    by_months = entry.handler(entry.validate({"age_months": 365 / growth.DAYS_PER_MONTH,
+                                              "head_circumference_cm": 46, "gender": "f"}))
+    assert by_days.data == by_months.data
+    with pytest.raises(SchemaValidationError) as error:
+        entry.validate({"head_circumference_cm": 46, "gender": "f"})
+    assert error.value.details == [{"field": "age_months, age_days",
+                                    "message": "indicare almeno uno tra age_months, age_days"}]
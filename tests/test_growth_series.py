@@ -0,0 +1,85 @@
+"""Serie di crescita: kernel batch e screening a blocchi identici alla valutazione del singolo bambino"""
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+
+from tools.growth_screening import screen
+from tools.registry import get_registered_tool
+from tools.validation import SchemaValidationError
+from utils import velocity
+
+
+def _children(count: int, seed: int) -> list[dict]:
+    """Bambini casuali che seguono all'incirca una curva, con misure a volte mancanti"""
+    rng = np.random.default_rng(seed)
+    children = []
+    for index in range(count):
+        start = float(rng.uniform(0, 150))
+        ages = np.sort(rng.uniform(start, start + 60, int(rng.integers(1, 7))))
+        visits = []
+        for age in ages:
+            visit = {"age_months": round(float(age), 1)}
+            if rng.random() < 0.9:
+                visit["weight_kg"] = round(3.5 + 0.25 * float(age) + float(rng.normal(0, 1.5)), 1)
+            if rng.random() < 0.7:
+                visit["length_cm"] = round(52 + 0.6 * float(age) + float(rng.normal(0, 3)), 1)
+            if age < 60 and rng.random() < 0.6:
+                visit["head_circumference_cm"] = round(35 + 2.5 * float(np.log1p(age)) + float(rng.normal(0, 1)), 1)
+            visits.append(visit)
+        rng.shuffle(visits)
+        children.append({"is_male": bool(index % 2), "visits": visits, "reference": ("who", "cdc")[index % 4 == 0]})
+    return children
+
+
+def _csv(children: list[dict]) -> list[str]:
+    lines = ["child_id,is_male,age_days,weight_kg,length_cm,head_circumference_cm"]
+    for index, child in enumerate(children):
+        for visit in child["visits"]:
+            values = [visit.get(key, "") for key in ("weight_kg", "length_cm", "head_circumference_cm")]
+            lines.append(",".join(map(str, [f"c{index}", int(child["is_male"]), round(visit["age_months"] * 30.4375),
+                                            *values])))
+    return [line + "\n" for line in lines]
+
+
+def test_batch_kernel_matches_handler(batch_mismatches):
+    assert batch_mismatches("assess_growth_series", _children(300, 23)) == []
+
+
+@pytest.mark.parametrize("chunk_visits", [1, 7, 50000])
+def test_screen_matches_single_pass(chunk_visits):
+    lines = _csv(_children(200, 5))
+    rows = list(csv.DictReader(lines))
+    expected = velocity.records(velocity.assess_series(
+        [row["child_id"] for row in rows], [row["is_male"] == "1" for row in rows],
+        [float(row["age_days"]) for row in rows],
+        {key: [float(row[key]) if row[key] else float("nan") for row in rows] for key in velocity.MEASURES},
+        "who"
+    ))
+    output = io.StringIO()
+    counts = screen(lines, output, chunk_visits=chunk_visits)
+    # Ogni blocco è ordinato per bambino: si confronta il contenuto, non l'ordine delle righe
+    actual = {series["child"]: series for series in map(json.loads, output.getvalue().splitlines())}
+    assert actual == {series["child"]: series for series in json.loads(json.dumps(expected))}
+    assert counts == {"children": len(expected), "visits": len(rows),
+                      "flagged": sum(series["flagged"] for series in expected)}
+
+
+def test_screen_rejects_non_contiguous_child():
+    lines = ["child_id,is_male,age_days,weight_kg\n", "a,1,30,4.2\n", "b,0,30,4.0\n", "a,1,60,5.1\n"]
+    with pytest.raises(ValueError, match="non sono contigue"):
+        screen(lines, io.StringIO())
+
+
+def test_nested_visit_errors():
+    validate = get_registered_tool("assess_growth_series").validate
+    with pytest.raises(SchemaValidationError) as error:
+        validate({"is_male": True, "visits": [{"weight_kg": 4.0}, {"age_months": 3, "weight_kg": "4", "bmi": 1}]})
+    messages = [detail["message"] for detail in error.value.details]
+    assert messages == [
+        "visits: elemento 0 age_months: campo obbligatorio mancante",
+        "visits: elemento 1 weight_kg: deve essere un numero",
+        "visits: elemento 1 bmi: campo non previsto dallo schema",
+    ]
@@ -0,0 +1,38 @@
+"""Generatore di carico: mix e argomenti dagli schemi validi, giro breve end-to-end su stdio"""
+import argparse
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import load_test  # noqa: E402
+from tools.registry import call_registered_tool, get_registered_tools  # noqa: E402
+
+
+def test_parse_mix():
+    assert load_test.parse_mix("call=9,list=1") == {"call": 9, "list": 1}
+    assert load_test.parse_mix("call") == {"call": 1}
+    with pytest.raises(argparse.ArgumentTypeError):
+        load_test.parse_mix("read=1")
+
+
+@pytest.mark.parametrize("verbosity", [None, "minimal"])
+def test_workload_calls_are_accepted(verbosity):
+    workload = load_test.Workload(get_registered_tools(), {"call": 1}, None, verbosity, seed=0)
+    assert {name for name, _ in workload.calls}.isdisjoint(load_test.DEFAULT_EXCLUDED)
+    for name, args in workload.calls:
+        result = call_registered_tool(name, dict(args))
+        assert not result.isError, f"{name} {args}: {result.content[0].text}"
+
+
+def test_stdio_run_without_errors():
+    args = argparse.Namespace(transport="stdio", url=None, workers=1, stateless=False, clients=1, rate=0.0,
+                              duration=1.0, interval=1.0, timeout=10.0, mix={"call": 9, "list": 1}, tools=None,
+                              verbosity=None, seed=0)
+    summary = asyncio.run(load_test.run(args))
+    assert summary["requests"] > 0
+    assert summary["errors"] == 0
+    assert set(summary["by_operation"]) <= {"call", "list"}
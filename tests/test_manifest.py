@@ -0,0 +1,80 @@
+"""
+Manifest del catalogo e import differito dei moduli dei tool
+Ogni scenario gira in un processo nuovo: in quello dei test i moduli sono già importati
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tools import manifest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Avvio come in server.py (hook delle tabelle degli score, poi load_tools) con il manifest in argv[1]
+STARTUP = """
+import json, sys
+from tools import manifest
+manifest.MANIFEST_PATH = sys.argv[1]
+from tools.registry import add_load_hook, call_registered_tool, get_registered_tool, get_registered_tools
+from tools.score_tables import ScoreTable, install_score_tables
+add_load_hook(install_score_tables)
+source = manifest.load_tools()
+report = {"source": source, "catalog": [tool.name for tool in get_registered_tools()],
+          "imported": sorted(module for module in manifest.TOOL_MODULES if module in sys.modules)}
+"""
+
+FIRST_CALL = STARTUP + """
+result = call_registered_tool("calculate_pews", {"behavior": 1, "age_months": 24, "cardiovascular": 1, "respiratory": 0})
+report.update(
+    after_call=sorted(module for module in manifest.TOOL_MODULES if module in sys.modules),
+    text=result.content[0].text,
+    tabulated=isinstance(get_registered_tool("calculate_pews", load=False).handler, ScoreTable),
+)
+print(json.dumps(report))
+"""
+
+
+def _run(script: str, path) -> dict:
+    completed = subprocess.run([sys.executable, "-c", script, str(path)], cwd=PROJECT_DIR,
+                               capture_output=True, text=True, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    return tmp_path / ".tool_manifest.json"
+
+
+def _write(path, data) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.mark.parametrize("stale", [None, "fingerprint", "corrupt"])
+def test_invalid_manifest_is_rebuilt(manifest_path, stale):
+    if stale == "fingerprint":
+        _write(manifest_path, {"fingerprint": "0" * 64, "tools": []})
+    elif stale == "corrupt":
+        manifest_path.write_text("{", encoding="utf-8")
+    report = _run(STARTUP + "print(json.dumps(report))", manifest_path)
+    assert report["source"] == "import"
+    assert report["imported"] == sorted(manifest.TOOL_MODULES)
+    rebuilt = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert rebuilt["fingerprint"] == manifest.fingerprint()
+    assert [tool["name"] for tool in rebuilt["tools"]] == report["catalog"]
+
+
+def test_deferred_module_imported_on_first_call(manifest_path):
+    imported = _run(STARTUP + "print(json.dumps(report))", manifest_path)
+    report = _run(FIRST_CALL, manifest_path)
+    assert report["source"] == "manifest"
+    # Catalogo completo dal manifest senza importare alcun modulo di tool
+    assert report["catalog"] == imported["catalog"]
+    assert report["imported"] == []
+    assert report["after_call"] == ["tools.scores"]
+    # Gli hook di caricamento girano anche per i moduli importati alla prima chiamata
+    assert report["tabulated"]
+    assert report["text"].startswith("PEWS")
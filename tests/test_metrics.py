@@ -0,0 +1,98 @@
+"""Metriche per tool: bucket log-lineari, percentili, esposizione Prometheus e server_stats"""
+import asyncio
+
+import pytest
+
+from tools import metrics
+from tools.executor import ToolExecutor
+from tools.metrics import LatencyHistogram, _bucket, _bucket_bounds
+from tools.registry import call_registered_tool
+
+
+@pytest.mark.parametrize("power", range(metrics._MAX_BITS))
+def test_buckets_at_powers_of_two(power):
+    value = 1 << power
+    index = _bucket(value)
+    lower, upper = _bucket_bounds(index)
+    # Ogni potenza di due apre un bucket, e il valore precedente cade nel bucket prima
+    assert lower == value and upper > value
+    assert _bucket(value - 1) == index - 1 if value > 1 else index == 1
+    assert _bucket_bounds(index - 1)[1] == lower
+    assert _bucket(upper - 1) == index
+    # Larghezza massima 1/16 del limite inferiore (esatti sotto 32 µs)
+    assert upper - lower <= max(1, lower // metrics._SUB_COUNT)
+
+
+def test_buckets_are_contiguous():
+    previous = 0
+    for index in range(metrics._BUCKETS):
+        lower, upper = _bucket_bounds(index)
+        assert lower == previous and _bucket(lower) == index
+        previous = upper
+    assert previous == 1 << metrics._MAX_BITS
+
+
+def test_top_bucket_collects_overflow():
+    top = metrics._BUCKETS - 1
+    assert _bucket((1 << metrics._MAX_BITS) - 1) == top
+    assert _bucket(1 << metrics._MAX_BITS) == top
+    assert _bucket(1 << 50) == top
+    histogram = LatencyHistogram()
+    histogram.record(1e6)
+    assert histogram.counts[top] == 1 and histogram.percentile(99) == 1e6
+
+
+def test_percentiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    values = [(index + 1) * 0.000137 for index in range(10000)]
+    for value in values:
+        histogram.record(value)
+    for percent in (1, 50, 90, 99, 100):
+        exact = values[-(-len(values) * percent // 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) <= exact / metrics._SUB_COUNT
+    assert histogram.percentile(100) <= histogram.maximum == values[-1]
+    assert LatencyHistogram().percentile(50) is None
+
+
+@pytest.fixture
+def fresh_metrics(monkeypatch):
+    monkeypatch.setattr(metrics, "_metrics", {})
+
+
+def test_prometheus_text(fresh_metrics):
+    metrics.record_call('odd"name\\x', 0.0003, False)
+    metrics.record_call('odd"name\\x', 0.02, True)
+    text = metrics.prometheus_text({"executor_queued": 3})
+    label = 'tool="odd\\"name\\\\x"'
+    lines = text.splitlines()
+    assert "pediatric_mcp_executor_queued 3" in lines
+    assert f"pediatric_mcp_tool_calls_total{{{label}}} 2" in lines
+    assert f"pediatric_mcp_tool_errors_total{{{label}}} 1" in lines
+    assert f'pediatric_mcp_tool_duration_seconds_bucket{{{label},le="0.0005"}} 1' in lines
+    assert f'pediatric_mcp_tool_duration_seconds_bucket{{{label},le="0.025"}} 2' in lines
+    assert f'pediatric_mcp_tool_duration_seconds_bucket{{{label},le="+Inf"}} 2' in lines
+    assert f"pediatric_mcp_tool_duration_seconds_sum{{{label}}} 0.020300" in lines
+    assert f"pediatric_mcp_tool_duration_seconds_count{{{label}}} 2" in lines
+    buckets = [line for line in lines if line.startswith("pediatric_mcp_tool_duration_seconds_bucket")]
+    assert len(buckets) == len(metrics.PROMETHEUS_BUCKETS) + 1
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert counts == sorted(counts)
+    assert text.endswith("\n")
+
+
+def test_server_stats_reports_errors_per_tool(fresh_metrics):
+    async def calls():
+        pool = ToolExecutor("thread", 2, 16, 10.0)
+        try:
+            await pool.run("calculate_bsa", {"weight_kg": 20, "height_cm": 115})
+            await pool.run("calculate_bsa", {"weight_kg": 20})
+            await pool.run("calculate_bsa", {"weight_kg": 20, "height_cm": 115, "verbosity": "none"})
+            await pool.run("calculate_bmi_pediatric", {"weight_kg": 20, "height_cm": 115, "age_months": 72})
+        finally:
+            pool.shutdown()
+
+    asyncio.run(calls())
+    stats = call_registered_tool("server_stats", {}).structuredContent["tool_metrics"]
+    assert (stats["calculate_bsa"]["calls"], stats["calculate_bsa"]["errors"]) == (3, 2)
+    assert stats["calculate_bsa"]["error_rate"] == round(2 / 3, 4)
+    assert (stats["calculate_bmi_pediatric"]["calls"], stats["calculate_bmi_pediatric"]["errors"]) == (1, 0)
@@ -0,0 +1,63 @@
+"""Profilazione su richiesta: chiamate concorrenti sotto cProfile e rotazione dei dump"""
+import cProfile
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tools import profiling
+from utils import config
+
+ARGS = {"weight_kg": 20, "height_cm": 115}
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "_CPU", True)
+    monkeypatch.setattr(profiling, "_MEMORY", False)
+    monkeypatch.setattr(config, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "PROFILE_MIN_MS", 0.0)
+    monkeypatch.setattr(config, "PROFILE_KEEP", 3)
+    return tmp_path
+
+
+def _dumps(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith(".pstats"))
+
+
+def test_concurrent_calls_profile_one_at_a_time(profile_dir, monkeypatch):
+    # Le due chiamate si attendono a vicenda: sono entrambe in corso nello stesso momento
+    barrier = threading.Barrier(2, timeout=5)
+    call = profiling.call_registered_tool
+
+    def together(name, arguments):
+        barrier.wait()
+        return call(name, arguments)
+
+    monkeypatch.setattr(profiling, "call_registered_tool", together)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(lambda _: profiling.profiled_call("calculate_bsa", dict(ARGS)), range(2)))
+    assert not any(result.isError for result in results)
+    assert results[0].content == results[1].content
+    # Solo la chiamata che ha ottenuto il profiler lascia un dump
+    assert len(_dumps(profile_dir)) == 1
+    assert not profiling._cpu_lock.locked()
+
+    monkeypatch.setattr(profiling, "call_registered_tool", call)
+    for _ in range(5):
+        profiling.profiled_call("calculate_bsa", dict(ARGS))
+    assert len(_dumps(profile_dir)) == config.PROFILE_KEEP
+
+
+def test_call_runs_unprofiled_when_profiler_refuses(profile_dir, monkeypatch):
+    class Busy(cProfile.Profile):
+        def enable(self, *args, **kwargs):
+            raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(profiling.cProfile, "Profile", Busy)
+    result = profiling.profiled_call("calculate_bsa", dict(ARGS))
+    assert not result.isError
+    assert result.content == profiling.call_registered_tool("calculate_bsa", dict(ARGS)).content
+    assert _dumps(profile_dir) == []
+    assert not profiling._cpu_lock.locked()
@@ -0,0 +1,14 @@
+"""Tabelle precalcolate degli score: equivalenza esaustiva con gli handler live"""
+from tools.registry import get_registered_tool
+from tools.score_tables import SCORE_TABLES, ScoreTable, install_score_tables, verify
+
+
+def test_tables_installed_for_every_score():
+    tables = install_score_tables()
+    assert set(tables) == set(SCORE_TABLES)
+    for name in SCORE_TABLES:
+        assert isinstance(get_registered_tool(name).handler, ScoreTable)
+
+
+def test_tables_match_live_handlers():
+    assert verify(install_score_tables()) == 0
@@ -0,0 +1,105 @@
+"""Validazione compilata degli input: vincoli dichiarati, normalizzazione ed errori strutturati"""
+import math
+
+import mcp.types as types
+import pytest
+
+from tools.registry import call_registered_tool
+from tools.validation import SchemaValidationError, compile_validator
+
+TOOL = types.Tool(
+    name="example",
+    description="Tool di prova",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "weight_kg": {"type": "number", "minimum": 0, "maximum": 150},
+            "age_years": {"type": "integer", "minimum": 0, "maximum": 18},
+            "gender": {"type": "string", "enum": ["m", "f"]},
+            "is_male": {"type": "boolean"},
+            "height_cm": {"type": "number"},
+            "length_cm": {"type": "number"},
+        },
+        "required": ["weight_kg"],
+        "allOf": [{"anyOf": [{"required": ["height_cm"]}, {"required": ["length_cm"]}]}]
+    }
+)
+validate = compile_validator(TOOL)
+
+
+def _messages(arguments) -> list[str]:
+    with pytest.raises(SchemaValidationError) as error:
+        validate(arguments)
+    return [detail["message"] for detail in error.value.details]
+
+
+def test_valid_arguments_pass_through():
+    arguments = {"weight_kg": 20, "age_years": 6, "gender": "m", "is_male": True, "height_cm": 115.5}
+    assert validate(dict(arguments)) == arguments
+
+
+def test_missing_required_field():
+    assert _messages({"height_cm": 115}) == ["weight_kg: campo obbligatorio mancante"]
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_booleans_are_not_numbers(value):
+    assert _messages({"weight_kg": value, "height_cm": 115}) == ["weight_kg: deve essere un numero"]
+    assert _messages({"weight_kg": 20, "age_years": value, "height_cm": 115}) == ["age_years: deve essere un intero"]
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_numbers_rejected(value):
+    assert _messages({"weight_kg": value, "height_cm": 115}) == ["weight_kg: deve essere un numero"]
+
+
+def test_integral_float_accepted_as_integer():
+    arguments = validate({"weight_kg": 20, "age_years": 2.0, "height_cm": 115})
+    assert arguments["age_years"] == 2 and type(arguments["age_years"]) is int
+    assert _messages({"weight_kg": 20, "age_years": 2.5, "height_cm": 115}) == ["age_years: deve essere un intero"]
+
+
+def test_range_and_enum_violations():
+    assert _messages({"weight_kg": -1, "age_years": 19, "gender": "x", "height_cm": 115}) == [
+        "weight_kg: deve essere ≥ 0",
+        "age_years: deve essere ≤ 18",
+        "gender: valore non ammesso (ammessi: m, f)",
+    ]
+
+
+def test_unknown_and_non_object_arguments():
+    assert _messages({"weight_kg": 20, "height_cm": 115, "bmi": 15}) == ["bmi: campo non previsto dallo schema"]
+    assert _messages(["weight_kg"]) == ["arguments: deve essere un oggetto"]
+    assert _messages(None) == ["weight_kg: campo obbligatorio mancante", "indicare almeno uno tra height_cm, length_cm"]
+
+
+def test_any_of_required_groups():
+    assert validate({"weight_kg": 20, "length_cm": 80}) == {"weight_kg": 20, "length_cm": 80}
+    with pytest.raises(SchemaValidationError) as error:
+        validate({"weight_kg": 20})
+    assert error.value.details == [{"field": "height_cm, length_cm",
+                                    "message": "indicare almeno uno tra height_cm, length_cm"}]
+
+
+def test_unsupported_schema_keys_fail_at_registration():
+    schema = dict(TOOL.inputSchema, oneOf=[])
+    with pytest.raises(ValueError, match="oneOf"):
+        compile_validator(types.Tool(name="broken", description="", inputSchema=schema))
+    schema = dict(TOOL.inputSchema, allOf=[{"anyOf": [{"properties": {}}]}])
+    with pytest.raises(ValueError, match="allOf"):
+        compile_validator(types.Tool(name="broken", description="", inputSchema=schema))
+
+
+def test_structured_error_payload():
+    result = call_registered_tool("calculate_pews", {"behavior": True, "age_months": 24, "cardiovascular": 0})
+    assert result.isError
+    assert result.structuredContent == {
+        "error": "invalid_arguments",
+        "tool": "calculate_pews",
+        "details": [
+            {"field": "respiratory, respiratory_rate, oxygen_l_min, fio2_percent",
+             "message": "indicare almeno uno tra respiratory, respiratory_rate, oxygen_l_min, fio2_percent"},
+            {"field": "behavior", "message": "behavior: deve essere un intero"},
+        ]
+    }
+    assert result.content[0].text.startswith("Input non valido per calculate_pews: ")
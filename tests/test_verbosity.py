@@ -0,0 +1,40 @@
+"""Livelli di dettaglio del referto: stessi dati, testo full = referto + materiale di riferimento"""
+import pytest
+
+from benchmarks.schema_args import schema_argument_sets
+from tools.registry import call_registered_tool, get_registered_tool, get_registered_tools
+from tools.results import reference_uri
+
+REPORT_TOOLS = [tool.name for tool in get_registered_tools()
+                if get_registered_tool(tool.name).report and tool.name != "batch"]
+
+
+def _calls(name: str) -> list[dict]:
+    entry = get_registered_tool(name)
+    calls = []
+    for args in schema_argument_sets(entry.definition.inputSchema):
+        try:
+            calls.append((args, entry.handler(entry.validate(dict(args)))))
+        except ValueError:
+            continue  # combinazione rifiutata dall'handler: nessun referto da confrontare
+    return calls
+
+
+@pytest.mark.parametrize("name", REPORT_TOOLS)
+def test_verbosity_levels(name):
+    entry = get_registered_tool(name)
+    calls = _calls(name)
+    assert calls, f"{name}: nessun set di argomenti accettato"
+    for args, result in calls:
+        outputs = {level: call_registered_tool(name, dict(args, verbosity=level))
+                   for level in ("full", "standard", "minimal")}
+        for output in outputs.values():
+            assert not output.isError
+            assert output.structuredContent == result.data
+        full, standard, minimal = (outputs[level].content[0].text for level in ("full", "standard", "minimal"))
+        if entry.reference is None:
+            assert full == standard == result.text
+        else:
+            assert full == f"{result.text}\n\n{entry.reference}"
+            assert standard == f"{result.text}\n\nMateriale di riferimento: {reference_uri(name)}"
+        assert minimal == result.summary()
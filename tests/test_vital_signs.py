@@ -0,0 +1,108 @@
+"""Parametri vitali negli score: sotto-punteggi PEWS, kernel batch, tabelle e segnalazioni di GCS e PTS"""
+import random
+
+import pytest
+
+from tools.registry import get_registered_tool
+from tools.score_tables import LIVE_FIELDS, install_score_tables
+from tools.scores import PEWS_SYSTEM_VITALS
+from tools.validation import SchemaValidationError
+from utils import vital_signs
+
+VITAL_VALUES = {
+    "heart_rate": lambda rng: rng.randint(40, 230),
+    "capillary_refill_s": lambda rng: rng.choice([1, 2.5, 3, 4, 6]),
+    "respiratory_rate": lambda rng: rng.randint(8, 80),
+    "oxygen_l_min": lambda rng: rng.choice([1, 3, 6, 9]),
+    "fio2_percent": lambda rng: rng.choice([25, 30, 45, 60]),
+}
+
+
+def _pews_items(count: int, seed: int) -> list[dict]:
+    """Chiamate PEWS casuali con ogni sotto-punteggio osservato, ricavato dai parametri vitali o entrambi"""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        args = {"behavior": rng.randint(0, 3), "age_months": rng.randint(0, 216)}
+        if rng.random() < 0.5:
+            args["nebulizer_use"] = rng.randint(0, 2)
+        for system, vitals in PEWS_SYSTEM_VITALS.items():
+            for vital in vitals:
+                if rng.random() < 0.4:
+                    args[vital] = VITAL_VALUES[vital](rng)
+            if rng.random() < 0.5 or not any(vital in args for vital in vitals):
+                args[system] = rng.randint(0, 3)
+        items.append(args)
+    return items
+
+
+@pytest.mark.parametrize("age_months, heart_rate, expected", [
+    (30, 140, 0), (30, 159, 0), (30, 160, 2), (30, 170, 3), (30, 94, 3), (6, 179, 0), (6, 180, 2), (200, 59, 3),
+])
+def test_pews_cardiovascular_from_heart_rate(age_months, heart_rate, expected):
+    # Range APLS: 2-5 anni 95-140, <1 anno 110-160, >12 anni 60-100
+    assert int(vital_signs.pews_cardiovascular(age_months, heart_rate)) == expected
+
+
+@pytest.mark.parametrize("age_months, respiratory_rate, expected", [
+    (30, 40, 0), (30, 41, 1), (30, 50, 1), (30, 51, 2), (30, 21, 0), (30, 20, 3),
+])
+def test_pews_respiratory_from_rate(age_months, respiratory_rate, expected):
+    # Range APLS 2-5 anni: 25-30 atti/min
+    assert int(vital_signs.pews_respiratory(age_months, respiratory_rate)) == expected
+
+
+def test_pews_batch_matches_handler(batch_mismatches):
+    assert batch_mismatches("calculate_pews", _pews_items(2000, 25)) == []
+
+
+def test_pews_table_routes_vitals_to_handler():
+    table = install_score_tables()["calculate_pews"]
+    entry = get_registered_tool("calculate_pews")
+    assert entry.handler is table
+    for args in _pews_items(300, 3):
+        expected = table.handler(dict(args))
+        actual = entry.handler(dict(args))
+        assert (actual.text, actual.data) == (expected.text, expected.data)
+    assert LIVE_FIELDS["calculate_pews"] == tuple(field for vitals in PEWS_SYSTEM_VITALS.values() for field in vitals)
+
+
+@pytest.mark.parametrize("args, missing", [
+    ({"behavior": 0, "age_months": 24}, ["cardiovascular", "respiratory"]),
+    ({"behavior": 0, "age_months": 24, "capillary_refill_s": 2}, ["respiratory"]),
+    ({"behavior": 0, "age_months": 24, "cardiovascular": 1, "fio2_percent": 21}, []),
+])
+def test_pews_rejects_unassessed_systems(args, missing):
+    entry = get_registered_tool("calculate_pews")
+    if not missing:
+        entry.handler(entry.validate(dict(args)))
+        return
+    with pytest.raises(SchemaValidationError) as error:
+        entry.validate(dict(args))
+    assert [detail["field"].split(", ")[0] for detail in error.value.details] == missing
+    with pytest.raises(ValueError, match="non valutato"):
+        entry.handler(dict(args))
+    with pytest.raises(ValueError):
+        entry.batch([{"behavior": 0, "age_months": 24, "cardiovascular": 0, "respiratory": 0}, dict(args)])
+
+
+def test_gcs_flags_cushing_triad():
+    handler = get_registered_tool("calculate_gcs_pediatric").handler
+    base = {"eye_opening": 2, "verbal_response": 2, "motor_response": 4, "age_months": 60}
+    result = handler(dict(base, heart_rate=60, systolic_bp=130))
+    assert result.data["cushing"] and not result.data["hypotension"]
+    assert "Cushing" in result.text
+    assert handler(dict(base, systolic_bp=75)).data["hypotension"]
+    assert "vital_signs" not in handler(dict(base)).data
+
+
+def test_pts_flags_hypotension_for_age():
+    handler = get_registered_tool("calculate_pediatric_trauma_score").handler
+    base = {"weight_kg": 18, "systolic_bp": 74, "conscious": True, "open_wound": False, "fracture": True, "cutaneous": True}
+    # 74 mmHg a 5 anni è sotto la soglia PALS (70 + 2 x età): ipotensione, punteggio PTS invariato
+    result = handler(dict(base, age_months=60, heart_rate=150))
+    assert result.data["hypotension"] and result.data["score"] == handler(dict(base)).data["score"]
+    assert "Ipotensione per l'età" in result.text
+    assert not handler(dict(base, systolic_bp=95, age_months=60)).data["hypotension"]
+    with pytest.raises(ValueError, match="age_months"):
+        handler(dict(base, heart_rate=150))
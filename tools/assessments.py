@@ -2,887 +2,74 @@
 Assessment clinici per la pediatria
 Valutazione disidratazione e scale del dolore
 """
+from functools import partial
+
 import mcp.types as types
-def get_assessment_tools():
-    """Restituisce tutti i tool per gli assessment clinici"""
-    return [
-        types.Tool(
-            name="assess_dehydration",
-            description="Valuta il grado di disidratazione nel bambino usando parametri clinici",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "general_appearance": {
-                        "type": "string",
-                        "enum": ["normal", "restless_thirsty", "lethargic_unconscious"],
-                        "description": "Aspetto generale: normal, restless_thirsty, lethargic_unconscious"
-                    },
-                    "eyes": {
-                        "type": "string", 
-                        "enum": ["normal", "slightly_sunken", "very_sunken"],
-                        "description": "Occhi: normal, slightly_sunken, very_sunken"
-                    },
-                    "tears": {
-                        "type": "string",
-                        "enum": ["present", "decreased", "absent"], 
-                        "description": "Lacrime: present, decreased, absent"
-                    },
-                    "mouth_tongue": {
-                        "type": "string",
-                        "enum": ["moist", "sticky", "dry"],
-                        "description": "Bocca e lingua: moist, sticky, dry"
-                    },
-                    "thirst": {
-                        "type": "string",
-                        "enum": ["drinks_normal", "eager_to_drink", "unable_to_drink"],
-                        "description": "Sete: drinks_normal, eager_to_drink, unable_to_drink"
-                    },
-                    "skin_pinch": {
-                        "type": "string", 
-                        "enum": ["normal", "slow", "very_slow"],
-                        "description": "Pinch test: normal (<2sec), slow (2-3sec), very_slow (>3sec)"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 216,
-                        "description": "Età in mesi (0-216 mesi = 0-18 anni)"
-                    }
-                },
-                "required": ["general_appearance", "eyes", "tears", "mouth_tongue", "thirst", "skin_pinch", "age_months"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_pain_scale",
-            description="Raccomanda la scala del dolore più appropriata basata su età e capacità comunicative",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_months": {
-                        "type": "integer", 
-                        "minimum": 0,
-                        "maximum": 216,
-                        "description": "Età in mesi (0-216 mesi = 0-18 anni)"
-                    },
-                    "cognitive_ability": {
-                        "type": "string",
-                        "enum": ["normal", "delayed", "unable_to_communicate"],
-                        "description": "Capacità cognitive: normal, delayed, unable_to_communicate"
-                    },
-                    "pain_type": {
-                        "type": "string",
-                        "enum": ["acute", "chronic", "postoperative"],
-                        "description": "Tipo di dolore: acute, chronic, postoperative"
-                    },
-                    "current_pain_indicators": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["crying", "facial_expression", "body_posture", "movement", "verbal_complaint", "sleep_disturbance", "feeding_difficulty"]
-                        },
-                        "description": "Indicatori di dolore presenti"
-                    }
-                },
-                "required": ["age_months", "cognitive_ability", "pain_type"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_nutritional_status",
-            description="Valuta lo stato nutrizionale pediatrico con parametri clinici",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 216,
-                        "description": "Età in mesi"
-                    },
-                    "recent_weight_loss": {
-                        "type": "boolean",
-                        "description": "Perdita di peso recente (ultimo mese)"
-                    },
-                    "poor_appetite": {
-                        "type": "boolean", 
-                        "description": "Appetito ridotto persistente"
-                    },
-                    "feeding_difficulties": {
-                        "type": "boolean",
-                        "description": "Difficoltà alimentari (suzione, deglutizione)"
-                    },
-                    "growth_faltering": {
-                        "type": "boolean",
-                        "description": "Faltering di crescita (crossing percentili)"
-                    },
-                    "muscle_wasting": {
-                        "type": "boolean",
-                        "description": "Perdita massa muscolare visibile"
-                    },
-                    "subcutaneous_fat_loss": {
-                        "type": "boolean",
-                        "description": "Perdita grasso sottocutaneo"
-                    },
-                    "edema_present": {
-                        "type": "boolean",
-                        "description": "Edema presente"
-                    },
-                    "chronic_disease": {
-                        "type": "boolean",
-                        "description": "Malattia cronica presente"
-                    }
-                },
-                "required": ["age_months", "recent_weight_loss", "poor_appetite", "feeding_difficulties", "growth_faltering", "muscle_wasting", "subcutaneous_fat_loss", "edema_present", "chronic_disease"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_developmental_milestones",
-            description="Valuta raggiungimento tappe sviluppo psicomotorio per età",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 72,
-                        "description": "Età in mesi (0-72 mesi)"
-                    },
-                    "motor_skills": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["head_control", "sits_unsupported", "crawls", "walks_independently", "runs", "jumps", "climbs_stairs", "rides_tricycle"]
-                        },
-                        "description": "Abilità motorie raggiunte"
-                    },
-                    "language_skills": {
-                        "type": "array",
-                        "items": {
-                            "type": "string", 
-                            "enum": ["responds_to_name", "babbles", "first_words", "two_words", "simple_sentences", "follows_commands", "tells_stories"]
-                        },
-                        "description": "Abilità linguistiche raggiunte"
-                    },
-                    "social_skills": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["smiles_socially", "stranger_anxiety", "parallel_play", "cooperative_play", "empathy", "shares_toys", "follows_rules"]
-                        },
-                        "description": "Abilità sociali raggiunte"
-                    },
-                    "cognitive_skills": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["object_permanence", "cause_effect", "symbolic_play", "sorting_shapes", "counts_to_ten", "draws_person", "understands_time"]
-                        },
-                        "description": "Abilità cognitive raggiunte"
-                    }
-                },
-                "required": ["age_months", "motor_skills", "language_skills", "social_skills", "cognitive_skills"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_asthma_control",
-            description="Valuta controllo asma pediatrico usando parametri clinici",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "daytime_symptoms_per_week": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 7,
-                        "description": "Giorni con sintomi diurni nell'ultima settimana"
-                    },
-                    "nighttime_awakenings_per_month": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 30,
-                        "description": "Risvegli notturni per asma nell'ultimo mese"
-                    },
-                    "rescue_inhaler_use_per_week": {
-                        "type": "integer", 
-                        "minimum": 0,
-                        "maximum": 50,
-                        "description": "Utilizzi broncodilatatore al bisogno per settimana"
-                    },
-                    "activity_limitation": {
-                        "type": "string",
-                        "enum": ["none", "minor", "moderate", "severe"],
-                        "description": "Limitazione attività: none, minor, moderate, severe"
-                    },
-                    "school_absences_asthma": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 30,
-                        "description": "Giorni assenza scuola per asma (ultimo mese)"
-                    },
-                    "recent_exacerbations": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 10,
-                        "description": "Riacutizzazioni ultime 4 settimane"
-                    }
-                },
-                "required": ["daytime_symptoms_per_week", "nighttime_awakenings_per_month", "rescue_inhaler_use_per_week", "activity_limitation", "school_absences_asthma", "recent_exacerbations"]
-            }
-        ),
-        
-        # NUOVI STRUMENTI AGGIUNTI
-        
-        types.Tool(
-            name="assess_heads_ed",
-            description="Valuta HEADS-ED per screening rapido salute mentale pediatrica in pronto soccorso",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "home": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Home (ambiente familiare): 0=Supportivo/appropriato, 1=Alcune/lievi preoccupazioni, 2=Caos/conflitti maggiori/unsafe"
-                    },
-                    "education": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Education (scuola): 0=Andamento bene/supportiva, 1=Alcuni problemi/assenteismo, 2=Fallimento/sospensioni/non frequenta"
-                    },
-                    "activities_peers": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Activities/Peers (attività/pari): 0=Buone amicizie/attività, 1=Qualche preoccupazione sociale, 2=Isolamento/peer negativi/nessuna attività"
-                    },
-                    "drugs_alcohol": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Drugs/Alcohol (sostanze): 0=Nessun uso, 1=Sperimentazione/uso occasionale, 2=Uso regolare/problematico"
-                    },
-                    "suicidality": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Suicidality (suicidalità): 0=Negata, 1=Ideazione senza piano/intento, 2=Ideazione con piano/intento/comportamenti"
-                    },
-                    "emotions_behavior": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Emotions/Behavior (emozioni/comportamento): 0=Appropriate/stable, 1=Mood/anxiety lievi, 2=Depressione/ansia severe/psicosi/aggressività"
-                    },
-                    "discharge_resources": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Discharge Resources (risorse dimissione): 0=Supporto familiare adeguato/follow-up, 1=Risorse limitate, 2=Nessun supporto/follow-up"
-                    },
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 8,
-                        "maximum": 18,
-                        "description": "Età in anni (validato per 8-18 anni)"
-                    }
-                },
-                "required": ["home", "education", "activities_peers", "drugs_alcohol", "suicidality", "emotions_behavior", "discharge_resources", "age_years"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_pediatric_sleep",
-            description="Valuta BEARS per screening disturbi del sonno pediatrico",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 18,
-                        "description": "Età in anni"
-                    },
-                    "bedtime_problems": {
-                        "type": "boolean",
-                        "description": "Problemi di addormentamento"
-                    },
-                    "excessive_daytime_sleepiness": {
-                        "type": "boolean",
-                        "description": "Sonnolenza diurna eccessiva"
-                    },
-                    "awakenings": {
-                        "type": "boolean",
-                        "description": "Risvegli notturni frequenti"
-                    },
-                    "regularity": {
-                        "type": "boolean",
-                        "description": "Regolarità del ciclo sonno-veglia"
-                    },
-                    "snoring": {
-                        "type": "boolean",
-                        "description": "Russamento/problemi respiratori"
-                    }
-                },
-                "required": ["age_years", "bedtime_problems", "excessive_daytime_sleepiness", "awakenings", "regularity", "snoring"]
-            }
-        ),
-        
-        # CRITERI ROME IV AGGIUNTI
-        
-        types.Tool(
-            name="assess_rome4_abdominal_migraine",
-            description="Valuta criteri Rome IV per emicrania addominale pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "episodes_abdominal_pain": {
-                        "type": "boolean",
-                        "description": "Episodi stereotipati di dolore addominale acuto periombelicale"
-                    },
-                    "episodes_duration_hours": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 72,
-                        "description": "Durata tipica degli episodi in ore (1-72)"
-                    },
-                    "normal_between_episodes": {
-                        "type": "boolean",
-                        "description": "Ritorno allo stato di salute normale tra gli episodi"
-                    },
-                    "interferes_activities": {
-                        "type": "boolean",
-                        "description": "Dolore interferisce con attività quotidiane"
-                    },
-                    "associated_symptoms": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["anorexia", "nausea", "vomiting", "headache", "photophobia", "pallor"]
-                        },
-                        "description": "Sintomi associati: anoressia, nausea, vomito, mal di testa, fotofobia, pallore"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "episodes_count": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Numero di episodi negli ultimi 6 mesi"
-                    }
-                },
-                "required": ["episodes_abdominal_pain", "episodes_duration_hours", "normal_between_episodes", "interferes_activities", "associated_symptoms", "symptoms_duration_months", "episodes_count"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_aerophagia",
-            description="Valuta criteri Rome IV per aerofagia pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "air_swallowing": {
-                        "type": "boolean",
-                        "description": "Deglutizione eccessiva di aria"
-                    },
-                    "abdominal_distension": {
-                        "type": "boolean",
-                        "description": "Distensione addominale dovuta all'aria"
-                    },
-                    "repetitive_belching": {
-                        "type": "boolean",
-                        "description": "Eruttazione ripetuta"
-                    },
-                    "repetitive_flatulence": {
-                        "type": "boolean",
-                        "description": "Flatulenza ripetuta"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "symptoms_frequency_weekly": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 7,
-                        "description": "Frequenza dei sintomi (giorni/settimana)"
-                    },
-                    "other_gi_conditions": {
-                        "type": "boolean",
-                        "description": "Presenza di altre condizioni gastrointestinali che spiegano i sintomi"
-                    }
-                },
-                "required": ["air_swallowing", "abdominal_distension", "repetitive_belching", "repetitive_flatulence", "symptoms_duration_months", "symptoms_frequency_weekly", "other_gi_conditions"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_constipation",
-            description="Valuta criteri Rome IV per stipsi funzionale pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bowel_movements_weekly": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 21,
-                        "description": "Numero di evacuazioni settimanali"
-                    },
-                    "fecal_incontinence": {
-                        "type": "boolean",
-                        "description": "Almeno 1 episodio di incontinenza fecale settimanale (in bambini continenti)"
-                    },
-                    "stool_retention": {
-                        "type": "boolean",
-                        "description": "Storia di posture o comportamenti di ritenzione fecale"
-                    },
-                    "painful_defecation": {
-                        "type": "boolean",
-                        "description": "Storia di defecazione dolorosa o difficoltosa"
-                    },
-                    "large_fecal_mass": {
-                        "type": "boolean",
-                        "description": "Presenza di grande massa fecale nel retto"
-                    },
-                    "large_diameter_stools": {
-                        "type": "boolean",
-                        "description": "Storia di feci di grande diametro"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "toilet_trained": {
-                        "type": "boolean",
-                        "description": "Bambino ha completato training toilette"
-                    }
-                },
-                "required": ["bowel_movements_weekly", "fecal_incontinence", "stool_retention", "painful_defecation", "large_fecal_mass", "large_diameter_stools", "symptoms_duration_months"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_cyclic_vomiting",
-            description="Valuta criteri Rome IV per sindrome del vomito ciclico pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stereotypical_episodes": {
-                        "type": "boolean",
-                        "description": "Episodi stereotipati di vomito intenso"
-                    },
-                    "episodes_duration_hours": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 168,
-                        "description": "Durata tipica degli episodi in ore (1-168)"
-                    },
-                    "episodes_count": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Numero di episodi negli ultimi 12 mesi"
-                    },
-                    "return_to_baseline": {
-                        "type": "boolean",
-                        "description": "Ritorno allo stato di salute normale tra gli episodi"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "vomiting_frequency": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Frequenza del vomito durante gli episodi (numero episodi/ora)"
-                    },
-                    "other_gi_conditions": {
-                        "type": "boolean",
-                        "description": "Presenza di altre condizioni gastrointestinali che spiegano i sintomi"
-                    }
-                },
-                "required": ["stereotypical_episodes", "episodes_duration_hours", "episodes_count", "return_to_baseline", "symptoms_duration_months", "vomiting_frequency", "other_gi_conditions"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_functional_abdominal_pain",
-            description="Valuta criteri Rome IV per dolore addominale funzionale pediatrico - non altrimenti specificato",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "abdominal_pain_frequency": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 7,
-                        "description": "Frequenza del dolore addominale (giorni/settimana)"
-                    },
-                    "continuous_pain": {
-                        "type": "boolean",
-                        "description": "Dolore addominale continuo"
-                    },
-                    "meets_ibs_criteria": {
-                        "type": "boolean",
-                        "description": "Soddisfa criteri per sindrome intestino irritabile"
-                    },
-                    "meets_dyspepsia_criteria": {
-                        "type": "boolean",
-                        "description": "Soddisfa criteri per dispepsia funzionale"
-                    },
-                    "meets_abdominal_migraine_criteria": {
-                        "type": "boolean",
-                        "description": "Soddisfa criteri per emicrania addominale"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "inflammatory_condition": {
-                        "type": "boolean",
-                        "description": "Evidenza di processo infiammatorio, anatomico, metabolico o neoplastico"
-                    }
-                },
-                "required": ["abdominal_pain_frequency", "continuous_pain", "meets_ibs_criteria", "meets_dyspepsia_criteria", "meets_abdominal_migraine_criteria", "symptoms_duration_months", "inflammatory_condition"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_functional_dyspepsia",
-            description="Valuta criteri Rome IV per dispepsia funzionale pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bothersome_postprandial_fullness": {
-                        "type": "boolean",
-                        "description": "Sensazione fastidiosa di pienezza postprandiale"
-                    },
-                    "early_satiety": {
-                        "type": "boolean",
-                        "description": "Sazietà precoce che impedisce di terminare un pasto normale"
-                    },
-                    "epigastric_pain": {
-                        "type": "boolean",
-                        "description": "Dolore epigastrico"
-                    },
-                    "epigastric_burning": {
-                        "type": "boolean",
-                        "description": "Bruciore epigastrico"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "symptoms_frequency_weekly": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 7,
-                        "description": "Frequenza dei sintomi (giorni/settimana)"
-                    },
-                    "organic_disease": {
-                        "type": "boolean",
-                        "description": "Evidenza di malattia organica che spiega i sintomi"
-                    }
-                },
-                "required": ["bothersome_postprandial_fullness", "early_satiety", "epigastric_pain", "epigastric_burning", "symptoms_duration_months", "symptoms_frequency_weekly", "organic_disease"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_functional_nausea_vomiting",
-            description="Valuta criteri Rome IV per nausea e vomito funzionali pediatrici",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bothersome_nausea": {
-                        "type": "boolean",
-                        "description": "Nausea fastidiosa come sintomo predominante"
-                    },
-                    "weekly_vomiting_episodes": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 50,
-                        "description": "Episodi di vomito settimanali"
-                    },
-                    "meal_related": {
-                        "type": "boolean",
-                        "description": "Sintomi regolarmente associati ai pasti"
-                    },
-                    "induced_vomiting": {
-                        "type": "boolean",
-                        "description": "Vomito autoindotto"
-                    },
-                    "meets_eating_disorder_criteria": {
-                        "type": "boolean",
-                        "description": "Soddisfa criteri per disturbo alimentare"
-                    },
-                    "meets_rumination_criteria": {
-                        "type": "boolean",
-                        "description": "Soddisfa criteri per sindrome di ruminazione"
-                    },
-                    "meets_cyclic_vomiting_criteria": {
-                        "type": "boolean",
-                        "description": "Soddisfa criteri per sindrome del vomito ciclico"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "organic_disease": {
-                        "type": "boolean",
-                        "description": "Evidenza di malattia organica che spiega i sintomi"
-                    }
-                },
-                "required": ["bothersome_nausea", "weekly_vomiting_episodes", "meal_related", "induced_vomiting", "meets_eating_disorder_criteria", "meets_rumination_criteria", "meets_cyclic_vomiting_criteria", "symptoms_duration_months", "organic_disease"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_ibs",
-            description="Valuta criteri Rome IV per sindrome dell'intestino irritabile pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "abdominal_pain_days_monthly": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 30,
-                        "description": "Giorni con dolore addominale al mese"
-                    },
-                    "pain_related_to_defecation": {
-                        "type": "boolean",
-                        "description": "Dolore addominale associato alla defecazione"
-                    },
-                    "stool_frequency_change": {
-                        "type": "boolean",
-                        "description": "Dolore associato a cambio nella frequenza delle feci"
-                    },
-                    "stool_form_change": {
-                        "type": "boolean",
-                        "description": "Dolore associato a cambio nella forma/consistenza delle feci"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "predominant_stool_pattern": {
-                        "type": "string",
-                        "enum": ["constipation", "diarrhea", "mixed", "unspecified"],
-                        "description": "Pattern predominante delle feci: constipation, diarrhea, mixed, unspecified"
-                    },
-                    "organic_disease": {
-                        "type": "boolean",
-                        "description": "Evidenza di malattia organica che spiega i sintomi"
-                    }
-                },
-                "required": ["abdominal_pain_days_monthly", "pain_related_to_defecation", "stool_frequency_change", "stool_form_change", "symptoms_duration_months", "predominant_stool_pattern", "organic_disease"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_nonretentive_fecal_incontinence",
-            description="Valuta criteri Rome IV per incontinenza fecale non ritentiva pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "defecation_inappropriate_places": {
-                        "type": "boolean",
-                        "description": "Defecazione in luoghi inappropriati"
-                    },
-                    "fecal_incontinence_frequency": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 30,
-                        "description": "Frequenza incontinenza fecale (giorni/mese)"
-                    },
-                    "developmental_age_at_least_4": {
-                        "type": "boolean",
-                        "description": "Età di sviluppo di almeno 4 anni"
-                    },
-                    "toilet_trained": {
-                        "type": "boolean",
-                        "description": "Bambino ha completato training toilette"
-                    },
-                    "fecal_retention": {
-                        "type": "boolean",
-                        "description": "Evidenza di ritenzione fecale"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "organic_disease": {
-                        "type": "boolean",
-                        "description": "Evidenza di malattia organica che spiega i sintomi"
-                    }
-                },
-                "required": ["defecation_inappropriate_places", "fecal_incontinence_frequency", "developmental_age_at_least_4", "toilet_trained", "fecal_retention", "symptoms_duration_months", "organic_disease"]
-            }
-        ),
-        
-        types.Tool(
-            name="assess_rome4_rumination_syndrome",
-            description="Valuta criteri Rome IV per sindrome di ruminazione pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "repeated_regurgitation": {
-                        "type": "boolean",
-                        "description": "Rigurgito ripetuto e senza sforzo di cibo parzialmente digerito"
-                    },
-                    "regurgitation_not_preceded_by_retching": {
-                        "type": "boolean",
-                        "description": "Rigurgito non preceduto da nausea o conati"
-                    },
-                    "regurgitation_within_30min_after_meal": {
-                        "type": "boolean",
-                        "description": "Inizio entro 30 minuti dal pasto"
-                    },
-                    "regurgitation_not_improved_with_acid_suppression": {
-                        "type": "boolean",
-                        "description": "Non migliora con terapie standard per reflusso"
-                    },
-                    "symptoms_duration_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 60,
-                        "description": "Durata dei sintomi in mesi"
-                    },
-                    "symptoms_frequency_weekly": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 7,
-                        "description": "Frequenza dei sintomi (giorni/settimana)"
-                    },
-                    "organic_disease": {
-                        "type": "boolean",
-                        "description": "Evidenza di malattia organica che spiega i sintomi"
-                    }
-                },
-                "required": ["repeated_regurgitation", "regurgitation_not_preceded_by_retching", "regurgitation_within_30min_after_meal", "regurgitation_not_improved_with_acid_suppression", "symptoms_duration_months", "symptoms_frequency_weekly", "organic_disease"]
-            }
-        ),
-        types.Tool(
-            name="assess_brue_criteria",
-            description="Valuta i criteri per Brief Resolved Unexplained Events (BRUE) nei lattanti e classifica il rischio",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_less_than_1_year": {
-                        "type": "boolean",
-                        "description": "Età <1 anno"
-                    },
-                    "event_brief": {
-                        "type": "boolean",
-                        "description": "Evento breve (<1 minuto) e risolto completamente"
-                    },
-                    "no_explanation": {
-                        "type": "boolean",
-                        "description": "Nessuna spiegazione identificabile dopo valutazione"
-                    },
-                    "event_features": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": [
-                                "cyanosis", "pallor", "absent_breathing", "marked_change_in_tone", 
-                                "altered_responsiveness"
-                            ]
-                        },
-                        "description": "Caratteristiche dell'evento (cianosi, pallore, respiro assente, alterato tono, alterata responsività)"
-                    },
-                    "age_less_than_2_months": {
-                        "type": "boolean",
-                        "description": "Età <2 mesi"
-                    },
-                    "prematurity": {
-                        "type": "boolean",
-                        "description": "Prematurità <32 settimane o età <45 settimane post-concezionali"
-                    },
-                    "event_duration_gt_1_min": {
-                        "type": "boolean",
-                        "description": "Durata evento >1 minuto"
-                    },
-                    "multiple_events": {
-                        "type": "boolean",
-                        "description": "Eventi multipli"
-                    },
-                    "cpr_required": {
-                        "type": "boolean",
-                        "description": "RCP richiesta da personale sanitario"
-                    }
-                },
-                "required": ["age_less_than_1_year", "event_brief", "no_explanation", "event_features"]
+from tools.registry import register_tool
+from tools.results import ToolResult
+
+# Gli assessment restituiscono un prefisso d'errore specifico
+assessment_tool = partial(register_tool, error_prefix="Errore nell'assessment")
+
+DEHYDRATION_REFERENCE = """Note cliniche:
+- Controllare peso se disponibile per calcoli precisi
+- Nei lattanti <6 mesi la disidratazione può essere più severa
+- Monitorare diuresi, sete, comportamento
+- Rivalutare ogni 2-4 ore durante trattamento
+
+Segni di allarme per ospedalizzazione:
+- Vomito persistente (non tollera SRO)
+- Diarrea profusa (>10 scariche/die)
+- Febbre alta persistente
+- Segni di shock (ipotensione, tachicardia)
+"""
+
+@assessment_tool(types.Tool(
+    name="assess_dehydration",
+    description="Valuta il grado di disidratazione nel bambino usando parametri clinici",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "general_appearance": {
+                "type": "string",
+                "enum": ["normal", "restless_thirsty", "lethargic_unconscious"],
+                "description": "Aspetto generale: normal, restless_thirsty, lethargic_unconscious"
+            },
+            "eyes": {
+                "type": "string",
+                "enum": ["normal", "slightly_sunken", "very_sunken"],
+                "description": "Occhi: normal, slightly_sunken, very_sunken"
+            },
+            "tears": {
+                "type": "string",
+                "enum": ["present", "decreased", "absent"],
+                "description": "Lacrime: present, decreased, absent"
+            },
+            "mouth_tongue": {
+                "type": "string",
+                "enum": ["moist", "sticky", "dry"],
+                "description": "Bocca e lingua: moist, sticky, dry"
+            },
+            "thirst": {
+                "type": "string",
+                "enum": ["drinks_normal", "eager_to_drink", "unable_to_drink"],
+                "description": "Sete: drinks_normal, eager_to_drink, unable_to_drink"
+            },
+            "skin_pinch": {
+                "type": "string",
+                "enum": ["normal", "slow", "very_slow"],
+                "description": "Pinch test: normal (<2sec), slow (2-3sec), very_slow (>3sec)"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi (0-216 mesi = 0-18 anni)"
             }
-        )
-    
-    ]
-def handle_assessment_tools(name: str, arguments: dict):
-    """Gestisce gli assessment clinici"""
-    try:
-        if name == "assess_dehydration":
-            return _assess_dehydration(arguments)
-        elif name == "assess_pain_scale":
-            return _assess_pain_scale(arguments)
-        elif name == "assess_nutritional_status":
-            return _assess_nutritional_status(arguments)
-        elif name == "assess_developmental_milestones":
-            return _assess_developmental_milestones(arguments)
-        elif name == "assess_asthma_control":
-            return _assess_asthma_control(arguments)
-        elif name == "assess_heads_ed":
-            return _assess_heads_ed(arguments)
-        elif name == "assess_pediatric_sleep":
-            return _assess_pediatric_sleep(arguments)
-        elif name == "assess_rome4_abdominal_migraine":
-            return _assess_rome4_abdominal_migraine(arguments)
-        elif name == "assess_rome4_aerophagia":
-            return _assess_rome4_aerophagia(arguments)
-        elif name == "assess_rome4_constipation":
-            return _assess_rome4_constipation(arguments)
-        elif name == "assess_rome4_cyclic_vomiting":
-            return _assess_rome4_cyclic_vomiting(arguments)
-        elif name == "assess_rome4_functional_abdominal_pain":
-            return _assess_rome4_functional_abdominal_pain(arguments)
-        elif name == "assess_rome4_functional_dyspepsia":
-            return _assess_rome4_functional_dyspepsia(arguments)
-        elif name == "assess_rome4_functional_nausea_vomiting":
-            return _assess_rome4_functional_nausea_vomiting(arguments)
-        elif name == "assess_rome4_ibs":
-            return _assess_rome4_ibs(arguments)
-        elif name == "assess_rome4_nonretentive_fecal_incontinence":
-            return _assess_rome4_nonretentive_fecal_incontinence(arguments)
-        elif name == "assess_rome4_rumination_syndrome":
-            return _assess_rome4_rumination_syndrome(arguments)
-        # Nuovi strumenti aggiunti
-        elif name == "assess_brue_criteria":
-            return _assess_brue_criteria(arguments)
-        else:
-            raise ValueError(f"Assessment non implementato: {name}")
-    except Exception as e:
-        return [types.TextContent(type="text", text=f"Errore nell'assessment: {str(e)}")]
+        },
+        "required": ["general_appearance", "eyes", "tears", "mouth_tongue", "thirst", "skin_pinch", "age_months"]
+    }
+), reference=DEHYDRATION_REFERENCE)
 def _assess_dehydration(args):
     """Valuta il grado di disidratazione secondo WHO/UNICEF"""
     
@@ -955,7 +142,8 @@ def _assess_dehydration(args):
     weight_estimate = "Non specificato"
     sro_volume = "Non calcolabile senza peso"
     
-    result = f"""Valutazione Disidratazione (WHO/UNICEF)
+    def render():
+        return f"""Valutazione Disidratazione (WHO/UNICEF)
 ========================================
 Età paziente: {age_months} mesi
 Punteggio totale: {total_score}/12
@@ -968,22 +156,62 @@ Parametri valutati:
 {chr(10).join(details)}
 
 Trattamento raccomandato:
-{management}
+{management}"""
 
-Note cliniche:
-- Controllare peso se disponibile per calcoli precisi
-- Nei lattanti <6 mesi la disidratazione può essere più severa
-- Monitorare diuresi, sete, comportamento
-- Rivalutare ogni 2-4 ore durante trattamento
+    return ToolResult({
+        "total_score": total_score,
+        "dehydration_grade": dehydration_grade,
+        "fluid_loss": fluid_loss,
+        "who_plan": who_plan
+    }, render)
 
-Segni di allarme per ospedalizzazione:
-- Vomito persistente (non tollera SRO)
-- Diarrea profusa (>10 scariche/die)
-- Febbre alta persistente
-- Segni di shock (ipotensione, tachicardia)
+PAIN_SCALE_REFERENCE = """Note per la valutazione:
+- Valutare dolore a riposo e durante attività
+- Documentare intensità prima e dopo interventi
+- Considerare fattori culturali e familiari
+- Coinvolgere i genitori nella valutazione
+- Rivalutare regolarmente l'efficacia degli interventi
+
+Targets terapeutici:
+- Dolore acuto: <4/10 o assenza pianto/distress
+- Dolore procedurale: <6/10 con interventi appropriati
+- Dolore cronico: funzionalità e qualità di vita
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_pain_scale",
+    description="Raccomanda la scala del dolore più appropriata basata su età e capacità comunicative",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi (0-216 mesi = 0-18 anni)"
+            },
+            "cognitive_ability": {
+                "type": "string",
+                "enum": ["normal", "delayed", "unable_to_communicate"],
+                "description": "Capacità cognitive: normal, delayed, unable_to_communicate"
+            },
+            "pain_type": {
+                "type": "string",
+                "enum": ["acute", "chronic", "postoperative"],
+                "description": "Tipo di dolore: acute, chronic, postoperative"
+            },
+            "current_pain_indicators": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["crying", "facial_expression", "body_posture", "movement", "verbal_complaint", "sleep_disturbance", "feeding_difficulty"]
+                },
+                "description": "Indicatori di dolore presenti"
+            }
+        },
+        "required": ["age_months", "cognitive_ability", "pain_type"]
+    }
+), reference=PAIN_SCALE_REFERENCE)
 def _assess_pain_scale(args):
     """Raccomanda la scala del dolore più appropriata"""
     
@@ -1050,7 +278,8 @@ def _assess_pain_scale(args):
     if age_months < 6:
         special_considerations.append("• Nei neonati pretermine usare scale specifiche (PIPP)")
     
-    result = f"""Raccomandazione Scala del Dolore
+    def render():
+        return f"""Raccomandazione Scala del Dolore
 =================================
 Paziente: {age_years:.1f} anni ({age_months} mesi)
 Capacità cognitive: {cognitive_ability.replace('_', ' ')}
@@ -1068,22 +297,81 @@ Scale alternative per età:
 - 7+ anni: NRS 0-10, VAS, Wong-Baker FACES
 
 Considerazioni speciali:
-{chr(10).join(special_considerations) if special_considerations else "• Nessuna particolare"}
+{chr(10).join(special_considerations) if special_considerations else "• Nessuna particolare"}"""
 
-Note per la valutazione:
-- Valutare dolore a riposo e durante attività
-- Documentare intensità prima e dopo interventi
-- Considerare fattori culturali e familiari
-- Coinvolgere i genitori nella valutazione
-- Rivalutare regolarmente l'efficacia degli interventi
+    return ToolResult({
+        "recommended_scale": recommended_scale,
+        "description": description
+    }, render)
 
-Targets terapeutici:
-- Dolore acuto: <4/10 o assenza pianto/distress
-- Dolore procedurale: <6/10 con interventi appropriati
-- Dolore cronico: funzionalità e qualità di vita
+NUTRITIONAL_STATUS_REFERENCE = """Valutazione completa dovrebbe includere:
+- Antropometria (peso, altezza, BMI, circonferenze)
+- Curve di crescita e velocità crescita
+- Anamnesi alimentare (diario alimentare 3-7 giorni)
+- Esame obiettivo (segni carenza specifiche)
+- Laboratorio se indicato (albumina, prealbumina, transferrina)
+
+Indicatori antropometrici chiave:
+- Peso per età (sottopeso se <3° percentile)
+- Altezza per età (stunting se <3° percentile)  
+- Peso per altezza o BMI (wasting se <3° percentile)
+- Velocità di crescita (crossing percentili)
+
+Red flags per malnutrizione:
+- Perdita >5% peso in 1 mese
+- Crossing >2 percentili in 6 mesi
+- Segni clinici carenze vitaminiche/minerali
+- Ritardo sviluppo psicomotorio
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_nutritional_status",
+    description="Valuta lo stato nutrizionale pediatrico con parametri clinici",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi"
+            },
+            "recent_weight_loss": {
+                "type": "boolean",
+                "description": "Perdita di peso recente (ultimo mese)"
+            },
+            "poor_appetite": {
+                "type": "boolean",
+                "description": "Appetito ridotto persistente"
+            },
+            "feeding_difficulties": {
+                "type": "boolean",
+                "description": "Difficoltà alimentari (suzione, deglutizione)"
+            },
+            "growth_faltering": {
+                "type": "boolean",
+                "description": "Faltering di crescita (crossing percentili)"
+            },
+            "muscle_wasting": {
+                "type": "boolean",
+                "description": "Perdita massa muscolare visibile"
+            },
+            "subcutaneous_fat_loss": {
+                "type": "boolean",
+                "description": "Perdita grasso sottocutaneo"
+            },
+            "edema_present": {
+                "type": "boolean",
+                "description": "Edema presente"
+            },
+            "chronic_disease": {
+                "type": "boolean",
+                "description": "Malattia cronica presente"
+            }
+        },
+        "required": ["age_months", "recent_weight_loss", "poor_appetite", "feeding_difficulties", "growth_faltering", "muscle_wasting", "subcutaneous_fat_loss", "edema_present", "chronic_disease"]
+    }
+), reference=NUTRITIONAL_STATUS_REFERENCE)
 def _assess_nutritional_status(args):
     """Valuta stato nutrizionale pediatrico"""
     age_months = args.get('age_months')
@@ -1128,7 +416,8 @@ def _assess_nutritional_status(args):
     
     age_years = age_months / 12
     
-    result = f"""Valutazione Stato Nutrizionale Pediatrico
+    def render():
+        return f"""Valutazione Stato Nutrizionale Pediatrico
 =========================================
 Età: {age_years:.1f} anni ({age_months} mesi)
 Fattori di rischio presenti: {risk_factors}/8
@@ -1138,29 +427,78 @@ Raccomandazione: {recommendation}
 Monitoraggio: {monitoring}
 
 Fattori di rischio identificati:
-{chr(10).join(risk_details) if risk_details else '• Nessun fattore di rischio identificato'}
+{chr(10).join(risk_details) if risk_details else '• Nessun fattore di rischio identificato'}"""
 
-Valutazione completa dovrebbe includere:
-- Antropometria (peso, altezza, BMI, circonferenze)
-- Curve di crescita e velocità crescita
-- Anamnesi alimentare (diario alimentare 3-7 giorni)
-- Esame obiettivo (segni carenza specifiche)
-- Laboratorio se indicato (albumina, prealbumina, transferrina)
+    return ToolResult({
+        "risk_factors": risk_factors,
+        "risk_level": risk_level,
+        "recommendation": recommendation,
+        "monitoring": monitoring
+    }, render)
 
-Indicatori antropometrici chiave:
-- Peso per età (sottopeso se <3° percentile)
-- Altezza per età (stunting se <3° percentile)  
-- Peso per altezza o BMI (wasting se <3° percentile)
-- Velocità di crescita (crossing percentili)
+DEVELOPMENTAL_MILESTONES_REFERENCE = """Note importanti:
+- Valutazione basata su milestone semplificati
+- Variabilità individuale normale
+- Considerare fattori ambientali e culturali
+- Screening formale raccomandato se preoccupazioni
+- Early intervention efficace se avviato precocemente
 
-Red flags per malnutrizione:
-- Perdita >5% peso in 1 mese
-- Crossing >2 percentili in 6 mesi
-- Segni clinici carenze vitaminiche/minerali
-- Ritardo sviluppo psicomotorio
+Red flags per riferimento urgente:
+- Perdita abilità già acquisite
+- Ritardo significativo in 2+ domini
+- Assenza linguaggio a 2 anni
+- Comportamenti ripetitivi/stereotipati
+- Mancanza interesse sociale
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_developmental_milestones",
+    description="Valuta raggiungimento tappe sviluppo psicomotorio per età",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 72,
+                "description": "Età in mesi (0-72 mesi)"
+            },
+            "motor_skills": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["head_control", "sits_unsupported", "crawls", "walks_independently", "runs", "jumps", "climbs_stairs", "rides_tricycle"]
+                },
+                "description": "Abilità motorie raggiunte"
+            },
+            "language_skills": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["responds_to_name", "babbles", "first_words", "two_words", "simple_sentences", "follows_commands", "tells_stories"]
+                },
+                "description": "Abilità linguistiche raggiunte"
+            },
+            "social_skills": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["smiles_socially", "stranger_anxiety", "parallel_play", "cooperative_play", "empathy", "shares_toys", "follows_rules"]
+                },
+                "description": "Abilità sociali raggiunte"
+            },
+            "cognitive_skills": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["object_permanence", "cause_effect", "symbolic_play", "sorting_shapes", "counts_to_ten", "draws_person", "understands_time"]
+                },
+                "description": "Abilità cognitive raggiunte"
+            }
+        },
+        "required": ["age_months", "motor_skills", "language_skills", "social_skills", "cognitive_skills"]
+    }
+), reference=DEVELOPMENTAL_MILESTONES_REFERENCE)
 def _assess_developmental_milestones(args):
     """Valuta tappe sviluppo psicomotorio"""
     age_months = args.get('age_months')
@@ -1234,7 +572,8 @@ def _assess_developmental_milestones(args):
     
     age_years = age_months / 12
     
-    result = f"""Valutazione Sviluppo Psicomotorio
+    def render():
+        return f"""Valutazione Sviluppo Psicomotorio
 =================================
 Età: {age_years:.1f} anni ({age_months} mesi)
 
@@ -1254,24 +593,83 @@ Abilità raggiunte per dominio:
 - Motorie: {', '.join(motor_skills) if motor_skills else 'Nessuna specificata'}
 - Linguistiche: {', '.join(language_skills) if language_skills else 'Nessuna specificata'}  
 - Sociali: {', '.join(social_skills) if social_skills else 'Nessuna specificata'}
-- Cognitive: {', '.join(cognitive_skills) if cognitive_skills else 'Nessuna specificata'}
+- Cognitive: {', '.join(cognitive_skills) if cognitive_skills else 'Nessuna specificata'}"""
 
-Note importanti:
-- Valutazione basata su milestone semplificati
-- Variabilità individuale normale
-- Considerare fattori ambientali e culturali
-- Screening formale raccomandato se preoccupazioni
-- Early intervention efficace se avviato precocemente
+    return ToolResult({
+        "overall_assessment": overall_assessment,
+        "recommendation": recommendation,
+        "follow_up": follow_up,
+        "areas_concern": len(areas_concern)
+    }, render)
 
-Red flags per riferimento urgente:
-- Perdita abilità già acquisite
-- Ritardo significativo in 2+ domini
-- Assenza linguaggio a 2 anni
-- Comportamenti ripetitivi/stereotipati
-- Mancanza interesse sociale
+ASTHMA_CONTROL_REFERENCE = """Criteri controllo ottimale (tutti presenti):
+- Sintomi diurni ≤2 giorni/settimana
+- Risvegli notturni ≤2/mese
+- Broncodilatatore ≤2 giorni/settimana
+- Nessuna limitazione attività
+- Nessuna riacutizzazione
+
+Red flags per controllo insufficiente:
+- Sintomi quotidiani
+- Risvegli notturni frequenti (>1/settimana)
+- Uso frequente broncodilatatore (>2/settimana)
+- Limitazione significativa attività
+- Riacutizzazioni multiple
+
+Prossimi passi:
+- Verificare tecnica inalatoria
+- Valutare aderenza terapeutica
+- Identificare trigger ambientali
+- Considerare comorbidità (rinite, MRGE)
+- Educazione paziente/famiglia
+- Piano d'azione scritto personalizzato
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_asthma_control",
+    description="Valuta controllo asma pediatrico usando parametri clinici",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "daytime_symptoms_per_week": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 7,
+                "description": "Giorni con sintomi diurni nell'ultima settimana"
+            },
+            "nighttime_awakenings_per_month": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 30,
+                "description": "Risvegli notturni per asma nell'ultimo mese"
+            },
+            "rescue_inhaler_use_per_week": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 50,
+                "description": "Utilizzi broncodilatatore al bisogno per settimana"
+            },
+            "activity_limitation": {
+                "type": "string",
+                "enum": ["none", "minor", "moderate", "severe"],
+                "description": "Limitazione attività: none, minor, moderate, severe"
+            },
+            "school_absences_asthma": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 30,
+                "description": "Giorni assenza scuola per asma (ultimo mese)"
+            },
+            "recent_exacerbations": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 10,
+                "description": "Riacutizzazioni ultime 4 settimane"
+            }
+        },
+        "required": ["daytime_symptoms_per_week", "nighttime_awakenings_per_month", "rescue_inhaler_use_per_week", "activity_limitation", "school_absences_asthma", "recent_exacerbations"]
+    }
+), reference=ASTHMA_CONTROL_REFERENCE)
 def _assess_asthma_control(args):
     """Valuta controllo dell'asma pediatrico"""
     daytime_symptoms = args.get('daytime_symptoms_per_week', 0)
@@ -1345,7 +743,8 @@ def _assess_asthma_control(args):
         follow_up = "Controllo entro 2-4 settimane"
         color = "Rosso"
     
-    result = f"""Valutazione Controllo Asma Pediatrico
+    def render():
+        return f"""Valutazione Controllo Asma Pediatrico
 ====================================
 Punteggio controllo: {control_score}/13
 
@@ -1360,40 +759,94 @@ Parametri valutati:
 - Uso broncodilatatore: {rescue_inhaler_use}/settimana
 - Limitazione attività: {activity_limitation}
 - Assenze scolastiche: {school_absences}/mese
-- Riacutizzazioni recenti: {recent_exacerbations}/mese
+- Riacutizzazioni recenti: {recent_exacerbations}/mese"""
 
-Criteri controllo ottimale (tutti presenti):
-- Sintomi diurni ≤2 giorni/settimana
-- Risvegli notturni ≤2/mese
-- Broncodilatatore ≤2 giorni/settimana
-- Nessuna limitazione attività
-- Nessuna riacutizzazione
+    return ToolResult({
+        "control_score": control_score,
+        "control_level": control_level,
+        "action": action,
+        "follow_up": follow_up
+    }, render)
 
-Red flags per controllo insufficiente:
-- Sintomi quotidiani
-- Risvegli notturni frequenti (>1/settimana)
-- Uso frequente broncodilatatore (>2/settimana)
-- Limitazione significativa attività
-- Riacutizzazioni multiple
+HEADS_ED_REFERENCE = """Interpretazione punteggi:
+- 0-4: Rischio basso - Follow-up ambulatoriale
+- 5-8: Rischio moderato - Consulenza psichiatrica raccomandata
+- >8: Rischio alto - Consulenza psichiatrica urgente
 
-Prossimi passi:
-- Verificare tecnica inalatoria
-- Valutare aderenza terapeutica
-- Identificare trigger ambientali
-- Considerare comorbidità (rinite, MRGE)
-- Educazione paziente/famiglia
-- Piano d'azione scritto personalizzato
+Note di utilizzo:
+- Validato in pronto soccorso pediatrico
+- Punteggio di ogni item: 0=nessun problema, 1=lieve, 2=moderato/severo
+- Qualsiasi punteggio ≥1 per suicidalità richiede valutazione immediata
+- Prioritizzare items con punteggio 2 per intervento immediato
+- Non sostituisce valutazione clinica completa
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_heads_ed",
+    description="Valuta HEADS-ED per screening rapido salute mentale pediatrica in pronto soccorso",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "home": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Home (ambiente familiare): 0=Supportivo/appropriato, 1=Alcune/lievi preoccupazioni, 2=Caos/conflitti maggiori/unsafe"
+            },
+            "education": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Education (scuola): 0=Andamento bene/supportiva, 1=Alcuni problemi/assenteismo, 2=Fallimento/sospensioni/non frequenta"
+            },
+            "activities_peers": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Activities/Peers (attività/pari): 0=Buone amicizie/attività, 1=Qualche preoccupazione sociale, 2=Isolamento/peer negativi/nessuna attività"
+            },
+            "drugs_alcohol": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Drugs/Alcohol (sostanze): 0=Nessun uso, 1=Sperimentazione/uso occasionale, 2=Uso regolare/problematico"
+            },
+            "suicidality": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Suicidality (suicidalità): 0=Negata, 1=Ideazione senza piano/intento, 2=Ideazione con piano/intento/comportamenti"
+            },
+            "emotions_behavior": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Emotions/Behavior (emozioni/comportamento): 0=Appropriate/stable, 1=Mood/anxiety lievi, 2=Depressione/ansia severe/psicosi/aggressività"
+            },
+            "discharge_resources": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Discharge Resources (risorse dimissione): 0=Supporto familiare adeguato/follow-up, 1=Risorse limitate, 2=Nessun supporto/follow-up"
+            },
+            "age_years": {
+                "type": "number",
+                "minimum": 8,
+                "maximum": 18,
+                "description": "Età in anni (validato per 8-18 anni)"
+            }
+        },
+        "required": ["home", "education", "activities_peers", "drugs_alcohol", "suicidality", "emotions_behavior", "discharge_resources", "age_years"]
+    }
+), reference=HEADS_ED_REFERENCE)
 def _assess_heads_ed(args):
     """Valuta HEADS-ED per screening salute mentale pediatrica in pronto soccorso"""
     home = args.get('home', 0)
     education = args.get('education', 0)
     activities_peers = args.get('activities_peers', 0)
-    drug_use = args.get('drug_use', 0)
-    suicide = args.get('suicide', 0)
-    emotions_behaviors = args.get('emotions_behaviors', 0)
+    drug_use = args.get('drugs_alcohol', 0)
+    suicide = args.get('suicidality', 0)
+    emotions_behaviors = args.get('emotions_behavior', 0)
     discharge_resources = args.get('discharge_resources', 0)
     
     # Calcolo punteggio totale
@@ -1426,29 +879,74 @@ def _assess_heads_ed(args):
     if suicide >= 1:
         suicide_alert = "\n⚠️ ATTENZIONE: Rischio suicidario presente - Valutazione urgente richiesta"
     
-    result = f"""HEADS-ED (Screening Salute Mentale Pediatrica PS)
+    def render():
+        return f"""HEADS-ED (Screening Salute Mentale Pediatrica PS)
 ===============================================
 Punteggio totale: {total_score}/14
 Livello di rischio: {risk_level}
 Disposizione: {disposition}{suicide_alert}
 
 Componenti valutate:
-{chr(10).join(components)}
+{chr(10).join(components)}"""
 
-Interpretazione punteggi:
-- 0-4: Rischio basso - Follow-up ambulatoriale
-- 5-8: Rischio moderato - Consulenza psichiatrica raccomandata
-- >8: Rischio alto - Consulenza psichiatrica urgente
+    return ToolResult({
+        "total_score": total_score,
+        "risk_level": risk_level,
+        "disposition": disposition,
+        "suicide_alert": suicide >= 1
+    }, render)
 
-Note di utilizzo:
-- Validato in pronto soccorso pediatrico
-- Punteggio di ogni item: 0=nessun problema, 1=lieve, 2=moderato/severo
-- Qualsiasi punteggio ≥1 per suicidalità richiede valutazione immediata
-- Prioritizzare items con punteggio 2 per intervento immediato
-- Non sostituisce valutazione clinica completa
+PEDIATRIC_SLEEP_REFERENCE = """Aree valutate (BEARS):
+B = Bedtime problems (problemi addormentamento)
+E = Excessive daytime sleepiness (sonnolenza diurna)
+A = Awakenings (risvegli notturni)
+R = Regularity (regolarità sonno-veglia)
+S = Snoring (russamento/disturbi respiratori)
+
+Note cliniche:
+- Screening semplice per setting ambulatoriale
+- Se ≥3 problemi, valutare impatto su funzionamento
+- Russamento persistente richiede valutazione OSAS
+- Disturbi del sonno spesso correlati a problemi comportamentali
+- Interventi educativi efficaci nella maggior parte dei casi
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_pediatric_sleep",
+    description="Valuta BEARS per screening disturbi del sonno pediatrico",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_years": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 18,
+                "description": "Età in anni"
+            },
+            "bedtime_problems": {
+                "type": "boolean",
+                "description": "Problemi di addormentamento"
+            },
+            "excessive_daytime_sleepiness": {
+                "type": "boolean",
+                "description": "Sonnolenza diurna eccessiva"
+            },
+            "awakenings": {
+                "type": "boolean",
+                "description": "Risvegli notturni frequenti"
+            },
+            "regularity": {
+                "type": "boolean",
+                "description": "Regolarità del ciclo sonno-veglia"
+            },
+            "snoring": {
+                "type": "boolean",
+                "description": "Russamento/problemi respiratori"
+            }
+        },
+        "required": ["age_years", "bedtime_problems", "excessive_daytime_sleepiness", "awakenings", "regularity", "snoring"]
+    }
+), reference=PEDIATRIC_SLEEP_REFERENCE)
 def _assess_pediatric_sleep(args):
     """Valuta BEARS per screening disturbi del sonno pediatrico"""
     age_years = args.get('age_years', 0)
@@ -1509,7 +1007,8 @@ def _assess_pediatric_sleep(args):
         assessment = "DISTURBO SIGNIFICATIVO"
         recommendation = "Valutazione approfondita, considerare referral specialistico"
     
-    result = f"""Screening Disturbi del Sonno Pediatrico (BEARS)
+    def render():
+        return f"""Screening Disturbi del Sonno Pediatrico (BEARS)
 ==========================================
 Età: {age_years} anni
 Problemi identificati: {problems_count}/5
@@ -1522,40 +1021,100 @@ Problemi del sonno:
 
 Pattern normale per età:
 - Ore di sonno raccomandate: {sleep_hours}
-- Pattern tipico: {normal_pattern}
-
-Aree valutate (BEARS):
-B = Bedtime problems (problemi addormentamento)
-E = Excessive daytime sleepiness (sonnolenza diurna)
-A = Awakenings (risvegli notturni)
-R = Regularity (regolarità sonno-veglia)
-S = Snoring (russamento/disturbi respiratori)
+- Pattern tipico: {normal_pattern}"""
 
-Note cliniche:
-- Screening semplice per setting ambulatoriale
-- Se ≥3 problemi, valutare impatto su funzionamento
-- Russamento persistente richiede valutazione OSAS
-- Disturbi del sonno spesso correlati a problemi comportamentali
-- Interventi educativi efficaci nella maggior parte dei casi
-"""
-    return [types.TextContent(type="text", text=result)]
+    return ToolResult({
+        "problems_count": problems_count,
+        "assessment": assessment,
+        "recommendation": recommendation
+    }, render)
 
 # IMPLEMENTAZIONE DEI CRITERI ROME IV
 
-def _assess_rome4_abdominal_migraine(args):
-    """Valuta criteri Rome IV per emicrania addominale pediatrica"""
-    episodes_abdominal_pain = args.get('episodes_abdominal_pain', False)
-    episodes_duration_hours = args.get('episodes_duration_hours', 0)
-    normal_between_episodes = args.get('normal_between_episodes', False)
-    interferes_activities = args.get('interferes_activities', False)
-    associated_symptoms = args.get('associated_symptoms', [])
-    symptoms_duration_months = args.get('symptoms_duration_months', 0)
-    episodes_count = args.get('episodes_count', 0)
-    
-    # Verifica criteri essenziali
-    criteria_met = []
-    criteria_not_met = []
-    
+ROME4_ABDOMINAL_MIGRAINE_REFERENCE = """Criteri Rome IV completi per l'emicrania addominale:
+1. Episodi stereotipati di dolore addominale acuto periombelicale
+2. Episodi separati da settimane/mesi di normalità
+3. Dolore interferisce con attività quotidiane
+4. Almeno 2 dei seguenti sintomi: anoressia, nausea, vomito, mal di testa, fotofobia, pallore
+5. Sintomi presenti per almeno 6 mesi
+6. Almeno 2 episodi di dolore
+
+Diagnosi differenziali da considerare:
+- Malattia infiammatoria intestinale
+- Patologia delle vie biliari
+- Patologia urinaria
+- Dolore addominale funzionale
+- Sindrome intestino irritabile
+
+Note cliniche:
+- Più comune in età scolare (7-12 anni)
+- Spesso familiarità per emicrania
+- Risposta a terapie antiemicraniche
+- Possibile evoluzione in emicrania tipica in adolescenza
+"""
+
+@assessment_tool(types.Tool(
+    name="assess_rome4_abdominal_migraine",
+    description="Valuta criteri Rome IV per emicrania addominale pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "episodes_abdominal_pain": {
+                "type": "boolean",
+                "description": "Episodi stereotipati di dolore addominale acuto periombelicale"
+            },
+            "episodes_duration_hours": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 72,
+                "description": "Durata tipica degli episodi in ore (1-72)"
+            },
+            "normal_between_episodes": {
+                "type": "boolean",
+                "description": "Ritorno allo stato di salute normale tra gli episodi"
+            },
+            "interferes_activities": {
+                "type": "boolean",
+                "description": "Dolore interferisce con attività quotidiane"
+            },
+            "associated_symptoms": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["anorexia", "nausea", "vomiting", "headache", "photophobia", "pallor"]
+                },
+                "description": "Sintomi associati: anoressia, nausea, vomito, mal di testa, fotofobia, pallore"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "episodes_count": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Numero di episodi negli ultimi 6 mesi"
+            }
+        },
+        "required": ["episodes_abdominal_pain", "episodes_duration_hours", "normal_between_episodes", "interferes_activities", "associated_symptoms", "symptoms_duration_months", "episodes_count"]
+    }
+), reference=ROME4_ABDOMINAL_MIGRAINE_REFERENCE)
+def _assess_rome4_abdominal_migraine(args):
+    """Valuta criteri Rome IV per emicrania addominale pediatrica"""
+    episodes_abdominal_pain = args.get('episodes_abdominal_pain', False)
+    episodes_duration_hours = args.get('episodes_duration_hours', 0)
+    normal_between_episodes = args.get('normal_between_episodes', False)
+    interferes_activities = args.get('interferes_activities', False)
+    associated_symptoms = args.get('associated_symptoms', [])
+    symptoms_duration_months = args.get('symptoms_duration_months', 0)
+    episodes_count = args.get('episodes_count', 0)
+    
+    # Verifica criteri essenziali
+    criteria_met = []
+    criteria_not_met = []
+    
     if episodes_abdominal_pain:
         criteria_met.append("• Episodi stereotipati di dolore addominale acuto periombelicale")
     else:
@@ -1617,7 +1176,8 @@ def _assess_rome4_abdominal_migraine(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Emicrania Addominale Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Emicrania Addominale Pediatrica
 =================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -1626,31 +1186,82 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per l'emicrania addominale:
-1. Episodi stereotipati di dolore addominale acuto periombelicale
-2. Episodi separati da settimane/mesi di normalità
-3. Dolore interferisce con attività quotidiane
-4. Almeno 2 dei seguenti sintomi: anoressia, nausea, vomito, mal di testa, fotofobia, pallore
-5. Sintomi presenti per almeno 6 mesi
-6. Almeno 2 episodi di dolore
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
+
+ROME4_AEROPHAGIA_REFERENCE = """Criteri Rome IV completi per l'aerofagia:
+1. Deglutizione eccessiva di aria
+2. Distensione addominale dovuta all'aria
+3. Eruttazione e/o flatulenza ripetuta
+4. Sintomi presenti almeno 2 giorni a settimana
+5. Sintomi presenti per almeno 2 mesi
+6. Sintomi non spiegati da altre condizioni mediche
 
 Diagnosi differenziali da considerare:
-- Malattia infiammatoria intestinale
-- Patologia delle vie biliari
-- Patologia urinaria
-- Dolore addominale funzionale
-- Sindrome intestino irritabile
+- Disturbi funzionali GI (IBS, dispepsia)
+- Malattia da reflusso gastroesofageo
+- Intolleranze alimentari
+- Patologie organiche GI
 
 Note cliniche:
-- Più comune in età scolare (7-12 anni)
-- Spesso familiarità per emicrania
-- Risposta a terapie antiemicraniche
-- Possibile evoluzione in emicrania tipica in adolescenza
+- Spesso associata a situazioni di stress/ansia
+- Può essere inconsapevole o inconscia
+- Più comune in bambini con disturbi del neurosviluppo
+- Approccio terapeutico:
+  * Educazione e rassicurazione
+  * Tecniche comportamentali
+  * Riduzione stress
+  * Considerare supporto psicologico
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_aerophagia",
+    description="Valuta criteri Rome IV per aerofagia pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "air_swallowing": {
+                "type": "boolean",
+                "description": "Deglutizione eccessiva di aria"
+            },
+            "abdominal_distension": {
+                "type": "boolean",
+                "description": "Distensione addominale dovuta all'aria"
+            },
+            "repetitive_belching": {
+                "type": "boolean",
+                "description": "Eruttazione ripetuta"
+            },
+            "repetitive_flatulence": {
+                "type": "boolean",
+                "description": "Flatulenza ripetuta"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "symptoms_frequency_weekly": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 7,
+                "description": "Frequenza dei sintomi (giorni/settimana)"
+            },
+            "other_gi_conditions": {
+                "type": "boolean",
+                "description": "Presenza di altre condizioni gastrointestinali che spiegano i sintomi"
+            }
+        },
+        "required": ["air_swallowing", "abdominal_distension", "repetitive_belching", "repetitive_flatulence", "symptoms_duration_months", "symptoms_frequency_weekly", "other_gi_conditions"]
+    }
+), reference=ROME4_AEROPHAGIA_REFERENCE)
 def _assess_rome4_aerophagia(args):
     """Valuta criteri Rome IV per aerofagia pediatrica"""
     air_swallowing = args.get('air_swallowing', False)
@@ -1718,7 +1329,8 @@ def _assess_rome4_aerophagia(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Aerofagia Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Aerofagia Pediatrica
 =======================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -1727,34 +1339,86 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per l'aerofagia:
-1. Deglutizione eccessiva di aria
-2. Distensione addominale dovuta all'aria
-3. Eruttazione e/o flatulenza ripetuta
-4. Sintomi presenti almeno 2 giorni a settimana
-5. Sintomi presenti per almeno 2 mesi
-6. Sintomi non spiegati da altre condizioni mediche
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
 
-Diagnosi differenziali da considerare:
-- Disturbi funzionali GI (IBS, dispepsia)
-- Malattia da reflusso gastroesofageo
-- Intolleranze alimentari
-- Patologie organiche GI
+ROME4_CONSTIPATION_REFERENCE = """Criteri Rome IV completi per la stipsi funzionale:
+Almeno 2 dei seguenti criteri, presenti per almeno 1 mese:
+1. Meno di 2 defecazioni alla settimana
+2. Almeno 1 episodio di incontinenza fecale alla settimana (dopo acquisizione continenza)
+3. Storia di posture o comportamenti di ritenzione fecale
+4. Storia di defecazione dolorosa o difficile
+5. Presenza di grande massa fecale nel retto
+6. Storia di feci di grande diametro
 
 Note cliniche:
-- Spesso associata a situazioni di stress/ansia
-- Può essere inconsapevole o inconscia
-- Più comune in bambini con disturbi del neurosviluppo
-- Approccio terapeutico:
-  * Educazione e rassicurazione
-  * Tecniche comportamentali
-  * Riduzione stress
-  * Considerare supporto psicologico
+- Nei bambini con continenza, l'incontinenza è quasi sempre secondaria a ritenzione
+- Importante escludere cause organiche, specialmente nei lattanti
+- Anamnesi perinatale e familiare importanti
+- Elementi diagnostici aggiuntivi: DRE, diario evacuativo
+- Trattamento: educazione, dieta, disimpatto se necessario, lassativi
+
+Red flags per cause organiche:
+- Ritardo di crescita
+- Insorgenza molto precoce (<1 mese di vita)
+- Sangue nelle feci senza ragade
+- Febbre o vomito
+- Alterazioni neurologiche
+- Alterazioni alla regione sacrale
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_constipation",
+    description="Valuta criteri Rome IV per stipsi funzionale pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "bowel_movements_weekly": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 21,
+                "description": "Numero di evacuazioni settimanali"
+            },
+            "fecal_incontinence": {
+                "type": "boolean",
+                "description": "Almeno 1 episodio di incontinenza fecale settimanale (in bambini continenti)"
+            },
+            "stool_retention": {
+                "type": "boolean",
+                "description": "Storia di posture o comportamenti di ritenzione fecale"
+            },
+            "painful_defecation": {
+                "type": "boolean",
+                "description": "Storia di defecazione dolorosa o difficoltosa"
+            },
+            "large_fecal_mass": {
+                "type": "boolean",
+                "description": "Presenza di grande massa fecale nel retto"
+            },
+            "large_diameter_stools": {
+                "type": "boolean",
+                "description": "Storia di feci di grande diametro"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "toilet_trained": {
+                "type": "boolean",
+                "description": "Bambino ha completato training toilette"
+            }
+        },
+        "required": ["bowel_movements_weekly", "fecal_incontinence", "stool_retention", "painful_defecation", "large_fecal_mass", "large_diameter_stools", "symptoms_duration_months"]
+    }
+), reference=ROME4_CONSTIPATION_REFERENCE)
 def _assess_rome4_constipation(args):
     """Valuta criteri Rome IV per stipsi funzionale pediatrica"""
     bowel_movements_weekly = args.get('bowel_movements_weekly', 0)
@@ -1818,7 +1482,8 @@ def _assess_rome4_constipation(args):
     if not duration_met:
         criteria_not_met.append(f"• Durata dei sintomi: {symptoms_duration_months} mesi (<1, richiesto ≥1 mese)")
     
-    result = f"""Criteri Rome IV per Stipsi Funzionale Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Stipsi Funzionale Pediatrica
 =============================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -1829,34 +1494,85 @@ Criteri presenti ({criteria_count}/6):
 {'Criteri non soddisfatti:' if criteria_not_met else ''}
 {chr(10).join(criteria_not_met) if criteria_not_met else ''}
 
-Durata dei sintomi: {symptoms_duration_months} mesi (richiesto ≥1 mese)
+Durata dei sintomi: {symptoms_duration_months} mesi (richiesto ≥1 mese)"""
 
-Criteri Rome IV completi per la stipsi funzionale:
-Almeno 2 dei seguenti criteri, presenti per almeno 1 mese:
-1. Meno di 2 defecazioni alla settimana
-2. Almeno 1 episodio di incontinenza fecale alla settimana (dopo acquisizione continenza)
-3. Storia di posture o comportamenti di ritenzione fecale
-4. Storia di defecazione dolorosa o difficile
-5. Presenza di grande massa fecale nel retto
-6. Storia di feci di grande diametro
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_count": criteria_count
+    }, render)
 
-Note cliniche:
-- Nei bambini con continenza, l'incontinenza è quasi sempre secondaria a ritenzione
-- Importante escludere cause organiche, specialmente nei lattanti
-- Anamnesi perinatale e familiare importanti
-- Elementi diagnostici aggiuntivi: DRE, diario evacuativo
-- Trattamento: educazione, dieta, disimpatto se necessario, lassativi
+ROME4_CYCLIC_VOMITING_REFERENCE = """Criteri Rome IV completi per la sindrome del vomito ciclico:
+1. Episodi stereotipati di vomito intenso e acuto
+2. Durata episodi 1 ora - 10 giorni
+3. Almeno 2 episodi in un periodo di 6 mesi
+4. Ritorno allo stato di salute normale tra gli episodi
+5. Sintomi presenti per almeno 6 mesi
+6. Frequenza del vomito durante gli episodi ≥4 volte/ora
+7. Sintomi non spiegati da altre condizioni mediche
 
-Red flags per cause organiche:
-- Ritardo di crescita
-- Insorgenza molto precoce (<1 mese di vita)
-- Sangue nelle feci senza ragade
-- Febbre o vomito
-- Alterazioni neurologiche
-- Alterazioni alla regione sacrale
+Diagnosi differenziali da considerare:
+- Patologia del SNC (tumori, ipertensione endocranica)
+- Patologie metaboliche/endocrine
+- Patologie ostruttive gastrointestinali
+- Disturbi alimentari
+- Malrotazione intestinale/volvolo intermittente
+
+Note cliniche:
+- Spesso esordio stereotipato (stessi orari, stessi sintomi)
+- Tipici prodromi: pallore, letargia, nausea, anoressia
+- Associata a disturbi del movimento (mal d'auto)
+- Spesso familiarità per emicrania
+- Possibili trigger: stress, infezioni, mestruazioni, alimenti
+- Considerare consulenza neurologica
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_cyclic_vomiting",
+    description="Valuta criteri Rome IV per sindrome del vomito ciclico pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "stereotypical_episodes": {
+                "type": "boolean",
+                "description": "Episodi stereotipati di vomito intenso"
+            },
+            "episodes_duration_hours": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 168,
+                "description": "Durata tipica degli episodi in ore (1-168)"
+            },
+            "episodes_count": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Numero di episodi negli ultimi 12 mesi"
+            },
+            "return_to_baseline": {
+                "type": "boolean",
+                "description": "Ritorno allo stato di salute normale tra gli episodi"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "vomiting_frequency": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Frequenza del vomito durante gli episodi (numero episodi/ora)"
+            },
+            "other_gi_conditions": {
+                "type": "boolean",
+                "description": "Presenza di altre condizioni gastrointestinali che spiegano i sintomi"
+            }
+        },
+        "required": ["stereotypical_episodes", "episodes_duration_hours", "episodes_count", "return_to_baseline", "symptoms_duration_months", "vomiting_frequency", "other_gi_conditions"]
+    }
+), reference=ROME4_CYCLIC_VOMITING_REFERENCE)
 def _assess_rome4_cyclic_vomiting(args):
     """Valuta criteri Rome IV per sindrome del vomito ciclico pediatrica"""
     stereotypical_episodes = args.get('stereotypical_episodes', False)
@@ -1930,7 +1646,8 @@ def _assess_rome4_cyclic_vomiting(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Sindrome del Vomito Ciclico Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Sindrome del Vomito Ciclico Pediatrica
 ======================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -1939,34 +1656,82 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per la sindrome del vomito ciclico:
-1. Episodi stereotipati di vomito intenso e acuto
-2. Durata episodi 1 ora - 10 giorni
-3. Almeno 2 episodi in un periodo di 6 mesi
-4. Ritorno allo stato di salute normale tra gli episodi
-5. Sintomi presenti per almeno 6 mesi
-6. Frequenza del vomito durante gli episodi ≥4 volte/ora
-7. Sintomi non spiegati da altre condizioni mediche
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
+
+ROME4_FUNCTIONAL_ABDOMINAL_PAIN_REFERENCE = """Criteri Rome IV completi per dolore addominale funzionale - NOS:
+1. Dolore addominale almeno 4 giorni/settimana o continuo
+2. Non soddisfa criteri per IBS, dispepsia funzionale o emicrania addominale
+3. Sintomi presenti per almeno 2 mesi
+4. Assenza di processi infiammatori, anatomici, metabolici o neoplastici
 
 Diagnosi differenziali da considerare:
-- Patologia del SNC (tumori, ipertensione endocranica)
-- Patologie metaboliche/endocrine
-- Patologie ostruttive gastrointestinali
-- Disturbi alimentari
-- Malrotazione intestinale/volvolo intermittente
+- Sindrome dell'intestino irritabile
+- Dispepsia funzionale
+- Emicrania addominale
+- Malattia infiammatoria intestinale
+- Malattia celiaca
+- Patologie delle vie biliari
+- Patologie urinarie
+- Intolleranze alimentari
 
 Note cliniche:
-- Spesso esordio stereotipato (stessi orari, stessi sintomi)
-- Tipici prodromi: pallore, letargia, nausea, anoressia
-- Associata a disturbi del movimento (mal d'auto)
-- Spesso familiarità per emicrania
-- Possibili trigger: stress, infezioni, mestruazioni, alimenti
-- Considerare consulenza neurologica
+- Diagnosi di esclusione dopo valutazione appropriata
+- Importanza di una buona anamnesi ed esame obiettivo
+- Considerare red flags per patologie organiche
+- Approccio biopsicosociale al trattamento
+- Educazione del paziente e della famiglia
+- Terapia cognitivo-comportamentale spesso efficace
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_functional_abdominal_pain",
+    description="Valuta criteri Rome IV per dolore addominale funzionale pediatrico - non altrimenti specificato",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "abdominal_pain_frequency": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 7,
+                "description": "Frequenza del dolore addominale (giorni/settimana)"
+            },
+            "continuous_pain": {
+                "type": "boolean",
+                "description": "Dolore addominale continuo"
+            },
+            "meets_ibs_criteria": {
+                "type": "boolean",
+                "description": "Soddisfa criteri per sindrome intestino irritabile"
+            },
+            "meets_dyspepsia_criteria": {
+                "type": "boolean",
+                "description": "Soddisfa criteri per dispepsia funzionale"
+            },
+            "meets_abdominal_migraine_criteria": {
+                "type": "boolean",
+                "description": "Soddisfa criteri per emicrania addominale"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "inflammatory_condition": {
+                "type": "boolean",
+                "description": "Evidenza di processo infiammatorio, anatomico, metabolico o neoplastico"
+            }
+        },
+        "required": ["abdominal_pain_frequency", "continuous_pain", "meets_ibs_criteria", "meets_dyspepsia_criteria", "meets_abdominal_migraine_criteria", "symptoms_duration_months", "inflammatory_condition"]
+    }
+), reference=ROME4_FUNCTIONAL_ABDOMINAL_PAIN_REFERENCE)
 def _assess_rome4_functional_abdominal_pain(args):
     """Valuta criteri Rome IV per dolore addominale funzionale pediatrico - non altrimenti specificato"""
     abdominal_pain_frequency = args.get('abdominal_pain_frequency', 0)
@@ -2029,7 +1794,8 @@ def _assess_rome4_functional_abdominal_pain(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Dolore Addominale Funzionale - NOS
+    def render():
+        return f"""Criteri Rome IV per Dolore Addominale Funzionale - NOS
 ======================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -2038,34 +1804,90 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per dolore addominale funzionale - NOS:
-1. Dolore addominale almeno 4 giorni/settimana o continuo
-2. Non soddisfa criteri per IBS, dispepsia funzionale o emicrania addominale
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
+
+ROME4_FUNCTIONAL_DYSPEPSIA_REFERENCE = """Criteri Rome IV completi per dispepsia funzionale:
+1. Uno o più dei seguenti sintomi:
+   - Pienezza postprandiale fastidiosa
+   - Sazietà precoce
+   - Dolore epigastrico
+   - Bruciore epigastrico
+2. Sintomi presenti almeno 4 giorni a settimana
 3. Sintomi presenti per almeno 2 mesi
-4. Assenza di processi infiammatori, anatomici, metabolici o neoplastici
+4. Assenza di malattie organiche che spiegano i sintomi
+
+Sottotipi:
+- Sindrome da distress postprandiale: pienezza postprandiale e/o sazietà precoce
+- Sindrome da dolore epigastrico: dolore e/o bruciore epigastrico
+- Overlap: caratteristiche di entrambi i sottotipi
 
 Diagnosi differenziali da considerare:
-- Sindrome dell'intestino irritabile
-- Dispepsia funzionale
-- Emicrania addominale
-- Malattia infiammatoria intestinale
+- Malattia da reflusso gastroesofageo
+- Gastroparesi
+- Ulcera peptica
 - Malattia celiaca
-- Patologie delle vie biliari
-- Patologie urinarie
-- Intolleranze alimentari
+- Infezione da H. pylori
+- Patologie biliari
+- Pancreatite
 
 Note cliniche:
-- Diagnosi di esclusione dopo valutazione appropriata
-- Importanza di una buona anamnesi ed esame obiettivo
-- Considerare red flags per patologie organiche
-- Approccio biopsicosociale al trattamento
-- Educazione del paziente e della famiglia
-- Terapia cognitivo-comportamentale spesso efficace
+- Considerare endoscopia in presenza di red flags
+- Valutare test per H. pylori
+- Approccio terapeutico basato sul sottotipo
+- Considerare modifiche dietetiche e stile di vita
+- Farmaci: IPP, procinetici, antiacidi
+- Supporto psicologico se componente ansiosa
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_functional_dyspepsia",
+    description="Valuta criteri Rome IV per dispepsia funzionale pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "bothersome_postprandial_fullness": {
+                "type": "boolean",
+                "description": "Sensazione fastidiosa di pienezza postprandiale"
+            },
+            "early_satiety": {
+                "type": "boolean",
+                "description": "Sazietà precoce che impedisce di terminare un pasto normale"
+            },
+            "epigastric_pain": {
+                "type": "boolean",
+                "description": "Dolore epigastrico"
+            },
+            "epigastric_burning": {
+                "type": "boolean",
+                "description": "Bruciore epigastrico"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "symptoms_frequency_weekly": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 7,
+                "description": "Frequenza dei sintomi (giorni/settimana)"
+            },
+            "organic_disease": {
+                "type": "boolean",
+                "description": "Evidenza di malattia organica che spiega i sintomi"
+            }
+        },
+        "required": ["bothersome_postprandial_fullness", "early_satiety", "epigastric_pain", "epigastric_burning", "symptoms_duration_months", "symptoms_frequency_weekly", "organic_disease"]
+    }
+), reference=ROME4_FUNCTIONAL_DYSPEPSIA_REFERENCE)
 def _assess_rome4_functional_dyspepsia(args):
     """Valuta criteri Rome IV per dispepsia funzionale pediatrica"""
     bothersome_postprandial_fullness = args.get('bothersome_postprandial_fullness', False)
@@ -2145,7 +1967,8 @@ def _assess_rome4_functional_dyspepsia(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Dispepsia Funzionale Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Dispepsia Funzionale Pediatrica
 =================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -2155,42 +1978,96 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per dispepsia funzionale:
-1. Uno o più dei seguenti sintomi:
-   - Pienezza postprandiale fastidiosa
-   - Sazietà precoce
-   - Dolore epigastrico
-   - Bruciore epigastrico
-2. Sintomi presenti almeno 4 giorni a settimana
-3. Sintomi presenti per almeno 2 mesi
-4. Assenza di malattie organiche che spiegano i sintomi
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "subtype": subtype,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
+
+ROME4_FUNCTIONAL_NAUSEA_VOMITING_REFERENCE = """Criteri Rome IV completi per nausea e vomito funzionali:
+1. Nausea fastidiosa come sintomo predominante e/o episodi di vomito
+2. Sintomi presenti almeno 2 volte a settimana (nausea) o almeno 1 volta a settimana (vomito)
+3. Non soddisfa criteri per disturbi alimentari, sindrome di ruminazione o vomito ciclico
+4. Vomito non autoindotto
+5. Sintomi presenti per almeno 2 mesi
+6. Assenza di malattie organiche che spiegano i sintomi
 
 Sottotipi:
-- Sindrome da distress postprandiale: pienezza postprandiale e/o sazietà precoce
-- Sindrome da dolore epigastrico: dolore e/o bruciore epigastrico
-- Overlap: caratteristiche di entrambi i sottotipi
+- Nausea funzionale: nausea come sintomo predominante, almeno 2 volte/settimana
+- Vomito funzionale: almeno 1 episodio di vomito/settimana
 
 Diagnosi differenziali da considerare:
 - Malattia da reflusso gastroesofageo
+- Patologie del SNC
+- Patologie metaboliche/endocrine
+- Disturbi alimentari
 - Gastroparesi
-- Ulcera peptica
-- Malattia celiaca
-- Infezione da H. pylori
-- Patologie biliari
-- Pancreatite
+- Patologie delle vie biliari
+- Sindrome da vomito ciclico
+- Sindrome di ruminazione
 
 Note cliniche:
-- Considerare endoscopia in presenza di red flags
-- Valutare test per H. pylori
-- Approccio terapeutico basato sul sottotipo
-- Considerare modifiche dietetiche e stile di vita
-- Farmaci: IPP, procinetici, antiacidi
-- Supporto psicologico se componente ansiosa
+- Considerare relazione con stress/ansia
+- Importante esame neurologico completo
+- Valutare red flags per patologie organiche
+- Approccio terapeutico: farmacologico e psicologico
+- Considerare terapie complementari (agopuntura, biofeedback)
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_functional_nausea_vomiting",
+    description="Valuta criteri Rome IV per nausea e vomito funzionali pediatrici",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "bothersome_nausea": {
+                "type": "boolean",
+                "description": "Nausea fastidiosa come sintomo predominante"
+            },
+            "weekly_vomiting_episodes": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 50,
+                "description": "Episodi di vomito settimanali"
+            },
+            "meal_related": {
+                "type": "boolean",
+                "description": "Sintomi regolarmente associati ai pasti"
+            },
+            "induced_vomiting": {
+                "type": "boolean",
+                "description": "Vomito autoindotto"
+            },
+            "meets_eating_disorder_criteria": {
+                "type": "boolean",
+                "description": "Soddisfa criteri per disturbo alimentare"
+            },
+            "meets_rumination_criteria": {
+                "type": "boolean",
+                "description": "Soddisfa criteri per sindrome di ruminazione"
+            },
+            "meets_cyclic_vomiting_criteria": {
+                "type": "boolean",
+                "description": "Soddisfa criteri per sindrome del vomito ciclico"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "organic_disease": {
+                "type": "boolean",
+                "description": "Evidenza di malattia organica che spiega i sintomi"
+            }
+        },
+        "required": ["bothersome_nausea", "weekly_vomiting_episodes", "meal_related", "induced_vomiting", "meets_eating_disorder_criteria", "meets_rumination_criteria", "meets_cyclic_vomiting_criteria", "symptoms_duration_months", "organic_disease"]
+    }
+), reference=ROME4_FUNCTIONAL_NAUSEA_VOMITING_REFERENCE)
 def _assess_rome4_functional_nausea_vomiting(args):
     """Valuta criteri Rome IV per nausea e vomito funzionali pediatrici"""
     bothersome_nausea = args.get('bothersome_nausea', False)
@@ -2274,7 +2151,8 @@ def _assess_rome4_functional_nausea_vomiting(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Nausea e Vomito Funzionali Pediatrici
+    def render():
+        return f"""Criteri Rome IV per Nausea e Vomito Funzionali Pediatrici
 =====================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -2284,39 +2162,93 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per nausea e vomito funzionali:
-1. Nausea fastidiosa come sintomo predominante e/o episodi di vomito
-2. Sintomi presenti almeno 2 volte a settimana (nausea) o almeno 1 volta a settimana (vomito)
-3. Non soddisfa criteri per disturbi alimentari, sindrome di ruminazione o vomito ciclico
-4. Vomito non autoindotto
-5. Sintomi presenti per almeno 2 mesi
-6. Assenza di malattie organiche che spiegano i sintomi
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "subtype": subtype,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
 
-Sottotipi:
-- Nausea funzionale: nausea come sintomo predominante, almeno 2 volte/settimana
-- Vomito funzionale: almeno 1 episodio di vomito/settimana
+ROME4_IBS_REFERENCE = """Criteri Rome IV completi per IBS:
+1. Dolore addominale almeno 4 giorni al mese
+2. Dolore associato a uno o più dei seguenti:
+   - Defecazione
+   - Cambio nella frequenza delle feci
+   - Cambio nella forma/consistenza delle feci
+3. Sintomi presenti per almeno 2 mesi
+4. Assenza di malattie organiche che spiegano i sintomi
+
+Sottotipi di IBS:
+- IBS-C: Stipsi predominante (>25% feci tipo 1-2 Bristol, <25% tipo 6-7)
+- IBS-D: Diarrea predominante (>25% feci tipo 6-7 Bristol, <25% tipo 1-2)
+- IBS-M: Pattern misto (>25% feci tipo 1-2 e >25% tipo 6-7)
+- IBS-U: Non classificato (criteri IBS soddisfatti ma pattern fecale non classificabile)
 
 Diagnosi differenziali da considerare:
-- Malattia da reflusso gastroesofageo
-- Patologie del SNC
-- Patologie metaboliche/endocrine
-- Disturbi alimentari
-- Gastroparesi
-- Patologie delle vie biliari
-- Sindrome da vomito ciclico
-- Sindrome di ruminazione
+- Malattia infiammatoria intestinale
+- Malattia celiaca
+- Intolleranza al lattosio/fruttosio
+- Stipsi funzionale
+- Allergie alimentari
+- Infezioni gastrointestinali
+- Dolore addominale funzionale
 
 Note cliniche:
-- Considerare relazione con stress/ansia
-- Importante esame neurologico completo
-- Valutare red flags per patologie organiche
-- Approccio terapeutico: farmacologico e psicologico
-- Considerare terapie complementari (agopuntura, biofeedback)
+- Approccio terapeutico:
+  * Educazione e rassicurazione
+  * Modifiche dietetiche (FODMAP)
+  * Gestione dello stress
+  * Farmaci sintomatici specifici per sottotipo
+- Considerare supporto psicologico
+- Follow-up regolare
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_ibs",
+    description="Valuta criteri Rome IV per sindrome dell'intestino irritabile pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "abdominal_pain_days_monthly": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 30,
+                "description": "Giorni con dolore addominale al mese"
+            },
+            "pain_related_to_defecation": {
+                "type": "boolean",
+                "description": "Dolore addominale associato alla defecazione"
+            },
+            "stool_frequency_change": {
+                "type": "boolean",
+                "description": "Dolore associato a cambio nella frequenza delle feci"
+            },
+            "stool_form_change": {
+                "type": "boolean",
+                "description": "Dolore associato a cambio nella forma/consistenza delle feci"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "predominant_stool_pattern": {
+                "type": "string",
+                "enum": ["constipation", "diarrhea", "mixed", "unspecified"],
+                "description": "Pattern predominante delle feci: constipation, diarrhea, mixed, unspecified"
+            },
+            "organic_disease": {
+                "type": "boolean",
+                "description": "Evidenza di malattia organica che spiega i sintomi"
+            }
+        },
+        "required": ["abdominal_pain_days_monthly", "pain_related_to_defecation", "stool_frequency_change", "stool_form_change", "symptoms_duration_months", "predominant_stool_pattern", "organic_disease"]
+    }
+), reference=ROME4_IBS_REFERENCE)
 def _assess_rome4_ibs(args):
     """Valuta criteri Rome IV per sindrome dell'intestino irritabile pediatrica"""
     abdominal_pain_days_monthly = args.get('abdominal_pain_days_monthly', 0)
@@ -2391,7 +2323,8 @@ def _assess_rome4_ibs(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Sindrome dell'Intestino Irritabile Pediatrica (IBS)
+    def render():
+        return f"""Criteri Rome IV per Sindrome dell'Intestino Irritabile Pediatrica (IBS)
 ==================================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -2401,43 +2334,87 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per IBS:
-1. Dolore addominale almeno 4 giorni al mese
-2. Dolore associato a uno o più dei seguenti:
-   - Defecazione
-   - Cambio nella frequenza delle feci
-   - Cambio nella forma/consistenza delle feci
-3. Sintomi presenti per almeno 2 mesi
-4. Assenza di malattie organiche che spiegano i sintomi
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "subtype": predominant_stool_pattern,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
 
-Sottotipi di IBS:
-- IBS-C: Stipsi predominante (>25% feci tipo 1-2 Bristol, <25% tipo 6-7)
-- IBS-D: Diarrea predominante (>25% feci tipo 6-7 Bristol, <25% tipo 1-2)
-- IBS-M: Pattern misto (>25% feci tipo 1-2 e >25% tipo 6-7)
-- IBS-U: Non classificato (criteri IBS soddisfatti ma pattern fecale non classificabile)
+ROME4_NONRETENTIVE_FECAL_INCONTINENCE_REFERENCE = """Criteri Rome IV completi per incontinenza fecale non ritentiva:
+1. Defecazione in luoghi inappropriati al contesto sociale
+2. Almeno un episodio al mese
+3. Età cronologica o di sviluppo di almeno 4 anni
+4. Bambino ha completato training toilette
+5. Assenza di evidenza di ritenzione fecale
+6. Sintomi presenti per almeno 1 mese
+7. Assenza di malattie organiche che spiegano i sintomi
 
 Diagnosi differenziali da considerare:
-- Malattia infiammatoria intestinale
-- Malattia celiaca
-- Intolleranza al lattosio/fruttosio
-- Stipsi funzionale
-- Allergie alimentari
-- Infezioni gastrointestinali
-- Dolore addominale funzionale
+- Stipsi funzionale con incontinenza da overflow
+- Diarrea cronica
+- Disturbi neurogenici dell'intestino
+- Malattie infiammatorie intestinali
+- Disturbi comportamentali
+- Abuso sessuale
 
 Note cliniche:
+- Distinzione chiave da stipsi con overflow: assenza di ritenzione
+- Importante valutazione psicologica e comportamentale
 - Approccio terapeutico:
-  * Educazione e rassicurazione
-  * Modifiche dietetiche (FODMAP)
-  * Gestione dello stress
-  * Farmaci sintomatici specifici per sottotipo
-- Considerare supporto psicologico
-- Follow-up regolare
+  * Educazione famiglia e bambino
+  * Programma di allenamento intestinale
+  * Rinforzo positivo
+  * Terapia comportamentale
+- Considerare stress psicosociale
+- Prognosi generalmente favorevole con intervento precoce
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_nonretentive_fecal_incontinence",
+    description="Valuta criteri Rome IV per incontinenza fecale non ritentiva pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "defecation_inappropriate_places": {
+                "type": "boolean",
+                "description": "Defecazione in luoghi inappropriati"
+            },
+            "fecal_incontinence_frequency": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 30,
+                "description": "Frequenza incontinenza fecale (giorni/mese)"
+            },
+            "developmental_age_at_least_4": {
+                "type": "boolean",
+                "description": "Età di sviluppo di almeno 4 anni"
+            },
+            "toilet_trained": {
+                "type": "boolean",
+                "description": "Bambino ha completato training toilette"
+            },
+            "fecal_retention": {
+                "type": "boolean",
+                "description": "Evidenza di ritenzione fecale"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "organic_disease": {
+                "type": "boolean",
+                "description": "Evidenza di malattia organica che spiega i sintomi"
+            }
+        },
+        "required": ["defecation_inappropriate_places", "fecal_incontinence_frequency", "developmental_age_at_least_4", "toilet_trained", "fecal_retention", "symptoms_duration_months", "organic_disease"]
+    }
+), reference=ROME4_NONRETENTIVE_FECAL_INCONTINENCE_REFERENCE)
 def _assess_rome4_nonretentive_fecal_incontinence(args):
     """Valuta criteri Rome IV per incontinenza fecale non ritentiva pediatrica"""
     defecation_inappropriate_places = args.get('defecation_inappropriate_places', False)
@@ -2517,7 +2494,8 @@ def _assess_rome4_nonretentive_fecal_incontinence(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Incontinenza Fecale Non Ritentiva Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Incontinenza Fecale Non Ritentiva Pediatrica
 ==============================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -2526,38 +2504,89 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per incontinenza fecale non ritentiva:
-1. Defecazione in luoghi inappropriati al contesto sociale
-2. Almeno un episodio al mese
-3. Età cronologica o di sviluppo di almeno 4 anni
-4. Bambino ha completato training toilette
-5. Assenza di evidenza di ritenzione fecale
-6. Sintomi presenti per almeno 1 mese
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
+
+ROME4_RUMINATION_SYNDROME_REFERENCE = """Criteri Rome IV completi per la sindrome di ruminazione:
+1. Rigurgito ripetuto e senza sforzo di cibo parzialmente digerito
+2. Rigurgito non preceduto da nausea o conati
+3. Inizio entro 30 minuti dal pasto
+4. Non migliora con terapie standard per reflusso
+5. Sintomi presenti almeno 2 giorni a settimana
+6. Sintomi presenti per almeno 2 mesi
 7. Assenza di malattie organiche che spiegano i sintomi
 
 Diagnosi differenziali da considerare:
-- Stipsi funzionale con incontinenza da overflow
-- Diarrea cronica
-- Disturbi neurogenici dell'intestino
-- Malattie infiammatorie intestinali
-- Disturbi comportamentali
-- Abuso sessuale
+- Malattia da reflusso gastroesofageo
+- Disturbi della motilità esofagea
+- Acalasia
+- Ernia iatale
+- Stenosi pilorica
+- Gastroparesi
+- Disturbi del comportamento alimentare
+- Sindrome di Sandifer
 
 Note cliniche:
-- Distinzione chiave da stipsi con overflow: assenza di ritenzione
-- Importante valutazione psicologica e comportamentale
+- Osservazione diretta spesso necessaria per la diagnosi
+- Caratteristica contrazione dei muscoli addominali
+- Può verificarsi con o senza consapevolezza
+- Più comune in lattanti e bambini con ritardo dello sviluppo
 - Approccio terapeutico:
-  * Educazione famiglia e bambino
-  * Programma di allenamento intestinale
-  * Rinforzo positivo
+  * Riabilitazione diaframmatica
+  * Tecniche di distrazione durante/dopo i pasti
   * Terapia comportamentale
-- Considerare stress psicosociale
-- Prognosi generalmente favorevole con intervento precoce
+  * Biofeedback
+- Prognosi migliore con intervento multidisciplinare
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_rome4_rumination_syndrome",
+    description="Valuta criteri Rome IV per sindrome di ruminazione pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "repeated_regurgitation": {
+                "type": "boolean",
+                "description": "Rigurgito ripetuto e senza sforzo di cibo parzialmente digerito"
+            },
+            "regurgitation_not_preceded_by_retching": {
+                "type": "boolean",
+                "description": "Rigurgito non preceduto da nausea o conati"
+            },
+            "regurgitation_within_30min_after_meal": {
+                "type": "boolean",
+                "description": "Inizio entro 30 minuti dal pasto"
+            },
+            "regurgitation_not_improved_with_acid_suppression": {
+                "type": "boolean",
+                "description": "Non migliora con terapie standard per reflusso"
+            },
+            "symptoms_duration_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 60,
+                "description": "Durata dei sintomi in mesi"
+            },
+            "symptoms_frequency_weekly": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 7,
+                "description": "Frequenza dei sintomi (giorni/settimana)"
+            },
+            "organic_disease": {
+                "type": "boolean",
+                "description": "Evidenza di malattia organica che spiega i sintomi"
+            }
+        },
+        "required": ["repeated_regurgitation", "regurgitation_not_preceded_by_retching", "regurgitation_within_30min_after_meal", "regurgitation_not_improved_with_acid_suppression", "symptoms_duration_months", "symptoms_frequency_weekly", "organic_disease"]
+    }
+), reference=ROME4_RUMINATION_SYNDROME_REFERENCE)
 def _assess_rome4_rumination_syndrome(args):
     """Valuta criteri Rome IV per sindrome di ruminazione pediatrica"""
     repeated_regurgitation = args.get('repeated_regurgitation', False)
@@ -2633,7 +2662,8 @@ def _assess_rome4_rumination_syndrome(args):
         else:
             recommendation = "Considerare diagnosi alternative"
     
-    result = f"""Criteri Rome IV per Sindrome di Ruminazione Pediatrica
+    def render():
+        return f"""Criteri Rome IV per Sindrome di Ruminazione Pediatrica
 ===================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -2642,41 +2672,92 @@ Criteri soddisfatti:
 {chr(10).join(criteria_met) if criteria_met else '• Nessun criterio soddisfatto'}
 
 Criteri non soddisfatti:
-{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}
+{chr(10).join(criteria_not_met) if criteria_not_met else '• Tutti i criteri soddisfatti'}"""
 
-Criteri Rome IV completi per la sindrome di ruminazione:
-1. Rigurgito ripetuto e senza sforzo di cibo parzialmente digerito
-2. Rigurgito non preceduto da nausea o conati
-3. Inizio entro 30 minuti dal pasto
-4. Non migliora con terapie standard per reflusso
-5. Sintomi presenti almeno 2 giorni a settimana
-6. Sintomi presenti per almeno 2 mesi
-7. Assenza di malattie organiche che spiegano i sintomi
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_met": len(criteria_met),
+        "criteria_not_met": len(criteria_not_met)
+    }, render)
 
-Diagnosi differenziali da considerare:
-- Malattia da reflusso gastroesofageo
-- Disturbi della motilità esofagea
-- Acalasia
-- Ernia iatale
-- Stenosi pilorica
-- Gastroparesi
-- Disturbi del comportamento alimentare
-- Sindrome di Sandifer
+BRUE_CRITERIA_REFERENCE = """Interpretazione:
+- BRUE richiede tutti i seguenti criteri:
+  - Età <1 anno
+  - Evento breve (<1 minuto) e risolto completamente
+  - Nessuna spiegazione dopo valutazione appropriata
+  - ≥1 tra: cianosi/pallore, respiro assente/irregolare, alterato tono muscolare, alterata responsività
+
+- Fattori di alto rischio:
+  - Età <2 mesi
+  - Prematurità
+  - Durata evento >1 minuto
+  - Eventi multipli
+  - RCP richiesta da sanitari
 
 Note cliniche:
-- Osservazione diretta spesso necessaria per la diagnosi
-- Caratteristica contrazione dei muscoli addominali
-- Può verificarsi con o senza consapevolezza
-- Più comune in lattanti e bambini con ritardo dello sviluppo
-- Approccio terapeutico:
-  * Riabilitazione diaframmatica
-  * Tecniche di distrazione durante/dopo i pasti
-  * Terapia comportamentale
-  * Biofeedback
-- Prognosi migliore con intervento multidisciplinare
+- BRUE sostituisce il vecchio termine ALTE (Apparent Life-Threatening Event)
+- BRUE a basso rischio: considerare dimissione senza indagini estese
+- BRUE ad alto rischio: considerare ricovero, monitoraggio e indagini più approfondite
+- Indagini da considerare in BRUE ad alto rischio: ECG, poligrafia, EEG, valutazione reflusso GE
+- Educare sempre i genitori sulla gestione e monitoraggio del bambino
+
+Fonte: Linee guida American Academy of Pediatrics 2016
 """
-    return [types.TextContent(type="text", text=result)]
 
+@assessment_tool(types.Tool(
+    name="assess_brue_criteria",
+    description="Valuta i criteri per Brief Resolved Unexplained Events (BRUE) nei lattanti e classifica il rischio",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_less_than_1_year": {
+                "type": "boolean",
+                "description": "Età <1 anno"
+            },
+            "event_brief": {
+                "type": "boolean",
+                "description": "Evento breve (<1 minuto) e risolto completamente"
+            },
+            "no_explanation": {
+                "type": "boolean",
+                "description": "Nessuna spiegazione identificabile dopo valutazione"
+            },
+            "event_features": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [
+                        "cyanosis", "pallor", "absent_breathing", "marked_change_in_tone",
+                        "altered_responsiveness"
+                    ]
+                },
+                "description": "Caratteristiche dell'evento (cianosi, pallore, respiro assente, alterato tono, alterata responsività)"
+            },
+            "age_less_than_2_months": {
+                "type": "boolean",
+                "description": "Età <2 mesi"
+            },
+            "prematurity": {
+                "type": "boolean",
+                "description": "Prematurità <32 settimane o età <45 settimane post-concezionali"
+            },
+            "event_duration_gt_1_min": {
+                "type": "boolean",
+                "description": "Durata evento >1 minuto"
+            },
+            "multiple_events": {
+                "type": "boolean",
+                "description": "Eventi multipli"
+            },
+            "cpr_required": {
+                "type": "boolean",
+                "description": "RCP richiesta da personale sanitario"
+            }
+        },
+        "required": ["age_less_than_1_year", "event_brief", "no_explanation", "event_features"]
+    }
+), reference=BRUE_CRITERIA_REFERENCE)
 def _assess_brue_criteria(args):
     """Valuta criteri per Brief Resolved Unexplained Events (BRUE)"""
     age_less_than_1_year = args.get('age_less_than_1_year', False)
@@ -2738,7 +2819,8 @@ def _assess_brue_criteria(args):
         recommendation = "Considerare dimissione dopo esame obiettivo normale ed educazione ai genitori."
         risk = "BASSO"
     
-    result = f"""Valutazione Brief Resolved Unexplained Event (BRUE)
+    def render():
+        return f"""Valutazione Brief Resolved Unexplained Event (BRUE)
 ==================================================
 Diagnosi: {diagnosis}
 Rischio: {risk}
@@ -2748,29 +2830,11 @@ Criteri BRUE:
 {chr(10).join(criteria_present) if criteria_present else "• Nessun criterio presente"}
 
 {'Fattori di rischio elevato:' if high_risk_factors else ''}
-{chr(10).join(high_risk_factors) if high_risk_factors else ''}
-
-Interpretazione:
-- BRUE richiede tutti i seguenti criteri:
-  - Età <1 anno
-  - Evento breve (<1 minuto) e risolto completamente
-  - Nessuna spiegazione dopo valutazione appropriata
-  - ≥1 tra: cianosi/pallore, respiro assente/irregolare, alterato tono muscolare, alterata responsività
-
-- Fattori di alto rischio:
-  - Età <2 mesi
-  - Prematurità
-  - Durata evento >1 minuto
-  - Eventi multipli
-  - RCP richiesta da sanitari
-
-Note cliniche:
-- BRUE sostituisce il vecchio termine ALTE (Apparent Life-Threatening Event)
-- BRUE a basso rischio: considerare dimissione senza indagini estese
-- BRUE ad alto rischio: considerare ricovero, monitoraggio e indagini più approfondite
-- Indagini da considerare in BRUE ad alto rischio: ECG, poligrafia, EEG, valutazione reflusso GE
-- Educare sempre i genitori sulla gestione e monitoraggio del bambino
-
-Fonte: Linee guida American Academy of Pediatrics 2016
-"""
-    return [types.TextContent(type="text", text=result)]
\ No newline at end of file
+{chr(10).join(high_risk_factors) if high_risk_factors else ''}"""
+
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "risk": risk,
+        "recommendation": recommendation,
+        "high_risk_factors": len(high_risk_factors)
+    }, render)
\ No newline at end of file
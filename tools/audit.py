@@ -0,0 +1,212 @@
+"""
+Registro di audit delle chiamate ai tool
+Ogni chiamata di un tool registrato produce una riga JSON (tool, argomenti,
+sintesi del risultato, durata, esito) in un file append-only. Sul percorso
+della richiesta la chiamata viene solo accodata in memoria: serializzazione,
+scrittura e fsync avvengono in un thread di fondo, a blocchi di
+AUDIT_BATCH_SIZE righe o ogni AUDIT_FLUSH_INTERVAL secondi, con un solo fsync
+per blocco. Oltre AUDIT_MAX_BYTES il file viene ruotato (.1, .2, ... fino a
+AUDIT_BACKUPS copie); oltre AUDIT_QUEUE_LIMIT righe in attesa le nuove
+chiamate non vengono registrate ma contate, invece di rallentare le risposte.
+
+Con più worker HTTP ogni processo scrive il proprio file ({nome}.{pid}), così
+che rotazione e scritture dei worker non si intreccino.
+Attivo se AUDIT_LOG indica il percorso del file (vedi utils/config.py)
+"""
+import collections
+import json
+import logging
+import os
+import threading
+import time
+
+import mcp.types as types
+from utils import config
+
+logger = logging.getLogger(__name__)
+
+# Sintesi del risultato: dati strutturati fino a questa dimensione, altrimenti solo la loro dimensione
+SUMMARY_MAX_BYTES = 2048
+# Caratteri conservati della prima riga del referto, per i risultati senza dati strutturati
+SUMMARY_TEXT_CHARS = 200
+
+# Processo che ha importato il modulo: nei worker creati con fork il pid è diverso
+_PARENT_PID = os.getpid()
+
+# Encoder riutilizzato per tutte le righe (json.dumps con separatori propri ne crea uno per chiamata)
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+
+def _summary(result) -> str:
+    """Sintesi compatta del risultato MCP in JSON: dati strutturati (se piccoli) o prima riga del testo"""
+    if result is None:
+        return "null"
+    if result.__class__ is types.CallToolResult:
+        if result.structuredContent is not None:
+            # Serializzati una sola volta: la stessa stringa è inserita nella riga
+            data = _encode(result.structuredContent)
+            if len(data) <= SUMMARY_MAX_BYTES:
+                return '{"data":' + data + "}"
+            return '{"data_bytes":%d}' % len(data)
+        result = result.content
+    for block in result:
+        if block.type == "text":
+            return '{"text":' + _encode(block.text.split("\n", 1)[0][:SUMMARY_TEXT_CHARS]) + "}"
+    return "null"
+
+
+def _line(entry: tuple) -> str:
+    """Riga JSON compatta: ts (epoch, s), tool, args, ms, error, result"""
+    timestamp, tool, arguments, seconds, error, result = entry
+    return '{"ts":%.3f,"tool":%s,"args":%s,"ms":%.3f,"error":%s,"result":%s}' % (
+        timestamp, _encode(tool), _encode(arguments), seconds * 1000, "true" if error else "false", _summary(result)
+    )
+
+
+class AuditLog:
+    """Scrittura a blocchi in un thread di fondo, con fsync per blocco e rotazione per dimensione"""
+
+    def __init__(self, path: str, batch_size: int, flush_interval: float, max_bytes: int, backups: int,
+                 queue_limit: int):
+        if batch_size < 1 or queue_limit < 1:
+            raise ValueError("Dimensione del blocco e limite della coda devono essere almeno 1")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue_limit = queue_limit
+        # deque.append è atomico: il percorso della richiesta non prende lock
+        self._queue = collections.deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._file = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.rotations = 0
+        self.failures = 0
+
+    def record(self, tool: str, arguments, seconds: float, error: bool, result) -> None:
+        """Accoda una chiamata (nessun I/O né serializzazione qui)"""
+        queue = self._queue
+        if len(queue) >= self.queue_limit:
+            self.dropped += 1
+            return
+        queue.append((time.time(), tool, arguments, seconds, error, result))
+        if self._thread is None:
+            self._start()
+        if len(queue) >= self.batch_size:
+            self._wakeup.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._stopping:
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._flush()
+        self._flush()
+
+    def _open(self):
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "ab")
+        return self._file
+
+    def _rotate(self) -> None:
+        """audit.jsonl -> audit.jsonl.1 -> ... -> audit.jsonl.{backups} (la copia più vecchia viene eliminata)"""
+        self._file.close()
+        self._file = None
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotations += 1
+
+    def _flush(self) -> None:
+        """Scrive tutte le righe in coda a blocchi di batch_size, con un fsync per blocco"""
+        queue = self._queue
+        while queue:
+            entries = []
+            while queue and len(entries) < self.batch_size:
+                entries.append(queue.popleft())
+            try:
+                data = ("\n".join(map(_line, entries)) + "\n").encode("utf-8")
+                file = self._open()
+                if self.max_bytes > 0 and file.tell() and file.tell() + len(data) > self.max_bytes:
+                    self._rotate()
+                    file = self._open()
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+                self.written += len(entries)
+                self.batches += 1
+            except (OSError, TypeError, ValueError) as e:
+                # Un registro non scrivibile non deve interrompere il servizio: le righe perse sono contate
+                self.failures += len(entries)
+                logger.error("Registro di audit %s: %d chiamate non scritte (%s)", self.path, len(entries), e)
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+
+    def close(self) -> None:
+        """Scrive le chiamate ancora in coda e chiude il file"""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        if thread is not None:
+            self._wakeup.set()
+            thread.join()
+        else:
+            self._flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failures,
+            "batches": self.batches,
+            "rotations": self.rotations
+        }
+
+
+_audit: AuditLog | None = None
+_audit_pid = None
+
+
+def get_audit_log() -> AuditLog | None:
+    """Registro di audit del processo (None se AUDIT_LOG non è impostato)"""
+    global _audit, _audit_pid
+    if not config.AUDIT_LOG:
+        return None
+    pid = os.getpid()
+    if _audit is None or _audit_pid != pid:
+        path = config.AUDIT_LOG if pid == _PARENT_PID else f"{config.AUDIT_LOG}.{pid}"
+        _audit = AuditLog(path, config.AUDIT_BATCH_SIZE, config.AUDIT_FLUSH_INTERVAL, config.AUDIT_MAX_BYTES,
+                          config.AUDIT_BACKUPS, config.AUDIT_QUEUE_LIMIT)
+        _audit_pid = pid
+    return _audit
+
+
+def close_audit_log() -> None:
+    """Svuota la coda su disco allo spegnimento del server"""
+    if _audit is not None and _audit_pid == os.getpid():
+        _audit.close()
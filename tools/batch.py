@@ -0,0 +1,101 @@
+"""
+Esecuzione batch dei tool
+Una sola chiamata MCP applica un tool registrato a molti set di argomenti
+(es. tutti i pazienti di un reparto): ogni elemento viene validato con lo
+schema del tool, gli errori sono riportati per elemento senza interrompere
+il batch e, per i tool con un kernel batch, i calcoli avvengono in un unico
+passaggio; negli altri casi si usano i dati strutturati dell'handler. In
+nessun caso viene formattato il referto testuale di ciascun paziente
+"""
+import json
+
+import mcp.types as types
+from tools.registry import get_registered_tool, register_tool
+from tools.results import ToolResult
+from tools.validation import SchemaValidationError
+
+# Limite di elementi per singola chiamata batch
+MAX_BATCH_ITEMS = 50000
+
+
+def _run_one(entry, args: dict) -> dict:
+    """Esegue un singolo elemento: kernel batch se disponibile, altrimenti i dati strutturati dell'handler"""
+    try:
+        if entry.batch is not None:
+            return {"result": entry.batch([args])[0]}
+        result = entry.handler(args)
+        if isinstance(result, ToolResult):
+            # Solo i dati: il referto testuale non viene mai generato
+            return {"result": result.data}
+        return {"result": {"text": "\n".join(block.text for block in result)}}
+    except Exception as e:
+        return {"error": [{"message": f"{entry.error_prefix}: {str(e)}"}]}
+
+
+def _run_items(entry, items: list[dict]) -> list[dict]:
+    """Esegue gli elementi già validati, nello stesso ordine"""
+    if entry.batch is not None:
+        try:
+            return [{"result": result} for result in entry.batch(items)]
+        except Exception:
+            # Un elemento ha fatto fallire il kernel: si ripete elemento per elemento
+            # per isolare gli errori senza perdere i risultati validi
+            pass
+    return [_run_one(entry, args) for args in items]
+
+
+@register_tool(types.Tool(
+    name="batch",
+    description="Esegue un tool su molti pazienti in una sola chiamata, restituendo risultati ed errori per ciascun elemento (es. PEWS di tutto il reparto)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "tool": {
+                "type": "string",
+                "description": "Nome del tool da eseguire (es. calculate_pews, calculate_bsa, calculate_maintenance_fluids)"
+            },
+            "items": {
+                "type": "array",
+                "items": {"type": "object"},
+                "maxItems": MAX_BATCH_ITEMS,
+                "description": "Lista di oggetti argomento, uno per paziente, conformi allo schema del tool"
+            }
+        },
+        "required": ["tool", "items"]
+    }
+), deterministic=False, report=False, offload=True)
+def _run_batch(args):
+    """Esegue un tool su una lista di argomenti"""
+    name = args['tool']
+    entry = get_registered_tool(name)
+    if entry is None or name == "batch":
+        raise ValueError(f"Strumento non utilizzabile in batch: {name}")
+
+    items = args['items']
+    outcomes = [None] * len(items)
+    valid_indexes = []
+    valid_args = []
+    for index, item in enumerate(items):
+        try:
+            valid_args.append(entry.validate(item))
+            valid_indexes.append(index)
+        except SchemaValidationError as e:
+            outcomes[index] = {"index": index, "error": e.details}
+
+    for index, outcome in zip(valid_indexes, _run_items(entry, valid_args)):
+        outcomes[index] = {"index": index, **outcome}
+
+    failed = sum(1 for outcome in outcomes if "error" in outcome)
+    structured = {
+        "tool": name,
+        "count": len(items),
+        "succeeded": len(items) - failed,
+        "failed": failed,
+        "items": outcomes
+    }
+    # Il JSON testuale è il fallback per i client che non leggono structuredContent
+    text = json.dumps(structured, ensure_ascii=False, separators=(",", ":"))
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=text)],
+        structuredContent=structured
+    )
@@ -0,0 +1,95 @@
+"""
+Cache LRU/TTL dei risultati dei tool
+I tool deterministici sono funzioni pure dei loro argomenti: il risultato MCP
+prodotto (referto già generato e dati strutturati) viene conservato per tool,
+con chiave canonica ricavata dagli argomenti (ordinati e con il tipo di ogni
+valore, così che 20, 20.0 e True restino chiavi distinte come lo sono nei referti).
+Attivabile con RESULT_CACHE_SIZE > 0 (vedi utils/config.py)
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from utils import config
+
+
+def canonical_key(arguments: dict) -> tuple:
+    """Chiave hashable indipendente dall'ordine degli argomenti e sensibile al tipo"""
+    items = tuple(sorted(arguments.items()))
+    classes = tuple([value.__class__ for _, value in items])
+    if list in classes or dict in classes:
+        return tuple((name, _canonical_value(value)) for name, value in items), None
+    return items, classes
+
+
+def _canonical_value(value):
+    if isinstance(value, list):
+        return (list, tuple(_canonical_value(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, canonical_key(value))
+    return (value.__class__, value)
+
+
+class ResultCache:
+    """Cache LRU con scadenza opzionale e contatori di hit/miss/eviction"""
+
+    def __init__(self, max_size: int, ttl: float = 0.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Risultato in cache (None se assente o scaduto)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires = entry
+            if expires and expires < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            expires = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+def cache_for(tool: str, deterministic: bool) -> ResultCache | None:
+    """Cache da associare al tool secondo la configurazione (None se non va messo in cache)"""
+    if not deterministic or config.RESULT_CACHE_SIZE <= 0:
+        return None
+    if config.RESULT_CACHE_TOOLS is not None and tool not in config.RESULT_CACHE_TOOLS:
+        return None
+    return ResultCache(config.RESULT_CACHE_SIZE, config.RESULT_CACHE_TTL)
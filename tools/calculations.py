@@ -4,6 +4,10 @@ BSA - Body Surface Area
 Fluidi di mantenimento secondo Holiday-Segar
 """
 import mcp.types as types
+import numpy as np
+from tools.registry import register_batch, register_tool
+from tools.results import ToolResult
+from utils import blood_pressure, growth, vectorized
 from utils.medical_formulas import (
     calculate_bsa_dubois,
     calculate_bsa_mosteller,
@@ -14,387 +18,46 @@ from utils.medical_formulas import (
     calculate_normal_bp_pediatric,
     calculate_predicted_height,
     calculate_burned_surface_area,
+    calculate_anc,
     calculate_pnfs,
     calculate_pnfs_interpretation,
     calculate_calcium_corrected,
     calculate_bone_mineral_density_zscore_interpretation
 )
 
-def get_calculation_tools():
-    """Restituisce tutti i tool per i calcoli medici"""
-    return [
-        types.Tool(
-            name="calculate_bsa",
-            description="Calcola la superficie corporea (BSA) usando formule di DuBois e Mosteller",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "weight_kg": {
-                        "type": "number",
-                        "minimum": 0.1,
-                        "maximum": 200,
-                        "description": "Peso del paziente in kg"
-                    },
-                    "height_cm": {
-                        "type": "number", 
-                        "minimum": 10,
-                        "maximum": 250,
-                        "description": "Altezza del paziente in cm"
-                    }
-                },
-                "required": ["weight_kg", "height_cm"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_maintenance_fluids",
-            description="Calcola i fluidi di mantenimento secondo il metodo Holiday-Segar",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "weight_kg": {
-                        "type": "number",
-                        "minimum": 0.5,
-                        "maximum": 150,
-                        "description": "Peso del paziente in kg"
-                    }
-                },
-                "required": ["weight_kg"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_creatinine_clearance",
-            description="Calcola clearance della creatinina pediatrica usando formula di Schwartz",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "creatinine_mg_dl": {
-                        "type": "number",
-                        "minimum": 0.1,
-                        "maximum": 10,
-                        "description": "Creatinina sierica in mg/dL"
-                    },
-                    "height_cm": {
-                        "type": "number",
-                        "minimum": 30,
-                        "maximum": 200,
-                        "description": "Altezza in cm"
-                    },
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 18,
-                        "description": "Età in anni"
-                    }
-                },
-                "required": ["creatinine_mg_dl", "height_cm", "age_years"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_bmi_pediatric",
-            description="Calcola BMI pediatrico e valutazione nutrizionale",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "weight_kg": {
-                        "type": "number",
-                        "minimum": 1,
-                        "maximum": 150,
-                        "description": "Peso in kg"
-                    },
-                    "height_cm": {
-                        "type": "number",
-                        "minimum": 40,
-                        "maximum": 200,
-                        "description": "Altezza in cm"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 24,
-                        "maximum": 216,
-                        "description": "Età in mesi (≥24 mesi per BMI)"
-                    }
-                },
-                "required": ["weight_kg", "height_cm", "age_months"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_daily_calories",
-            description="Calcola fabbisogno calorico giornaliero pediatrico",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "weight_kg": {
-                        "type": "number",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "description": "Peso in kg"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 216,
-                        "description": "Età in mesi"
-                    }
-                },
-                "required": ["weight_kg", "age_months"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_normal_blood_pressure",
-            description="Calcola valori normali di pressione arteriosa per età pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 18,
-                        "description": "Età in anni"
-                    },
-                    "height_percentile": {
-                        "type": "integer",
-                        "minimum": 5,
-                        "maximum": 95,
-                        "description": "Percentile di altezza (default 50°)"
-                    }
-                },
-                "required": ["age_years"]
-            }
-        ),
-        
-        # NUOVI STRUMENTI AGGIUNTI
-        
-        types.Tool(
-            name="calculate_predicted_height",
-            description="Calcola l'altezza predetta finale basata sull'altezza dei genitori",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "father_height_cm": {
-                        "type": "number",
-                        "minimum": 140,
-                        "maximum": 220,
-                        "description": "Altezza del padre in cm"
-                    },
-                    "mother_height_cm": {
-                        "type": "number",
-                        "minimum": 140,
-                        "maximum": 200,
-                        "description": "Altezza della madre in cm"
-                    },
-                    "is_male": {
-                        "type": "boolean",
-                        "description": "Sesso del bambino: True=maschio, False=femmina"
-                    }
-                },
-                "required": ["father_height_cm", "mother_height_cm", "is_male"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_burned_surface_area",
-            description="Calcola la superficie corporea ustionata secondo Lund-Browder modificata per età pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 18,
-                        "description": "Età in anni"
-                    },
-                    "weight_kg": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Peso in kg (opzionale, per calcolo fluidi)"
-                    },
-                    "head_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione della testa/collo (0-100%)"
-                    },
-                    "trunk_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione del tronco (0-100%)"
-                    },
-                    "arms_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione delle braccia (0-100%)"
-                    },
-                    "hands_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione delle mani (0-100%)"
-                    },
-                    "legs_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione delle gambe (0-100%)"
-                    },
-                    "feet_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione dei piedi (0-100%)"
-                    },
-                    "genitals_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di ustione dei genitali (0-100%)"
-                    }
-                },
-                "required": ["age_years"]
-            }
-        ),
-        types.Tool(
-            name="calculate_anc",
-            description="Calcola l'Absolute Neutrophil Count (ANC) da WBC e percentuali neutrofili/bande",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wbc_count": {
-                        "type": "number",
-                        "minimum": 0.1,
-                        "description": "Globuli bianchi totali (x10^3/μL)"
-                    },
-                    "neutrophil_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Percentuale di neutrofili segmentati"
-                    },
-                    "bands_percent": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "default": 0,
-                        "description": "Percentuale di bande (opzionale)"
-                    }
-                },
-                "required": ["wbc_count", "neutrophil_percent"]
-            }
-        ),
-        types.Tool(
-            name="calculate_pnfs",
-            description="Calcola il Pediatric NAFLD Fibrosis Score (PNFS) per predire il rischio di fibrosi avanzata in steatosi epatica non alcolica pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "alt_iu_l": {
-                        "type": "number",
-                        "minimum": 5,
-                        "maximum": 1000,
-                        "description": "ALT in IU/L"
-                    },
-                    "alkaline_phosphatase_iu_l": {
-                        "type": "number",
-                        "minimum": 50,
-                        "maximum": 1500,
-                        "description": "Fosfatasi alcalina in IU/L"
-                    },
-                    "platelets_k_ul": {
-                        "type": "number",
-                        "minimum": 20,
-                        "maximum": 999,
-                        "description": "Piastrine in K/μL"
-                    },
-                    "ggt_iu_l": {
-                        "type": "number",
-                        "minimum": 5,
-                        "maximum": 1000,
-                        "description": "GGT in IU/L"
-                    }
-                },
-                "required": ["alt_iu_l", "alkaline_phosphatase_iu_l", "platelets_k_ul", "ggt_iu_l"]
-            }
-        ),
-        types.Tool(
-            name="calculate_pediatric_bone_health",
-            description="Calcola parametri di salute ossea pediatrica (calcio corretto, interpretazione DXA)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calcium_total_mg_dl": {
-                        "type": "number",
-                        "minimum": 5,
-                        "maximum": 15,
-                        "description": "Calcio sierico totale in mg/dL"
-                    },
-                    "albumin_g_dl": {
-                        "type": "number",
-                        "minimum": 1,
-                        "maximum": 6,
-                        "description": "Albumina sierica in g/dL"
-                    },
-                    "bmd_zscore": {
-                        "type": "number",
-                        "minimum": -5,
-                        "maximum": 5,
-                        "description": "Z-score della densità minerale ossea (DXA)"
-                    },
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 18,
-                        "description": "Età in anni"
-                    },
-                    "vitamin_d_ng_ml": {
-                        "type": "number",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "description": "Livello di vitamina D (25-OH) in ng/mL"
-                    }
-                },
-                "required": ["calcium_total_mg_dl", "albumin_g_dl", "age_years"]
+BSA_REFERENCE = """Note cliniche:
+• DuBois: Più accurata per bambini >10 kg
+• Mosteller: Più semplice, adatta per tutti i pesi
+• Normale BSA pediatrica: 0.25-1.8 m²
+
+Utilizzi clinici:
+- Calcolo dosaggi chemioterapici
+- Valutazione funzione renale
+- Parametri emodinamici (IC, GC)
+"""
+
+@register_tool(types.Tool(
+    name="calculate_bsa",
+    description="Calcola la superficie corporea (BSA) usando formule di DuBois e Mosteller",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "weight_kg": {
+                "type": "number",
+                "minimum": 0.1,
+                "maximum": 200,
+                "description": "Peso del paziente in kg"
+            },
+            "height_cm": {
+                "type": "number",
+                "minimum": 10,
+                "maximum": 250,
+                "description": "Altezza del paziente in cm"
             }
-        )
-    ]
-
-
-def handle_calculation_tools(name: str, arguments: dict):
-    """Gestisce i calcoli medici"""
-    try:
-        if name == "calculate_bsa":
-            return _calculate_bsa(arguments)
-        elif name == "calculate_maintenance_fluids":
-            return _calculate_maintenance_fluids(arguments)
-        elif name == "calculate_creatinine_clearance":
-            return _calculate_creatinine_clearance(arguments)
-        elif name == "calculate_bmi_pediatric":
-            return _calculate_bmi_pediatric(arguments)
-        elif name == "calculate_daily_calories":
-            return _calculate_daily_calories(arguments)
-        elif name == "calculate_normal_blood_pressure":
-            return _calculate_normal_blood_pressure(arguments)
-        elif name == "calculate_predicted_height":
-            return _calculate_predicted_height(arguments)
-        elif name == "calculate_burned_surface_area":
-            return _calculate_burned_surface_area(arguments)
-        elif name == "calculate_anc":
-            return _calculate_anc(arguments)
-        # Nuovi strumenti aggiunti
-        elif name == "calculate_pnfs":
-            return _calculate_pnfs(arguments)
-        elif name == "calculate_pediatric_bone_health":
-            return _calculate_pediatric_bone_health(arguments)
-        else:
-            raise ValueError(f"Calcolo non implementato: {name}")
-    except Exception as e:
-        return [types.TextContent(type="text", text=f"Errore nel calcolo: {str(e)}")]
+        },
+        "required": ["weight_kg", "height_cm"]
+    }
+), reference=BSA_REFERENCE)
 def _calculate_bsa(args):
     """Calcola la superficie corporea"""
     weight_kg = args.get('weight_kg')
@@ -416,7 +79,8 @@ def _calculate_bsa(args):
         recommended = "DuBois" 
         recommended_value = bsa_dubois
     
-    result = f"""Calcolo Superficie Corporea (BSA)
+    def render():
+        return f"""Calcolo Superficie Corporea (BSA)
 ==================================
 Parametri inseriti:
 - Peso: {weight_kg} kg
@@ -427,20 +91,60 @@ Risultati:
 - Formula Mosteller: {bsa_mosteller} m²
 
 Formula raccomandata: {recommended}
-BSA raccomandata: {recommended_value} m²
+BSA raccomandata: {recommended_value} m²"""
+
+    return ToolResult({
+        "bsa_dubois": bsa_dubois,
+        "bsa_mosteller": bsa_mosteller,
+        "recommended": recommended,
+        "bsa_m2": recommended_value
+    }, render)
+
+@register_batch("calculate_bsa")
+def _batch_bsa(items):
+    """Kernel batch BSA: DuBois, Mosteller e valore raccomandato per ogni paziente"""
+    weight_kg = vectorized.column(items, 'weight_kg')
+    height_cm = vectorized.column(items, 'height_cm')
+    bsa_dubois = vectorized.calculate_bsa_dubois(weight_kg, height_cm)
+    bsa_mosteller = vectorized.calculate_bsa_mosteller(weight_kg, height_cm)
+    mosteller = weight_kg < 10
+    return vectorized.records(
+        bsa_dubois=bsa_dubois,
+        bsa_mosteller=bsa_mosteller,
+        recommended=np.where(mosteller, "Mosteller", "DuBois"),
+        bsa_m2=np.where(mosteller, bsa_mosteller, bsa_dubois)
+    )
+
+MAINTENANCE_FLUIDS_REFERENCE = """Metodo Holiday-Segar:
+• Primi 10 kg: 100 ml/kg/die
+• Kg 11-20: 50 ml/kg/die aggiuntivi
+• Oltre 20 kg: 20 ml/kg/die aggiuntivi
 
 Note cliniche:
-• DuBois: Più accurata per bambini >10 kg
-• Mosteller: Più semplice, adatta per tutti i pesi
-• Normale BSA pediatrica: 0.25-1.8 m²
+- Valido per bambini sani senza perdite patologiche
+- Aumentare del 10-15% per ogni grado di febbre >38°C
+- Ridurre del 20% in caso di oliguria/anuria
+- Monitorare bilancio idrico e elettroliti
 
-Utilizzi clinici:
-- Calcolo dosaggi chemioterapici
-- Valutazione funzione renale
-- Parametri emodinamici (IC, GC)
+Soluzione standard: Glucosata 5% + NaCl 0.45% + KCl 20 mEq/L
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_maintenance_fluids",
+    description="Calcola i fluidi di mantenimento secondo il metodo Holiday-Segar",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "weight_kg": {
+                "type": "number",
+                "minimum": 0.5,
+                "maximum": 150,
+                "description": "Peso del paziente in kg"
+            }
+        },
+        "required": ["weight_kg"]
+    }
+), reference=MAINTENANCE_FLUIDS_REFERENCE)
 def _calculate_maintenance_fluids(args):
     """Calcola i fluidi di mantenimento Holiday-Segar"""
     weight_kg = args.get('weight_kg')
@@ -454,7 +158,8 @@ def _calculate_maintenance_fluids(args):
     daily_na = round(fluids['daily_ml'] * 0.002)  # ~2 mEq/L
     daily_k = round(fluids['daily_ml'] * 0.002)   # ~2 mEq/L
     
-    result = f"""Fluidi di Mantenimento (Holiday-Segar)
+    def render():
+        return f"""Fluidi di Mantenimento (Holiday-Segar)
 =====================================
 Peso paziente: {weight_kg} kg
 
@@ -465,23 +170,71 @@ Fluidi di mantenimento:
 
 Elettroliti giornalieri (approssimativi):
 - Sodio: {daily_na} mEq/die (~2 mEq/kg/die)
-- Potassio: {daily_k} mEq/die (~2 mEq/kg/die)
+- Potassio: {daily_k} mEq/die (~2 mEq/kg/die)"""
 
-Metodo Holiday-Segar:
-• Primi 10 kg: 100 ml/kg/die
-• Kg 11-20: 50 ml/kg/die aggiuntivi
-• Oltre 20 kg: 20 ml/kg/die aggiuntivi
+    return ToolResult({
+        "daily_ml": fluids['daily_ml'],
+        "hourly_ml": fluids['hourly_ml'],
+        "rate_ml_h": fluids['rate_ml_h'],
+        "daily_na_meq": daily_na,
+        "daily_k_meq": daily_k
+    }, render)
 
-Note cliniche:
-- Valido per bambini sani senza perdite patologiche
-- Aumentare del 10-15% per ogni grado di febbre >38°C
-- Ridurre del 20% in caso di oliguria/anuria
-- Monitorare bilancio idrico e elettroliti
+@register_batch("calculate_maintenance_fluids")
+def _batch_maintenance_fluids(items):
+    """Kernel batch Holiday-Segar: volumi ed elettroliti giornalieri per ogni paziente"""
+    fluids = vectorized.calculate_holiday_segar_fluids(vectorized.column(items, 'weight_kg'))
+    electrolytes = np.rint(fluids['daily_ml'] * 0.002).astype(np.int64)
+    return vectorized.records(
+        daily_ml=fluids['daily_ml'],
+        hourly_ml=fluids['hourly_ml'],
+        rate_ml_h=fluids['rate_ml_h'],
+        daily_na_meq=electrolytes,
+        daily_k_meq=electrolytes
+    )
 
-Soluzione standard: Glucosata 5% + NaCl 0.45% + KCl 20 mEq/L
+CREATININE_CLEARANCE_REFERENCE = """Formula utilizzata:
+- Lattanti (<1 anno): k = 0.45
+- Bambini (1-12 anni): k = 0.55  
+- Adolescenti maschi (>12 anni): k = 0.7
+- CrCl = (k × Altezza) / Creatinina
+
+Classificazione IRC pediatrica:
+• Stadio 1: ≥90 ml/min/1.73m² (normale)
+• Stadio 2: 60-89 ml/min/1.73m² (lieve riduzione)
+• Stadio 3: 30-59 ml/min/1.73m² (moderata riduzione)
+• Stadio 4: 15-29 ml/min/1.73m² (severa riduzione)
+• Stadio 5: <15 ml/min/1.73m² (insufficienza terminale)
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_creatinine_clearance",
+    description="Calcola clearance della creatinina pediatrica usando formula di Schwartz",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "creatinine_mg_dl": {
+                "type": "number",
+                "minimum": 0.1,
+                "maximum": 10,
+                "description": "Creatinina sierica in mg/dL"
+            },
+            "height_cm": {
+                "type": "number",
+                "minimum": 30,
+                "maximum": 200,
+                "description": "Altezza in cm"
+            },
+            "age_years": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 18,
+                "description": "Età in anni"
+            }
+        },
+        "required": ["creatinine_mg_dl", "height_cm", "age_years"]
+    }
+), reference=CREATININE_CLEARANCE_REFERENCE)
 def _calculate_creatinine_clearance(args):
     """Calcola clearance creatinina con formula di Schwartz"""
     creatinine_mg_dl = args.get('creatinine_mg_dl')
@@ -506,7 +259,8 @@ def _calculate_creatinine_clearance(args):
     else:
         interpretation = "NORMALE"
     
-    result = f"""Clearance Creatinina Pediatrica (Schwartz)
+    def render():
+        return f"""Clearance Creatinina Pediatrica (Schwartz)
 =========================================
 Parametri:
 - Creatinina sierica: {creatinine_mg_dl} mg/dL
@@ -515,23 +269,95 @@ Parametri:
 
 Clearance calcolata: {clearance} ml/min/1.73m²
 Range normale: {normal_range}
-Interpretazione: {interpretation}
+Interpretazione: {interpretation}"""
 
-Formula utilizzata:
-- Lattanti (<1 anno): k = 0.45
-- Bambini (1-12 anni): k = 0.55  
-- Adolescenti maschi (>12 anni): k = 0.7
-- CrCl = (k × Altezza) / Creatinina
+    return ToolResult({
+        "clearance_ml_min_173m2": clearance,
+        "normal_range": normal_range,
+        "interpretation": interpretation
+    }, render)
 
-Classificazione IRC pediatrica:
-• Stadio 1: ≥90 ml/min/1.73m² (normale)
-• Stadio 2: 60-89 ml/min/1.73m² (lieve riduzione)
-• Stadio 3: 30-59 ml/min/1.73m² (moderata riduzione)
-• Stadio 4: 15-29 ml/min/1.73m² (severa riduzione)
-• Stadio 5: <15 ml/min/1.73m² (insufficienza terminale)
+@register_batch("calculate_creatinine_clearance")
+def _batch_creatinine_clearance(items):
+    """Kernel batch Schwartz: clearance, range normale e interpretazione per ogni paziente"""
+    age_years = vectorized.column(items, 'age_years')
+    clearance = vectorized.calculate_schwartz_creatinine_clearance(
+        vectorized.column(items, 'creatinine_mg_dl'), vectorized.column(items, 'height_cm'), age_years
+    )
+    return vectorized.records(
+        clearance_ml_min_173m2=clearance,
+        normal_range=np.select(
+            [age_years < 2, age_years < 13],
+            ["50-80 ml/min/1.73m²", "70-120 ml/min/1.73m²"],
+            "90-130 ml/min/1.73m²"
+        ),
+        interpretation=np.select(
+            [clearance < 60, clearance < 90],
+            ["RIDOTTA - Insufficienza renale cronica", "LIEVEMENTE RIDOTTA"],
+            "NORMALE"
+        )
+    )
+
+BMI_PEDIATRIC_REFERENCE = """Note importanti:
+• BMI pediatrico varia con età e sesso
+• Utilizzare curve di crescita CDC/WHO per percentili
+• Valutazione accurata richiede percentili specifici
+• BMI valido da 2 anni in poi
+
+Raccomandazioni per valutazione completa:
+- Curve di crescita peso/altezza
+- Velocità di crescita
+- Valutazione nutrizionale qualitativa
+- Anamnesi alimentare
+
+Con il sesso (is_male) il BMI è valutato sulle curve per età e sesso:
+- WHO (default): <2 DS magrezza, >1 DS sovrappeso, >2 DS obesità (5-19 anni);
+  0-5 anni >1 DS rischio di sovrappeso, >2 DS sovrappeso, >3 DS obesità
+- CDC 2000: <5° sottopeso, 85°-95° sovrappeso, ≥95° obesità
+
+Limiti della valutazione senza sesso:
+- Non considera percentili specifici per età/sesso
+- Classificazione semplificata
+- Richiede interpretazione clinica contestuale
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_bmi_pediatric",
+    description="Calcola BMI pediatrico e valutazione nutrizionale",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "weight_kg": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 150,
+                "description": "Peso in kg"
+            },
+            "height_cm": {
+                "type": "number",
+                "minimum": 40,
+                "maximum": 200,
+                "description": "Altezza in cm"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 24,
+                "maximum": 216,
+                "description": "Età in mesi (≥24 mesi per BMI)"
+            },
+            "is_male": {
+                "type": "boolean",
+                "description": "Sesso (True=maschio, False=femmina): se indicato, z-score e percentile del BMI per età e classificazione WHO/CDC"
+            },
+            "reference": {
+                "type": "string",
+                "enum": ["who", "cdc"],
+                "description": "Curve di riferimento con is_male: who (WHO 2006/2007, default) o cdc (CDC 2000)"
+            }
+        },
+        "required": ["weight_kg", "height_cm", "age_months"]
+    }
+), reference=BMI_PEDIATRIC_REFERENCE)
 def _calculate_bmi_pediatric(args):
     """Calcola BMI pediatrico"""
     weight_kg = args.get('weight_kg')
@@ -540,7 +366,10 @@ def _calculate_bmi_pediatric(args):
     
     bmi = calculate_bmi_pediatric(weight_kg, height_cm)
     age_years = age_months / 12
-    
+
+    if 'is_male' in args:
+        return _bmi_for_age(args, bmi, age_years)
+
     # Classificazione approssimativa (senza curve di crescita precise)
     if age_years < 5:
         if bmi < 14: status = "SOTTOPESO"
@@ -553,34 +382,124 @@ def _calculate_bmi_pediatric(args):
         elif bmi < 25: status = "SOVRAPPESO"
         else: status = "OBESITÀ"
     
-    result = f"""BMI Pediatrico
+    def render():
+        return f"""BMI Pediatrico
 ==============
 Età: {age_years:.1f} anni ({age_months} mesi)
 Peso: {weight_kg} kg
 Altezza: {height_cm} cm
 
 BMI calcolato: {bmi} kg/m²
-Stato nutrizionale: {status} (approssimativo)
+Stato nutrizionale: {status} (approssimativo)"""
 
-Note importanti:
-• BMI pediatrico varia con età e sesso
-• Utilizzare curve di crescita CDC/WHO per percentili
-• Valutazione accurata richiede percentili specifici
-• BMI valido da 2 anni in poi
+    return ToolResult({
+        "bmi": bmi,
+        "status": status
+    }, render)
 
-Raccomandazioni per valutazione completa:
-- Curve di crescita peso/altezza
-- Velocità di crescita
-- Valutazione nutrizionale qualitativa
-- Anamnesi alimentare
+def _bmi_for_age(args, bmi, age_years):
+    """BMI con z-score e percentile per età e sesso (curve LMS WHO/CDC)"""
+    weight_kg = args['weight_kg']
+    height_cm = args['height_cm']
+    age_months = args['age_months']
+    is_male = args['is_male']
+    reference = args.get('reference', 'who')
+    age_days = age_months * growth.DAYS_PER_MONTH
+    # z-score sul BMI non arrotondato
+    result = growth.assess("bmi_for_age", is_male, weight_kg / ((height_cm / 100) ** 2), age_days, age_days, reference)
 
-Limiti di questa valutazione:
-- Non considera percentili specifici per età/sesso
-- Classificazione semplificata
-- Richiede interpretazione clinica contestuale
+    def render():
+        return f"""BMI Pediatrico
+==============
+Età: {age_years:.1f} anni ({age_months} mesi), {'maschio' if is_male else 'femmina'}
+Peso: {weight_kg} kg
+Altezza: {height_cm} cm
+
+BMI calcolato: {bmi} kg/m²
+BMI per età ({reference.upper()}): z {result['zscore']:+.2f} ({result['percentile']}° percentile)
+Stato nutrizionale: {result['status']}"""
+
+    return ToolResult({
+        "bmi": bmi,
+        "status": result['status'],
+        "zscore": result['zscore'],
+        "percentile": result['percentile'],
+        "reference": reference
+    }, render)
+
+@register_batch("calculate_bmi_pediatric")
+def _batch_bmi_pediatric(items):
+    """Kernel batch BMI: BMI e stato nutrizionale (per percentile se il sesso è indicato) per ogni paziente"""
+    weight_kg = vectorized.column(items, 'weight_kg')
+    height_cm = vectorized.column(items, 'height_cm')
+    bmi = vectorized.calculate_bmi_pediatric(weight_kg, height_cm)
+    under_5 = vectorized.column(items, 'age_months') / 12 < 5
+    results = vectorized.records(
+        bmi=bmi,
+        status=np.select(
+            [bmi < np.where(under_5, 14, 16), bmi < np.where(under_5, 17, 22), bmi < np.where(under_5, 18, 25)],
+            ["SOTTOPESO", "NORMALE", "SOVRAPPESO"],
+            "OBESITÀ"
+        )
+    )
+    # Pazienti con il sesso: BMI per età dalle curve, raggruppati per riferimento
+    sexed = [index for index, args in enumerate(items) if 'is_male' in args]
+    if sexed:
+        references = np.array([items[index].get('reference', 'who') for index in sexed], dtype=object)
+        is_male = np.array([items[index]['is_male'] for index in sexed], dtype=np.float64)
+        age_days = vectorized.column(items, 'age_months')[sexed] * growth.DAYS_PER_MONTH
+        raw_bmi = weight_kg[sexed] / ((height_cm[sexed] / 100) ** 2)
+        indexes = np.array(sexed)
+        for reference in set(references.tolist()):
+            rows = references == reference
+            scores = vectorized.calculate_growth_zscore("bmi_for_age", is_male[rows], raw_bmi[rows], age_days[rows],
+                                                        reference)
+            status = vectorized.classify_growth("bmi_for_age", age_days[rows], reference, scores)
+            for index, zscore, percentile, state in zip(indexes[rows].tolist(), scores['zscore'].tolist(),
+                                                        scores['percentile'].tolist(), status.tolist()):
+                results[index].update(status=state, zscore=zscore, percentile=percentile, reference=reference)
+    return results
+
+DAILY_CALORIES_REFERENCE = """Fabbisogno per età:
+• 0-12 mesi: 100-120 kcal/kg/die
+• 1-3 anni: 100 kcal/kg/die
+• 3-10 anni: 70-80 kcal/kg/die
+• >10 anni: 50-60 kcal/kg/die
+
+Note cliniche:
+- Aumentare del 10-15% in caso di febbre
+- Aumentare del 20-50% in malattie acute
+- Ridurre in caso di sedentarietà
+- Personalizzare per attività fisica e crescita
+
+Monitoraggio:
+- Curva di crescita peso/altezza
+- Apporti alimentari effettivi
+- Attività fisica e sviluppo
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_daily_calories",
+    description="Calcola fabbisogno calorico giornaliero pediatrico",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "weight_kg": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 100,
+                "description": "Peso in kg"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi"
+            }
+        },
+        "required": ["weight_kg", "age_months"]
+    }
+), reference=DAILY_CALORIES_REFERENCE)
 def _calculate_daily_calories(args):
     """Calcola fabbisogno calorico giornaliero"""
     weight_kg = args.get('weight_kg')
@@ -594,7 +513,8 @@ def _calculate_daily_calories(args):
     fat_percent = 30  # 30% grassi
     carb_percent = 50  # 50% carboidrati
     
-    result = f"""Fabbisogno Calorico Pediatrico
+    def render():
+        return f"""Fabbisogno Calorico Pediatrico
 ==============================
 Età: {age_years:.1f} anni ({age_months} mesi)
 Peso: {weight_kg} kg
@@ -606,35 +526,92 @@ Fabbisogno calorico:
 Distribuzione raccomandata:
 - Proteine: {protein_g}g/die (~15% delle calorie)
 - Grassi: ~{fat_percent}% delle calorie
-- Carboidrati: ~{carb_percent}% delle calorie
+- Carboidrati: ~{carb_percent}% delle calorie"""
 
-Fabbisogno per età:
-• 0-12 mesi: 100-120 kcal/kg/die
-• 1-3 anni: 100 kcal/kg/die
-• 3-10 anni: 70-80 kcal/kg/die
-• >10 anni: 50-60 kcal/kg/die
+    return ToolResult({
+        "daily_calories": calories_data['daily_calories'],
+        "calories_per_kg": calories_data['calories_per_kg'],
+        "protein_g": protein_g
+    }, render)
 
-Note cliniche:
-- Aumentare del 10-15% in caso di febbre
-- Aumentare del 20-50% in malattie acute
-- Ridurre in caso di sedentarietà
-- Personalizzare per attività fisica e crescita
+@register_batch("calculate_daily_calories")
+def _batch_daily_calories(items):
+    """Kernel batch fabbisogno calorico: kcal/die, kcal/kg e proteine per ogni paziente"""
+    weight_kg = vectorized.column(items, 'weight_kg')
+    calories = vectorized.calculate_daily_calories_pediatric(weight_kg, vectorized.column(items, 'age_months'))
+    return vectorized.records(
+        daily_calories=calories['daily_calories'],
+        calories_per_kg=calories['calories_per_kg'],
+        protein_g=np.rint(weight_kg * 1.2).astype(np.int64)
+    )
 
-Monitoraggio:
-- Curva di crescita peso/altezza
-- Apporti alimentari effettivi
-- Attività fisica e sviluppo
+NORMAL_BLOOD_PRESSURE_REFERENCE = """Regole di stadiazione AAP 2017 (Flynn et al., Pediatrics 2017):
+• 1-12 anni: normale <90° percentile per età, sesso e altezza (percentili NHBPEP 2004, vedi sotto);
+  elevata ≥90° o ≥120/80; stadio 1 ≥95° o ≥130/80; stadio 2 ≥95° + 12 mmHg o ≥140/90
+  (vale la soglia più bassa)
+• ≥13 anni: normale <120/<80; elevata 120-129/<80; stadio 1 130-139/80-89; stadio 2 ≥140/90
+
+Tabelle per sesso, età (1-17 anni) e percentile di altezza (con is_male):
+- Percentili 50°, 90°, 95° e 95° + 12 mmHg dal modello di regressione NHBPEP 2004
+  (Fourth Report): non sono le tabelle AAP 2017, ricalcolate escludendo i bambini
+  in sovrappeso e con valori più bassi; da AAP 2017 vengono solo le regole di
+  stadiazione e le soglie dell'adulto usate come tetto
+- Interpolazione lineare tra età e tra percentili di altezza (5°-95°)
+
+Note importanti:
+- Utilizzare bracciale appropriato (40% circonferenza braccio)
+- Misurare dopo 5 min riposo, seduti
+- Confermare su 3 visite separate
+- Considerare variazioni circadiane
+
+Formula semplificata utilizzata (senza sesso o sotto l'anno di età):
+- Sistolica: 90 + (2 × età in anni)
+- Diastolica: 50 + (1.5 × età in anni)
+
+Per valutazione accurata utilizzare:
+- Tabelle specifiche per sesso, età, altezza
+- Curve di riferimento pediatriche validate
+- Monitoraggio pressorio 24h se indicato
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_normal_blood_pressure",
+    description="Calcola valori normali di pressione arteriosa per età pediatrica (con il sesso: percentili NHBPEP 2004 per età, sesso e altezza)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_years": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 18,
+                "description": "Età in anni"
+            },
+            "height_percentile": {
+                "type": "integer",
+                "minimum": 5,
+                "maximum": 95,
+                "description": "Percentile di altezza (default 50°)"
+            },
+            "is_male": {
+                "type": "boolean",
+                "description": "Sesso (True=maschio, False=femmina): se indicato, percentili 50°/90°/95°/95°+12 per età, sesso e altezza (dal primo anno)"
+            }
+        },
+        "required": ["age_years"]
+    }
+), reference=NORMAL_BLOOD_PRESSURE_REFERENCE)
 def _calculate_normal_blood_pressure(args):
     """Calcola pressione arteriosa normale per età"""
     age_years = args.get('age_years')
     height_percentile = args.get('height_percentile', 50)
-    
+
+    if 'is_male' in args and age_years >= 1:
+        return _blood_pressure_percentiles(args)
+
     bp_data = calculate_normal_bp_pediatric(age_years, height_percentile)
     
-    result = f"""Pressione Arteriosa Normale Pediatrica
+    def render():
+        return f"""Pressione Arteriosa Normale Pediatrica
 ====================================
 Età: {age_years} anni
 Percentile altezza: {height_percentile}°
@@ -645,30 +622,223 @@ Valori normali (approssimativi):
 
 Soglie ipertensione:
 - Sistolica 90° percentile: {bp_data['systolic_90th']} mmHg
-- Diastolica 90° percentile: {bp_data['diastolic_90th']} mmHg
+- Diastolica 90° percentile: {bp_data['diastolic_90th']} mmHg"""
 
-Classificazione ipertensione pediatrica:
-• Normale: <90° percentile per età, sesso, altezza
-• Prehipertensione: 90-95° percentile
-• Ipertensione stadio 1: 95-99° percentile + 5mmHg
-• Ipertensione stadio 2: >99° percentile + 5mmHg
+    return ToolResult({
+        "systolic_normal": bp_data['systolic_normal'],
+        "diastolic_normal": bp_data['diastolic_normal'],
+        "systolic_90th": bp_data['systolic_90th'],
+        "diastolic_90th": bp_data['diastolic_90th']
+    }, render)
 
-Note importanti:
-- Utilizzare bracciale appropriato (40% circonferenza braccio)
-- Misurare dopo 5 min riposo, seduti
-- Confermare su 3 visite separate
-- Considerare variazioni circadiane
+def _percentile_fields(table) -> dict:
+    """Campi dei dati dalle soglie (2, 4) della tabella di un paziente"""
+    (s50, s90, s95, s95_12), (d50, d90, d95, d95_12) = table.tolist()
+    return {
+        "systolic_normal": s50,
+        "diastolic_normal": d50,
+        "systolic_90th": s90,
+        "diastolic_90th": d90,
+        "systolic_95th": s95,
+        "diastolic_95th": d95,
+        "systolic_95th_plus_12": s95_12,
+        "diastolic_95th_plus_12": d95_12
+    }
 
-Formula semplificata utilizzata:
-- Sistolica: 90 + (2 × età in anni)
-- Diastolica: 50 + (1.5 × età in anni)
+def _blood_pressure_percentiles(args):
+    """Percentili di pressione per età, sesso e altezza (tabelle in utils/blood_pressure.py)"""
+    age_years = args['age_years']
+    is_male = args['is_male']
+    height_percentile = args.get('height_percentile', 50)
+    data = _percentile_fields(blood_pressure.percentiles(is_male, age_years, height_percentile))
 
-Per valutazione accurata utilizzare:
-- Tabelle specifiche per sesso, età, altezza
-- Curve di riferimento pediatriche validate
-- Monitoraggio pressorio 24h se indicato
+    def render():
+        return f"""Pressione Arteriosa Normale Pediatrica
+====================================
+Età: {age_years} anni, {'maschio' if is_male else 'femmina'}
+Percentile altezza: {height_percentile}°
+
+Percentili NHBPEP 2004 (mmHg)
+                       Sistolica   Diastolica
+- 50° (normale)        {data['systolic_normal']:>9}   {data['diastolic_normal']:>10}
+- 90° (elevata)        {data['systolic_90th']:>9}   {data['diastolic_90th']:>10}
+- 95° (stadio 1)       {data['systolic_95th']:>9}   {data['diastolic_95th']:>10}
+- 95° + 12 (stadio 2)  {data['systolic_95th_plus_12']:>9}   {data['diastolic_95th_plus_12']:>10}"""
+
+    return ToolResult(data, render)
+
+@register_batch("calculate_normal_blood_pressure")
+def _batch_normal_blood_pressure(items):
+    """Kernel batch pressione arteriosa normale per età di ogni paziente (tabelle per sesso e altezza se indicato)"""
+    age_years = vectorized.column(items, 'age_years')
+    results = vectorized.records(**vectorized.calculate_normal_bp_pediatric(age_years))
+    sexed = np.array([index for index, args in enumerate(items) if 'is_male' in args and args['age_years'] >= 1],
+                     dtype=np.int64)
+    if len(sexed):
+        is_male = np.array([bool(items[index]['is_male']) for index in sexed.tolist()], dtype=np.float64)
+        table = blood_pressure.percentiles(is_male, age_years[sexed], vectorized.column(items, 'height_percentile', 50)[sexed])
+        for index, row in zip(sexed.tolist(), table):
+            results[index] = _percentile_fields(row)
+    return results
+
+def _height_percentile(args) -> float:
+    """Percentile di altezza indicato o calcolato dall'altezza (curve CDC 2000, WHO sotto i 2 anni)"""
+    if 'height_cm' in args:
+        age_days = args['age_years'] * 365.25
+        return growth.calculate_growth_zscore("length_for_age", args['is_male'], args['height_cm'], age_days, "cdc")['percentile']
+    return float(args.get('height_percentile', 50))
+
+@register_tool(types.Tool(
+    name="classify_blood_pressure",
+    description="Classifica una misurazione di pressione arteriosa pediatrica con le regole di stadiazione AAP 2017 (normale, elevata, ipertensione stadio 1 o 2) applicate ai percentili NHBPEP 2004 per età, sesso e percentile di altezza, con le soglie dell'adulto AAP 2017 come tetto e dai 13 anni",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "is_male": {
+                "type": "boolean",
+                "description": "Sesso (True=maschio, False=femmina)"
+            },
+            "age_years": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 18,
+                "description": "Età in anni, anche con decimali"
+            },
+            "systolic_bp": {
+                "type": "integer",
+                "minimum": 40,
+                "maximum": 250,
+                "description": "Pressione sistolica misurata in mmHg"
+            },
+            "diastolic_bp": {
+                "type": "integer",
+                "minimum": 20,
+                "maximum": 150,
+                "description": "Pressione diastolica misurata in mmHg"
+            },
+            "height_percentile": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 99,
+                "description": "Percentile di altezza (default 50°; limitato a 5°-95° come le tabelle)"
+            },
+            "height_cm": {
+                "type": "number",
+                "minimum": 60,
+                "maximum": 200,
+                "description": "Altezza in cm: se indicata il percentile è calcolato sulle curve CDC (sostituisce height_percentile)"
+            }
+        },
+        "required": ["is_male", "age_years", "systolic_bp", "diastolic_bp"]
+    }
+), error_prefix="Errore nella classificazione pressoria", reference=NORMAL_BLOOD_PRESSURE_REFERENCE)
+def _classify_blood_pressure(args):
+    """Classifica la pressione arteriosa (stadiazione AAP 2017 sui percentili NHBPEP 2004)"""
+    is_male = args['is_male']
+    age_years = args['age_years']
+    systolic = args['systolic_bp']
+    diastolic = args['diastolic_bp']
+    height_percentile = _height_percentile(args)
+    result = blood_pressure.classify(is_male, age_years, systolic, diastolic, height_percentile)
+    stage = int(result['stage'])
+    band = blood_pressure.STAGES.records[stage]
+    thresholds = _percentile_fields(result['percentiles'])
+    adult = age_years >= blood_pressure.ADULT_THRESHOLDS_AGE
+
+    def render():
+        criteria = ("soglie dell'adulto (≥13 anni): 120/<80, 130/80, 140/90" if adult else
+                    f"percentili NHBPEP 2004 90° {thresholds['systolic_90th']}/{thresholds['diastolic_90th']}, "
+                    f"95° {thresholds['systolic_95th']}/{thresholds['diastolic_95th']}, "
+                    f"95° + 12 {thresholds['systolic_95th_plus_12']}/{thresholds['diastolic_95th_plus_12']} mmHg")
+        return f"""Classificazione Pressione Arteriosa (stadiazione AAP 2017)
+==============================================
+Età: {age_years} anni, {'maschio' if is_male else 'femmina'}
+Percentile altezza: {height_percentile}°
+Misurazione: {systolic}/{diastolic} mmHg
+
+Soglie: {criteria}
+Sistolica: {blood_pressure.STAGES.records[int(result['systolic_stage'])]['status']}
+Diastolica: {blood_pressure.STAGES.records[int(result['diastolic_stage'])]['status']}
+
+Classificazione: {band['status']}
+Indicazione: {band['recommendation']}"""
+
+    return ToolResult({
+        "stage": stage,
+        "status": band['status'],
+        "recommendation": band['recommendation'],
+        "height_percentile": height_percentile,
+        "adult_thresholds": adult,
+        "thresholds": thresholds
+    }, render)
+
+@register_batch("classify_blood_pressure")
+def _batch_classify_blood_pressure(items):
+    """Kernel batch pressione: classificazione AAP 2017 di tutte le misurazioni in un solo passaggio"""
+    is_male = np.fromiter((bool(args['is_male']) for args in items), dtype=np.float64, count=len(items))
+    age_years = vectorized.column(items, 'age_years')
+    height_percentile = vectorized.column(items, 'height_percentile', 50)
+    height_cm = vectorized.column(items, 'height_cm', np.nan)
+    measured = ~np.isnan(height_cm)
+    if measured.any():
+        scores = vectorized.calculate_growth_zscore("length_for_age", is_male[measured], height_cm[measured],
+                                                    age_years[measured] * 365.25, "cdc")
+        height_percentile[measured] = scores['percentile']
+    result = blood_pressure.classify(is_male, age_years, vectorized.column(items, 'systolic_bp'),
+                                     vectorized.column(items, 'diastolic_bp'), height_percentile)
+    return vectorized.records(
+        stage=result['stage'],
+        status=result['status'],
+        recommendation=blood_pressure.STAGES.lookup(result['stage'], 'recommendation'),
+        height_percentile=height_percentile,
+        adult_thresholds=age_years >= blood_pressure.ADULT_THRESHOLDS_AGE,
+        thresholds=[_percentile_fields(row) for row in result['percentiles']]
+    )
+
+PREDICTED_HEIGHT_REFERENCE = """Formula utilizzata:
+- Maschi: [(altezza padre + altezza madre + 13) / 2] ± 8.5 cm
+- Femmine: [(altezza padre + altezza madre - 13) / 2] ± 8.5 cm
+
+Note cliniche:
+- Predizione basata sul potenziale genetico
+- Accuratezza ±8.5 cm nel 95% dei casi
+- Non considera fattori ambientali o patologie
+- Utile per valutare crescita in relazione al target genetico
+- Non utilizzare in presenza di patologie endocrine
+
+Fattori che possono influenzare:
+- Stato nutrizionale
+- Malattie croniche
+- Pubertà precoce o ritardata
+- Fattori ormonali
 """
-    return [types.TextContent(type="text", text=result)]
+
+@register_tool(types.Tool(
+    name="calculate_predicted_height",
+    description="Calcola l'altezza predetta finale basata sull'altezza dei genitori",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "father_height_cm": {
+                "type": "number",
+                "minimum": 140,
+                "maximum": 220,
+                "description": "Altezza del padre in cm"
+            },
+            "mother_height_cm": {
+                "type": "number",
+                "minimum": 140,
+                "maximum": 200,
+                "description": "Altezza della madre in cm"
+            },
+            "is_male": {
+                "type": "boolean",
+                "description": "Sesso del bambino: True=maschio, False=femmina"
+            }
+        },
+        "required": ["father_height_cm", "mother_height_cm", "is_male"]
+    }
+), reference=PREDICTED_HEIGHT_REFERENCE)
 def _calculate_predicted_height(args):
     """Calcola altezza predetta finale"""
     father_height_cm = args.get('father_height_cm', 0)
@@ -686,7 +856,8 @@ def _calculate_predicted_height(args):
     lower_range = round(predicted - 8.5, 1)
     upper_range = round(predicted + 8.5, 1)
     
-    result = f"""Altezza Predetta Finale
+    def render():
+        return f"""Altezza Predetta Finale
 =====================
 Dati genitori:
 - Altezza padre: {father_height_cm} cm
@@ -695,27 +866,93 @@ Dati genitori:
 
 Risultati:
 - Altezza predetta: {predicted} cm
-- Range di confidenza: {lower_range} - {upper_range} cm
+- Range di confidenza: {lower_range} - {upper_range} cm"""
 
-Formula utilizzata:
-- Maschi: [(altezza padre + altezza madre + 13) / 2] ± 8.5 cm
-- Femmine: [(altezza padre + altezza madre - 13) / 2] ± 8.5 cm
+    return ToolResult({
+        "predicted_height_cm": predicted,
+        "lower_range_cm": lower_range,
+        "upper_range_cm": upper_range
+    }, render)
 
-Note cliniche:
-- Predizione basata sul potenziale genetico
-- Accuratezza ±8.5 cm nel 95% dei casi
-- Non considera fattori ambientali o patologie
-- Utile per valutare crescita in relazione al target genetico
-- Non utilizzare in presenza di patologie endocrine
+BURNED_SURFACE_AREA_REFERENCE = """Considerazioni cliniche:
+- Ustioni >10% TBSA richiedono reidratazione IV
+- Ustioni >15% richiedono ricovero
+- Formula Parkland pediatrica: 3 ml × kg × %TBSA
+- Ustioni >20% aumentano rischio di shock
+- Ustioni >30% possono richiedere escarotomie
 
-Fattori che possono influenzare:
-- Stato nutrizionale
-- Malattie croniche
-- Pubertà precoce o ritardata
-- Fattori ormonali
+Criteri di trasferimento a centro ustioni:
+- TBSA >10% in età <10 anni
+- TBSA >15% in età >10 anni
+- Ustioni III grado >5%
+- Ustioni a mani, viso, genitali, articolazioni
+- Ustioni da corrente elettrica
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_burned_surface_area",
+    description="Calcola la superficie corporea ustionata secondo Lund-Browder modificata per età pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_years": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 18,
+                "description": "Età in anni"
+            },
+            "weight_kg": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Peso in kg (opzionale, per calcolo fluidi)"
+            },
+            "head_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione della testa/collo (0-100%)"
+            },
+            "trunk_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione del tronco (0-100%)"
+            },
+            "arms_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione delle braccia (0-100%)"
+            },
+            "hands_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione delle mani (0-100%)"
+            },
+            "legs_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione delle gambe (0-100%)"
+            },
+            "feet_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione dei piedi (0-100%)"
+            },
+            "genitals_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di ustione dei genitali (0-100%)"
+            }
+        },
+        "required": ["age_years"]
+    }
+), reference=BURNED_SURFACE_AREA_REFERENCE)
 def _calculate_burned_surface_area(args):
     """Calcola superficie corporea ustionata"""
     age_years = args.get('age_years', 0)
@@ -745,7 +982,8 @@ def _calculate_burned_surface_area(args):
             third_8h = round(first_8h / 2)
             fluid_text = f"• Totale 24h: {fluid_requirement} ml\n• Prime 8h: {first_8h} ml\n• Seconde 8h: {second_8h} ml\n• Terze 8h: {third_8h} ml"
     
-    result = f"""Valutazione Superficie Corporea Ustionata
+    def render():
+        return f"""Valutazione Superficie Corporea Ustionata
 ======================================
 Età: {age_years} anni
 TBSA totale: {total_bsa}% della superficie corporea
@@ -760,23 +998,162 @@ Aree ustionate:
 - Genitali: {areas['genitals']}%
 
 Fabbisogno idrico (Parkland modificato):
-{fluid_text}
+{fluid_text}"""
 
-Considerazioni cliniche:
-- Ustioni >10% TBSA richiedono reidratazione IV
-- Ustioni >15% richiedono ricovero
-- Formula Parkland pediatrica: 3 ml × kg × %TBSA
-- Ustioni >20% aumentano rischio di shock
-- Ustioni >30% possono richiedere escarotomie
+    return ToolResult({
+        "total_bsa_percent": total_bsa,
+        "fluid_24h_ml": fluid_requirement or None
+    }, render)
+ANC_REFERENCE = """Formula utilizzata:
+- ANC = GB × (% neutrofili + % bande) / 100 × 1000
 
-Criteri di trasferimento a centro ustioni:
-- TBSA >10% in età <10 anni
-- TBSA >15% in età >10 anni
-- Ustioni III grado >5%
-- Ustioni a mani, viso, genitali, articolazioni
-- Ustioni da corrente elettrica
+Classificazione neutropenia:
+• Lieve: 1000-1500 cellule/μL
+• Moderata: 500-1000 cellule/μL
+• Severa: <500 cellule/μL
+
+Note cliniche:
+- Nei lattanti i valori normali possono essere più bassi
+- Neutropenia etnica benigna da considerare in popolazioni africane
+- Febbre con ANC <500: emergenza (neutropenia febbrile)
 """
-    return [types.TextContent(type="text", text=result)]
+
+@register_tool(types.Tool(
+    name="calculate_anc",
+    description="Calcola l'Absolute Neutrophil Count (ANC) da WBC e percentuali neutrofili/bande",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "wbc_count": {
+                "type": "number",
+                "minimum": 0.1,
+                "description": "Globuli bianchi totali (x10^3/μL)"
+            },
+            "neutrophil_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Percentuale di neutrofili segmentati"
+            },
+            "bands_percent": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "default": 0,
+                "description": "Percentuale di bande (opzionale)"
+            }
+        },
+        "required": ["wbc_count", "neutrophil_percent"]
+    }
+), reference=ANC_REFERENCE)
+def _calculate_anc(args):
+    """Calcola Absolute Neutrophil Count (ANC)"""
+    wbc_count = args.get('wbc_count')
+    neutrophil_percent = args.get('neutrophil_percent')
+    bands_percent = args.get('bands_percent', 0)
+    
+    anc = calculate_anc(wbc_count, neutrophil_percent, bands_percent)
+    
+    # Classificazione neutropenia
+    if anc < 500:
+        severity = "NEUTROPENIA SEVERA"
+        risk = "Rischio infettivo elevato - Valutare isolamento e antibioticoterapia empirica se febbre"
+    elif anc < 1000:
+        severity = "NEUTROPENIA MODERATA"
+        risk = "Rischio infettivo moderato - Monitoraggio stretto"
+    elif anc < 1500:
+        severity = "NEUTROPENIA LIEVE"
+        risk = "Rischio infettivo lieve"
+    else:
+        severity = "NORMALE"
+        risk = "Nessun aumento del rischio infettivo"
+    
+    def render():
+        return f"""Absolute Neutrophil Count (ANC)
+===============================
+Parametri:
+- Globuli bianchi: {wbc_count} x10^3/μL
+- Neutrofili segmentati: {neutrophil_percent}%
+- Bande: {bands_percent}%
+
+ANC calcolato: {anc} cellule/μL
+Classificazione: {severity}
+Rischio: {risk}"""
+
+    return ToolResult({
+        "anc": anc,
+        "severity": severity
+    }, render)
+@register_batch("calculate_anc")
+def _batch_anc(items):
+    """Kernel batch ANC: conteggio assoluto e classificazione neutropenia per ogni paziente"""
+    anc = vectorized.calculate_anc(
+        vectorized.column(items, 'wbc_count'),
+        vectorized.column(items, 'neutrophil_percent'),
+        vectorized.column(items, 'bands_percent', 0)
+    )
+    return vectorized.records(
+        anc=anc,
+        severity=np.select(
+            [anc < 500, anc < 1000, anc < 1500],
+            ["NEUTROPENIA SEVERA", "NEUTROPENIA MODERATA", "NEUTROPENIA LIEVE"],
+            "NORMALE"
+        )
+    )
+
+PNFS_REFERENCE = """Interpretazione:
+- <30%: Basso rischio di fibrosi avanzata
+- 30-60%: Rischio intermedio
+- >60%: Alto rischio di fibrosi avanzata
+
+Note cliniche:
+- Score validato in popolazione pediatrica con NAFLD confermata da biopsia
+- AUROC di 0.74 (95% CI: 0.66, 0.82) per predire fibrosi avanzata
+- Significativamente migliore di APRI, NAFLD Fibrosis Score e FIB-4 Index
+- Non sostituisce la biopsia epatica che rimane il gold standard
+- Utile per identificare pazienti ad alto rischio da candidare a biopsia
+
+NAFLD vs NASH:
+- NAFLD (steatosi semplice): Accumulo di grasso epatico senza infiammazione significativa
+- NASH (steatoepatite): Steatosi con infiammazione e danno epatocellulare
+- La fibrosi avanzata è associata a maggior rischio di progressione a cirrosi
+Fonte: Alkhouri et al., 2014
+"""
+
+@register_tool(types.Tool(
+    name="calculate_pnfs",
+    description="Calcola il Pediatric NAFLD Fibrosis Score (PNFS) per predire il rischio di fibrosi avanzata in steatosi epatica non alcolica pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "alt_iu_l": {
+                "type": "number",
+                "minimum": 5,
+                "maximum": 1000,
+                "description": "ALT in IU/L"
+            },
+            "alkaline_phosphatase_iu_l": {
+                "type": "number",
+                "minimum": 50,
+                "maximum": 1500,
+                "description": "Fosfatasi alcalina in IU/L"
+            },
+            "platelets_k_ul": {
+                "type": "number",
+                "minimum": 20,
+                "maximum": 999,
+                "description": "Piastrine in K/μL"
+            },
+            "ggt_iu_l": {
+                "type": "number",
+                "minimum": 5,
+                "maximum": 1000,
+                "description": "GGT in IU/L"
+            }
+        },
+        "required": ["alt_iu_l", "alkaline_phosphatase_iu_l", "platelets_k_ul", "ggt_iu_l"]
+    }
+), reference=PNFS_REFERENCE)
 def _calculate_pnfs(args):
     """Calcola Pediatric NAFLD Fibrosis Score (PNFS)"""
     alt_iu_l = args.get('alt_iu_l', 0)
@@ -788,7 +1165,8 @@ def _calculate_pnfs(args):
     pnfs_score = calculate_pnfs(alt_iu_l, alkaline_phosphatase_iu_l, platelets_k_ul, ggt_iu_l)
     interpretation = calculate_pnfs_interpretation(pnfs_score)
     
-    result = f"""Pediatric NAFLD Fibrosis Score (PNFS)
+    def render():
+        return f"""Pediatric NAFLD Fibrosis Score (PNFS)
 ====================================
 Probabilità di fibrosi avanzata: {pnfs_score}%
 
@@ -799,29 +1177,79 @@ Parametri utilizzati:
 - ALT: {alt_iu_l} IU/L
 - Fosfatasi alcalina: {alkaline_phosphatase_iu_l} IU/L
 - Piastrine: {platelets_k_ul} K/μL
-- GGT: {ggt_iu_l} IU/L
+- GGT: {ggt_iu_l} IU/L"""
 
-Interpretazione:
-- <30%: Basso rischio di fibrosi avanzata
-- 30-60%: Rischio intermedio
-- >60%: Alto rischio di fibrosi avanzata
+    return ToolResult({
+        "pnfs_score": pnfs_score,
+        "interpretation": interpretation['interpretation'],
+        "recommendation": interpretation['recommendation']
+    }, render)
 
-Note cliniche:
-- Score validato in popolazione pediatrica con NAFLD confermata da biopsia
-- AUROC di 0.74 (95% CI: 0.66, 0.82) per predire fibrosi avanzata
-- Significativamente migliore di APRI, NAFLD Fibrosis Score e FIB-4 Index
-- Non sostituisce la biopsia epatica che rimane il gold standard
-- Utile per identificare pazienti ad alto rischio da candidare a biopsia
 
-NAFLD vs NASH:
-- NAFLD (steatosi semplice): Accumulo di grasso epatico senza infiammazione significativa
-- NASH (steatoepatite): Steatosi con infiammazione e danno epatocellulare
-- La fibrosi avanzata è associata a maggior rischio di progressione a cirrosi
-Fonte: Alkhouri et al., 2014
-"""
-    return [types.TextContent(type="text", text=result)]
+PEDIATRIC_BONE_HEALTH_REFERENCE = """Note cliniche:
+- Valori di riferimento calcio corretto: 8.5-10.5 mg/dL
+- Correzione calcio per albumina: Calcio totale + 0.8 × (4 - Albumina)
+- Valori di riferimento vitamina D (25-OH):
+  * <12 ng/mL: Carenza severa
+  * 12-20 ng/mL: Carenza
+  * 20-30 ng/mL: Insufficienza
+  * >30 ng/mL: Sufficienza
+
+Raccomandazioni generali:
+- Dieta ricca di calcio (latticini, verdure a foglia verde, legumi)
+- Attività fisica regolare con carico (corsa, salto)
+- Adeguata esposizione solare
+- Evitare fumo passivo e attivo
+- Limitare bevande gassate e caffeina
 
+Screening in bambini a rischio:
+- Malassorbimento intestinale
+- Terapia steroidea cronica
+- Malattie infiammatorie croniche
+- Disordini endocrini
+- Immobilizzazione prolungata
+"""
 
+@register_tool(types.Tool(
+    name="calculate_pediatric_bone_health",
+    description="Calcola parametri di salute ossea pediatrica (calcio corretto, interpretazione DXA)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "calcium_total_mg_dl": {
+                "type": "number",
+                "minimum": 5,
+                "maximum": 15,
+                "description": "Calcio sierico totale in mg/dL"
+            },
+            "albumin_g_dl": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 6,
+                "description": "Albumina sierica in g/dL"
+            },
+            "bmd_zscore": {
+                "type": "number",
+                "minimum": -5,
+                "maximum": 5,
+                "description": "Z-score della densità minerale ossea (DXA)"
+            },
+            "age_years": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 18,
+                "description": "Età in anni"
+            },
+            "vitamin_d_ng_ml": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 100,
+                "description": "Livello di vitamina D (25-OH) in ng/mL"
+            }
+        },
+        "required": ["calcium_total_mg_dl", "albumin_g_dl", "age_years"]
+    }
+), reference=PEDIATRIC_BONE_HEALTH_REFERENCE)
 def _calculate_pediatric_bone_health(args):
     """Calcola parametri di salute ossea pediatrica"""
     calcium_total_mg_dl = args.get('calcium_total_mg_dl', 0)
@@ -895,7 +1323,8 @@ Nota: In età pediatrica, si utilizza il Z-score (non il T-score)
     else:
         vitamin_d_rda = 600
     
-    result = f"""Valutazione Salute Ossea Pediatrica
+    def render():
+        return f"""Valutazione Salute Ossea Pediatrica
 ================================
 Età: {age_years} anni
 
@@ -913,30 +1342,14 @@ CALCIO:
 {f'- Raccomandazione: {vitamin_d_recommendation}' if vitamin_d_ng_ml is not None else ''}
 - Fabbisogno giornaliero: {vitamin_d_rda} UI/die
 
-{bmd_interpretation if bmd_zscore is not None else ''}
-
-Note cliniche:
-- Valori di riferimento calcio corretto: 8.5-10.5 mg/dL
-- Correzione calcio per albumina: Calcio totale + 0.8 × (4 - Albumina)
-- Valori di riferimento vitamina D (25-OH):
-  * <12 ng/mL: Carenza severa
-  * 12-20 ng/mL: Carenza
-  * 20-30 ng/mL: Insufficienza
-  * >30 ng/mL: Sufficienza
-
-Raccomandazioni generali:
-- Dieta ricca di calcio (latticini, verdure a foglia verde, legumi)
-- Attività fisica regolare con carico (corsa, salto)
-- Adeguata esposizione solare
-- Evitare fumo passivo e attivo
-- Limitare bevande gassate e caffeina
+{bmd_interpretation if bmd_zscore is not None else ''}"""
 
-Screening in bambini a rischio:
-- Malassorbimento intestinale
-- Terapia steroidea cronica
-- Malattie infiammatorie croniche
-- Disordini endocrini
-- Immobilizzazione prolungata
-"""
-    return [types.TextContent(type="text", text=result)]
+    return ToolResult({
+        "calcium_corrected": calcium_corrected,
+        "calcium_status": calcium_status,
+        "calcium_rda_mg": calcium_rda,
+        "vitamin_d_status": vitamin_d_status or None,
+        "vitamin_d_rda_ui": vitamin_d_rda,
+        "bmd_interpretation": bmd_result['interpretation'] if bmd_zscore is not None else None
+    }, render)
     
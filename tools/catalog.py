@@ -0,0 +1,72 @@
+"""
+Catalogo immutabile dei tool
+Costruito una sola volta dal registro (al primo tools/list) e congelato:
+la risposta tools/list e la sua forma serializzata vengono riutilizzate
+ad ogni richiesta invece di ricostruire e riserializzare decine di types.Tool
+"""
+import json
+from types import MappingProxyType
+
+import mcp.types as types
+from pydantic import PrivateAttr
+from tools.registry import get_registered_tools, registry_generation
+
+# Argomenti con cui la sessione MCP serializza ogni risposta
+_WIRE_DUMP_ARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+class _PrecomputedServerResult(types.ServerResult):
+    """ServerResult che restituisce la forma serializzata calcolata una volta sola"""
+    _wire: dict = PrivateAttr()
+
+    def model_dump(self, **kwargs):
+        if kwargs == _WIRE_DUMP_ARGS:
+            return self._wire
+        return super().model_dump(**kwargs)
+
+
+class ToolCatalog:
+    """Definizioni dei tool congelate, indice per nome e risposta tools/list precalcolata"""
+    __slots__ = ("tools", "by_name", "result", "wire_json", "generation")
+
+    def __init__(self, tools: list[types.Tool], generation: int):
+        self.tools = tuple(tools)
+        self.by_name = MappingProxyType({tool.name: tool for tool in self.tools})
+        self.result = _PrecomputedServerResult(types.ListToolsResult(tools=list(self.tools)))
+        self.result._wire = types.ServerResult.model_dump(self.result, **_WIRE_DUMP_ARGS)
+        self.wire_json = json.dumps(self.result._wire, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.generation = generation
+
+
+_catalog: ToolCatalog | None = None
+
+
+def get_catalog() -> ToolCatalog:
+    """Restituisce il catalogo, ricostruendolo solo se nel frattempo sono stati registrati nuovi tool"""
+    global _catalog
+    generation = registry_generation()
+    if _catalog is None or _catalog.generation != generation:
+        _catalog = ToolCatalog(get_registered_tools(), generation)
+    return _catalog
+
+
+def install_catalog(app) -> None:
+    """
+    Serve tools/list dal catalogo precalcolato
+
+    L'handler registrato da @app.list_tools() viene richiamato solo quando il
+    catalogo cambia, per mantenere aggiornata la cache dei tool interna a mcp
+    (usata da call_tool per cercare la definizione del tool).
+    """
+    refresh_tool_cache = app.request_handlers[types.ListToolsRequest]
+    synced_generation = None
+
+    async def list_tools_precomputed(request):
+        nonlocal synced_generation
+        catalog = get_catalog()
+        if catalog.generation != synced_generation:
+            await refresh_tool_cache(request)
+            synced_generation = catalog.generation
+        return catalog.result
+
+    app.request_handlers[types.ListToolsRequest] = list_tools_precomputed
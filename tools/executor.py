@@ -0,0 +1,203 @@
+"""
+Esecuzione dei tool fuori dall'event loop
+Gli handler sono sincroni: eseguiti direttamente nella coroutine call_tool
+bloccano l'event loop e con esso tutte le altre richieste in corso. I tool
+economici (la quasi totalità: pochi microsecondi) restano in linea, mentre
+quelli registrati con offload=True (es. batch su una coorte) vengono eseguiti
+in un pool di thread o di processi.
+
+Il numero di chiamate in coda o in esecuzione nel pool è limitato: oltre il
+limite la chiamata viene respinta subito (isError=True) invece di accumularsi.
+Con un timeout la richiesta riceve un errore allo scadere; l'esecuzione già
+avviata non può essere interrotta e continua a occupare il suo posto finché
+non termina, così che il limite rifletta il lavoro reale del pool.
+Ogni chiamata di un tool registrato è misurata (vedi tools/metrics.py): la
+latenza comprende l'eventuale attesa in coda, e respinte e timeout contano come errori.
+Con AUDIT_LOG impostato ogni chiamata è anche accodata al registro di audit (tools/audit.py).
+
+Una chiamata nel pool identica (stesso tool, stessi argomenti in forma
+canonica) a una ancora in esecuzione non viene rieseguita: attende la prima e
+ne condivide il risultato. A differenza della cache vale anche per i tool non
+deterministici, perché il risultato condiviso è prodotto dopo l'arrivo di ogni
+richiesta in attesa. Le chiamate in linea terminano prima che l'event loop
+accetti la richiesta successiva e non si sovrappongono mai.
+Configurazione: EXECUTOR_* in utils/config.py
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import mcp.types as types
+from tools.audit import get_audit_log
+from tools.cache import canonical_key
+from tools.metrics import record_call
+from tools.profiling import is_profiled, profiled_call
+from tools.registry import (
+    add_load_hook, call_registered_tool, get_load_hooks, get_registered_tool, get_tool_modules, load_module
+)
+from utils import config
+
+logger = logging.getLogger(__name__)
+
+
+def _error_result(tool: str, error: str, message: str) -> types.CallToolResult:
+    """Risultato MCP di errore dell'esecuzione, con il codice in structuredContent"""
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=f"{message} ({tool})")],
+        structuredContent={"error": error, "tool": tool, "message": message},
+        isError=True,
+    )
+
+
+def _init_process_worker(modules: list[str], hooks: list) -> None:
+    """
+    Registra i tool nel processo worker con gli stessi moduli e hook di caricamento del server
+
+    Gli hook (es. le tabelle degli score) sostituiscono gli handler: senza, il worker
+    eseguirebbe gli handler originali mentre il processo principale usa le tabelle
+    """
+    for hook in hooks:
+        if hook not in get_load_hooks():
+            add_load_hook(hook)
+    for module in modules:
+        load_module(module)
+
+
+class ToolExecutor:
+    """Esegue in linea i tool economici e nel pool quelli costosi, con limite di coda e timeout"""
+
+    def __init__(self, pool: str, workers: int, queue_limit: int, timeout: float, coalesce: bool = True):
+        if workers < 1 or queue_limit < 1:
+            raise ValueError("Worker e limite di coda devono essere almeno 1")
+        self.pool = pool
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.coalesce = coalesce
+        self._executor: Executor | None = None
+        # (tool, chiave canonica degli argomenti) -> esecuzione in corso, condivisa dalle chiamate identiche
+        self._flights: dict[tuple, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.inline = 0
+        self.offloaded = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.coalesced = 0
+
+    def _get_executor(self) -> Executor:
+        # Creato alla prima chiamata da eseguire nel pool: con i processi i moduli dei tool sono già registrati
+        if self._executor is None:
+            if self.pool == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_process_worker,
+                    initargs=(get_tool_modules(), get_load_hooks())
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tool-worker")
+        return self._executor
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    async def run(self, name: str, arguments: dict) -> list[types.TextContent] | types.CallToolResult:
+        """Esegue il tool registrato: in linea, oppure nel pool se registrato con offload=True"""
+        entry = get_registered_tool(name)
+        if entry is None:
+            # Strumento sconosciuto: nessuna metrica, per non creare una serie per ogni nome ricevuto
+            return call_registered_tool(name, arguments)
+        # Con PROFILE_MODE attivo le chiamate dei tool selezionati passano dal profiler
+        call = profiled_call if is_profiled(name) else call_registered_tool
+        start = time.perf_counter()
+        error = True
+        result = None
+        try:
+            if entry.offload and self.coalesce:
+                result = await self._run_shared(call, name, arguments)
+            elif entry.offload:
+                result = await self._run_offloaded(call, name, arguments)
+            else:
+                self.inline += 1
+                result = call(name, arguments)
+            error = result.__class__ is types.CallToolResult and result.isError
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            record_call(name, seconds, error)
+            audit = get_audit_log()
+            if audit is not None:
+                audit.record(name, arguments, seconds, error, result)
+
+    async def _run_shared(self, call, name: str, arguments: dict) -> list[types.TextContent] | types.CallToolResult:
+        """Esecuzione nel pool condivisa con le chiamate identiche arrivate mentre è in corso"""
+        key = (name, canonical_key(arguments))
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._run_offloaded(call, name, arguments))
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _task: self._flights.pop(key, None))
+        else:
+            self.coalesced += 1
+        # La disconnessione di un client annulla solo la sua attesa, non l'esecuzione condivisa
+        return await asyncio.shield(flight)
+
+    async def _run_offloaded(self, call, name: str, arguments: dict) -> list[types.TextContent] | types.CallToolResult:
+        with self._lock:
+            if self.in_flight >= self.queue_limit:
+                self.rejected += 1
+                logger.warning("Chiamata %s respinta: %d esecuzioni in corso", name, self.in_flight)
+                return _error_result(
+                    name, "server_busy",
+                    f"Server occupato: {self.in_flight} esecuzioni in corso, riprovare più tardi"
+                )
+            self.in_flight += 1
+            self.offloaded += 1
+        future = self._get_executor().submit(call, name, arguments)
+        # Il posto si libera quando l'esecuzione termina davvero (o viene annullata mentre è in coda)
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout if self.timeout > 0 else None)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            logger.warning("Chiamata %s oltre il tempo massimo di %g s", name, self.timeout)
+            return _error_result(name, "timeout", f"Tempo massimo di esecuzione superato ({self.timeout:g} s)")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pool": self.pool,
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "timeout_seconds": self.timeout,
+                "in_flight": self.in_flight,
+                "inline": self.inline,
+                "offloaded": self.offloaded,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "coalesced": self.coalesced
+            }
+
+    def shutdown(self) -> None:
+        """Chiude il pool annullando le esecuzioni ancora in coda"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_executor: ToolExecutor | None = None
+
+
+def get_executor() -> ToolExecutor:
+    """Esecutore del server, configurato dalle variabili EXECUTOR_*"""
+    global _executor
+    if _executor is None:
+        _executor = ToolExecutor(
+            config.EXECUTOR_POOL, config.EXECUTOR_WORKERS, config.EXECUTOR_QUEUE_LIMIT, config.EXECUTOR_TIMEOUT,
+            bool(config.EXECUTOR_COALESCE)
+        )
+    return _executor
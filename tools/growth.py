@@ -0,0 +1,391 @@
+"""
+Valutazione della crescita con i riferimenti LMS WHO/CDC
+z-score, percentile e classificazione WHO di peso, lunghezza/altezza, BMI e
+circonferenza cranica per età e del peso per lunghezza/altezza, dalle tabelle
+di utils/growth.py (età in giorni fino a 5 anni, in mesi oltre); serie di
+visite con velocità e attraversamento dei centili (utils/velocity.py)
+"""
+import math
+
+import mcp.types as types
+import numpy as np
+from tools.registry import register_batch, register_tool
+from tools.results import ToolResult
+from utils import growth, vectorized, velocity
+from utils.medical_formulas import calculate_bmi_pediatric
+
+INDICATOR_LABELS = {
+    "weight_for_age": "Peso per età",
+    "length_for_age": "Lunghezza/altezza per età",
+    "bmi_for_age": "BMI per età",
+    "head_circumference_for_age": "Circonferenza cranica per età",
+    "weight_for_length": "Peso per lunghezza",
+    "weight_for_height": "Peso per altezza",
+}
+
+# Sotto i 2 anni peso per lunghezza (misura supina), poi peso per altezza fino a 5 anni
+LENGTH_AGE_LIMIT_DAYS = 24 * growth.DAYS_PER_MONTH
+
+GROWTH_REFERENCE = """Riferimenti:
+• WHO Child Growth Standards 2006 (0-5 anni, per giorno di età)
+• WHO Growth Reference 2007 (5-19 anni; peso per età fino a 10 anni)
+• CDC 2000 (2-20 anni; sotto i 2 anni si usano gli standard WHO, come raccomandato da CDC)
+• Peso per lunghezza 45-110 cm (<2 anni), peso per altezza 65-120 cm (2-5 anni)
+
+Classificazione WHO (z-score):
+• Peso per età: <-3 grave sottopeso, <-2 sottopeso
+• Lunghezza/altezza per età: <-3 bassa statura grave, <-2 bassa statura, >3 alta statura
+• BMI, peso per lunghezza/altezza 0-5 anni: <-3 malnutrizione acuta grave, <-2 moderata,
+  >1 rischio di sovrappeso, >2 sovrappeso, >3 obesità
+• BMI 5-19 anni: <-3 magrezza grave, <-2 magrezza, >1 sovrappeso, >2 obesità
+• Circonferenza cranica: <-2 microcefalia, >2 macrocefalia
+Classificazione CDC del BMI (2-20 anni): <5° sottopeso, 85°-95° sovrappeso, ≥95° obesità
+
+Note:
+• Per gli indicatori di peso WHO oltre ±3 z si applica la correzione WHO (z ristretto)
+• Misure fuori dall'intervallo delle tabelle non vengono valutate
+• La misura va presa supina sotto i 2 anni, in piedi dopo (nessuna correzione automatica)
+"""
+
+
+def _age_days(args) -> float:
+    if 'age_days' in args:
+        return float(args['age_days'])
+    return args['age_months'] * growth.DAYS_PER_MONTH
+
+
+def _measurements(age_days: float, weight_kg, length_cm, head_circumference_cm) -> dict:
+    """Indicatore -> (misura, x) per le misure disponibili"""
+    measurements = {}
+    if weight_kg is not None:
+        measurements["weight_for_age"] = (weight_kg, age_days)
+    if length_cm is not None:
+        measurements["length_for_age"] = (length_cm, age_days)
+    if weight_kg is not None and length_cm is not None:
+        measurements["bmi_for_age"] = (weight_kg / ((length_cm / 100) ** 2), age_days)
+        if age_days < LENGTH_AGE_LIMIT_DAYS:
+            measurements["weight_for_length"] = (weight_kg, length_cm)
+        elif age_days <= growth.WHO_STANDARDS_LAST_DAY:
+            measurements["weight_for_height"] = (weight_kg, length_cm)
+    if head_circumference_cm is not None:
+        measurements["head_circumference_for_age"] = (head_circumference_cm, age_days)
+    return measurements
+
+
+@register_tool(types.Tool(
+    name="calculate_growth_zscores",
+    description="Calcola z-score, percentili e classificazione WHO/CDC di peso, lunghezza/altezza, BMI e circonferenza cranica per età e del peso per lunghezza/altezza (curve di crescita LMS WHO 2006/2007 e CDC 2000)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "is_male": {
+                "type": "boolean",
+                "description": "Sesso del bambino (True=maschio, False=femmina)"
+            },
+            "age_days": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 7320,
+                "description": "Età in giorni, per la precisione giornaliera degli standard WHO 0-5 anni (se indicata sostituisce age_months)"
+            },
+            "age_months": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 240,
+                "description": "Età in mesi, anche con decimali"
+            },
+            "weight_kg": {
+                "type": "number",
+                "minimum": 0.5,
+                "maximum": 150,
+                "description": "Peso in kg"
+            },
+            "length_cm": {
+                "type": "number",
+                "minimum": 40,
+                "maximum": 200,
+                "description": "Lunghezza supina (<2 anni) o altezza in piedi in cm"
+            },
+            "head_circumference_cm": {
+                "type": "number",
+                "minimum": 25,
+                "maximum": 65,
+                "description": "Circonferenza cranica in cm"
+            },
+            "reference": {
+                "type": "string",
+                "enum": ["who", "cdc"],
+                "description": "Riferimento dai 2 anni: who (WHO 2006/2007, default) o cdc (CDC 2000)"
+            }
+        },
+        "required": ["is_male", "age_months"]
+    }
+), reference=GROWTH_REFERENCE)
+def _calculate_growth_zscores(args):
+    """Calcola gli z-score di crescita"""
+    is_male = args['is_male']
+    age_days = _age_days(args)
+    weight_kg = args.get('weight_kg')
+    length_cm = args.get('length_cm')
+    head_circumference_cm = args.get('head_circumference_cm')
+    reference = args.get('reference', 'who')
+
+    indicators, not_assessed = {}, []
+    for indicator, (value, x) in _measurements(age_days, weight_kg, length_cm, head_circumference_cm).items():
+        if growth.covers(indicator, reference, x):
+            indicators[indicator] = growth.assess(indicator, is_male, value, x, age_days, reference)
+        else:
+            not_assessed.append(indicator)
+    bmi = calculate_bmi_pediatric(weight_kg, length_cm) if weight_kg is not None and length_cm is not None else None
+
+    def render():
+        lines = [
+            f"Z-score di crescita ({reference.upper()})",
+            "=" * 30,
+            f"Sesso: {'maschio' if is_male else 'femmina'}",
+            f"Età: {age_days:.0f} giorni ({age_days / growth.DAYS_PER_MONTH:.1f} mesi)"
+        ]
+        if weight_kg is not None:
+            lines.append(f"Peso: {weight_kg} kg")
+        if length_cm is not None:
+            lines.append(f"Lunghezza/altezza: {length_cm} cm")
+        if bmi is not None:
+            lines.append(f"BMI: {bmi} kg/m²")
+        if head_circumference_cm is not None:
+            lines.append(f"Circonferenza cranica: {head_circumference_cm} cm")
+        lines.append("")
+        for indicator, result in indicators.items():
+            lines.append(f"{INDICATOR_LABELS[indicator]}: z {result['zscore']:+.2f} "
+                         f"({result['percentile']}° percentile) - {result['status']}")
+        if not indicators:
+            lines.append("Nessun indicatore valutabile: fornire peso, lunghezza/altezza o circonferenza cranica")
+        if not_assessed:
+            lines.append("")
+            lines.append("Fuori dall'intervallo delle tabelle: "
+                         + ", ".join(INDICATOR_LABELS[indicator] for indicator in not_assessed))
+        return "\n".join(lines)
+
+    return ToolResult({
+        "reference": reference,
+        "bmi": bmi,
+        "indicators": indicators
+    }, render)
+
+
+@register_batch("calculate_growth_zscores")
+def _batch_growth_zscores(items):
+    """Kernel batch crescita: z-score vettoriali per indicatore, un dizionario di indicatori per bambino"""
+    is_male = np.fromiter((bool(args['is_male']) for args in items), dtype=np.float64, count=len(items))
+    age_days = vectorized.column(items, 'age_days', math.nan)
+    age_days = np.where(np.isnan(age_days), vectorized.column(items, 'age_months') * growth.DAYS_PER_MONTH, age_days)
+    weight_kg = vectorized.column(items, 'weight_kg', math.nan)
+    length_cm = vectorized.column(items, 'length_cm', math.nan)
+    head_circumference_cm = vectorized.column(items, 'head_circumference_cm', math.nan)
+    references = np.array([args.get('reference', 'who') for args in items], dtype=object)
+    bmi = weight_kg / ((length_cm / 100) ** 2)
+    under_2 = age_days < LENGTH_AGE_LIMIT_DAYS
+    under_5 = age_days <= growth.WHO_STANDARDS_LAST_DAY
+
+    # Stesso ordine dell'handler; misure assenti (NaN) e valori fuori tabella danno z NaN e sono omessi
+    measurements = {
+        "weight_for_age": (weight_kg, age_days),
+        "length_for_age": (length_cm, age_days),
+        "bmi_for_age": (bmi, age_days),
+        "weight_for_length": (np.where(under_2, weight_kg, math.nan), length_cm),
+        "weight_for_height": (np.where(~under_2 & under_5, weight_kg, math.nan), length_cm),
+        "head_circumference_for_age": (head_circumference_cm, age_days),
+    }
+    columns = {}
+    for indicator, (value, x) in measurements.items():
+        zscore = np.full(len(items), math.nan)
+        percentile = np.full(len(items), math.nan)
+        status = np.empty(len(items), dtype=object)
+        for reference in set(references.tolist()):
+            rows = references == reference
+            scores = vectorized.calculate_growth_zscore(indicator, is_male[rows], value[rows], x[rows], reference)
+            zscore[rows], percentile[rows] = scores['zscore'], scores['percentile']
+            status[rows] = vectorized.classify_growth(indicator, age_days[rows], reference, scores)
+        columns[indicator] = (zscore.tolist(), percentile.tolist(), status.tolist())
+
+    indicators = [{} for _ in items]
+    for indicator, (zscore, percentile, status) in columns.items():
+        for index, z in enumerate(zscore):
+            if z == z:
+                indicators[index][indicator] = {"zscore": z, "percentile": percentile[index], "status": status[index]}
+    bmi_rounded = vectorized.calculate_bmi_pediatric(np.nan_to_num(weight_kg, nan=1.0), np.nan_to_num(length_cm, nan=100.0))
+    return vectorized.records(
+        reference=references,
+        bmi=np.where(np.isnan(bmi), None, bmi_rounded),
+        indicators=indicators
+    )
+
+
+MEASURE_LABELS = {
+    "weight_kg": "Peso",
+    "length_cm": "Lunghezza/altezza",
+    "head_circumference_cm": "Circonferenza cranica",
+}
+
+GROWTH_SERIES_REFERENCE = """Criteri (NICE NG75 per il peso):
+• Spazio di centile = 2/3 di z, tra le linee 0.4°, 2°, 9°, 25°, 50°, 75°, 91°, 98°, 99.6°
+• Crescita stentata: perdita dal picco della serie di ≥1 spazio se il picco è sotto il 9° centile,
+  ≥2 spazi tra 9° e 91°, ≥3 spazi sopra il 91°; lunghezza e circonferenza cranica ≥2 spazi
+• Ultima misura sotto il 2° centile: sempre segnalata
+• Accelerazione: guadagno di ≥2 spazi dal minimo della serie (peso: rischio di obesità;
+  circonferenza cranica: escludere idrocefalo)
+
+Velocità:
+• Ultimo intervallo tra visite: peso in g/die, lunghezza e circonferenza cranica in cm/mese
+• Attesa: velocità della curva di centile della visita precedente (WHO 2006/2007 o CDC 2000)
+
+Note:
+• Le visite possono essere in qualsiasi ordine; misure fuori tabella sono escluse dalla serie
+• Intervalli brevi (<1 mese per il peso, <3 mesi per la lunghezza) amplificano l'errore di misura
+• Stime sulle curve di distanza: non sostituiscono le tabelle WHO degli incrementi
+"""
+
+
+def _series_row(summary: dict, unit: str) -> list[str]:
+    lines = [f"z {summary['first_zscore']:+.2f} → {summary['last_zscore']:+.2f} "
+             f"({summary['last_percentile']}° percentile), Δz {summary['zscore_change']:+.2f}"]
+    crossed = summary['lines_crossed']
+    if crossed:
+        direction = "il basso" if crossed < 0 else "l'alto"
+        lines.append(f"{abs(crossed)} linee di centile attraversate verso {direction}")
+    if summary['centile_spaces_lost']:
+        lines.append(f"{summary['centile_spaces_lost']} spazi di centile persi dal picco")
+    if summary['velocity'] is not None:
+        lines.append(f"velocità ultimo intervallo {summary['velocity']} {unit} "
+                     f"(attesa sulla curva {summary['expected_velocity']} {unit})")
+    return lines
+
+
+@register_tool(types.Tool(
+    name="assess_growth_series",
+    description="Valuta una serie di visite di crescita (peso, lunghezza/altezza, circonferenza cranica): z-score WHO/CDC a ogni visita, linee di centile attraversate, velocità dell'ultimo intervallo contro quella attesa e segnalazione di crescita stentata (NICE) o accelerazione",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "is_male": {
+                "type": "boolean",
+                "description": "Sesso del bambino (True=maschio, False=femmina)"
+            },
+            "visits": {
+                "type": "array",
+                "maxItems": 200,
+                "description": "Visite del bambino, in qualsiasi ordine, ciascuna con età e misure rilevate",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "age_months": {
+                            "type": "number",
+                            "minimum": 0,
+                            "maximum": 240,
+                            "description": "Età in mesi alla visita, anche con decimali"
+                        },
+                        "age_days": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "maximum": 7320,
+                            "description": "Età in giorni alla visita (se indicata sostituisce age_months)"
+                        },
+                        "weight_kg": {
+                            "type": "number",
+                            "minimum": 0.5,
+                            "maximum": 150,
+                            "description": "Peso in kg"
+                        },
+                        "length_cm": {
+                            "type": "number",
+                            "minimum": 40,
+                            "maximum": 200,
+                            "description": "Lunghezza supina (<2 anni) o altezza in piedi in cm"
+                        },
+                        "head_circumference_cm": {
+                            "type": "number",
+                            "minimum": 25,
+                            "maximum": 65,
+                            "description": "Circonferenza cranica in cm"
+                        }
+                    },
+                    "required": ["age_months"]
+                }
+            },
+            "reference": {
+                "type": "string",
+                "enum": ["who", "cdc"],
+                "description": "Riferimento dai 2 anni: who (WHO 2006/2007, default) o cdc (CDC 2000)"
+            }
+        },
+        "required": ["is_male", "visits"]
+    }
+), error_prefix="Errore nella valutazione della serie di crescita", reference=GROWTH_SERIES_REFERENCE)
+def _assess_growth_series(args):
+    """Valuta la serie di visite di un bambino"""
+    is_male = args['is_male']
+    visits = args['visits']
+    reference = args.get('reference', 'who')
+    if not visits:
+        raise ValueError("Indicare almeno una visita")
+
+    ages = [_age_days(visit) for visit in visits]
+    result = velocity.assess_series(
+        np.zeros(len(visits)), np.full(len(visits), float(is_male)), ages,
+        {key: [visit.get(key, math.nan) for visit in visits] for key in velocity.MEASURES},
+        reference
+    )
+    series = velocity.records(result)[0]
+    measures = series['measures']
+
+    def render():
+        lines = [
+            f"Serie di crescita ({reference.upper()})",
+            "=" * 30,
+            f"Sesso: {'maschio' if is_male else 'femmina'}",
+            f"Visite: {len(visits)} (da {min(ages) / growth.DAYS_PER_MONTH:.1f} "
+            f"a {max(ages) / growth.DAYS_PER_MONTH:.1f} mesi)",
+            ""
+        ]
+        for key, summary in measures.items():
+            lines.append(f"{MEASURE_LABELS[key]} ({summary['visits']} visite): {summary['status']}")
+            lines.extend(f"  - {line}" for line in _series_row(summary, summary['velocity_unit']))
+        if not measures:
+            lines.append("Nessuna misura valutabile: fornire peso, lunghezza/altezza o circonferenza cranica")
+        lines.append("")
+        lines.append("⚠️ Crescita da rivalutare" if series['flagged'] else "✅ Nessuna deviazione dalle curve di centile")
+        return "\n".join(lines)
+
+    return ToolResult({
+        "reference": reference,
+        "visits": len(visits),
+        "flagged": series['flagged'],
+        "measures": measures
+    }, render)
+
+
+@register_batch("assess_growth_series")
+def _batch_growth_series(items):
+    """Kernel batch serie di crescita: le visite di tutti i bambini valutate con una sola chiamata al motore per riferimento"""
+    results = [None] * len(items)
+    references = [args.get('reference', 'who') for args in items]
+    for reference in set(references):
+        indexes = [index for index, item_reference in enumerate(references) if item_reference == reference]
+        if any(not items[index]['visits'] for index in indexes):
+            raise ValueError("Indicare almeno una visita")
+        visits = [(index, visit) for index in indexes for visit in items[index]['visits']]
+        result = velocity.assess_series(
+            np.fromiter((index for index, _ in visits), dtype=np.int64, count=len(visits)),
+            np.fromiter((bool(items[index]['is_male']) for index, _ in visits), dtype=np.float64, count=len(visits)),
+            [_age_days(visit) for _, visit in visits],
+            {key: [visit.get(key, math.nan) for _, visit in visits] for key in velocity.MEASURES},
+            reference
+        )
+        for series in velocity.records(result):
+            index = series['child']
+            results[index] = {
+                "reference": reference,
+                "visits": len(items[index]['visits']),
+                "flagged": series['flagged'],
+                "measures": series['measures']
+            }
+    return results
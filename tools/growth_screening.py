@@ -0,0 +1,118 @@
+"""
+Screening notturno della crescita da file di visite
+Legge un CSV in formato lungo (una riga per visita) e valuta le serie di tutti
+i bambini con il motore di utils/velocity.py, a blocchi di visite: il file non
+viene mai caricato per intero, ogni blocco è una sola chiamata vettoriale e le
+visite di un bambino non vengono mai divise tra due blocchi (devono quindi
+essere contigue nel file, come in un export ordinato per bambino).
+
+Colonne: child_id, is_male (1/0, M/F, true/false), age_days, weight_kg,
+length_cm, head_circumference_cm (vuoto = misura non rilevata). L'output è
+JSON per riga, un bambino per riga, con il riassunto di ogni misura.
+
+Uso: python -m tools.growth_screening visite.csv --output report.jsonl [--only-flagged] [--reference cdc]
+"""
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+
+from utils import velocity
+
+# Visite per blocco vettoriale (un blocco si chiude solo al cambio di bambino)
+DEFAULT_CHUNK_VISITS = 50000
+
+_MALE = {"1": True, "m": True, "true": True, "0": False, "f": False, "false": False}
+
+
+def _number(value: str) -> float:
+    value = value.strip()
+    return float(value) if value else math.nan
+
+
+def read_chunks(lines, chunk_visits: int = DEFAULT_CHUNK_VISITS):
+    """
+    Blocchi di visite dal CSV: (child_id, is_male, age_days, {misura: valori}) di liste parallele
+
+    Un bambino che ricompare dopo le visite di un altro solleva ValueError (righe non contigue)
+    """
+    reader = csv.DictReader(lines)
+    missing = {"child_id", "is_male", "age_days"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Colonne mancanti nel file: {', '.join(sorted(missing))}")
+    measures = [key for key in velocity.MEASURES if key in reader.fieldnames]
+    seen = set()
+    current = None
+
+    def empty():
+        return [], [], [], {key: [] for key in measures}
+
+    children, sexes, ages, values = empty()
+    for row in reader:
+        child = row["child_id"]
+        if child != current:
+            if child in seen:
+                raise ValueError(f"Riga {reader.line_num}: le visite del bambino {child} non sono contigue")
+            seen.add(child)
+            current = child
+            if len(children) >= chunk_visits:
+                yield children, sexes, ages, values
+                children, sexes, ages, values = empty()
+        try:
+            sexes.append(_MALE[row["is_male"].strip().lower()])
+            ages.append(float(row["age_days"]))
+            for key in measures:
+                values[key].append(_number(row[key]))
+        except (KeyError, ValueError):
+            raise ValueError(f"Riga {reader.line_num}: valori non validi per il bambino {child}")
+        children.append(child)
+    if children:
+        yield children, sexes, ages, values
+
+
+def screen(lines, output, reference: str = "who", only_flagged: bool = False,
+           chunk_visits: int = DEFAULT_CHUNK_VISITS) -> dict:
+    """Valuta tutte le serie del file scrivendo una riga JSON per bambino; restituisce i conteggi"""
+    counts = {"children": 0, "visits": 0, "flagged": 0}
+    for children, sexes, ages, values in read_chunks(lines, chunk_visits):
+        result = velocity.assess_series(children, sexes, ages, values, reference)
+        for series in velocity.records(result):
+            counts["children"] += 1
+            counts["visits"] += series["visits"]
+            counts["flagged"] += series["flagged"]
+            if series["flagged"] or not only_flagged:
+                output.write(json.dumps(series, ensure_ascii=False) + "\n")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screening della crescita da un file di visite (CSV)")
+    parser.add_argument("visits", help="CSV delle visite (- per stdin)")
+    parser.add_argument("--output", help="File JSON per riga del referto (default stdout)")
+    parser.add_argument("--reference", choices=("who", "cdc"), default="who", help="Riferimento dai 2 anni")
+    parser.add_argument("--only-flagged", action="store_true", help="Scrive solo i bambini da rivalutare")
+    parser.add_argument("--chunk-visits", type=int, default=DEFAULT_CHUNK_VISITS, help="Visite per blocco vettoriale")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    source = sys.stdin if args.visits == "-" else open(args.visits, newline="", encoding="utf-8")
+    output = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    try:
+        counts = screen(source, output, args.reference, args.only_flagged, args.chunk_visits)
+    except ValueError as e:
+        print(f"Errore: {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    seconds = time.perf_counter() - start
+    print(f"{counts['children']} bambini, {counts['visits']} visite, {counts['flagged']} da rivalutare "
+          f"in {seconds:.1f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Manifest del catalogo per l'import differito dei moduli dei tool
+All'avvio il server deve solo rispondere a initialize e a tools/list: le
+definizioni pubblicate dei tool (nome, descrizione, schema) sono salvate in
+.tool_manifest.json e bastano per il catalogo e l'elenco delle risorse, mentre
+il modulo che implementa un tool (numpy, tabelle degli score...) viene
+importato alla prima chiamata di uno dei suoi tool.
+
+Il manifest è valido solo per i sorgenti da cui è stato generato: l'impronta
+copre i file di tools/ e utils/, la verbosity predefinita (che entra negli
+schemi pubblicati) e la versione del protocollo MCP. Se non corrisponde i
+moduli vengono importati tutti e il manifest viene rigenerato
+"""
+import hashlib
+import json
+import os
+
+import mcp.types as types
+from tools.registry import defer_tools, get_registered_tool, get_registered_tools, load_module
+from utils import config
+
+# Moduli che registrano i tool, in ordine di catalogo
+TOOL_MODULES = (
+    "tools.scores",        # PEWS, PAS, etc
+    "tools.calculations",  # BSA, fluidi
+    "tools.assessments",   # Altri assessment
+    "tools.growth",        # Curve di crescita WHO/CDC
+    "tools.clinical_tools",  # Fluidi in febbre, velocità di crescita, circonferenza cranica
+    "tools.batch",         # Esecuzione batch dei tool registrati
+    "tools.server_tools",  # Statistiche del server
+)
+
+MANIFEST_PATH = os.path.join(config.PROJECT_DIR, ".tool_manifest.json")
+_SOURCE_DIRS = ("tools", "utils")
+
+
+def fingerprint() -> str:
+    """Impronta dei sorgenti e della configurazione da cui dipendono le definizioni pubblicate"""
+    digest = hashlib.sha256(f"{types.LATEST_PROTOCOL_VERSION}|{config.OUTPUT_VERBOSITY}".encode())
+    for directory in _SOURCE_DIRS:
+        path = os.path.join(config.PROJECT_DIR, directory)
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith(".py"):
+                digest.update(filename.encode())
+                with open(os.path.join(path, filename), "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def build_manifest() -> dict:
+    """Manifest dei tool registrati (i moduli devono essere già importati)"""
+    tools = []
+    for tool in get_registered_tools():
+        entry = get_registered_tool(tool.name, load=False)
+        tools.append({
+            "name": tool.name,
+            "module": entry.module,
+            "reference": entry.reference is not None,
+            "definition": tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+        })
+    return {"fingerprint": fingerprint(), "tools": tools}
+
+
+def _read_manifest() -> dict | None:
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest: dict) -> None:
+    # Scrittura atomica; una directory in sola lettura non impedisce l'avvio
+    temporary = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temporary, MANIFEST_PATH)
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+def load_tools(lazy: bool = True) -> str:
+    """
+    Registra i tool del server
+
+    Args:
+        lazy: Con un manifest valido dichiara i tool senza importarne i moduli
+
+    Returns:
+        "manifest" se i moduli sono differiti, "import" se sono stati importati
+    """
+    if lazy:
+        manifest = _read_manifest()
+        if manifest is not None and manifest.get("fingerprint") == fingerprint():
+            defer_tools(
+                (tool["name"], tool["module"], types.Tool.model_validate(tool["definition"]), tool["reference"])
+                for tool in manifest["tools"]
+            )
+            return "manifest"
+    load_all_tools()
+    if lazy:
+        _write_manifest(build_manifest())
+    return "import"
+
+
+def load_all_tools() -> None:
+    """Importa tutti i moduli dei tool (es. prima del fork dei worker, per condividerli)"""
+    for module in TOOL_MODULES:
+        load_module(module)
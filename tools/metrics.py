@@ -0,0 +1,196 @@
+"""
+Metriche di latenza e throughput per tool
+Ogni chiamata che passa da call_tool registra, per nome tool, il numero di
+chiamate, gli errori e la latenza in un istogramma in stile HDR: bucket
+lineari per i valori piccoli e, oltre, 16 sotto-bucket per ogni potenza di
+due (errore relativo massimo 1/16 ≈ 6%), con memoria fissa e registrazione in
+tempo costante indipendentemente dal numero di chiamate.
+
+Le metriche sono esposte dal tool server_stats e, con il trasporto HTTP,
+opzionalmente su /metrics nel formato testuale di Prometheus.
+Sono per processo: con più worker HTTP ogni worker ha le proprie
+"""
+import threading
+import time
+
+# Sotto-bucket per potenza di due (2^SUB_BITS) e unità di registrazione (microsecondi)
+SUB_BITS = 4
+_SUB_COUNT = 1 << SUB_BITS
+# Latenza massima distinta (~2^36 µs ≈ 19 ore): i valori oltre finiscono nell'ultimo bucket
+_MAX_BITS = 36
+_BUCKETS = ((_MAX_BITS - SUB_BITS) << SUB_BITS) + _SUB_COUNT
+
+# Soglie (secondi) dei bucket cumulativi esportati a Prometheus
+PROMETHEUS_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                      0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _bucket(micros: int) -> int:
+    """Indice del bucket di un valore in microsecondi"""
+    bits = micros.bit_length()
+    if bits <= SUB_BITS + 1:
+        return micros
+    if bits > _MAX_BITS:
+        return _BUCKETS - 1
+    shift = bits - SUB_BITS - 1
+    return (shift << SUB_BITS) + (micros >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Limite inferiore incluso e superiore escluso del bucket, in microsecondi"""
+    if index < 2 * _SUB_COUNT:
+        return index, index + 1
+    shift = (index >> SUB_BITS) - 1
+    lower = (index - (shift << SUB_BITS)) << shift
+    return lower, lower + (1 << shift)
+
+
+class LatencyHistogram:
+    """Istogramma di latenza a bucket log-lineari con conteggio, somma, minimo e massimo"""
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[_bucket(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, percent: float) -> float | None:
+        """Latenza (secondi) sotto cui ricade percent% delle chiamate: punto medio del bucket, entro min/max"""
+        if not self.count:
+            return None
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                lower, upper = _bucket_bounds(index)
+                value = (lower + upper) / 2 / 1_000_000
+                return min(max(value, self.minimum), self.maximum)
+        return self.maximum
+
+    def cumulative(self, thresholds) -> list[int]:
+        """Chiamate con latenza entro ciascuna soglia (secondi), per bucket cumulativi"""
+        limits = [threshold * 1_000_000 for threshold in thresholds]
+        result = [0] * len(limits)
+        for index, count in enumerate(self.counts):
+            if count:
+                _, upper = _bucket_bounds(index)
+                for position, limit in enumerate(limits):
+                    if upper <= limit:
+                        result[position] += count
+        return result
+
+
+class ToolMetrics:
+    """Contatori e istogramma di latenza di un tool"""
+    __slots__ = ("calls", "errors", "latency", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, error: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            if error:
+                self.errors += 1
+            self.latency.record(seconds)
+
+    def histogram(self, thresholds) -> tuple[list[int], int, float]:
+        """Conteggi cumulativi entro ciascuna soglia, numero di chiamate e latenza totale"""
+        with self._lock:
+            return self.latency.cumulative(thresholds), self.latency.count, self.latency.total
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latency = self.latency
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "error_rate": round(self.errors / self.calls, 4) if self.calls else None,
+                "total_ms": round(latency.total * 1000, 3),
+                "mean_ms": round(latency.total / latency.count * 1000, 3) if latency.count else None,
+                "p50_ms": _ms(latency.percentile(50)),
+                "p90_ms": _ms(latency.percentile(90)),
+                "p99_ms": _ms(latency.percentile(99)),
+                "max_ms": _ms(latency.maximum if latency.count else None)
+            }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+# Nome tool -> metriche (creato alla prima chiamata del tool)
+_metrics: dict[str, ToolMetrics] = {}
+_metrics_lock = threading.Lock()
+_started = time.monotonic()
+
+
+def record_call(tool: str, seconds: float, error: bool) -> None:
+    """Registra una chiamata di un tool registrato"""
+    metrics = _metrics.get(tool)
+    if metrics is None:
+        with _metrics_lock:
+            metrics = _metrics.setdefault(tool, ToolMetrics())
+    metrics.record(seconds, error)
+
+
+def tool_metrics() -> dict[str, dict]:
+    """Metriche dei tool chiamati, in ordine di tempo totale decrescente (i più onerosi per primi)"""
+    snapshots = {name: metrics.snapshot() for name, metrics in list(_metrics.items())}
+    return dict(sorted(snapshots.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def uptime() -> float:
+    """Secondi dall'avvio del processo (import del modulo)"""
+    return time.monotonic() - _started
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(extra_gauges: dict[str, float] | None = None) -> str:
+    """Metriche nel formato testuale di esposizione di Prometheus (0.0.4)"""
+    lines = [
+        "# HELP pediatric_mcp_uptime_seconds Secondi dall'avvio del processo",
+        "# TYPE pediatric_mcp_uptime_seconds gauge",
+        f"pediatric_mcp_uptime_seconds {uptime():.3f}",
+    ]
+    for name, value in (extra_gauges or {}).items():
+        lines.append(f"# TYPE pediatric_mcp_{name} gauge")
+        lines.append(f"pediatric_mcp_{name} {value}")
+    tools = sorted(_metrics.items())
+    lines.append("# HELP pediatric_mcp_tool_calls_total Chiamate per tool")
+    lines.append("# TYPE pediatric_mcp_tool_calls_total counter")
+    for name, metrics in tools:
+        lines.append(f'pediatric_mcp_tool_calls_total{{tool="{_label(name)}"}} {metrics.calls}')
+    lines.append("# HELP pediatric_mcp_tool_errors_total Chiamate concluse con errore per tool")
+    lines.append("# TYPE pediatric_mcp_tool_errors_total counter")
+    for name, metrics in tools:
+        lines.append(f'pediatric_mcp_tool_errors_total{{tool="{_label(name)}"}} {metrics.errors}')
+    lines.append("# HELP pediatric_mcp_tool_duration_seconds Latenza delle chiamate per tool")
+    lines.append("# TYPE pediatric_mcp_tool_duration_seconds histogram")
+    for name, metrics in tools:
+        label = _label(name)
+        cumulative, count, total = metrics.histogram(PROMETHEUS_BUCKETS)
+        for threshold, within in zip(PROMETHEUS_BUCKETS, cumulative):
+            lines.append(f'pediatric_mcp_tool_duration_seconds_bucket{{tool="{label}",le="{threshold:g}"}} {within}')
+        lines.append(f'pediatric_mcp_tool_duration_seconds_bucket{{tool="{label}",le="+Inf"}} {count}')
+        lines.append(f'pediatric_mcp_tool_duration_seconds_sum{{tool="{label}"}} {total:.6f}')
+        lines.append(f'pediatric_mcp_tool_duration_seconds_count{{tool="{label}"}} {count}')
+    return "\n".join(lines) + "\n"
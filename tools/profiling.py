@@ -0,0 +1,167 @@
+"""
+Profilazione su richiesta delle chiamate ai tool
+Con PROFILE_MODE attivo le chiamate ai tool selezionati (PROFILE_TOOLS) sono
+eseguite sotto cProfile (cpu), tracemalloc (memory) o entrambi, senza
+modificare il codice dei tool: l'intera chiamata è profilata, validazione e
+generazione del referto comprese.
+
+Ogni chiamata che dura almeno PROFILE_MIN_MS produce in PROFILE_DIR un file
+.pstats e/o un'istantanea .tracemalloc chiamati
+{tool}-{timestamp}-{hash argomenti}-{durata}ms; per ogni tool vengono
+conservati solo i profili delle ultime PROFILE_KEEP chiamate.
+tracemalloc è globale al processo: con chiamate concorrenti l'istantanea
+comprende anche le allocazioni degli altri thread. cProfile profila una
+chiamata alla volta (da Python 3.12 un secondo profiler attivo solleva
+ValueError): le chiamate concorrenti a quella profilata sono eseguite senza
+profilo cpu.
+
+Uso: python -m tools.profiling FILE [--limit N]  (riepilogo di un dump)
+"""
+import argparse
+import cProfile
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+from tools.registry import call_registered_tool
+from utils import config
+
+logger = logging.getLogger(__name__)
+
+_CPU = config.PROFILE_MODE in ("cpu", "both")
+_MEMORY = config.PROFILE_MODE in ("memory", "both")
+# Frame conservati per ogni allocazione tracciata
+TRACEMALLOC_FRAMES = 25
+
+# Chiamate in corso sotto tracemalloc: il tracciamento si avvia con la prima e si ferma con l'ultima
+# (solo se avviato da qui: un tracciamento già attivo, es. python -X tracemalloc, resta attivo)
+_tracing = 0
+_tracing_owned = False
+_tracing_lock = threading.Lock()
+# Chiamata sotto cProfile in corso: le altre nello stesso momento non sono profilate
+_cpu_lock = threading.Lock()
+
+
+def is_profiled(tool: str) -> bool:
+    """True se le chiamate al tool vanno profilate"""
+    return (_CPU or _MEMORY) and (config.PROFILE_TOOLS is None or tool in config.PROFILE_TOOLS)
+
+
+def arguments_hash(arguments) -> str:
+    """Impronta breve degli argomenti, per riconoscere le chiamate ripetute senza salvarne il contenuto"""
+    canonical = json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def _start_tracing() -> None:
+    global _tracing, _tracing_owned
+    with _tracing_lock:
+        if _tracing == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            _tracing_owned = True
+        _tracing += 1
+
+
+def _stop_tracing() -> tracemalloc.Snapshot:
+    global _tracing, _tracing_owned
+    with _tracing_lock:
+        snapshot = tracemalloc.take_snapshot()
+        _tracing -= 1
+        if _tracing == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+        return snapshot
+
+
+def _rotate(tool: str) -> None:
+    """Elimina i dump delle chiamate più vecchie del tool oltre PROFILE_KEEP (i nomi iniziano con tool e timestamp)"""
+    prefix = f"{tool}-"
+    names = [name for name in os.listdir(config.PROFILE_DIR) if name.startswith(prefix)]
+    calls = sorted({os.path.splitext(name)[0] for name in names})
+    expired = set(calls[:max(0, len(calls) - config.PROFILE_KEEP)])
+    for name in names:
+        if os.path.splitext(name)[0] in expired:
+            try:
+                os.remove(os.path.join(config.PROFILE_DIR, name))
+            except OSError:
+                pass
+
+
+def _save(tool: str, arguments, seconds: float, profiler, snapshot) -> None:
+    os.makedirs(config.PROFILE_DIR, exist_ok=True)
+    base = os.path.join(
+        config.PROFILE_DIR,
+        f"{tool}-{time.time_ns() // 1000:016d}-{arguments_hash(arguments)}-{seconds * 1000:.1f}ms"
+    )
+    if profiler is not None:
+        profiler.dump_stats(base + ".pstats")
+    if snapshot is not None:
+        snapshot.dump(base + ".tracemalloc")
+    _rotate(tool)
+    logger.info("Profilo di %s (%.1f ms) salvato in %s", tool, seconds * 1000, base)
+
+
+def _start_profiler() -> cProfile.Profile | None:
+    """Profiler cpu avviato, o None se un'altra chiamata (o un profiler esterno) è già sotto profilo"""
+    if not _cpu_lock.acquire(blocking=False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        _cpu_lock.release()
+        return None
+    return profiler
+
+
+def profiled_call(name: str, arguments: dict):
+    """call_registered_tool sotto cProfile e/o tracemalloc, con dump su disco oltre PROFILE_MIN_MS"""
+    profiler = None
+    snapshot = None
+    if _MEMORY:
+        _start_tracing()
+    start = time.perf_counter()
+    try:
+        if _CPU:
+            profiler = _start_profiler()
+        try:
+            return call_registered_tool(name, arguments)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                _cpu_lock.release()
+    finally:
+        seconds = time.perf_counter() - start
+        if _MEMORY:
+            snapshot = _stop_tracing()
+        if (profiler is not None or snapshot is not None) and seconds * 1000 >= config.PROFILE_MIN_MS:
+            try:
+                _save(name, arguments, seconds, profiler, snapshot)
+            except OSError as e:
+                # Un dump non scrivibile non deve far fallire la chiamata
+                logger.warning("Profilo di %s non salvato: %s", name, e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Riepilogo di un dump di profilazione di un tool")
+    parser.add_argument("file", help="File .pstats o .tracemalloc in PROFILE_DIR")
+    parser.add_argument("--limit", type=int, default=20, help="Righe da mostrare")
+    args = parser.parse_args()
+
+    if args.file.endswith(".tracemalloc"):
+        snapshot = tracemalloc.Snapshot.load(args.file)
+        statistics = snapshot.statistics("lineno")
+        print(f"Memoria allocata: {sum(stat.size for stat in statistics) / 1024:.1f} KiB")
+        for stat in statistics[:args.limit]:
+            print(stat)
+    else:
+        import pstats
+        pstats.Stats(args.file).sort_stats("cumulative").print_stats(args.limit)
+
+
+if __name__ == "__main__":
+    main()
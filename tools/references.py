@@ -0,0 +1,53 @@
+"""
+Materiale di riferimento dei tool come risorse MCP
+Tabelle di interpretazione e note cliniche statiche non cambiano tra una
+chiamata e l'altra: invece di ripeterle in ogni referto sono esposte come
+risorse pediatric://reference/{tool}, che il client legge una volta sola
+(con verbosity standard il referto contiene solo il rimando alla risorsa).
+L'elenco comprende i tool differiti; il testo è letto dal tool registrato,
+importandone il modulo alla prima lettura
+"""
+import mcp.types as types
+from tools.registry import get_reference_tools, get_registered_tool, registry_generation
+from tools.results import REFERENCE_URI, reference_uri
+
+REFERENCE_TEMPLATE = types.ResourceTemplate(
+    uriTemplate=REFERENCE_URI,
+    name="reference",
+    description="Materiale di riferimento clinico (interpretazione dei punteggi, note cliniche) di un tool",
+    mimeType="text/plain"
+)
+
+# (generazione del registro, risorse, nome tool per URI): ricostruito solo se cambia il catalogo
+_resources: tuple[int, tuple[types.Resource, ...], dict[str, str]] | None = None
+
+
+def _build() -> tuple[int, tuple[types.Resource, ...], dict[str, str]]:
+    global _resources
+    generation = registry_generation()
+    if _resources is None or _resources[0] != generation:
+        references = get_reference_tools()
+        resources = tuple(
+            types.Resource(
+                uri=reference_uri(tool),
+                name=tool,
+                description=f"Materiale di riferimento di {tool}",
+                mimeType="text/plain"
+            )
+            for tool in references
+        )
+        _resources = (generation, resources, {reference_uri(tool): tool for tool in references})
+    return _resources
+
+
+def get_reference_resources() -> tuple[types.Resource, ...]:
+    """Risorse MCP del materiale di riferimento, una per tool"""
+    return _build()[1]
+
+
+def read_reference(uri: str) -> str:
+    """Testo della risorsa di riferimento (ValueError se l'URI non corrisponde a nessun tool)"""
+    tool = _build()[2].get(uri)
+    if tool is None:
+        raise ValueError(f"Risorsa sconosciuta: {uri}")
+    return get_registered_tool(tool).reference
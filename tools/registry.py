@@ -0,0 +1,298 @@
+"""
+Registro centrale dei tool MCP
+Ogni handler _calculate_* / _assess_* si registra con la propria definizione types.Tool:
+catalogo (list_tools) e routing (call_tool) derivano dalla stessa fonte
+e il dispatch è un singolo lookup su dizionario.
+Alla registrazione l'inputSchema viene compilato in un validatore che respinge
+gli argomenti non conformi prima di invocare l'handler.
+I tool che producono un referto ricevono in più l'argomento verbosity, gestito
+dal registro e mai passato all'handler.
+I tool noti dal manifest del catalogo (vedi tools/manifest.py) possono essere
+differiti: il loro modulo viene importato alla prima richiesta di uno dei suoi tool
+"""
+import importlib
+import sys
+import threading
+import time
+
+import mcp.types as types
+from tools.cache import cache_for, canonical_key
+from tools.results import ToolResult, reference_suffixes
+from tools.validation import SchemaValidationError, compile_validator
+from utils import config
+
+# Argomento aggiunto allo schema pubblicato dei tool con referto
+VERBOSITY_PROPERTY = {
+    "type": "string",
+    "enum": list(config.VERBOSITY_LEVELS),
+    "default": config.OUTPUT_VERBOSITY,
+    "description": "Dettaglio: minimal=solo dati, standard=senza riferimenti clinici (risorsa MCP), full=referto completo"
+}
+
+
+def _with_verbosity(definition: types.Tool) -> types.Tool:
+    """Definizione pubblicata nel catalogo: lo schema del tool più l'argomento verbosity"""
+    schema = dict(definition.inputSchema)
+    schema["properties"] = {**schema.get("properties", {}), "verbosity": VERBOSITY_PROPERTY}
+    return definition.model_copy(update={"inputSchema": schema})
+
+
+class RegisteredTool:
+    """Definizione MCP e handler di un tool registrato"""
+    __slots__ = ("definition", "advertised", "handler", "validate", "batch", "cache", "module", "error_prefix",
+                 "report", "reference", "suffixes", "offload")
+
+    def __init__(self, definition: types.Tool, handler, error_prefix: str, deterministic: bool,
+                 reference: str | None, report: bool, offload: bool):
+        # definition è il contratto dell'handler; advertised è quella pubblicata nel catalogo
+        self.definition = definition
+        self.advertised = _with_verbosity(definition) if report else definition
+        self.handler = handler
+        self.validate = compile_validator(definition)
+        # Kernel opzionale per il tool batch: lista di argomenti validati -> lista di risultati strutturati
+        self.batch = None
+        # Cache dei risultati (None se disattivata o tool non deterministico)
+        self.cache = cache_for(definition.name, deterministic)
+        self.module = handler.__module__
+        self.error_prefix = error_prefix
+        # Materiale di riferimento statico (risorsa MCP) e testo da accodare per livello di dettaglio
+        self.report = report
+        self.reference = reference
+        self.suffixes = reference_suffixes(definition.name, reference)
+        # Eseguito nel pool di worker invece che sull'event loop (vedi tools/executor.py)
+        self.offload = offload
+
+
+class DeferredTool:
+    """Tool noto dal manifest il cui modulo non è ancora stato importato"""
+    __slots__ = ("module", "advertised", "has_reference")
+
+    def __init__(self, module: str, advertised: types.Tool, has_reference: bool):
+        self.module = module
+        self.advertised = advertised
+        self.has_reference = has_reference
+
+
+# Nome tool -> RegisteredTool (l'ordine di inserimento è l'ordine del catalogo)
+_registry: dict[str, RegisteredTool] = {}
+# Incrementato quando il catalogo cambia: permette ai consumatori di invalidare le proprie cache
+_generation = 0
+# Tool differiti e ordine del catalogo dichiarato dal manifest (stabile mentre i moduli vengono importati)
+_deferred: dict[str, DeferredTool] = {}
+_catalog_order: dict[str, None] = {}
+# Funzioni eseguite dopo l'import di ogni modulo di tool (es. costruzione delle tabelle degli score)
+_load_hooks: list = []
+# Modulo -> secondi impiegati da import e hook; stampati su stderr se il profilo è attivo
+_import_times: dict[str, float] = {}
+_import_profile = False
+_load_lock = threading.RLock()
+
+
+def register_tool(definition: types.Tool, error_prefix: str = "Errore nel calcolo", deterministic: bool = True,
+                  reference: str | None = None, report: bool = True, offload: bool = False):
+    """
+    Decoratore che registra un handler con la sua definizione types.Tool
+
+    Args:
+        definition: Definizione MCP del tool (nome, descrizione, inputSchema)
+        error_prefix: Prefisso del messaggio restituito se l'handler solleva un'eccezione
+        deterministic: False per i tool il cui risultato non dipende solo dagli argomenti (esclusi dalla cache)
+        reference: Materiale di riferimento statico (interpretazione, note cliniche), fuori dal referto del paziente
+        report: False per i tool che restituiscono dati e non un referto (nessun argomento verbosity)
+        offload: True per i tool costosi, da eseguire nel pool di worker senza bloccare l'event loop
+    """
+    def decorator(handler):
+        global _generation
+        if definition.name in _registry:
+            raise ValueError(f"Strumento già registrato: {definition.name}")
+        _registry[definition.name] = RegisteredTool(definition, handler, error_prefix, deterministic, reference, report, offload)
+        # Un tool differito era già nel catalogo: la sua registrazione non lo cambia
+        if _deferred.pop(definition.name, None) is None:
+            _generation += 1
+        return handler
+    return decorator
+
+
+def defer_tools(tools) -> None:
+    """
+    Dichiara tool registrati da moduli non ancora importati
+
+    Args:
+        tools: Sequenza di (nome, modulo, definizione pubblicata, ha materiale di riferimento), in ordine di catalogo
+    """
+    global _generation
+    for name, module, advertised, has_reference in tools:
+        _catalog_order[name] = None
+        if name not in _registry:
+            _deferred[name] = DeferredTool(module, advertised, has_reference)
+    _generation += 1
+
+
+def add_load_hook(hook) -> None:
+    """Registra una funzione da eseguire (senza argomenti) dopo l'import di ogni modulo di tool"""
+    _load_hooks.append(hook)
+
+
+def get_load_hooks() -> list:
+    """Hook di caricamento registrati (da reinstallare in un nuovo processo)"""
+    return list(_load_hooks)
+
+
+def set_import_profile(enabled: bool) -> None:
+    """Attiva la stampa su stderr del tempo di import di ogni modulo di tool"""
+    global _import_profile
+    _import_profile = enabled
+
+
+def load_module(module: str) -> None:
+    """Importa un modulo di tool (una sola volta) ed esegue gli hook di caricamento"""
+    with _load_lock:
+        if module in _import_times:
+            return
+        start = time.perf_counter()
+        importlib.import_module(module)
+        for hook in _load_hooks:
+            hook()
+        _import_times[module] = time.perf_counter() - start
+    if _import_profile:
+        print(f"import {module}: {_import_times[module] * 1000:.1f} ms", file=sys.stderr)
+
+
+def _load_deferred(name: str) -> RegisteredTool | None:
+    deferred = _deferred.get(name)
+    if deferred is not None:
+        load_module(deferred.module)
+    return _registry.get(name)
+
+
+def register_batch(name: str):
+    """
+    Decoratore che associa un kernel batch ad un tool già registrato
+
+    Il kernel riceve la lista degli argomenti già validati e restituisce, nello
+    stesso ordine, un dizionario di risultati per ciascun elemento (senza testo formattato)
+    """
+    def decorator(kernel):
+        entry = _registry.get(name)
+        if entry is None:
+            raise ValueError(f"Strumento sconosciuto: {name}")
+        entry.batch = kernel
+        return kernel
+    return decorator
+
+
+def replace_handler(name: str, handler) -> None:
+    """Sostituisce l'handler di un tool registrato (es. con una versione tabellata), mantenendo definizione, validazione e cache"""
+    entry = _registry.get(name)
+    if entry is None:
+        raise ValueError(f"Strumento sconosciuto: {name}")
+    entry.handler = handler
+
+
+def get_registered_tool(name: str, load: bool = True) -> RegisteredTool | None:
+    """
+    Restituisce il tool registrato con questo nome (None se assente)
+
+    Un tool differito viene caricato importandone il modulo, salvo load=False
+    """
+    entry = _registry.get(name)
+    if entry is None and load and name in _deferred:
+        entry = _load_deferred(name)
+    return entry
+
+
+def get_registered_tools() -> list[types.Tool]:
+    """Restituisce le definizioni pubblicate di tutti i tool, differiti compresi, in ordine di catalogo"""
+    tools = []
+    for name in _catalog_order:
+        entry = _registry.get(name)
+        tools.append(entry.advertised if entry is not None else _deferred[name].advertised)
+    tools.extend(entry.advertised for name, entry in _registry.items() if name not in _catalog_order)
+    return tools
+
+
+def get_reference_tools() -> list[str]:
+    """Tool con materiale di riferimento statico, differiti compresi, in ordine di catalogo"""
+    names = [name for name in _catalog_order
+             if (name in _registry and _registry[name].reference is not None)
+             or (name in _deferred and _deferred[name].has_reference)]
+    names.extend(name for name, entry in _registry.items()
+                 if entry.reference is not None and name not in _catalog_order)
+    return names
+
+
+def get_tool_modules() -> list[str]:
+    """Moduli che registrano i tool, differiti compresi (da importare in un nuovo processo)"""
+    modules = [entry.module for entry in _registry.values()]
+    modules.extend(deferred.module for deferred in _deferred.values())
+    return list(dict.fromkeys(modules))
+
+
+def import_times() -> dict[str, float]:
+    """Secondi impiegati per importare ogni modulo di tool caricato finora"""
+    return dict(_import_times)
+
+
+def cache_stats() -> dict[str, dict]:
+    """Contatori della cache dei risultati per ogni tool che la utilizza"""
+    return {name: entry.cache.stats() for name, entry in _registry.items() if entry.cache is not None}
+
+
+def registry_generation() -> int:
+    """Numero di registrazioni effettuate finora"""
+    return _generation
+
+
+def call_registered_tool(name: str, arguments: dict) -> types.CallToolResult | list[types.TextContent]:
+    """
+    Esegue il tool registrato: un solo lookup, nessuna catena di confronti sul nome
+
+    Argomenti non conformi all'inputSchema producono un CallToolResult di errore
+    (isError=True) con i dettagli in structuredContent, senza invocare l'handler;
+    un'eccezione dell'handler produce un CallToolResult di errore con il suo messaggio.
+    Per i tool con cache attiva un risultato già calcolato viene restituito senza rieseguire l'handler.
+    Un ToolResult dell'handler viene reso qui, al confine MCP, al livello di dettaglio
+    richiesto (argomento verbosity o default del server): testo in content e dati
+    strutturati in structuredContent.
+    """
+    entry = _registry.get(name)
+    if entry is None:
+        entry = _load_deferred(name)
+        if entry is None:
+            raise ValueError(f"Strumento sconosciuto: {name}")
+    # La cache contiene solo risultati di argomenti già validati: un hit salta anche la validazione
+    cache = entry.cache if isinstance(arguments, dict) else None
+    if cache is not None:
+        key = canonical_key(arguments)
+        cached = cache.get(key)
+        if cached is not None:
+            return list(cached) if cached.__class__ is tuple else cached
+    verbosity = config.OUTPUT_VERBOSITY
+    if entry.report and isinstance(arguments, dict) and "verbosity" in arguments:
+        arguments = dict(arguments)
+        verbosity = arguments.pop("verbosity")
+        if verbosity not in config.VERBOSITY_LEVELS:
+            allowed = ", ".join(config.VERBOSITY_LEVELS)
+            return SchemaValidationError(name, [
+                {"field": "verbosity", "message": f"verbosity: valore non ammesso (ammessi: {allowed})"}
+            ]).to_result()
+    try:
+        arguments = entry.validate(arguments)
+    except SchemaValidationError as e:
+        return e.to_result()
+    try:
+        result = entry.handler(arguments)
+        if isinstance(result, ToolResult):
+            # Il referto è generato qui: anche i suoi errori diventano il messaggio d'errore del tool
+            result = result.to_call_result(verbosity, entry.suffixes)
+    except Exception as e:
+        # isError=True: il client (e le metriche) distinguono il fallimento da un referto
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=f"{entry.error_prefix}: {str(e)}")],
+            isError=True
+        )
+    if cache is not None:
+        # Le eccezioni non vengono messe in cache; il CallToolResult è condiviso tra gli hit,
+        # le liste di contenuti sono copiate in tupla per non condividere quella restituita
+        cache.put(key, tuple(result) if isinstance(result, list) else result)
+    return result
@@ -0,0 +1,86 @@
+"""
+Risultati strutturati dei tool
+Gli handler restituiscono un ToolResult: i dati essenziali del calcolo
+(punteggio, fascia, raccomandazione...) come dizionario JSON-serializzabile e
+una funzione che produce il referto testuale. Il testo viene generato solo
+quando serve, al confine MCP, e memorizzato; chi consuma i dati (tool batch,
+structuredContent) non paga la formattazione del referto.
+
+Il referto contiene solo le righe specifiche del paziente: il materiale di
+riferimento statico del tool (tabelle di interpretazione, note cliniche) è
+registrato a parte e, secondo il livello di dettaglio, viene accodato (full),
+sostituito da un rimando alla risorsa MCP pediatric://reference/{tool}
+(standard) oppure omesso insieme al referto, lasciando i soli dati (minimal)
+"""
+import mcp.types as types
+
+# URI delle risorse MCP con il materiale di riferimento di ciascun tool
+REFERENCE_URI = "pediatric://reference/{tool}"
+
+
+def reference_uri(tool: str) -> str:
+    return REFERENCE_URI.format(tool=tool)
+
+
+def reference_suffixes(tool: str, reference: str | None) -> dict[str, str]:
+    """Testo da accodare al referto per ogni livello di dettaglio (vuoto se il tool non ha riferimenti)"""
+    if reference is None:
+        return {}
+    return {
+        "full": "\n\n" + reference,
+        "standard": f"\n\nMateriale di riferimento: {reference_uri(tool)}"
+    }
+
+
+def _format_value(value) -> str:
+    if value is True:
+        return "sì"
+    if value is False:
+        return "no"
+    if isinstance(value, list):
+        return ", ".join(map(str, value)) if value else "-"
+    return str(value)
+
+
+class ToolResult:
+    """Dati strutturati di un tool con referto testuale generato su richiesta"""
+    __slots__ = ("data", "_render", "_text")
+
+    def __init__(self, data: dict, render=None, text: str | None = None):
+        if render is None and text is None:
+            raise ValueError("Serve una funzione di rendering o un testo già formattato")
+        self.data = data
+        self._render = render
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        """Referto testuale specifico del paziente (generato alla prima richiesta)"""
+        if self._text is None:
+            self._text = self._render()
+            self._render = None
+        return self._text
+
+    @property
+    def rendered(self) -> bool:
+        return self._text is not None
+
+    def summary(self) -> str:
+        """Testo minimo: una riga 'chiave: valore' per ogni dato, senza generare il referto"""
+        return "\n".join(f"{key}: {_format_value(value)}" for key, value in self.data.items() if value is not None)
+
+    def to_call_result(self, verbosity: str = "full", suffixes: dict[str, str] | None = None) -> types.CallToolResult:
+        """Risultato MCP al livello di dettaglio richiesto: testo in content e dati in structuredContent"""
+        if verbosity == "minimal":
+            text = self.summary()
+        elif suffixes:
+            text = self.text + suffixes.get(verbosity, "")
+        else:
+            text = self.text
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=text)],
+            structuredContent=self.data
+        )
+
+    def __repr__(self):
+        return f"ToolResult({self.data!r})"
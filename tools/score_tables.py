@@ -0,0 +1,260 @@
+"""
+Tabelle precalcolate degli score a input discreti
+Per gli score con spazio di input piccolo e finito (APGAR, PEWS, GCS, Westley,
+PAS/PASS asma) l'handler _calculate_* viene eseguito una volta per ogni
+combinazione di input e il referto è salvato in una tabella indicizzata
+(indice intero a base mista -> ToolResult internato, con il referto già
+generato): a runtime una chiamata costa un calcolo di indice e un lookup.
+
+I campi liberi che l'handler stampa o confronta con poche soglie (es. età in
+mesi nel GCS) non vengono enumerati: si enumerano le fasce delimitate dalle
+soglie e il valore è reinserito nel testo e nei dati tramite segnaposto.
+I parametri vitali grezzi (valori continui) non entrano nella tabella: se
+presenti nella chiamata si usa l'handler live.
+
+Uso: python -m tools.score_tables --verify  (confronto esaustivo con gli handler)
+"""
+import argparse
+import itertools
+import sys
+from bisect import bisect_right
+
+from tools.registry import get_registered_tool, replace_handler
+from tools.results import ToolResult
+
+# Tool tabellati -> campi passanti con le soglie (upper-exclusive) usate dall'handler.
+# I campi non elencati sono enumerati per intero dallo schema (interi con minimo/massimo, booleani)
+SCORE_TABLES = {
+    "calculate_apgar": {},
+    "calculate_pews": {"age_months": ()},
+    "calculate_gcs_pediatric": {"age_months": (24,)},
+    "calculate_westley_croup_score": {},
+    "calculate_pas_asthma": {},
+    "calculate_pass_asthma": {},
+}
+
+# Campi che, se presenti, richiedono l'handler live (parametri vitali grezzi, vedi utils/vital_signs.py)
+LIVE_FIELDS = {
+    "calculate_pews": ("heart_rate", "capillary_refill_s", "respiratory_rate", "oxygen_l_min", "fio2_percent"),
+    "calculate_gcs_pediatric": ("heart_rate", "respiratory_rate", "systolic_bp"),
+}
+
+# Limite di combinazioni per tabella: oltre si preferisce l'handler live
+MAX_TABLE_SIZE = 50000
+
+
+class _Placeholder(int):
+    """Valore rappresentativo di una fascia che nel testo si formatta come segnaposto"""
+
+    def __new__(cls, value: int, marker: str):
+        obj = super().__new__(cls, value)
+        obj.marker = marker
+        return obj
+
+    def __format__(self, spec):
+        return self.marker
+
+    def __str__(self):
+        return self.marker
+
+    __repr__ = __str__
+
+
+class _Field:
+    """Cifra dell'indice a base mista: valori enumerati o fasce di un campo passante"""
+    __slots__ = ("name", "radix", "stride", "values", "minimum", "absent", "breakpoints", "marker")
+
+    def __init__(self, name: str, spec: dict, required: bool, breakpoints):
+        self.name = name
+        self.breakpoints = breakpoints
+        self.marker = None
+        self.minimum = 0
+        if breakpoints is not None:
+            if not required or spec.get("type") != "integer":
+                raise ValueError(f"Campo passante {name}: deve essere intero e obbligatorio")
+            lower = spec.get("minimum", 0)
+            self.marker = f"\x00{name}\x00"
+            # Un rappresentante per fascia (il suo limite inferiore)
+            self.values = [_Placeholder(value, self.marker) for value in (lower, *breakpoints)]
+        elif spec.get("type") == "boolean":
+            self.values = [False, True]
+        elif spec.get("type") == "integer" and "minimum" in spec and "maximum" in spec:
+            self.minimum = spec["minimum"]
+            self.values = list(range(spec["minimum"], spec["maximum"] + 1))
+        else:
+            raise ValueError(f"Campo non enumerabile: {name}")
+        # I campi facoltativi hanno una cifra in più per "assente"
+        self.absent = None if required else len(self.values)
+        self.radix = len(self.values) + (0 if required else 1)
+        self.stride = 1
+
+    def choices(self):
+        """(cifra, valore) per l'enumerazione; None = campo assente"""
+        pairs = list(enumerate(self.values))
+        if self.absent is not None:
+            pairs.append((self.absent, None))
+        return pairs
+
+
+class ScoreTable:
+    """Referti di uno score per ogni combinazione di input, indicizzati a base mista"""
+
+    def __init__(self, name: str, handler, passthrough: dict, live: tuple = ()):
+        self.name = name
+        self.handler = handler
+        self.live = live
+        schema = get_registered_tool(name).definition.inputSchema
+        required = set(schema.get("required", ()))
+        self.fields = [
+            _Field(field, spec, field in required, passthrough.get(field))
+            for field, spec in schema["properties"].items() if field not in live
+        ]
+        size = 1
+        for field in reversed(self.fields):
+            field.stride = size
+            size *= field.radix
+        if size > MAX_TABLE_SIZE:
+            raise ValueError(f"Tabella {name} troppo grande: {size} combinazioni")
+        self.size = size
+        self.markers = [field for field in self.fields if field.marker is not None]
+        # Cifre dei campi enumerati, in forma compatta per il calcolo dell'indice
+        self.digits = tuple(
+            (field.name, field.stride, field.minimum, field.absent)
+            for field in self.fields if field.marker is None
+        )
+        self.table = self._build()
+
+    def _build(self) -> list:
+        """Esegue l'handler su tutte le combinazioni; referti identici condividono lo stesso risultato"""
+        table = [None] * self.size
+        interned = {}
+        for combination in itertools.product(*(field.choices() for field in self.fields)):
+            index = 0
+            args = {}
+            for field, (digit, value) in zip(self.fields, combination):
+                index += digit * field.stride
+                if value is not None:
+                    args[field.name] = value
+            try:
+                result = self.handler(args)
+                text = result.text
+            except Exception:
+                continue  # None: a runtime si richiama l'handler live (che gestisce l'errore)
+            # Campi dei dati che contengono il valore di un campo passante
+            slots = tuple(
+                (key, value.marker) for key, value in result.data.items() if isinstance(value, _Placeholder)
+            )
+            if self.markers and (slots or any(field.marker in text for field in self.markers)):
+                # Modello: i segnaposto vengono sostituiti coi valori effettivi ad ogni chiamata
+                table[index] = interned.setdefault((text, slots), (text, result.data, slots))
+            else:
+                table[index] = interned.setdefault(text, ToolResult(result.data, text=text))
+        return table
+
+    def __call__(self, args: dict) -> ToolResult:
+        for name in self.live:
+            if name in args:
+                return self.handler(args)
+        index = 0
+        for name, stride, minimum, absent in self.digits:
+            value = args.get(name)
+            index += (absent if value is None else value - minimum) * stride
+        for field in self.markers:
+            index += bisect_right(field.breakpoints, args[field.name]) * field.stride
+        entry = self.table[index]
+        if entry is None:
+            return self.handler(args)
+        if entry.__class__ is ToolResult:
+            return entry
+        text, data, slots = entry
+        values = {field.marker: args[field.name] for field in self.markers}
+        for marker, value in values.items():
+            text = text.replace(marker, str(value))
+        if slots:
+            data = dict(data)
+            for key, marker in slots:
+                data[key] = values[marker]
+        return ToolResult(data, text=text)
+
+    def all_inputs(self):
+        """Tutte le combinazioni valide, con i campi passanti enumerati su tutto il loro intervallo"""
+        schema = get_registered_tool(self.name).definition.inputSchema
+        domains = []
+        for field in self.fields:
+            if field.breakpoints is not None:
+                spec = schema["properties"][field.name]
+                values = list(range(spec.get("minimum", 0), spec["maximum"] + 1))
+            else:
+                values = list(field.values)
+            if field.absent is not None:
+                values.append(None)
+            domains.append(values)
+        for combination in itertools.product(*domains):
+            yield {field.name: value for field, value in zip(self.fields, combination) if value is not None}
+
+
+_tables: dict[str, ScoreTable] = {}
+
+
+def install_score_tables() -> dict[str, ScoreTable]:
+    """
+    Costruisce le tabelle e sostituisce gli handler dei tool tabellati con il lookup
+
+    Considera solo i tool già importati (non carica moduli differiti): va richiamata
+    dopo l'import di ogni modulo di tool, es. come hook di caricamento del registro
+    """
+    for name, passthrough in SCORE_TABLES.items():
+        if name in _tables:
+            continue
+        entry = get_registered_tool(name, load=False)
+        if entry is None:
+            continue
+        table = ScoreTable(name, entry.handler, passthrough, LIVE_FIELDS.get(name, ()))
+        replace_handler(name, table)
+        _tables[name] = table
+    return _tables
+
+
+def _outcome(handler, args: dict) -> tuple:
+    """Testo e dati del referto, o tipo e messaggio dell'errore (combinazioni non valide, es. campi mancanti)"""
+    try:
+        result = handler(dict(args))
+    except Exception as e:
+        return type(e), str(e)
+    return result.text, result.data
+
+
+def verify(tables: dict[str, ScoreTable]) -> int:
+    """Confronta tabella e handler live su ogni input valido; restituisce il numero di differenze"""
+    differences = 0
+    for name, table in tables.items():
+        checked = 0
+        for args in table.all_inputs():
+            expected = _outcome(table.handler, args)
+            actual = _outcome(table, args)
+            checked += 1
+            if actual != expected:
+                differences += 1
+                if differences <= 10:
+                    print(f"DIFFERENZA {name} {args}", file=sys.stderr)
+        print(f"{name:<32} {table.size:6d} voci  {len(set(map(id, table.table))):5d} referti distinti  {checked:6d} input verificati")
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tabelle precalcolate degli score a input discreti")
+    parser.add_argument("--verify", action="store_true", help="Verifica esaustiva tabella contro handler live")
+    args = parser.parse_args()
+
+    import tools.scores  # noqa: F401 - registra gli score
+    tables = install_score_tables()
+    if args.verify:
+        differences = verify(tables)
+        print(f"Differenze: {differences}")
+        sys.exit(1 if differences else 0)
+    for name, table in tables.items():
+        print(f"{name:<32} {table.size:6d} voci")
+
+
+if __name__ == "__main__":
+    main()
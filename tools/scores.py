@@ -3,9 +3,17 @@ Score medici per la pediatria
 PEWS - Pediatric Early Warning Score
 PAS - Pediatric Appendicitis Score  
 APGAR - Score neonatale
+PEWS, GCS e PTS accettano anche i parametri vitali grezzi (utils/vital_signs.py)
 """
+import math
+
 import mcp.types as types
+import numpy as np
+from tools.registry import register_batch, register_tool
+from tools.results import ToolResult
+from utils import vectorized, vital_signs
 from utils.medical_formulas import (
+    PEWS_BANDS,
     calculate_pews_interpretation,
     calculate_pas_interpretation, 
     calculate_apgar_interpretation,
@@ -23,898 +31,148 @@ from utils.medical_formulas import (
     calculate_bops_interpretation
 )
 
-def get_score_tools():
-    """Restituisce tutti i tool per i score medici"""
-    return [
-        types.Tool(
-            name="calculate_pews",
-            description="Calcola il PEWS (Pediatric Early Warning Score) versione italiana validata per identificare bambini a rischio di deterioramento clinico",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "behavior": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Comportamento: 0=Gioca/appropriato, 1=Dorme, 2=Irritabile/Preoccupazione genitori, 3=Letargico/confuso/Ridotta risposta al dolore"
-                    },
-                    "cardiovascular": {
-                        "type": "integer", 
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Apparato cardiovascolare: 0=Roseo/refill 1-2sec, 1=Pallido/refill 3sec, 2=Grigio/refill 4sec/tachicardia +20bpm, 3=Grigio marezzato/refill ≥5sec/tachicardia +30bpm/BRADICARDIA"
-                    },
-                    "respiratory": {
-                        "type": "integer",
-                        "minimum": 0, 
-                        "maximum": 3,
-                        "description": "Apparato respiratorio: 0=Parametri normali/no rientramenti, 1=Lievi alterazioni/rientramenti intercostali, 2=Moderate alterazioni/rientramenti sottosternali, 3=Gravi alterazioni/rientramenti globali"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 216,
-                        "description": "Età in mesi per interpretazione parametri vitali"
-                    }
-                },
-                "required": ["behavior", "cardiovascular", "respiratory", "age_months"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_pas",
-            description="Calcola il PAS (Pediatric Appendicitis Score) per valutare la probabilità di appendicite acuta",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "fever": {
-                        "type": "boolean",
-                        "description": "Febbre ≥38°C (1 punto se presente)"
-                    },
-                    "anorexia": {
-                        "type": "boolean", 
-                        "description": "Anoressia (1 punto se presente)"
-                    },
-                    "nausea_vomiting": {
-                        "type": "boolean",
-                        "description": "Nausea o vomito (1 punto se presente)" 
-                    },
-                    "cough_percussion_hopping": {
-                        "type": "boolean",
-                        "description": "Dolore con colpo di tosse, percussione o saltellamento (2 punti se presente)"
-                    },
-                    "rlq_tenderness": {
-                        "type": "boolean",
-                        "description": "Dolorabilità in fossa iliaca destra (2 punti se presente)"
-                    },
-                    "pain_migration": {
-                        "type": "boolean", 
-                        "description": "Migrazione del dolore da regione periombelicale a fossa iliaca destra (1 punto se presente)"
-                    },
-                    "leukocytosis": {
-                        "type": "boolean",
-                        "description": "Leucocitosi >10.000/μL (1 punto se presente)"
-                    },
-                    "neutrophilia": {
-                        "type": "boolean",
-                        "description": "Neutrofilia >7.500/μL (1 punto se presente)"
-                    }
-                },
-                "required": ["fever", "anorexia", "nausea_vomiting", "cough_percussion_hopping", "rlq_tenderness", "pain_migration", "leukocytosis", "neutrophilia"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_apgar",
-            description="Calcola il punteggio APGAR per valutare le condizioni del neonato",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "heart_rate": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Frequenza cardiaca: 0=Assente, 1=<100 bpm, 2=≥100 bpm"
-                    },
-                    "respiratory_effort": {
-                        "type": "integer",
-                        "minimum": 0, 
-                        "maximum": 2,
-                        "description": "Sforzo respiratorio: 0=Assente, 1=Debole/irregolare, 2=Buono/pianto vigoroso"
-                    },
-                    "muscle_tone": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2, 
-                        "description": "Tono muscolare: 0=Flaccido, 1=Flessione degli arti, 2=Movimento attivo"
-                    },
-                    "reflex_irritability": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Riflessi/irritabilità: 0=Nessuna risposta, 1=Smorfie, 2=Pianto vigoroso"
-                    },
-                    "color": {
-                        "type": "integer", 
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Colorito: 0=Blu/pallido, 1=Rosa con estremità blu, 2=Completamente rosa"
-                    }
-                },
-                "required": ["heart_rate", "respiratory_effort", "muscle_tone", "reflex_irritability", "color"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_gcs_pediatric",
-            description="Calcola Glasgow Coma Scale pediatrica per valutazione neurologica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "eye_opening": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 4,
-                        "description": "Apertura occhi: 1=Nessuna, 2=Al dolore, 3=Al richiamo, 4=Spontanea"
-                    },
-                    "verbal_response": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 5,
-                        "description": "Risposta verbale: 1=Nessuna, 2=Suoni incomprensibili, 3=Parole inappropriate, 4=Confuso, 5=Orientato"
-                    },
-                    "motor_response": {
-                        "type": "integer",
-                        "minimum": 1, 
-                        "maximum": 6,
-                        "description": "Risposta motoria: 1=Nessuna, 2=Estensione, 3=Flessione abnorme, 4=Retrazione, 5=Localizza, 6=Obbedisce"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 216,
-                        "description": "Età in mesi per adattamento scala"
-                    }
-                },
-                "required": ["eye_opening", "verbal_response", "motor_response", "age_months"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_mchat",
-            description="Valuta M-CHAT (Modified Checklist for Autism in Toddlers) per screening autismo",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "enjoys_swinging": {"type": "boolean", "description": "Il bambino ama dondolarsi/essere fatto saltare sulle ginocchia?"},
-                    "interest_other_children": {"type": "boolean", "description": "Il bambino mostra interesse per altri bambini?"},
-                    "enjoys_climbing": {"type": "boolean", "description": "Il bambino ama arrampicarsi?"},
-                    "enjoys_peekaboo": {"type": "boolean", "description": "Il bambino ama giocare a cu-cu/nascondino?"},
-                    "pretend_play": {"type": "boolean", "description": "Il bambino fa giochi di finzione (es. bere da tazza vuota)?"},
-                    "points_to_request": {"type": "boolean", "description": "Il bambino usa l'indice per chiedere qualcosa?"},
-                    "points_to_show_interest": {"type": "boolean", "description": "Il bambino punta per mostrare interesse?"},
-                    "plays_appropriately_toys": {"type": "boolean", "description": "Il bambino gioca appropriatamente con giocattoli piccoli?"},
-                    "brings_objects_to_show": {"type": "boolean", "description": "Il bambino porta oggetti per mostrarli?"},
-                    "looks_in_eyes": {"type": "boolean", "description": "Il bambino guarda negli occhi per più di 1-2 secondi?"},
-                    "oversensitive_noise": {"type": "boolean", "description": "Il bambino sembra ipersensibile ai rumori?"},
-                    "smiles_in_response": {"type": "boolean", "description": "Il bambino sorride in risposta al vostro viso/sorriso?"},
-                    "imitates_actions": {"type": "boolean", "description": "Il bambino imita le vostre azioni?"},
-                    "responds_to_name": {"type": "boolean", "description": "Il bambino risponde quando chiamato per nome?"},
-                    "points_at_airplane": {"type": "boolean", "description": "Se puntate un aeroplano nel cielo, il bambino lo guarda?"},
-                    "walks_independently": {"type": "boolean", "description": "Il bambino cammina da solo?"},
-                    "looks_at_pointed_objects": {"type": "boolean", "description": "Il bambino guarda cose che voi puntate?"},
-                    "unusual_finger_movements": {"type": "boolean", "description": "Il bambino fa movimenti strani con le dita vicino agli occhi?"},
-                    "tries_to_attract_attention": {"type": "boolean", "description": "Il bambino cerca di attirare la vostra attenzione sulla sua attività?"},
-                    "suspected_hearing_problem": {"type": "boolean", "description": "Vi siete mai chiesti se il bambino ha problemi di udito?"}
-                },
-                "required": ["enjoys_swinging", "interest_other_children", "enjoys_climbing", "enjoys_peekaboo", "pretend_play", "points_to_request", "points_to_show_interest", "plays_appropriately_toys", "brings_objects_to_show", "looks_in_eyes", "oversensitive_noise", "smiles_in_response", "imitates_actions", "responds_to_name", "points_at_airplane", "walks_independently", "looks_at_pointed_objects", "unusual_finger_movements", "tries_to_attract_attention", "suspected_hearing_problem"]
-            }
-        ),
-        
-        # NUOVI STRUMENTI AGGIUNTI
-        
-        types.Tool(
-            name="calculate_pediatric_trauma_score",
-            description="Calcola Pediatric Trauma Score (PTS) per valutare la gravità dei traumi pediatrici",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "weight_kg": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Peso in kg"
-                    },
-                    "systolic_bp": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 200,
-                        "description": "Pressione arteriosa sistolica in mmHg"
-                    },
-                    "conscious": {
-                        "type": "boolean",
-                        "description": "Stato di coscienza: True=sveglio, False=obnubilato/coma"
-                    },
-                    "open_wound": {
-                        "type": "boolean",
-                        "description": "Ferita aperta/penetrante: True=presente, False=assente"
-                    },
-                    "fracture": {
-                        "type": "boolean",
-                        "description": "Frattura aperta/multipla: True=presente, False=assente"
-                    },
-                    "cutaneous": {
-                        "type": "boolean",
-                        "description": "Cute intatta: True=intatta, False=compromessa"
-                    }
-                },
-                "required": ["weight_kg", "systolic_bp", "conscious", "open_wound", "fracture", "cutaneous"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_catch_score",
-            description="Calcola CATCH (Canadian Assessment of Tomography for Childhood Head injury) per valutare necessità di TC in trauma cranico pediatrico",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vomiting": {
-                        "type": "boolean",
-                        "description": "Vomito ≥3 episodi dopo il trauma"
-                    },
-                    "headache": {
-                        "type": "boolean",
-                        "description": "Cefalea severa persistente"
-                    },
-                    "gcsscore": {
-                        "type": "integer",
-                        "minimum": 13,
-                        "maximum": 15,
-                        "description": "GCS a 2 ore dal trauma (13-15)"
-                    },
-                    "suspected_skull_fracture": {
-                        "type": "boolean",
-                        "description": "Segni clinici di frattura cranica"
-                    },
-                    "dangerous_mechanism": {
-                        "type": "boolean",
-                        "description": "Meccanismo traumatico pericoloso (caduta >1m, incidente auto)"
-                    }
-                },
-                "required": ["vomiting", "headache", "gcsscore", "suspected_skull_fracture", "dangerous_mechanism"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_westley_croup_score",
-            description="Calcola Westley Croup Score per valutare la gravità del croup pediatrico",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stridor": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Stridore inspiratorio: 0=Nessuno, 1=Con agitazione, 2=A riposo"
-                    },
-                    "retraction": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Retrazioni: 0=Nessuna, 1=Lievi, 2=Moderate, 3=Severe"
-                    },
-                    "air_entry": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Ingresso d'aria: 0=Normale, 1=Diminuito, 2=Marcatamente diminuito"
-                    },
-                    "cyanosis": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 5,
-                        "description": "Cianosi: 0=Nessuna, 4=Con agitazione, 5=A riposo"
-                    },
-                    "consciousness": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 5,
-                        "description": "Livello di coscienza: 0=Normale, 5=Alterato"
-                    }
-                },
-                "required": ["stridor", "retraction", "air_entry", "cyanosis", "consciousness"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_centor_score_pediatric",
-            description="Calcola Centor Score modificato per faringite streptococcica in età pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age_years": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 18,
-                        "description": "Età in anni"
-                    },
-                    "exudate": {
-                        "type": "boolean",
-                        "description": "Essudato tonsillare presente"
-                    },
-                    "tender_nodes": {
-                        "type": "boolean",
-                        "description": "Linfoadenopatia cervicale anteriore dolente"
-                    },
-                    "fever": {
-                        "type": "boolean",
-                        "description": "Febbre >38°C"
-                    },
-                    "cough": {
-                        "type": "boolean",
-                        "description": "Presenza di tosse"
-                    }
-                },
-                "required": ["age_years", "exudate", "tender_nodes", "fever", "cough"]
-            }
-        ),
-        
-        types.Tool(
-            name="calculate_wells_score_pediatric",
-            description="Calcola Wells Score pediatrico per valutare probabilità di trombosi venosa profonda",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "provoked_dvt": {
-                        "type": "boolean",
-                        "description": "TVP provocata da traumi, chirurgia recente, immobilizzazione"
-                    },
-                    "alternative_diagnosis": {
-                        "type": "boolean",
-                        "description": "Diagnosi alternativa possibile"
-                    },
-                    "swelling": {
-                        "type": "boolean",
-                        "description": "Gonfiore dell'intero arto"
-                    },
-                    "unilateral_tenderness": {
-                        "type": "boolean",
-                        "description": "Dolorabilità unilaterale lungo sistema venoso profondo"
-                    },
-                    "swelling_thigh_calf": {
-                        "type": "boolean",
-                        "description": "Gonfiore polpaccio >3cm rispetto controlaterale"
-                    },
-                    "unilateral_pitting": {
-                        "type": "boolean",
-                        "description": "Edema improntabile monolaterale"
-                    },
-                    "bedridden": {
-                        "type": "boolean",
-                        "description": "Allettamento recente >3 giorni"
-                    },
-                    "active_cancer": {
-                        "type": "boolean",
-                        "description": "Cancro attivo"
-                    },
-                    "previous_dvt": {
-                        "type": "boolean",
-                        "description": "Precedente TVP"
-                    }
-                },
-                "required": ["provoked_dvt", "alternative_diagnosis", "swelling", "unilateral_tenderness", "swelling_thigh_calf", "unilateral_pitting", "bedridden", "active_cancer", "previous_dvt"]
-            }
-        ),
-        types.Tool(
-            name="calculate_pas_asthma",
-            description="Calcola il Pediatric Asthma Score (PAS) per valutare la gravità di un'esacerbazione asmatica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "respiratory_rate": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Frequenza respiratoria: 0=normale, 1=aumentata, 2=molto aumentata, 3=grave tachipnea"
-                    },
-                    "oxygen_requirement": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Richiesta di ossigeno: 0=nessuna (SatO2≥96%), 1=bassa (SatO2 94-95%), 2=moderata (SatO2 90-93%), 3=alta (SatO2<90%)"
-                    },
-                    "auscultation": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Auscultazione: 0=normale, 1=wheezing fine/localizzato, 2=wheezing durante tutta l'espirazione, 3=wheezing in ins/esp o silenzio"
-                    },
-                    "retractions": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Retrazioni: 0=nessuna, 1=lievi intercostali, 2=moderate intercostali/sottosternali, 3=gravi con uso muscoli accessori"
-                    },
-                    "dyspnea": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Dispnea: 0=nessuna, 1=lieve, 2=moderata, 3=grave con difficoltà a parlare/alimentarsi"
-                    }
-                },
-                "required": ["respiratory_rate", "oxygen_requirement", "auscultation", "retractions", "dyspnea"]
-            }
-        ),
-
-        types.Tool(
-            name="calculate_pass_asthma",
-            description="Calcola il Pediatric Asthma Severity Score (PASS) per valutare la gravità di un'esacerbazione asmatica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wheezing": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Wheezing: 0=assente, 1=fine/localizzato, 2=diffuso"
-                    },
-                    "work_of_breathing": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Lavoro respiratorio: 0=normale, 1=aumentato, 2=massimale"
-                    },
-                    "prolonged_expiration": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Espirazione prolungata: 0=assente, 1=moderata, 2=marcata"
-                    }
-                },
-                "required": ["wheezing", "work_of_breathing", "prolonged_expiration"]
-            }
-        ),
-        types.Tool(
-            name="calculate_pas_asthma",
-            description="Calcola il Pediatric Asthma Score (PAS) per valutare la gravità di un'esacerbazione asmatica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "respiratory_rate": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Frequenza respiratoria: 0=normale, 1=aumentata, 2=molto aumentata, 3=grave tachipnea"
-                    },
-                    "oxygen_requirement": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Richiesta di ossigeno: 0=nessuna (SatO2≥96%), 1=bassa (SatO2 94-95%), 2=moderata (SatO2 90-93%), 3=alta (SatO2<90%)"
-                    },
-                    "auscultation": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Auscultazione: 0=normale, 1=wheezing fine/localizzato, 2=wheezing durante tutta l'espirazione, 3=wheezing in ins/esp o silenzio"
-                    },
-                    "retractions": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Retrazioni: 0=nessuna, 1=lievi intercostali, 2=moderate intercostali/sottosternali, 3=gravi con uso muscoli accessori"
-                    },
-                    "dyspnea": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 3,
-                        "description": "Dispnea: 0=nessuna, 1=lieve, 2=moderata, 3=grave con difficoltà a parlare/alimentarsi"
-                    }
-                },
-                "required": ["respiratory_rate", "oxygen_requirement", "auscultation", "retractions", "dyspnea"]
-            }
-        ),
-
-        types.Tool(
-            name="calculate_pass_asthma",
-            description="Calcola il Pediatric Asthma Severity Score (PASS) per valutare la gravità di un'esacerbazione asmatica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wheezing": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Wheezing: 0=assente, 1=fine/localizzato, 2=diffuso"
-                    },
-                    "work_of_breathing": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Lavoro respiratorio: 0=normale, 1=aumentato, 2=massimale"
-                    },
-                    "prolonged_expiration": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Espirazione prolungata: 0=assente, 1=moderata, 2=marcata"
-                    }
-                },
-                "required": ["wheezing", "work_of_breathing", "prolonged_expiration"]
-            }
-        ),
-        types.Tool(
-            name="calculate_bacterial_meningitis_score",
-            description="Calcola il Bacterial Meningitis Score for Children per predire il rischio di meningite batterica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "csf_gram_stain_positive": {
-                        "type": "boolean",
-                        "description": "Colorazione di Gram positiva nel liquor"
-                    },
-                    "csf_anc_geq_1000": {
-                        "type": "boolean",
-                        "description": "Conta neutrofili nel liquor ≥1000 cell/μL"
-                    },
-                    "csf_protein_geq_80": {
-                        "type": "boolean",
-                        "description": "Proteine liquorali ≥80 mg/dL"
-                    },
-                    "peripheral_anc_geq_10000": {
-                        "type": "boolean",
-                        "description": "Conta neutrofili periferici ≥10000 cell/μL"
-                    },
-                    "seizure_at_onset": {
-                        "type": "boolean",
-                        "description": "Convulsioni all'esordio"
-                    }
-                },
-                "required": ["csf_gram_stain_positive", "csf_anc_geq_1000", "csf_protein_geq_80", "peripheral_anc_geq_10000", "seizure_at_onset"]
-            }
-        ),
-        types.Tool(
-            name="calculate_kocher_criteria",
-            description="Calcola i Kocher Criteria per la diagnosi di artrite settica dell'anca in età pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "fever": {
-                        "type": "boolean",
-                        "description": "Febbre >38.5°C"
-                    },
-                    "weight_bearing": {
-                        "type": "boolean",
-                        "description": "Incapacità/rifiuto di carico sull'arto interessato"
-                    },
-                    "esr_elevated": {
-                        "type": "boolean",
-                        "description": "VES >40 mm/h"
-                    },
-                    "wbc_elevated": {
-                        "type": "boolean",
-                        "description": "Leucociti >12,000/μL"
-                    }
-                },
-                "required": ["fever", "weight_bearing", "esr_elevated", "wbc_elevated"]
-            }
-        ),
-        types.Tool(
-            name="calculate_kawasaki_criteria",
-            description="Valuta i criteri diagnostici per la malattia di Kawasaki in età pediatrica",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "fever_5_days": {
-                        "type": "boolean",
-                        "description": "Febbre persistente per ≥5 giorni"
-                    },
-                    "conjunctival_injection": {
-                        "type": "boolean",
-                        "description": "Iniezione congiuntivale bilaterale non essudativa"
-                    },
-                    "oral_changes": {
-                        "type": "boolean",
-                        "description": "Alterazioni del cavo orale (labbra screpolate, eritema orofaringeo, lingua a fragola)"
-                    },
-                    "extremity_changes": {
-                        "type": "boolean",
-                        "description": "Alterazioni delle estremità (eritema palmo-plantare, edema, desquamazione)"
-                    },
-                    "polymorphous_rash": {
-                        "type": "boolean",
-                        "description": "Esantema polimorfo"
-                    },
-                    "cervical_lymphadenopathy": {
-                        "type": "boolean",
-                        "description": "Linfoadenopatia cervicale (>1.5 cm di diametro)"
-                    },
-                    "laboratory_findings": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["elevated_crp", "elevated_esr", "anemia", "hypoalbuminemia", "elevated_alt", "leukocytosis", "thrombocytosis", "pyuria"]
-                        },
-                        "description": "Esami di laboratorio anormali"
-                    },
-                    "echocardiogram_findings": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["coronary_artery_abnormality", "mitral_regurgitation", "pericardial_effusion", "decreased_lv_function", "z_score_gt_2"]
-                        },
-                        "description": "Reperti ecocardiografici"
-                    }
-                },
-                "required": ["fever_5_days", "conjunctival_injection", "oral_changes", "extremity_changes", "polymorphous_rash", "cervical_lymphadenopathy"]
-            }
-        ),
-        types.Tool(
-            name="calculate_hsp_criteria",
-            description="Valuta i criteri EULAR/PRINTO/PRES per la diagnosi di Porpora di Henoch-Schönlein (HSP)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "palpable_purpura": {
-                        "type": "boolean",
-                        "description": "Porpora palpabile (criterio obbligatorio)"
-                    },
-                    "abdominal_pain": {
-                        "type": "boolean",
-                        "description": "Dolore addominale"
-                    },
-                    "histopathology": {
-                        "type": "boolean",
-                        "description": "Depositi di IgA alla biopsia"
-                    },
-                    "arthritis_arthralgia": {
-                        "type": "boolean",
-                        "description": "Artrite o artralgia"
-                    },
-                    "renal_involvement": {
-                        "type": "boolean",
-                        "description": "Coinvolgimento renale (ematuria e/o proteinuria)"
-                    }
-                },
-                "required": ["palpable_purpura", "abdominal_pain", "histopathology", "arthritis_arthralgia", "renal_involvement"]
-            }
-        ),
-        types.Tool(
-            name="calculate_jones_criteria",
-            description="Valuta i criteri di Jones aggiornati (2015) per la diagnosi di febbre reumatica acuta",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "prior_rheumatic_heart_disease": {
-                        "type": "boolean",
-                        "description": "Precedente cardiopatia reumatica"
-                    },
-                    "high_risk_population": {
-                        "type": "boolean",
-                        "description": "Popolazione ad alto rischio (endemicità elevata)"
-                    },
-                    "confirmed_strep_infection": {
-                        "type": "boolean",
-                        "description": "Infezione streptococcica recente confermata"
-                    },
-                    "major_criteria": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": [
-                                "carditis", "arthritis", "chorea", "erythema_marginatum", "subcutaneous_nodules",
-                                "subclinical_carditis", "polyarthralgia"
-                            ]
-                        },
-                        "description": "Criteri maggiori (cardite, artrite, corea, eritema marginato, noduli sottocutanei, cardite subclinica, poliartralgia)"
-                    },
-                    "minor_criteria": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": [
-                                "fever", "elevated_esr_crp", "prolonged_pr_interval", "polyarthralgia", "monoarthralgia"
-                            ]
-                        },
-                        "description": "Criteri minori (febbre, VES/PCR elevata, PR prolungato, poliartralgia, monoartralgia)"
-                    }
-                },
-                "required": ["prior_rheumatic_heart_disease", "high_risk_population", "confirmed_strep_infection", "major_criteria", "minor_criteria"]
-            }
-        ),
-
-        types.Tool(
-            name="calculate_bops",
-            description="Calcola il Behavioral Observational Pain Scale (BOPS) per dolore post-operatorio pediatrico (1-7 anni)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "facial_expression": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Espressione facciale: 0=Neutra/sorridente/calma, 1=Occasionale fronte corrugata/labbra serrate, 2=Frequenti/costanti espressioni dolore"
-                    },
-                    "verbalization": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Verbalizzazione: 0=Normale/dorme silenziosamente, 1=Occasionali lamenti/piagnucola, 2=Pianto intenso/grida/singhiozzi"
-                    },
-                    "body_position": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 2,
-                        "description": "Posizione corporea: 0=Inattiva/rilassata/movimento normale, 1=Tesa/irrequieta/si contorce, 2=Rigida/flessa/calci/tocca la ferita"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 12,
-                        "maximum": 84,
-                        "description": "Età in mesi (12-84 mesi = 1-7 anni)"
-                    }
-                },
-                "required": ["facial_expression", "verbalization", "body_position", "age_months"]
-            }
-        ),
-        types.Tool(
-            name="calculate_lansky_score",
-            description="Calcola il Lansky Play-Performance Scale per la valutazione funzionale pediatrica (0-16 anni)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "performance_level": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "multipleOf": 10,
-                        "description": "Livello funzionale: 100=attività normale, 0=non responsivo (a intervalli di 10)"
-                    },
-                    "age_months": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 192,
-                        "description": "Età in mesi (0-192 mesi = 0-16 anni)"
-                    }
-                },
-                "required": ["performance_level", "age_months"]
-            }
-        ),
-        types.Tool(
-            name="calculate_sickle_cell_complication_risk",
-            description="Calcola il rischio di complicanze severe in bambini con anemia falciforme (Miller et al.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hemoglobin_level": {
-                        "type": "number",
-                        "minimum": 3,
-                        "maximum": 15,
-                        "description": "Livello di emoglobina basale in g/dL"
-                    },
-                    "wbc_count": {
-                        "type": "number",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "description": "Conta leucocitaria basale in x10^3/μL"
-                    },
-                    "history_of_acs": {
-                        "type": "boolean",
-                        "description": "Storia di sindrome toracica acuta"
-                    },
-                    "pain_events_per_year": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 20,
-                        "description": "Numero di eventi dolorosi che richiedono assistenza medica all'anno"
-                    },
-                    "dactylitis_under_1_year": {
-                        "type": "boolean",
-                        "description": "Storia di dattilite prima dell'anno di età"
-                    },
-                    "hemoglobin_f_level": {
-                        "type": "number",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Livello di emoglobina fetale (%)"
-                    },
-                    "genotype": {
-                        "type": "string",
-                        "enum": ["ss", "sbeta0", "sc", "sbeta+"],
-                        "description": "Genotipo: SS, Sβ0, SC o Sβ+"
-                    }
-                },
-                "required": ["hemoglobin_level", "wbc_count", "history_of_acs", "pain_events_per_year", "genotype"]
-            }
-        ),
-        types.Tool(
-            name="calculate_pnhs",
-            description="Calcola il Pediatric NAFLD Histological Score (PNHS) per distinguere NASH (steatoepatite) da semplice steatosi",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bmi_zscore": {
-                        "type": "number",
-                        "minimum": -3,
-                        "maximum": 5,
-                        "description": "BMI z-score"
-                    },
-                    "ast_iu_l": {
-                        "type": "number",
-                        "minimum": 5,
-                        "maximum": 1000,
-                        "description": "AST in IU/L"
-                    },
-                    "alt_iu_l": {
-                        "type": "number",
-                        "minimum": 5,
-                        "maximum": 1000,
-                        "description": "ALT in IU/L"
-                    },
-                    "insulin_resistance": {
-                        "type": "boolean",
-                        "description": "Presenza di resistenza insulinica (HOMA-IR >2.5 o diagnosi clinica)"
-                    },
-                    "apnea_obstructive_sleep": {
-                        "type": "boolean",
-                        "description": "Diagnosi di apnea ostruttiva del sonno"
-                    }
-                },
-                "required": ["bmi_zscore", "ast_iu_l", "alt_iu_l", "insulin_resistance"]
-            }
-        )
-    ]
+PEWS_REFERENCE = """Interpretazione clinica:
+• Score 0-2: Monitoraggio di routine
+• Score 3-4: Aumentare sorveglianza
+• Score 5-6: Considerare terapia intensiva
+• Score ≥7: Intervento immediato
 
-def handle_score_tools(name: str, arguments: dict):
-    """Gestisce i calcoli dei score"""
-    try:
-        if name == "calculate_pews":
-            return _calculate_pews(arguments)
-        elif name == "calculate_pas":
-            return _calculate_pas(arguments)
-        elif name == "calculate_apgar":
-            return _calculate_apgar(arguments)
-        elif name == "calculate_gcs_pediatric":
-            return _calculate_gcs_pediatric(arguments)
-        elif name == "calculate_mchat":
-            return _calculate_mchat(arguments)
-        elif name == "calculate_pediatric_trauma_score":
-            return _calculate_pediatric_trauma_score(arguments)
-        elif name == "calculate_catch_score":
-            return _calculate_catch_score(arguments)
-        elif name == "calculate_westley_croup_score":
-            return _calculate_westley_croup_score(arguments)
-        elif name == "calculate_centor_score_pediatric":
-            return _calculate_centor_score_pediatric(arguments)
-        elif name == "calculate_wells_score_pediatric":
-            return _calculate_wells_score_pediatric(arguments)
-        # Nuovi strumenti aggiunti
-        elif name == "calculate_pas_asthma":
-            return _calculate_pas_asthma(arguments)
-        elif name == "calculate_pass_asthma":
-            return _calculate_pass_asthma(arguments)
-        elif name == "calculate_bacterial_meningitis_score":
-            return _calculate_bacterial_meningitis_score(arguments)
-        elif name == "calculate_kocher_criteria":
-            return _calculate_kocher_criteria(arguments)
-        elif name == "calculate_kawasaki_criteria":
-            return _calculate_kawasaki_criteria(arguments)
-        elif name == "calculate_jones_criteria":
-            return _calculate_jones_criteria(arguments)
-        elif name == "calculate_bops":
-            return _calculate_bops(arguments)
-        elif name == "calculate_lansky_score":
-            return _calculate_lansky_score(arguments)
-        elif name == "calculate_sickle_cell_complication_risk":
-            return _calculate_sickle_cell_complication_risk(arguments)
-        elif name == "calculate_pnhs":
-            return _calculate_pnhs(arguments)
-        else:
-            raise ValueError(f"Score non implementato: {name}")
-    except Exception as e:
-        return [types.TextContent(type="text", text=f"Errore nel calcolo: {str(e)}")]
+Sotto-punteggi dai parametri vitali (range APLS per età):
+• Cardiovascolare: FC ≥20 sopra il range (2), ≥30 sopra o bradicardia (3);
+  refill 3 s (1), 4 s (2), ≥5 s (3)
+• Respiratorio: FR >10 sopra il range (1), >20 sopra (2), ≥5 sotto (3);
+  O2 ≥3 l/min o FiO2 ≥30% (1), ≥6 l/min o ≥40% (2), ≥8 l/min o ≥50% (3)
+• Con anche il punteggio osservato vale il più alto; la bradicardia indica rischio critico
+"""
+
+# Sotto-punteggi PEWS -> parametri vitali grezzi da cui si possono ricavare
+PEWS_SYSTEM_VITALS = {
+    "cardiovascular": ("heart_rate", "capillary_refill_s"),
+    "respiratory": ("respiratory_rate", "oxygen_l_min", "fio2_percent"),
+}
+PEWS_VITAL_FIELDS = tuple(field for fields in PEWS_SYSTEM_VITALS.values() for field in fields)
+VITAL_LABELS = {
+    "heart_rate": "Frequenza cardiaca",
+    "respiratory_rate": "Frequenza respiratoria",
+    "systolic_bp": "Pressione sistolica",
+}
+
+
+def _vital_signs(args, vitals: tuple) -> dict | None:
+    """Parametri vitali presenti negli argomenti confrontati col range per età (None se nessuno è indicato)"""
+    present = {vital: args[vital] for vital in vitals if vital in args}
+    if not present:
+        return None
+    if 'age_months' not in args:
+        raise ValueError("Per valutare i parametri vitali indicare age_months")
+    return vital_signs.records(vital_signs.assess(args['age_months'], present))[0]
+
+
+def _unassessed_pews_systems(args) -> list[str]:
+    """Sotto-punteggi PEWS senza punteggio osservato né parametri vitali da cui ricavarlo"""
+    return [system for system, vitals in PEWS_SYSTEM_VITALS.items()
+            if system not in args and not any(vital in args for vital in vitals)]
+
+
+def _vital_lines(age_months, vitals: dict) -> list[str]:
+    lines = [f"Parametri vitali (range per età {vital_signs.VITAL_SIGNS_BY_AGE(age_months)['age_group']}):"]
+    for vital, result in vitals.items():
+        low, high = result['normal_range']
+        lines.append(f"- {VITAL_LABELS[vital]}: {result['value']:g} {vital_signs.UNITS[vital]} "
+                     f"(normale {low}-{high}) - {result['status']}")
+    return lines
+
+
+@register_tool(types.Tool(
+    name="calculate_pews",
+    description="Calcola il PEWS (Pediatric Early Warning Score) versione italiana validata per identificare bambini a rischio di deterioramento clinico; i sotto-punteggi cardiovascolare e respiratorio possono essere ricavati dai parametri vitali grezzi",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "behavior": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Comportamento: 0=Gioca/appropriato, 1=Dorme, 2=Irritabile/Preoccupazione genitori, 3=Letargico/confuso/Ridotta risposta al dolore"
+            },
+            "cardiovascular": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Apparato cardiovascolare: 0=Roseo/refill 1-2sec, 1=Pallido/refill 3sec, 2=Grigio/refill 4sec/tachicardia +20bpm, 3=Grigio marezzato/refill ≥5sec/tachicardia +30bpm/BRADICARDIA (obbligatorio senza heart_rate o capillary_refill_s)"
+            },
+            "respiratory": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Apparato respiratorio: 0=Parametri normali/no rientramenti, 1=Lievi alterazioni/rientramenti intercostali, 2=Moderate alterazioni/rientramenti sottosternali, 3=Gravi alterazioni/rientramenti globali (obbligatorio senza respiratory_rate, oxygen_l_min o fio2_percent)"
+            },
+            "nebulizer_use": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Uso nebulizzatore: 0=No, 1=Ogni 30 minuti o meno frequente, 2=Continuo/ogni 15 minuti"
+            },
+            "persistent_vomiting": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 1,
+                "description": "Vomito persistente post-operatorio: 0=No, 1=Sì"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi per interpretazione parametri vitali"
+            },
+            "heart_rate": {
+                "type": "integer",
+                "minimum": 20,
+                "maximum": 300,
+                "description": "Frequenza cardiaca in bpm: ricava il punteggio cardiovascolare (range per età)"
+            },
+            "capillary_refill_s": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 15,
+                "description": "Tempo di refill capillare in secondi"
+            },
+            "respiratory_rate": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 150,
+                "description": "Frequenza respiratoria in atti/min: ricava il punteggio respiratorio (range per età)"
+            },
+            "oxygen_l_min": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 20,
+                "description": "Ossigeno somministrato in l/min"
+            },
+            "fio2_percent": {
+                "type": "integer",
+                "minimum": 21,
+                "maximum": 100,
+                "description": "FiO2 somministrata in %"
+            }
+        },
+        "required": ["behavior", "age_months"],
+        # Ogni sotto-punteggio: osservato oppure ricavato da almeno un parametro vitale del suo apparato
+        "allOf": [
+            {"anyOf": [{"required": [field]} for field in (system, *vitals)]}
+            for system, vitals in PEWS_SYSTEM_VITALS.items()
+        ]
+    }
+), reference=PEWS_REFERENCE)
 def _calculate_pews(args):
     """Calcola PEWS Score"""
+    missing = _unassessed_pews_systems(args)
+    if missing:
+        raise ValueError("; ".join(
+            f"Sotto-punteggio {system} non valutato: indicarlo oppure almeno uno tra {', '.join(PEWS_SYSTEM_VITALS[system])}"
+            for system in missing))
+    if any(field in args for field in PEWS_VITAL_FIELDS):
+        return _pews_from_vitals(args)
     behavior = args.get('behavior', 0)
     cardiovascular = args.get('cardiovascular', 0)
     respiratory = args.get('respiratory', 0) 
@@ -924,7 +182,8 @@ def _calculate_pews(args):
     total = behavior + cardiovascular + respiratory + nebulizer_use + persistent_vomiting
     interpretation = calculate_pews_interpretation(total)
     
-    result = f"""PEWS (Pediatric Early Warning Score)
+    def render():
+        return f"""PEWS (Pediatric Early Warning Score)
 =====================================
 Punteggio totale: {total}/13
 Livello di rischio: {interpretation['risk_level']}
@@ -935,16 +194,164 @@ Dettaglio punteggi:
 - Cardiovascolare: {cardiovascular}/3  
 - Respiratorio: {respiratory}/3
 - Uso nebulizzatore: {nebulizer_use}/2
-- Vomito persistente: {persistent_vomiting}/1
+- Vomito persistente: {persistent_vomiting}/1"""
+
+    return ToolResult({
+        "total": total,
+        "risk_level": interpretation['risk_level'],
+        "action": interpretation['action']
+    }, render)
+
+def _pews_subscores(args) -> tuple[int, int]:
+    """Sotto-punteggi cardiovascolare e respiratorio: il più alto tra osservato e ricavato dai parametri vitali"""
+    age_months = args['age_months']
+    cardiovascular = vital_signs.pews_cardiovascular(age_months, args.get('heart_rate', math.nan),
+                                                     args.get('capillary_refill_s', math.nan))
+    respiratory = vital_signs.pews_respiratory(age_months, args.get('respiratory_rate', math.nan),
+                                               args.get('oxygen_l_min', math.nan), args.get('fio2_percent', math.nan))
+    return max(args.get('cardiovascular', 0), int(cardiovascular)), max(args.get('respiratory', 0), int(respiratory))
+
+def _pews_from_vitals(args):
+    """PEWS con i sotto-punteggi cardiovascolare e respiratorio ricavati dai parametri vitali"""
+    age_months = args['age_months']
+    behavior = args['behavior']
+    nebulizer_use = args.get('nebulizer_use', 0)
+    persistent_vomiting = args.get('persistent_vomiting', 0)
+    cardiovascular, respiratory = _pews_subscores(args)
+    vitals = _vital_signs(args, ("heart_rate", "respiratory_rate")) or {}
+    bradycardia = vitals.get('heart_rate', {}).get('status') == "BASSA"
 
-Interpretazione clinica:
-• Score 0-2: Monitoraggio di routine
-• Score 3-4: Aumentare sorveglianza
-• Score 5-6: Considerare terapia intensiva
-• Score ≥7: Intervento immediato
+    total = behavior + cardiovascular + respiratory + nebulizer_use + persistent_vomiting
+    interpretation = calculate_pews_interpretation(total, bradycardia)
+
+    def render():
+        lines = [
+            "PEWS (Pediatric Early Warning Score)",
+            "=====================================",
+            f"Punteggio totale: {total}/13",
+            f"Livello di rischio: {interpretation['risk_level']}",
+            f"Azione raccomandata: {interpretation['action']}",
+            "",
+            "Dettaglio punteggi:",
+            f"- Comportamento: {behavior}/3",
+            f"- Cardiovascolare: {cardiovascular}/3",
+            f"- Respiratorio: {respiratory}/3",
+            f"- Uso nebulizzatore: {nebulizer_use}/2",
+            f"- Vomito persistente: {persistent_vomiting}/1"
+        ]
+        if vitals:
+            lines.append("")
+            lines.extend(_vital_lines(age_months, vitals))
+        if 'capillary_refill_s' in args:
+            lines.append(f"- Refill capillare: {args['capillary_refill_s']:g} s")
+        if 'oxygen_l_min' in args or 'fio2_percent' in args:
+            oxygen = [f"{args['oxygen_l_min']:g} l/min"] if 'oxygen_l_min' in args else []
+            oxygen += [f"FiO2 {args['fio2_percent']}%"] if 'fio2_percent' in args else []
+            lines.append(f"- Ossigenoterapia: {', '.join(oxygen)}")
+        if bradycardia:
+            lines.append("⚠️ Bradicardia per l'età: rischio critico indipendentemente dal punteggio")
+        return "\n".join(lines)
+
+    return ToolResult({
+        "total": total,
+        "risk_level": interpretation['risk_level'],
+        "action": interpretation['action'],
+        "cardiovascular": cardiovascular,
+        "respiratory": respiratory,
+        "vital_signs": vitals
+    }, render)
+
+@register_batch("calculate_pews")
+def _batch_pews(items):
+    """Kernel batch PEWS: punteggio totale e livello di rischio per ogni paziente (sotto-punteggi dai parametri vitali se indicati)"""
+    # Sotto-punteggi non valutati: l'handler segnala l'errore, ripetizione per elemento
+    if any(_unassessed_pews_systems(args) for args in items):
+        raise ValueError("Sotto-punteggi PEWS non valutati")
+    raw = [index for index, args in enumerate(items) if any(field in args for field in PEWS_VITAL_FIELDS)]
+    cardiovascular = vectorized.column(items, 'cardiovascular', 0)
+    respiratory = vectorized.column(items, 'respiratory', 0)
+    if raw:
+        age_months = vectorized.column(items, 'age_months')
+        heart_rate = vectorized.column(items, 'heart_rate', math.nan)
+        capillary_refill_s = vectorized.column(items, 'capillary_refill_s', math.nan)
+        respiratory_rate = vectorized.column(items, 'respiratory_rate', math.nan)
+        oxygen_l_min = vectorized.column(items, 'oxygen_l_min', math.nan)
+        fio2_percent = vectorized.column(items, 'fio2_percent', math.nan)
+        cardiovascular = np.maximum(cardiovascular,
+                                    vital_signs.pews_cardiovascular(age_months, heart_rate, capillary_refill_s))
+        respiratory = np.maximum(respiratory,
+                                 vital_signs.pews_respiratory(age_months, respiratory_rate, oxygen_l_min, fio2_percent))
+        low, _ = vital_signs.limits("heart_rate", age_months)
+        bradycardia = heart_rate < low
+    else:
+        bradycardia = np.zeros(len(items), dtype=bool)
+    total = (vectorized.column(items, 'behavior') + cardiovascular + respiratory
+             + vectorized.column(items, 'nebulizer_use', 0)
+             + vectorized.column(items, 'persistent_vomiting', 0)).astype(np.int64)
+    band = np.where(bradycardia, len(PEWS_BANDS.records) - 1, PEWS_BANDS.bands(total))
+    results = vectorized.records(
+        total=total,
+        risk_level=PEWS_BANDS.column('risk_level')[band],
+        action=PEWS_BANDS.column('action')[band]
+    )
+    if raw:
+        rows = np.array(raw)
+        vitals = vital_signs.records(vital_signs.assess(age_months[rows], {
+            "heart_rate": heart_rate[rows], "respiratory_rate": respiratory_rate[rows]}))
+        for index, cardio, resp, vital in zip(raw, cardiovascular[rows].astype(np.int64).tolist(),
+                                              respiratory[rows].astype(np.int64).tolist(), vitals):
+            results[index].update(cardiovascular=cardio, respiratory=resp, vital_signs=vital)
+    return results
+
+PAS_REFERENCE = """Interpretazione clinica:
+• Score 0-2: Appendicite improbabile (2%)
+• Score 3-5: Probabilità intermedia (15-25%) 
+• Score 6-7: Alta probabilità (70-80%)
+• Score 8-10: Appendicite molto probabile (95%+)
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_pas",
+    description="Calcola il PAS (Pediatric Appendicitis Score) per valutare la probabilità di appendicite acuta",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "fever": {
+                "type": "boolean",
+                "description": "Febbre ≥38°C (1 punto se presente)"
+            },
+            "anorexia": {
+                "type": "boolean",
+                "description": "Anoressia (1 punto se presente)"
+            },
+            "nausea_vomiting": {
+                "type": "boolean",
+                "description": "Nausea o vomito (1 punto se presente)"
+            },
+            "cough_percussion_hopping": {
+                "type": "boolean",
+                "description": "Dolore con colpo di tosse, percussione o saltellamento (2 punti se presente)"
+            },
+            "rlq_tenderness": {
+                "type": "boolean",
+                "description": "Dolorabilità in fossa iliaca destra (2 punti se presente)"
+            },
+            "pain_migration": {
+                "type": "boolean",
+                "description": "Migrazione del dolore da regione periombelicale a fossa iliaca destra (1 punto se presente)"
+            },
+            "leukocytosis": {
+                "type": "boolean",
+                "description": "Leucocitosi >10.000/μL (1 punto se presente)"
+            },
+            "neutrophilia": {
+                "type": "boolean",
+                "description": "Neutrofilia >7.500/μL (1 punto se presente)"
+            }
+        },
+        "required": ["fever", "anorexia", "nausea_vomiting", "cough_percussion_hopping", "rlq_tenderness", "pain_migration", "leukocytosis", "neutrophilia"]
+    }
+), reference=PAS_REFERENCE)
 def _calculate_pas(args):
     """Calcola PAS Score"""
     # Calcolo punteggio
@@ -978,23 +385,71 @@ def _calculate_pas(args):
     
     interpretation = calculate_pas_interpretation(score)
     
-    result = f"""PAS (Pediatric Appendicitis Score)
+    def render():
+        return f"""PAS (Pediatric Appendicitis Score)
 ===================================
 Punteggio totale: {score}/10
 Probabilità appendicite: {interpretation['probability']}
 Raccomandazione: {interpretation['recommendation']}
 
 Elementi presenti:
-{chr(10).join(details) if details else "• Nessun elemento presente"}
+{chr(10).join(details) if details else "• Nessun elemento presente"}"""
 
-Interpretazione clinica:
-• Score 0-2: Appendicite improbabile (2%)
-• Score 3-5: Probabilità intermedia (15-25%) 
-• Score 6-7: Alta probabilità (70-80%)
-• Score 8-10: Appendicite molto probabile (95%+)
+    return ToolResult({
+        "score": score,
+        "probability": interpretation['probability'],
+        "recommendation": interpretation['recommendation'],
+        "elements_present": len(details)
+    }, render)
+
+APGAR_REFERENCE = """Interpretazione clinica:
+• Score 8-10: Neonato normale
+• Score 4-7: Moderatamente depresso
+• Score 0-3: Severamente depresso
+
+Note: Valutazione a 1 e 5 minuti dalla nascita
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_apgar",
+    description="Calcola il punteggio APGAR per valutare le condizioni del neonato",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "heart_rate": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Frequenza cardiaca: 0=Assente, 1=<100 bpm, 2=≥100 bpm"
+            },
+            "respiratory_effort": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Sforzo respiratorio: 0=Assente, 1=Debole/irregolare, 2=Buono/pianto vigoroso"
+            },
+            "muscle_tone": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Tono muscolare: 0=Flaccido, 1=Flessione degli arti, 2=Movimento attivo"
+            },
+            "reflex_irritability": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Riflessi/irritabilità: 0=Nessuna risposta, 1=Smorfie, 2=Pianto vigoroso"
+            },
+            "color": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Colorito: 0=Blu/pallido, 1=Rosa con estremità blu, 2=Completamente rosa"
+            }
+        },
+        "required": ["heart_rate", "respiratory_effort", "muscle_tone", "reflex_irritability", "color"]
+    }
+), reference=APGAR_REFERENCE)
 def _calculate_apgar(args):
     """Calcola APGAR Score"""
     heart_rate = args.get('heart_rate', 0)
@@ -1006,7 +461,8 @@ def _calculate_apgar(args):
     total = heart_rate + respiratory_effort + muscle_tone + reflex_irritability + color
     interpretation = calculate_apgar_interpretation(total)
     
-    result = f"""APGAR Score
+    def render():
+        return f"""APGAR Score
 ===========
 Punteggio totale: {total}/10
 Condizione: {interpretation['condition']}
@@ -1017,17 +473,79 @@ Dettaglio punteggi:
 - Sforzo respiratorio: {respiratory_effort}/2
 - Tono muscolare: {muscle_tone}/2
 - Riflessi/irritabilità: {reflex_irritability}/2
-- Colorito: {color}/2
+- Colorito: {color}/2"""
 
-Interpretazione clinica:
-• Score 8-10: Neonato normale
-• Score 4-7: Moderatamente depresso
-• Score 0-3: Severamente depresso
+    return ToolResult({
+        "total": total,
+        "condition": interpretation['condition'],
+        "action": interpretation['action']
+    }, render)
 
-Note: Valutazione a 1 e 5 minuti dalla nascita
+GCS_PEDIATRIC_REFERENCE = """Indicazioni per monitoraggio:
+- GCS <9: Intubazione e ventilazione
+- GCS 9-12: Osservazione intensiva
+- GCS >12: Monitoraggio standard
+
+Con i parametri vitali (range APLS per età):
+- Bradicardia con pressione sistolica elevata (triade di Cushing): sospetta
+  ipertensione endocranica, neurochirurgia urgente
+- Ipotensione per età (PALS): ridotta perfusione cerebrale, trattare lo shock
 """
-    return [types.TextContent(type="text", text=result)]
 
+GCS_VITAL_FIELDS = ("heart_rate", "respiratory_rate", "systolic_bp")
+
+@register_tool(types.Tool(
+    name="calculate_gcs_pediatric",
+    description="Calcola Glasgow Coma Scale pediatrica per valutazione neurologica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "eye_opening": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 4,
+                "description": "Apertura occhi: 1=Nessuna, 2=Al dolore, 3=Al richiamo, 4=Spontanea"
+            },
+            "verbal_response": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 5,
+                "description": "Risposta verbale: 1=Nessuna, 2=Suoni incomprensibili, 3=Parole inappropriate, 4=Confuso, 5=Orientato"
+            },
+            "motor_response": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 6,
+                "description": "Risposta motoria: 1=Nessuna, 2=Estensione, 3=Flessione abnorme, 4=Retrazione, 5=Localizza, 6=Obbedisce"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi per adattamento scala"
+            },
+            "heart_rate": {
+                "type": "integer",
+                "minimum": 20,
+                "maximum": 300,
+                "description": "Frequenza cardiaca in bpm (facoltativa, confrontata col range per età)"
+            },
+            "respiratory_rate": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 150,
+                "description": "Frequenza respiratoria in atti/min (facoltativa)"
+            },
+            "systolic_bp": {
+                "type": "integer",
+                "minimum": 20,
+                "maximum": 250,
+                "description": "Pressione sistolica in mmHg (facoltativa)"
+            }
+        },
+        "required": ["eye_opening", "verbal_response", "motor_response", "age_months"]
+    }
+), reference=GCS_PEDIATRIC_REFERENCE)
 def _calculate_gcs_pediatric(args):
     """Calcola Glasgow Coma Scale pediatrica"""
     eye_opening = args.get('eye_opening', 1)
@@ -1042,8 +560,15 @@ def _calculate_gcs_pediatric(args):
     age_note = ""
     if age_months < 24:
         age_note = "\nNota: Scala adattata per età <2 anni - Valutazione più complessa"
-    
-    result = f"""Glasgow Coma Scale Pediatrica
+
+    vitals = _vital_signs(args, GCS_VITAL_FIELDS)
+    if vitals is not None:
+        cushing = (vitals.get('heart_rate', {}).get('status') == "BASSA"
+                   and vitals.get('systolic_bp', {}).get('status') == "ALTA")
+        hypotension = vitals.get('systolic_bp', {}).get('status') == "IPOTENSIONE"
+
+    def render():
+        report = f"""Glasgow Coma Scale Pediatrica
 ==============================
 Età paziente: {age_months} mesi
 Punteggio totale: {total}/15
@@ -1062,15 +587,69 @@ Interpretazione:
 • 9-12: Trauma cranico moderato  
 • 3-8: Trauma cranico severo
 
-{age_note}
+{age_note}"""
+        if vitals is None:
+            return report
+        lines = _vital_lines(age_months, vitals)
+        if cushing:
+            lines.append("⚠️ Bradicardia e ipertensione (triade di Cushing): sospetta ipertensione endocranica")
+        if hypotension:
+            lines.append("⚠️ Ipotensione per l'età: ridotta perfusione cerebrale")
+        return report + "\n" + "\n".join(lines)
+
+    data = {
+        "total": total,
+        "severity": interpretation['severity'],
+        "prognosis": interpretation['prognosis'],
+        "action": interpretation['action']
+    }
+    if vitals is not None:
+        data.update(vital_signs=vitals, cushing=cushing, hypotension=hypotension)
+    return ToolResult(data, render)
 
-Indicazioni per monitoraggio:
-- GCS <9: Intubazione e ventilazione
-- GCS 9-12: Osservazione intensiva
-- GCS >12: Monitoraggio standard
+MCHAT_REFERENCE = """Interpretazione:
+• ≥2 item critici falliti O ≥3 item totali: Alto rischio autismo
+• 2 item totali falliti: Rischio moderato, follow-up
+• 0-1 item falliti: Basso rischio
+
+Note importanti:
+- Età target: 16-30 mesi
+- (*) = Item critico
+- Sensibilità 95%, Specificità 95%
+- Follow-up M-CHAT raccomandato se rischio moderato
+- Valutazione specialistica se alto rischio
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_mchat",
+    description="Valuta M-CHAT (Modified Checklist for Autism in Toddlers) per screening autismo",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "enjoys_swinging": {"type": "boolean", "description": "Il bambino ama dondolarsi/essere fatto saltare sulle ginocchia?"},
+            "interest_other_children": {"type": "boolean", "description": "Il bambino mostra interesse per altri bambini?"},
+            "enjoys_climbing": {"type": "boolean", "description": "Il bambino ama arrampicarsi?"},
+            "enjoys_peekaboo": {"type": "boolean", "description": "Il bambino ama giocare a cu-cu/nascondino?"},
+            "pretend_play": {"type": "boolean", "description": "Il bambino fa giochi di finzione (es. bere da tazza vuota)?"},
+            "points_to_request": {"type": "boolean", "description": "Il bambino usa l'indice per chiedere qualcosa?"},
+            "points_to_show_interest": {"type": "boolean", "description": "Il bambino punta per mostrare interesse?"},
+            "plays_appropriately_toys": {"type": "boolean", "description": "Il bambino gioca appropriatamente con giocattoli piccoli?"},
+            "brings_objects_to_show": {"type": "boolean", "description": "Il bambino porta oggetti per mostrarli?"},
+            "looks_in_eyes": {"type": "boolean", "description": "Il bambino guarda negli occhi per più di 1-2 secondi?"},
+            "oversensitive_noise": {"type": "boolean", "description": "Il bambino sembra ipersensibile ai rumori?"},
+            "smiles_in_response": {"type": "boolean", "description": "Il bambino sorride in risposta al vostro viso/sorriso?"},
+            "imitates_actions": {"type": "boolean", "description": "Il bambino imita le vostre azioni?"},
+            "responds_to_name": {"type": "boolean", "description": "Il bambino risponde quando chiamato per nome?"},
+            "points_at_airplane": {"type": "boolean", "description": "Se puntate un aeroplano nel cielo, il bambino lo guarda?"},
+            "walks_independently": {"type": "boolean", "description": "Il bambino cammina da solo?"},
+            "looks_at_pointed_objects": {"type": "boolean", "description": "Il bambino guarda cose che voi puntate?"},
+            "unusual_finger_movements": {"type": "boolean", "description": "Il bambino fa movimenti strani con le dita vicino agli occhi?"},
+            "tries_to_attract_attention": {"type": "boolean", "description": "Il bambino cerca di attirare la vostra attenzione sulla sua attività?"},
+            "suspected_hearing_problem": {"type": "boolean", "description": "Vi siete mai chiesti se il bambino ha problemi di udito?"}
+        },
+        "required": ["enjoys_swinging", "interest_other_children", "enjoys_climbing", "enjoys_peekaboo", "pretend_play", "points_to_request", "points_to_show_interest", "plays_appropriately_toys", "brings_objects_to_show", "looks_in_eyes", "oversensitive_noise", "smiles_in_response", "imitates_actions", "responds_to_name", "points_at_airplane", "walks_independently", "looks_at_pointed_objects", "unusual_finger_movements", "tries_to_attract_attention", "suspected_hearing_problem"]
+    }
+), reference=MCHAT_REFERENCE)
 def _calculate_mchat(args):
     """Calcola M-CHAT Score"""
     
@@ -1133,7 +712,8 @@ def _calculate_mchat(args):
         recommendation = "Sviluppo nella norma, screening di routine"
         follow_up = "Screening standard ai controlli programmati"
     
-    result = f"""M-CHAT (Modified Checklist for Autism in Toddlers)
+    def render():
+        return f"""M-CHAT (Modified Checklist for Autism in Toddlers)
 =================================================
 Items falliti totali: {total_failed}/20
 Items critici falliti: {critical_failed}/6
@@ -1143,22 +723,92 @@ Raccomandazione: {recommendation}
 Follow-up: {follow_up}
 
 Items falliti:
-{chr(10).join(['• ' + item for item in failed_items]) if failed_items else '• Nessun item fallito'}
+{chr(10).join(['• ' + item for item in failed_items]) if failed_items else '• Nessun item fallito'}"""
+
+    return ToolResult({
+        "total_failed": total_failed,
+        "critical_failed": critical_failed,
+        "risk_level": risk_level,
+        "recommendation": recommendation,
+        "follow_up": follow_up,
+        "failed_items": failed_items
+    }, render)
+
+PEDIATRIC_TRAUMA_SCORE_REFERENCE = """Interpretazione clinica:
+- >8: Trauma minore - Basso rischio
+- 6-8: Trauma moderato - Potenziale pericolo per la vita
+- 0-5: Trauma severo - Pericolo per la vita
+- <0: Trauma critico - Estremo pericolo
 
-Interpretazione:
-• ≥2 item critici falliti O ≥3 item totali: Alto rischio autismo
-• 2 item totali falliti: Rischio moderato, follow-up
-• 0-1 item falliti: Basso rischio
+La pressione sistolica è già un item del PTS (soglie fisse >90, 50-90, <50 mmHg);
+con age_months è confrontata anche con la soglia di ipotensione per età (PALS)
+e con FC e FR indicate col range per età (APLS):
+- Ipotensione per età: shock scompensato
+- Tachicardia con pressione conservata: possibile shock compensato
 
-Note importanti:
-- Età target: 16-30 mesi
-- (*) = Item critico
-- Sensibilità 95%, Specificità 95%
-- Follow-up M-CHAT raccomandato se rischio moderato
-- Valutazione specialistica se alto rischio
+Note:
+- Score più utilizzato in pediatria per triage traumatologico
+- Forte correlatore di mortalità e necessità di cure intensive
+- PTS <8 richiede centro traumatologico pediatrico
+- PTS <6 associato a mortalità >25%
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_pediatric_trauma_score",
+    description="Calcola Pediatric Trauma Score (PTS) per valutare la gravità dei traumi pediatrici",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "weight_kg": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Peso in kg"
+            },
+            "systolic_bp": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 200,
+                "description": "Pressione arteriosa sistolica in mmHg"
+            },
+            "conscious": {
+                "type": "boolean",
+                "description": "Stato di coscienza: True=sveglio, False=obnubilato/coma"
+            },
+            "open_wound": {
+                "type": "boolean",
+                "description": "Ferita aperta/penetrante: True=presente, False=assente"
+            },
+            "fracture": {
+                "type": "boolean",
+                "description": "Frattura aperta/multipla: True=presente, False=assente"
+            },
+            "cutaneous": {
+                "type": "boolean",
+                "description": "Cute intatta: True=intatta, False=compromessa"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 216,
+                "description": "Età in mesi: se indicata i parametri vitali sono confrontati col range per età"
+            },
+            "heart_rate": {
+                "type": "integer",
+                "minimum": 20,
+                "maximum": 300,
+                "description": "Frequenza cardiaca in bpm (facoltativa, richiede age_months)"
+            },
+            "respiratory_rate": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 150,
+                "description": "Frequenza respiratoria in atti/min (facoltativa, richiede age_months)"
+            }
+        },
+        "required": ["weight_kg", "systolic_bp", "conscious", "open_wound", "fracture", "cutaneous"]
+    }
+), reference=PEDIATRIC_TRAUMA_SCORE_REFERENCE)
 def _calculate_pediatric_trauma_score(args):
     """Calcola Pediatric Trauma Score (PTS)"""
     weight_kg = args.get('weight_kg', 0)
@@ -1239,8 +889,15 @@ def _calculate_pediatric_trauma_score(args):
     else:
         risk_level = "CRITICO"
         management = "Rianimazione immediata - Estremo pericolo"
-    
-    result = f"""Pediatric Trauma Score (PTS)
+
+    # Con l'età anche la pressione sistolica misurata è confrontata col range
+    vitals = _vital_signs(args, ("heart_rate", "respiratory_rate") + (("systolic_bp",) if 'age_months' in args else ()))
+    if vitals is not None:
+        hypotension = vitals['systolic_bp']['status'] == "IPOTENSIONE"
+        tachycardia = vitals.get('heart_rate', {}).get('status') == "ALTA"
+
+    def render():
+        report = f"""Pediatric Trauma Score (PTS)
 ========================
 Punteggio totale: {score}/12
 
@@ -1248,22 +905,73 @@ Livello di rischio: {risk_level}
 Gestione: {management}
 
 Criteri valutati:
-{chr(10).join(details)}
+{chr(10).join(details)}"""
+        if vitals is None:
+            return report
+        lines = _vital_lines(args['age_months'], vitals)
+        if hypotension:
+            lines.append("⚠️ Ipotensione per l'età: shock scompensato, riempimento volemico immediato")
+        elif tachycardia:
+            lines.append("⚠️ Tachicardia con pressione conservata: possibile shock compensato")
+        return report + "\n\n" + "\n".join(lines)
+
+    data = {
+        "score": score,
+        "risk_level": risk_level,
+        "management": management
+    }
+    if vitals is not None:
+        data.update(vital_signs=vitals, hypotension=hypotension)
+    return ToolResult(data, render)
 
-Interpretazione clinica:
-- >8: Trauma minore - Basso rischio
-- 6-8: Trauma moderato - Potenziale pericolo per la vita
-- 0-5: Trauma severo - Pericolo per la vita
-- <0: Trauma critico - Estremo pericolo
+CATCH_SCORE_REFERENCE = """Criteri CATCH:
+- GCS <15 a 2 ore dal trauma
+- Sospetta frattura cranica aperta/depressa
+- Storia di vomito ≥3 episodi
+- Segni di frattura della base cranica
+- Meccanismo traumatico pericoloso
+- Cefalea severa
 
-Note:
-- Score più utilizzato in pediatria per triage traumatologico
-- Forte correlatore di mortalità e necessità di cure intensive
-- PTS <8 richiede centro traumatologico pediatrico
-- PTS <6 associato a mortalità >25%
+Nota clinica: 
+- Applicabile per traumi cranici con GCS 13-15
+- Età 0-16 anni
+- La presenza di ANCHE UN SOLO criterio indica necessità di TC
+- Sensibilità 98%, Specificità 50%
+- Se tutti negativi, rischio lesioni cerebrali <1%
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_catch_score",
+    description="Calcola CATCH (Canadian Assessment of Tomography for Childhood Head injury) per valutare necessità di TC in trauma cranico pediatrico",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "vomiting": {
+                "type": "boolean",
+                "description": "Vomito ≥3 episodi dopo il trauma"
+            },
+            "headache": {
+                "type": "boolean",
+                "description": "Cefalea severa persistente"
+            },
+            "gcsscore": {
+                "type": "integer",
+                "minimum": 13,
+                "maximum": 15,
+                "description": "GCS a 2 ore dal trauma (13-15)"
+            },
+            "suspected_skull_fracture": {
+                "type": "boolean",
+                "description": "Segni clinici di frattura cranica"
+            },
+            "dangerous_mechanism": {
+                "type": "boolean",
+                "description": "Meccanismo traumatico pericoloso (caduta >1m, incidente auto)"
+            }
+        },
+        "required": ["vomiting", "headache", "gcsscore", "suspected_skull_fracture", "dangerous_mechanism"]
+    }
+), reference=CATCH_SCORE_REFERENCE)
 def _calculate_catch_score(args):
     """Calcola CATCH (Canadian Assessment of Tomography for Childhood Head injury)"""
     vomiting = args.get('vomiting', False)
@@ -1300,7 +1008,8 @@ def _calculate_catch_score(args):
         risk_level = "BASSO"
         recommendation = "TC encefalo non necessaria - Osservazione"
     
-    result = f"""CATCH Score (Canadian Assessment of Tomography for Childhood Head injury)
+    def render():
+        return f"""CATCH Score (Canadian Assessment of Tomography for Childhood Head injury)
 ========================================================================
 Punteggio totale: {score}/5
 
@@ -1308,25 +1017,69 @@ Livello di rischio: {risk_level}
 Raccomandazione: {recommendation}
 
 Fattori di rischio presenti:
-{chr(10).join(risk_factors) if risk_factors else '• Nessun fattore di rischio presente'}
+{chr(10).join(risk_factors) if risk_factors else '• Nessun fattore di rischio presente'}"""
 
-Criteri CATCH:
-- GCS <15 a 2 ore dal trauma
-- Sospetta frattura cranica aperta/depressa
-- Storia di vomito ≥3 episodi
-- Segni di frattura della base cranica
-- Meccanismo traumatico pericoloso
-- Cefalea severa
+    return ToolResult({
+        "score": score,
+        "risk_level": risk_level,
+        "recommendation": recommendation,
+        "risk_factors": len(risk_factors)
+    }, render)
 
-Nota clinica: 
-- Applicabile per traumi cranici con GCS 13-15
-- Età 0-16 anni
-- La presenza di ANCHE UN SOLO criterio indica necessità di TC
-- Sensibilità 98%, Specificità 50%
-- Se tutti negativi, rischio lesioni cerebrali <1%
+WESTLEY_CROUP_SCORE_REFERENCE = """Interpretazione:
+- 0-2: Croup lieve - Steroidi e osservazione domiciliare
+- 3-5: Croup moderato - Osservazione ospedaliera
+- 6-11: Croup severo - Trattamento intensivo
+- ≥12: Croup critico - Insufficienza respiratoria imminente
+
+Criteri di score:
+1. Stridore inspiratorio: 0=nessuno, 1=con agitazione, 2=a riposo
+2. Retrazioni: 0=nessuna, 1=lievi, 2=moderate, 3=severe
+3. Ingresso d'aria: 0=normale, 1=diminuito, 2=marcatamente diminuito
+4. Cianosi: 0=nessuna, 4=con agitazione, 5=a riposo
+5. Coscienza: 0=normale, 5=alterata
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_westley_croup_score",
+    description="Calcola Westley Croup Score per valutare la gravità del croup pediatrico",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "stridor": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Stridore inspiratorio: 0=Nessuno, 1=Con agitazione, 2=A riposo"
+            },
+            "retraction": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Retrazioni: 0=Nessuna, 1=Lievi, 2=Moderate, 3=Severe"
+            },
+            "air_entry": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Ingresso d'aria: 0=Normale, 1=Diminuito, 2=Marcatamente diminuito"
+            },
+            "cyanosis": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 5,
+                "description": "Cianosi: 0=Nessuna, 4=Con agitazione, 5=A riposo"
+            },
+            "consciousness": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 5,
+                "description": "Livello di coscienza: 0=Normale, 5=Alterato"
+            }
+        },
+        "required": ["stridor", "retraction", "air_entry", "cyanosis", "consciousness"]
+    }
+), reference=WESTLEY_CROUP_SCORE_REFERENCE)
 def _calculate_westley_croup_score(args):
     """Calcola Westley Croup Score"""
     stridor = args.get('stridor', 0)
@@ -1351,7 +1104,8 @@ def _calculate_westley_croup_score(args):
         severity = "CRITICO"
         management = "Potenziale intubazione - Terapia intensiva"
     
-    result = f"""Westley Croup Score
+    def render():
+        return f"""Westley Croup Score
 ==================
 Punteggio totale: {total_score}/17
 
@@ -1363,23 +1117,59 @@ Dettaglio punteggi:
 - Retrazioni: {retraction}/3
 - Ingresso d'aria: {air_entry}/2
 - Cianosi: {cyanosis}/4
-- Livello di coscienza: {consciousness}/5
+- Livello di coscienza: {consciousness}/5"""
 
-Interpretazione:
-- 0-2: Croup lieve - Steroidi e osservazione domiciliare
-- 3-5: Croup moderato - Osservazione ospedaliera
-- 6-11: Croup severo - Trattamento intensivo
-- ≥12: Croup critico - Insufficienza respiratoria imminente
+    return ToolResult({
+        "total_score": total_score,
+        "severity": severity,
+        "management": management
+    }, render)
 
-Criteri di score:
-1. Stridore inspiratorio: 0=nessuno, 1=con agitazione, 2=a riposo
-2. Retrazioni: 0=nessuna, 1=lievi, 2=moderate, 3=severe
-3. Ingresso d'aria: 0=normale, 1=diminuito, 2=marcatamente diminuito
-4. Cianosi: 0=nessuna, 4=con agitazione, 5=a riposo
-5. Coscienza: 0=normale, 5=alterata
+CENTOR_SCORE_PEDIATRIC_REFERENCE = """Interpretazione:
+- 0-1: Probabilità <10% - No test/antibiotici
+- 2: Probabilità 10-17% - Test rapido
+- 3: Probabilità 30-35% - Test rapido
+- 4-5: Probabilità >50% - Test rapido o terapia empirica
+
+Note cliniche:
+- Score modificato per pediatria (aggiunge età 3-14 anni)
+- Utile in contesti ambulatoriali per razionalizzare test/antibiotici
+- Valore predittivo migliorato associando test rapido (Strep A)
+- Considerare fattori epidemiologici (contatti familiari, stagionalità)
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_centor_score_pediatric",
+    description="Calcola Centor Score modificato per faringite streptococcica in età pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "age_years": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 18,
+                "description": "Età in anni"
+            },
+            "exudate": {
+                "type": "boolean",
+                "description": "Essudato tonsillare presente"
+            },
+            "tender_nodes": {
+                "type": "boolean",
+                "description": "Linfoadenopatia cervicale anteriore dolente"
+            },
+            "fever": {
+                "type": "boolean",
+                "description": "Febbre >38°C"
+            },
+            "cough": {
+                "type": "boolean",
+                "description": "Presenza di tosse"
+            }
+        },
+        "required": ["age_years", "exudate", "tender_nodes", "fever", "cough"]
+    }
+), reference=CENTOR_SCORE_PEDIATRIC_REFERENCE)
 def _calculate_centor_score_pediatric(args):
     """Calcola Centor Score modificato per faringite streptococcica pediatrica"""
     age_years = args.get('age_years', 0)
@@ -1422,7 +1212,8 @@ def _calculate_centor_score_pediatric(args):
         probability = "ALTA (>50%)"
         recommendation = "Test rapido o trattamento empirico se test non disponibile"
     
-    result = f"""Centor Score Pediatrico (Faringite Streptococcica)
+    def render():
+        return f"""Centor Score Pediatrico (Faringite Streptococcica)
 ============================================
 Età paziente: {age_years} anni
 Punteggio totale: {score}/5
@@ -1431,22 +1222,74 @@ Probabilità infezione streptococcica: {probability}
 Raccomandazione: {recommendation}
 
 Criteri presenti:
-{chr(10).join(criteria) if criteria else '• Nessun criterio presente'}
+{chr(10).join(criteria) if criteria else '• Nessun criterio presente'}"""
 
-Interpretazione:
-- 0-1: Probabilità <10% - No test/antibiotici
-- 2: Probabilità 10-17% - Test rapido
-- 3: Probabilità 30-35% - Test rapido
-- 4-5: Probabilità >50% - Test rapido o terapia empirica
+    return ToolResult({
+        "score": score,
+        "probability": probability,
+        "recommendation": recommendation,
+        "criteria_present": len(criteria)
+    }, render)
 
-Note cliniche:
-- Score modificato per pediatria (aggiunge età 3-14 anni)
-- Utile in contesti ambulatoriali per razionalizzare test/antibiotici
-- Valore predittivo migliorato associando test rapido (Strep A)
-- Considerare fattori epidemiologici (contatti familiari, stagionalità)
+WELLS_SCORE_PEDIATRIC_REFERENCE = """Interpretazione:
+- ≥2: Alta probabilità TVP - Ecografia urgente
+- 1: Moderata probabilità - Ecografia + D-dimero
+- ≤0: Bassa probabilità - D-dimero
+
+Note:
+- Validato in popolazione pediatrica
+- D-dimero falsi positivi frequenti in bambini
+- Combinare con ecografia per decisioni cliniche
+- Soglie adattate per bambini (differenti da adulti)
+- Considerare fattori di rischio aggiuntivi (CVC, immobilità)
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_wells_score_pediatric",
+    description="Calcola Wells Score pediatrico per valutare probabilità di trombosi venosa profonda",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "provoked_dvt": {
+                "type": "boolean",
+                "description": "TVP provocata da traumi, chirurgia recente, immobilizzazione"
+            },
+            "alternative_diagnosis": {
+                "type": "boolean",
+                "description": "Diagnosi alternativa possibile"
+            },
+            "swelling": {
+                "type": "boolean",
+                "description": "Gonfiore dell'intero arto"
+            },
+            "unilateral_tenderness": {
+                "type": "boolean",
+                "description": "Dolorabilità unilaterale lungo sistema venoso profondo"
+            },
+            "swelling_thigh_calf": {
+                "type": "boolean",
+                "description": "Gonfiore polpaccio >3cm rispetto controlaterale"
+            },
+            "unilateral_pitting": {
+                "type": "boolean",
+                "description": "Edema improntabile monolaterale"
+            },
+            "bedridden": {
+                "type": "boolean",
+                "description": "Allettamento recente >3 giorni"
+            },
+            "active_cancer": {
+                "type": "boolean",
+                "description": "Cancro attivo"
+            },
+            "previous_dvt": {
+                "type": "boolean",
+                "description": "Precedente TVP"
+            }
+        },
+        "required": ["provoked_dvt", "alternative_diagnosis", "swelling", "unilateral_tenderness", "swelling_thigh_calf", "unilateral_pitting", "bedridden", "active_cancer", "previous_dvt"]
+    }
+), reference=WELLS_SCORE_PEDIATRIC_REFERENCE)
 def _calculate_wells_score_pediatric(args):
     """Calcola Wells Score pediatrico per TVP"""
     provoked_dvt = args.get('provoked_dvt', False)
@@ -1502,7 +1345,8 @@ def _calculate_wells_score_pediatric(args):
         probability = "BASSA (<5%)"
         recommendation = "D-dimero, considerare stop se negativo"
     
-    result = f"""Wells Score Pediatrico per TVP
+    def render():
+        return f"""Wells Score Pediatrico per TVP
 ==========================
 Punteggio totale: {score}
 
@@ -1510,21 +1354,63 @@ Probabilità TVP: {probability}
 Raccomandazione: {recommendation}
 
 Criteri presenti:
-{chr(10).join(details) if details else '• Nessun criterio presente'}
-
-Interpretazione:
-- ≥2: Alta probabilità TVP - Ecografia urgente
-- 1: Moderata probabilità - Ecografia + D-dimero
-- ≤0: Bassa probabilità - D-dimero
+{chr(10).join(details) if details else '• Nessun criterio presente'}"""
+
+    return ToolResult({
+        "score": score,
+        "probability": probability,
+        "recommendation": recommendation
+    }, render)
+PAS_ASTHMA_REFERENCE = """Interpretazione clinica:
+- Score 0-4: Asma lieve
+- Score 5-7: Asma moderata
+- Score 8-11: Asma severa
+- Score 12-15: Asma critica/potenziale arresto respiratorio
 
-Note:
-- Validato in popolazione pediatrica
-- D-dimero falsi positivi frequenti in bambini
-- Combinare con ecografia per decisioni cliniche
-- Soglie adattate per bambini (differenti da adulti)
-- Considerare fattori di rischio aggiuntivi (CVC, immobilità)
+Nota: Il PAS è uno strumento di valutazione oggettiva della gravità dell'asma
+utilizzato nei contesti di emergenza e per monitorare la risposta al trattamento.
 """
-    return [types.TextContent(type="text", text=result)]
+
+@register_tool(types.Tool(
+    name="calculate_pas_asthma",
+    description="Calcola il Pediatric Asthma Score (PAS) per valutare la gravità di un'esacerbazione asmatica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "respiratory_rate": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Frequenza respiratoria: 0=normale, 1=aumentata, 2=molto aumentata, 3=grave tachipnea"
+            },
+            "oxygen_requirement": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Richiesta di ossigeno: 0=nessuna (SatO2≥96%), 1=bassa (SatO2 94-95%), 2=moderata (SatO2 90-93%), 3=alta (SatO2<90%)"
+            },
+            "auscultation": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Auscultazione: 0=normale, 1=wheezing fine/localizzato, 2=wheezing durante tutta l'espirazione, 3=wheezing in ins/esp o silenzio"
+            },
+            "retractions": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Retrazioni: 0=nessuna, 1=lievi intercostali, 2=moderate intercostali/sottosternali, 3=gravi con uso muscoli accessori"
+            },
+            "dyspnea": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 3,
+                "description": "Dispnea: 0=nessuna, 1=lieve, 2=moderata, 3=grave con difficoltà a parlare/alimentarsi"
+            }
+        },
+        "required": ["respiratory_rate", "oxygen_requirement", "auscultation", "retractions", "dyspnea"]
+    }
+), reference=PAS_ASTHMA_REFERENCE)
 def _calculate_pas_asthma(args):
     """Calcola Pediatric Asthma Score"""
     respiratory_rate = args.get('respiratory_rate', 0)
@@ -1536,7 +1422,8 @@ def _calculate_pas_asthma(args):
     total = respiratory_rate + oxygen_requirement + auscultation + retractions + dyspnea
     interpretation = calculate_pas_asthma_interpretation(total)
     
-    result = f"""Pediatric Asthma Score (PAS)
+    def render():
+        return f"""Pediatric Asthma Score (PAS)
 =========================
 Punteggio totale: {total}/15
 Severità: {interpretation['severity']}
@@ -1547,19 +1434,52 @@ Dettaglio punteggi:
 - Richiesta di ossigeno: {oxygen_requirement}/3
 - Auscultazione: {auscultation}/3
 - Retrazioni: {retractions}/3
-- Dispnea: {dyspnea}/3
+- Dispnea: {dyspnea}/3"""
 
-Interpretazione clinica:
-- Score 0-4: Asma lieve
-- Score 5-7: Asma moderata
-- Score 8-11: Asma severa
-- Score 12-15: Asma critica/potenziale arresto respiratorio
+    return ToolResult({
+        "total": total,
+        "severity": interpretation['severity'],
+        "recommendation": interpretation['recommendation']
+    }, render)
 
-Nota: Il PAS è uno strumento di valutazione oggettiva della gravità dell'asma
-utilizzato nei contesti di emergenza e per monitorare la risposta al trattamento.
+PASS_ASTHMA_REFERENCE = """Interpretazione clinica:
+- Score 0-2: Asma lieve
+- Score 3-4: Asma moderata
+- Score 5-6: Asma severa
+
+Nota: Il PASS è uno score validato e semplificato a 3 parametri,
+utile per la valutazione rapida dell'esacerbazione asmatica
+in contesti di emergenza pediatrica.
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_pass_asthma",
+    description="Calcola il Pediatric Asthma Severity Score (PASS) per valutare la gravità di un'esacerbazione asmatica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "wheezing": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Wheezing: 0=assente, 1=fine/localizzato, 2=diffuso"
+            },
+            "work_of_breathing": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Lavoro respiratorio: 0=normale, 1=aumentato, 2=massimale"
+            },
+            "prolonged_expiration": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Espirazione prolungata: 0=assente, 1=moderata, 2=marcata"
+            }
+        },
+        "required": ["wheezing", "work_of_breathing", "prolonged_expiration"]
+    }
+), reference=PASS_ASTHMA_REFERENCE)
 def _calculate_pass_asthma(args):
     """Calcola Pediatric Asthma Severity Score (PASS)"""
     wheezing = args.get('wheezing', 0)
@@ -1569,7 +1489,8 @@ def _calculate_pass_asthma(args):
     total = wheezing + work_of_breathing + prolonged_expiration
     interpretation = calculate_pass_asthma_interpretation(total)
     
-    result = f"""Pediatric Asthma Severity Score (PASS)
+    def render():
+        return f"""Pediatric Asthma Severity Score (PASS)
 ==================================
 Punteggio totale: {total}/6
 Severità: {interpretation['severity']}
@@ -1578,19 +1499,63 @@ Raccomandazione: {interpretation['recommendation']}
 Dettaglio punteggi:
 - Wheezing: {wheezing}/2
 - Lavoro respiratorio: {work_of_breathing}/2
-- Espirazione prolungata: {prolonged_expiration}/2
+- Espirazione prolungata: {prolonged_expiration}/2"""
 
-Interpretazione clinica:
-- Score 0-2: Asma lieve
-- Score 3-4: Asma moderata
-- Score 5-6: Asma severa
+    return ToolResult({
+        "total": total,
+        "severity": interpretation['severity'],
+        "recommendation": interpretation['recommendation']
+    }, render)
 
-Nota: Il PASS è uno score validato e semplificato a 3 parametri,
-utile per la valutazione rapida dell'esacerbazione asmatica
-in contesti di emergenza pediatrica.
+BACTERIAL_MENINGITIS_SCORE_REFERENCE = """Interpretazione clinica:
+- Score 0: Rischio molto basso (<0.1%)
+- Score 1: Rischio basso (0.4-2.5%)
+- Score ≥2: Rischio alto (>8%)
+
+Note cliniche:
+- Applicabile a bambini ≥2 mesi con meningite a liquor limpido
+- Non applicabile in caso di antibioticoterapia nelle 72h precedenti
+- Non applicabile in caso di comorbilità o immunodepressione
+- Score validato in diversi contesti clinici con elevato valore predittivo negativo
+- Un punteggio ≥2 ha sensibilità 99-100% per meningite batterica
+
+Criteri di esclusione originali dello studio:
+- Condizioni critiche/immunocompromissione
+- Presenza di shunt/dispositivi neurochirurgici
+- Trauma cranico recente o neurochirurgia
+- Convulsioni epilettiche note
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_bacterial_meningitis_score",
+    description="Calcola il Bacterial Meningitis Score for Children per predire il rischio di meningite batterica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "csf_gram_stain_positive": {
+                "type": "boolean",
+                "description": "Colorazione di Gram positiva nel liquor"
+            },
+            "csf_anc_geq_1000": {
+                "type": "boolean",
+                "description": "Conta neutrofili nel liquor ≥1000 cell/μL"
+            },
+            "csf_protein_geq_80": {
+                "type": "boolean",
+                "description": "Proteine liquorali ≥80 mg/dL"
+            },
+            "peripheral_anc_geq_10000": {
+                "type": "boolean",
+                "description": "Conta neutrofili periferici ≥10000 cell/μL"
+            },
+            "seizure_at_onset": {
+                "type": "boolean",
+                "description": "Convulsioni all'esordio"
+            }
+        },
+        "required": ["csf_gram_stain_positive", "csf_anc_geq_1000", "csf_protein_geq_80", "peripheral_anc_geq_10000", "seizure_at_onset"]
+    }
+), reference=BACTERIAL_MENINGITIS_SCORE_REFERENCE)
 def _calculate_bacterial_meningitis_score(args):
     """Calcola Bacterial Meningitis Score for Children"""
     total_score = 0
@@ -1618,7 +1583,8 @@ def _calculate_bacterial_meningitis_score(args):
     
     interpretation = calculate_bacterial_meningitis_score_interpretation(total_score)
     
-    result = f"""Bacterial Meningitis Score for Children
+    def render():
+        return f"""Bacterial Meningitis Score for Children
 ====================================
 Punteggio totale: {total_score}/6
 
@@ -1626,28 +1592,62 @@ Rischio di meningite batterica: {interpretation['risk']}
 Raccomandazione: {interpretation['recommendation']}
 
 Criteri presenti:
-{chr(10).join(criteria) if criteria else "• Nessun criterio presente"}
+{chr(10).join(criteria) if criteria else "• Nessun criterio presente"}"""
 
-Interpretazione clinica:
-- Score 0: Rischio molto basso (<0.1%)
-- Score 1: Rischio basso (0.4-2.5%)
-- Score ≥2: Rischio alto (>8%)
+    return ToolResult({
+        "total_score": total_score,
+        "risk": interpretation['risk'],
+        "recommendation": interpretation['recommendation']
+    }, render)
+
+KOCHER_CRITERIA_REFERENCE = """Interpretazione clinica:
+- 0 criteri: <0.2% probabilità di artrite settica
+- 1 criterio: ~3% probabilità
+- 2 criteri: ~40% probabilità
+- 3 criteri: ~93% probabilità
+- 4 criteri: ~99% probabilità
 
 Note cliniche:
-- Applicabile a bambini ≥2 mesi con meningite a liquor limpido
-- Non applicabile in caso di antibioticoterapia nelle 72h precedenti
-- Non applicabile in caso di comorbilità o immunodepressione
-- Score validato in diversi contesti clinici con elevato valore predittivo negativo
-- Un punteggio ≥2 ha sensibilità 99-100% per meningite batterica
+- Criteri validati per bambini con dolore o limitazione articolare dell'anca
+- La PCR elevata (>2.0 mg/dL) è stata aggiunta successivamente come quinto criterio
+- Strumento di screening, non sostituisce il giudizio clinico
+- Un'ecografia dell'anca con versamento è compatibile ma non specifica
+- L'aspirazione articolare rimane il gold standard diagnostico
 
-Criteri di esclusione originali dello studio:
-- Condizioni critiche/immunocompromissione
-- Presenza di shunt/dispositivi neurochirurgici
-- Trauma cranico recente o neurochirurgia
-- Convulsioni epilettiche note
+Diagnosi differenziali da considerare:
+- Sinovite transitoria dell'anca
+- Osteomielite
+- Artrite reumatoide giovanile
+- Malattia di Legg-Calvé-Perthes
+- Epifisiolisi della testa femorale
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_kocher_criteria",
+    description="Calcola i Kocher Criteria per la diagnosi di artrite settica dell'anca in età pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "fever": {
+                "type": "boolean",
+                "description": "Febbre >38.5°C"
+            },
+            "weight_bearing": {
+                "type": "boolean",
+                "description": "Incapacità/rifiuto di carico sull'arto interessato"
+            },
+            "esr_elevated": {
+                "type": "boolean",
+                "description": "VES >40 mm/h"
+            },
+            "wbc_elevated": {
+                "type": "boolean",
+                "description": "Leucociti >12,000/μL"
+            }
+        },
+        "required": ["fever", "weight_bearing", "esr_elevated", "wbc_elevated"]
+    }
+), reference=KOCHER_CRITERIA_REFERENCE)
 def _calculate_kocher_criteria(args):
     """Calcola Kocher Criteria per artrite settica dell'anca"""
     total_score = 0
@@ -1671,7 +1671,8 @@ def _calculate_kocher_criteria(args):
     
     interpretation = calculate_kocher_criteria_interpretation(total_score)
     
-    result = f"""Kocher Criteria per Artrite Settica dell'Anca
+    def render():
+        return f"""Kocher Criteria per Artrite Settica dell'Anca
 =========================================
 Criteri positivi: {total_score}/4
 
@@ -1679,31 +1680,85 @@ Probabilità di artrite settica: {interpretation['probability']}
 Raccomandazione: {interpretation['recommendation']}
 
 Criteri presenti:
-{chr(10).join(criteria) if criteria else "• Nessun criterio presente"}
+{chr(10).join(criteria) if criteria else "• Nessun criterio presente"}"""
 
-Interpretazione clinica:
-- 0 criteri: <0.2% probabilità di artrite settica
-- 1 criterio: ~3% probabilità
-- 2 criteri: ~40% probabilità
-- 3 criteri: ~93% probabilità
-- 4 criteri: ~99% probabilità
+    return ToolResult({
+        "total_score": total_score,
+        "probability": interpretation['probability'],
+        "recommendation": interpretation['recommendation']
+    }, render)
+
+KAWASAKI_CRITERIA_REFERENCE = """Interpretazione:
+- Kawasaki classico: Febbre ≥5 giorni + ≥4 criteri clinici principali
+- Kawasaki incompleto: Febbre ≥5 giorni + 2-3 criteri clinici + anomalie laboratorio/ecocardiografia
+- Kawasaki atipico: Presentazione clinica insolita con febbre e anomalie coronariche
 
 Note cliniche:
-- Criteri validati per bambini con dolore o limitazione articolare dell'anca
-- La PCR elevata (>2.0 mg/dL) è stata aggiunta successivamente come quinto criterio
-- Strumento di screening, non sostituisce il giudizio clinico
-- Un'ecografia dell'anca con versamento è compatibile ma non specifica
-- L'aspirazione articolare rimane il gold standard diagnostico
+- Il trattamento tempestivo (entro 10 giorni) riduce il rischio di anomalie coronariche
+- Trattamento standard: IVIG 2g/kg in singola dose + ASA (80-100mg/kg/die)
+- Monitoraggio ecocardiografico: alla diagnosi, a 2 settimane e a 6-8 settimane
+- Fino al 25% dei pazienti non trattati sviluppa anomalie coronariche
+- Per Kawasaki incompleto: valutare algoritmo AHA per supporto diagnostico
 
-Diagnosi differenziali da considerare:
-- Sinovite transitoria dell'anca
-- Osteomielite
-- Artrite reumatoide giovanile
-- Malattia di Legg-Calvé-Perthes
-- Epifisiolisi della testa femorale
+Criteri di laboratorio supplementari per Kawasaki incompleto:
+- Albumina ≤3.0 g/dL
+- Anemia per età
+- Elevazione ALT
+- Piastrine ≥450,000/mm³ dopo 7 giorni
+- GB ≥15,000/mm³
+- Piuria sterile
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_kawasaki_criteria",
+    description="Valuta i criteri diagnostici per la malattia di Kawasaki in età pediatrica",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "fever_5_days": {
+                "type": "boolean",
+                "description": "Febbre persistente per ≥5 giorni"
+            },
+            "conjunctival_injection": {
+                "type": "boolean",
+                "description": "Iniezione congiuntivale bilaterale non essudativa"
+            },
+            "oral_changes": {
+                "type": "boolean",
+                "description": "Alterazioni del cavo orale (labbra screpolate, eritema orofaringeo, lingua a fragola)"
+            },
+            "extremity_changes": {
+                "type": "boolean",
+                "description": "Alterazioni delle estremità (eritema palmo-plantare, edema, desquamazione)"
+            },
+            "polymorphous_rash": {
+                "type": "boolean",
+                "description": "Esantema polimorfo"
+            },
+            "cervical_lymphadenopathy": {
+                "type": "boolean",
+                "description": "Linfoadenopatia cervicale (>1.5 cm di diametro)"
+            },
+            "laboratory_findings": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["elevated_crp", "elevated_esr", "anemia", "hypoalbuminemia", "elevated_alt", "leukocytosis", "thrombocytosis", "pyuria"]
+                },
+                "description": "Esami di laboratorio anormali"
+            },
+            "echocardiogram_findings": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["coronary_artery_abnormality", "mitral_regurgitation", "pericardial_effusion", "decreased_lv_function", "z_score_gt_2"]
+                },
+                "description": "Reperti ecocardiografici"
+            }
+        },
+        "required": ["fever_5_days", "conjunctival_injection", "oral_changes", "extremity_changes", "polymorphous_rash", "cervical_lymphadenopathy"]
+    }
+), reference=KAWASAKI_CRITERIA_REFERENCE)
 def _calculate_kawasaki_criteria(args):
     """Valuta criteri diagnostici per malattia di Kawasaki"""
     has_fever = args.get('fever_5_days', False)
@@ -1740,7 +1795,8 @@ def _calculate_kawasaki_criteria(args):
     # Interpretazione
     interpretation = calculate_kawasaki_criteria_interpretation(has_fever, criteria_count)
     
-    result = f"""Criteri Diagnostici per Malattia di Kawasaki
+    def render():
+        return f"""Criteri Diagnostici per Malattia di Kawasaki
 =========================================
 Diagnosi: {interpretation['diagnosis']}
 Raccomandazione: {interpretation['recommendation']}
@@ -1753,30 +1809,65 @@ Criteri clinici:
 
 {lab_findings_text if lab_findings_text else ""}
 
-{echo_findings_text if echo_findings_text else ""}
+{echo_findings_text if echo_findings_text else ""}"""
 
-Interpretazione:
-- Kawasaki classico: Febbre ≥5 giorni + ≥4 criteri clinici principali
-- Kawasaki incompleto: Febbre ≥5 giorni + 2-3 criteri clinici + anomalie laboratorio/ecocardiografia
-- Kawasaki atipico: Presentazione clinica insolita con febbre e anomalie coronariche
+    return ToolResult({
+        "diagnosis": interpretation['diagnosis'],
+        "recommendation": interpretation['recommendation'],
+        "fever": has_fever,
+        "criteria_count": criteria_count
+    }, render)
+
+HSP_CRITERIA_REFERENCE = """Interpretazione:
+- Criterio obbligatorio: Porpora palpabile non piastrinopenica
+- Diagnosi HSP: Criterio obbligatorio + almeno 1 dei seguenti:
+  - Dolore addominale
+  - Istologia con depositi di IgA
+  - Artrite/artralgia
+  - Coinvolgimento renale (ematuria/proteinuria)
 
 Note cliniche:
-- Il trattamento tempestivo (entro 10 giorni) riduce il rischio di anomalie coronariche
-- Trattamento standard: IVIG 2g/kg in singola dose + ASA (80-100mg/kg/die)
-- Monitoraggio ecocardiografico: alla diagnosi, a 2 settimane e a 6-8 settimane
-- Fino al 25% dei pazienti non trattati sviluppa anomalie coronariche
-- Per Kawasaki incompleto: valutare algoritmo AHA per supporto diagnostico
+- HSP è la vasculite più comune in età pediatrica
+- Età tipica: 3-10 anni, più comune in maschi
+- Porpora tipicamente localizzata a arti inferiori e glutei
+- Monitoraggio renale per 6 mesi è raccomandato
+- Prognosi generalmente buona, complicanze renali nel 20-30%
+- Trattamento: supportivo nella maggior parte dei casi
+- Steroidi indicati in caso di grave coinvolgimento gastrointestinale/articolare
 
-Criteri di laboratorio supplementari per Kawasaki incompleto:
-- Albumina ≤3.0 g/dL
-- Anemia per età
-- Elevazione ALT
-- Piastrine ≥450,000/mm³ dopo 7 giorni
-- GB ≥15,000/mm³
-- Piuria sterile
+Fonte: Criteri EULAR/PRINTO/PRES 2010
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_hsp_criteria",
+    description="Valuta i criteri EULAR/PRINTO/PRES per la diagnosi di Porpora di Henoch-Schönlein (HSP)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "palpable_purpura": {
+                "type": "boolean",
+                "description": "Porpora palpabile (criterio obbligatorio)"
+            },
+            "abdominal_pain": {
+                "type": "boolean",
+                "description": "Dolore addominale"
+            },
+            "histopathology": {
+                "type": "boolean",
+                "description": "Depositi di IgA alla biopsia"
+            },
+            "arthritis_arthralgia": {
+                "type": "boolean",
+                "description": "Artrite o artralgia"
+            },
+            "renal_involvement": {
+                "type": "boolean",
+                "description": "Coinvolgimento renale (ematuria e/o proteinuria)"
+            }
+        },
+        "required": ["palpable_purpura", "abdominal_pain", "histopathology", "arthritis_arthralgia", "renal_involvement"]
+    }
+), reference=HSP_CRITERIA_REFERENCE)
 def _calculate_hsp_criteria(args):
     """Valuta criteri EULAR/PRINTO/PRES per diagnosi di Porpora di Henoch-Schönlein"""
     palpable_purpura = args.get('palpable_purpura', False)
@@ -1811,7 +1902,8 @@ def _calculate_hsp_criteria(args):
         else:
             recommendation = "Necessario almeno un criterio aggiuntivo oltre alla porpora palpabile."
     
-    result = f"""Criteri EULAR/PRINTO/PRES per Porpora di Henoch-Schönlein (HSP)
+    def render():
+        return f"""Criteri EULAR/PRINTO/PRES per Porpora di Henoch-Schönlein (HSP)
 ===========================================================
 Diagnosi: {diagnosis}
 Raccomandazione: {recommendation}
@@ -1819,28 +1911,75 @@ Raccomandazione: {recommendation}
 Criteri presenti:
 {chr(10).join(criteria_present) if criteria_present else "• Nessun criterio presente"}
 
-Criteri aggiuntivi presenti: {criteria_count}/4
+Criteri aggiuntivi presenti: {criteria_count}/4"""
 
-Interpretazione:
-- Criterio obbligatorio: Porpora palpabile non piastrinopenica
-- Diagnosi HSP: Criterio obbligatorio + almeno 1 dei seguenti:
-  - Dolore addominale
-  - Istologia con depositi di IgA
-  - Artrite/artralgia
-  - Coinvolgimento renale (ematuria/proteinuria)
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "recommendation": recommendation,
+        "criteria_count": criteria_count
+    }, render)
+JONES_CRITERIA_REFERENCE = """Interpretazione:
+- Primo episodio: 
+  - ≥2 criteri maggiori, o
+  - 1 criterio maggiore + ≥2 criteri minori
+- Recidiva:
+  - ≥2 criteri maggiori, o
+  - 1 criterio maggiore + ≥2 criteri minori, o
+  - ≥3 criteri minori
 
-Note cliniche:
-- HSP è la vasculite più comune in età pediatrica
-- Età tipica: 3-10 anni, più comune in maschi
-- Porpora tipicamente localizzata a arti inferiori e glutei
-- Monitoraggio renale per 6 mesi è raccomandato
-- Prognosi generalmente buona, complicanze renali nel 20-30%
-- Trattamento: supportivo nella maggior parte dei casi
-- Steroidi indicati in caso di grave coinvolgimento gastrointestinale/articolare
+Note:
+- La poliartralgia è criterio maggiore SOLO in popolazioni ad alto rischio
+- La cardite subclinica (anomalie ecocardiografiche senza soffi) è criterio maggiore
+- Evidenza di infezione streptococcica recente è necessaria per la diagnosi
+- In caso di corea o cardite indolente, l'evidenza di infezione streptococcica può non essere richiesta
+- La profilassi secondaria è essenziale per prevenire recidive
 
-Fonte: Criteri EULAR/PRINTO/PRES 2010
+Fonte: Criteri di Jones aggiornati (AHA 2015)
 """
-    return [types.TextContent(type="text", text=result)]
+
+@register_tool(types.Tool(
+    name="calculate_jones_criteria",
+    description="Valuta i criteri di Jones aggiornati (2015) per la diagnosi di febbre reumatica acuta",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "prior_rheumatic_heart_disease": {
+                "type": "boolean",
+                "description": "Precedente cardiopatia reumatica"
+            },
+            "high_risk_population": {
+                "type": "boolean",
+                "description": "Popolazione ad alto rischio (endemicità elevata)"
+            },
+            "confirmed_strep_infection": {
+                "type": "boolean",
+                "description": "Infezione streptococcica recente confermata"
+            },
+            "major_criteria": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [
+                        "carditis", "arthritis", "chorea", "erythema_marginatum", "subcutaneous_nodules",
+                        "subclinical_carditis", "polyarthralgia"
+                    ]
+                },
+                "description": "Criteri maggiori (cardite, artrite, corea, eritema marginato, noduli sottocutanei, cardite subclinica, poliartralgia)"
+            },
+            "minor_criteria": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [
+                        "fever", "elevated_esr_crp", "prolonged_pr_interval", "polyarthralgia", "monoarthralgia"
+                    ]
+                },
+                "description": "Criteri minori (febbre, VES/PCR elevata, PR prolungato, poliartralgia, monoartralgia)"
+            }
+        },
+        "required": ["prior_rheumatic_heart_disease", "high_risk_population", "confirmed_strep_infection", "major_criteria", "minor_criteria"]
+    }
+), reference=JONES_CRITERIA_REFERENCE)
 def _calculate_jones_criteria(args):
     """Valuta criteri di Jones per diagnosi di febbre reumatica acuta"""
     prior_rheumatic_heart_disease = args.get('prior_rheumatic_heart_disease', False)
@@ -1900,7 +2039,8 @@ def _calculate_jones_criteria(args):
     else:
         recommendation = "Considerare diagnosi alternative."
     
-    result = f"""Criteri di Jones (2015) per Febbre Reumatica Acuta
+    def render():
+        return f"""Criteri di Jones (2015) per Febbre Reumatica Acuta
 ===========================================
 Diagnosi: {diagnosis}
 Dettagli: {details}
@@ -1914,28 +2054,67 @@ Criteri maggiori presenti ({major_count}):
 {chr(10).join(['• ' + c.replace('_', ' ').title() for c in major_criteria]) if major_criteria else '• Nessuno'}
 
 Criteri minori presenti ({minor_count}):
-{chr(10).join(['• ' + c.replace('_', ' ').title() for c in minor_criteria]) if minor_criteria else '• Nessuno'}
+{chr(10).join(['• ' + c.replace('_', ' ').title() for c in minor_criteria]) if minor_criteria else '• Nessuno'}"""
 
-Interpretazione:
-- Primo episodio: 
-  - ≥2 criteri maggiori, o
-  - 1 criterio maggiore + ≥2 criteri minori
-- Recidiva:
-  - ≥2 criteri maggiori, o
-  - 1 criterio maggiore + ≥2 criteri minori, o
-  - ≥3 criteri minori
+    return ToolResult({
+        "diagnosis": diagnosis,
+        "details": details,
+        "recommendation": recommendation,
+        "major_count": major_count,
+        "minor_count": minor_count
+    }, render)
 
-Note:
-- La poliartralgia è criterio maggiore SOLO in popolazioni ad alto rischio
-- La cardite subclinica (anomalie ecocardiografiche senza soffi) è criterio maggiore
-- Evidenza di infezione streptococcica recente è necessaria per la diagnosi
-- In caso di corea o cardite indolente, l'evidenza di infezione streptococcica può non essere richiesta
-- La profilassi secondaria è essenziale per prevenire recidive
+BOPS_REFERENCE = """Interpretazione:
+- 0-1: Nessun dolore
+- 2-3: Dolore lieve
+- 4: Dolore moderato
+- 5-6: Dolore severo
 
-Fonte: Criteri di Jones aggiornati (AHA 2015)
+Note cliniche:
+- Scala validata per bambini di 1-7 anni nel postoperatorio
+- Monitoraggio semplice e rapido (< 1 minuto)
+- Particolarmente utile nel setting di recovery room
+- Alta affidabilità inter-osservatore
+- Complementare alla valutazione dell'intensità dolore con altre scale
+- Rivalutare dopo ogni intervento analgesico
+
+Fonte: Behavioural Observational Pain Scale di Hesselgard et al.
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_bops",
+    description="Calcola il Behavioral Observational Pain Scale (BOPS) per dolore post-operatorio pediatrico (1-7 anni)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "facial_expression": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Espressione facciale: 0=Neutra/sorridente/calma, 1=Occasionale fronte corrugata/labbra serrate, 2=Frequenti/costanti espressioni dolore"
+            },
+            "verbalization": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Verbalizzazione: 0=Normale/dorme silenziosamente, 1=Occasionali lamenti/piagnucola, 2=Pianto intenso/grida/singhiozzi"
+            },
+            "body_position": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 2,
+                "description": "Posizione corporea: 0=Inattiva/rilassata/movimento normale, 1=Tesa/irrequieta/si contorce, 2=Rigida/flessa/calci/tocca la ferita"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 12,
+                "maximum": 84,
+                "description": "Età in mesi (12-84 mesi = 1-7 anni)"
+            }
+        },
+        "required": ["facial_expression", "verbalization", "body_position", "age_months"]
+    }
+), reference=BOPS_REFERENCE)
 def _calculate_bops(args):
     """Calcola Behavioral Observational Pain Scale (BOPS)"""
     facial_expression = args.get('facial_expression', 0)
@@ -1945,7 +2124,8 @@ def _calculate_bops(args):
     total = facial_expression + verbalization + body_position
     interpretation = calculate_bops_interpretation(total)
     
-    result = f"""Behavioral Observational Pain Scale (BOPS)
+    def render():
+        return f"""Behavioral Observational Pain Scale (BOPS)
 =======================================
 Punteggio totale: {total}/6
 Livello di dolore: {interpretation['pain_level']}
@@ -1954,26 +2134,59 @@ Raccomandazione: {interpretation['recommendation']}
 Dettaglio punteggi:
 - Espressione facciale: {facial_expression}/2
 - Verbalizzazione: {verbalization}/2
-- Posizione corporea: {body_position}/2
+- Posizione corporea: {body_position}/2"""
 
-Interpretazione:
-- 0-1: Nessun dolore
-- 2-3: Dolore lieve
-- 4: Dolore moderato
-- 5-6: Dolore severo
+    return ToolResult({
+        "total": total,
+        "pain_level": interpretation['pain_level'],
+        "recommendation": interpretation['recommendation']
+    }, render)
 
-Note cliniche:
-- Scala validata per bambini di 1-7 anni nel postoperatorio
-- Monitoraggio semplice e rapido (< 1 minuto)
-- Particolarmente utile nel setting di recovery room
-- Alta affidabilità inter-osservatore
-- Complementare alla valutazione dell'intensità dolore con altre scale
-- Rivalutare dopo ogni intervento analgesico
+LANSKY_SCORE_REFERENCE = """Interpretazione clinica:
+- 100-90: Attività normale o con limitazioni minime
+- 80-70: Attivo ma con affaticabilità aumentata
+- 60-50: In piedi, gioco ridotto, prevalenza attività calme
+- 40-30: Maggior parte del tempo a letto, bisogno di assistenza
+- 20-10: Allettato, attività molto limitate
+- 0: Non responsivo
 
-Fonte: Behavioural Observational Pain Scale di Hesselgard et al.
+Note:
+- Scala validata per bambini di 0-16 anni
+- Utilizzata principalmente in oncologia pediatrica e cure palliative
+- Utile per:
+  * Valutazione baseline e follow-up
+  * Decisioni terapeutiche
+  * Criteri di ammissione a studi clinici
+  * Quantificazione risultati terapeutici
+- Punteggio <50 indica necessità di assistenza importante
+- Punteggio <30 indica compromissione severa della qualità di vita
+
+Fonte: Lansky Play-Performance Scale, Lansky et al. 1987
 """
-    return [types.TextContent(type="text", text=result)]
 
+@register_tool(types.Tool(
+    name="calculate_lansky_score",
+    description="Calcola il Lansky Play-Performance Scale per la valutazione funzionale pediatrica (0-16 anni)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "performance_level": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 100,
+                "multipleOf": 10,
+                "description": "Livello funzionale: 100=attività normale, 0=non responsivo (a intervalli di 10)"
+            },
+            "age_months": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 192,
+                "description": "Età in mesi (0-192 mesi = 0-16 anni)"
+            }
+        },
+        "required": ["performance_level", "age_months"]
+    }
+), reference=LANSKY_SCORE_REFERENCE)
 def _calculate_lansky_score(args):
     """Calcola Lansky Play-Performance Scale"""
     performance_level = args.get('performance_level', 0)
@@ -2014,37 +2227,86 @@ def _calculate_lansky_score(args):
         functional_status = "GRAVE"
         recommendation = "Necessaria assistenza continua, considerare cure palliative/intensive"
     
-    result = f"""Lansky Play-Performance Scale
+    def render():
+        return f"""Lansky Play-Performance Scale
 ==========================
 Età: {age_years:.1f} anni ({age_months} mesi)
 Punteggio: {performance_level}/100
 
 Stato funzionale: {functional_status}
 Descrizione: {current_level}
-Raccomandazione: {recommendation}
-
-Interpretazione clinica:
-- 100-90: Attività normale o con limitazioni minime
-- 80-70: Attivo ma con affaticabilità aumentata
-- 60-50: In piedi, gioco ridotto, prevalenza attività calme
-- 40-30: Maggior parte del tempo a letto, bisogno di assistenza
-- 20-10: Allettato, attività molto limitate
-- 0: Non responsivo
+Raccomandazione: {recommendation}"""
+
+    return ToolResult({
+        "performance_level": performance_level,
+        "functional_status": functional_status,
+        "recommendation": recommendation
+    }, render)
+SICKLE_CELL_COMPLICATION_RISK_REFERENCE = """Fattori di rischio per complicanze severe:
+- Emoglobina basale <7 g/dL
+- Leucocitosi >15 x10^3/μL
+- Storia di sindrome toracica acuta
+- ≥3 eventi dolorosi/anno
+- Dattilite <1 anno di età
+- Emoglobina fetale <10%
+- Genotipo SS o Sβ0
 
-Note:
-- Scala validata per bambini di 0-16 anni
-- Utilizzata principalmente in oncologia pediatrica e cure palliative
-- Utile per:
-  * Valutazione baseline e follow-up
-  * Decisioni terapeutiche
-  * Criteri di ammissione a studi clinici
-  * Quantificazione risultati terapeutici
-- Punteggio <50 indica necessità di assistenza importante
-- Punteggio <30 indica compromissione severa della qualità di vita
+Indicazioni a idrossiurea (NHLBI):
+- Bambini ≥9 mesi con genotipo SS o Sβ0 e:
+  * ≥3 crisi dolorose moderate-severe nell'ultimo anno
+  * Storia di sindrome toracica acuta
+  * Altre complicanze severe legate alla vasoocclusione
 
-Fonte: Lansky Play-Performance Scale, Lansky et al. 1987
+Fonte: Miller et al., NEJM 2000 e Linee Guida NHLBI 2014
 """
-    return [types.TextContent(type="text", text=result)]
+
+@register_tool(types.Tool(
+    name="calculate_sickle_cell_complication_risk",
+    description="Calcola il rischio di complicanze severe in bambini con anemia falciforme (Miller et al.)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "hemoglobin_level": {
+                "type": "number",
+                "minimum": 3,
+                "maximum": 15,
+                "description": "Livello di emoglobina basale in g/dL"
+            },
+            "wbc_count": {
+                "type": "number",
+                "minimum": 1,
+                "maximum": 50,
+                "description": "Conta leucocitaria basale in x10^3/μL"
+            },
+            "history_of_acs": {
+                "type": "boolean",
+                "description": "Storia di sindrome toracica acuta"
+            },
+            "pain_events_per_year": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 20,
+                "description": "Numero di eventi dolorosi che richiedono assistenza medica all'anno"
+            },
+            "dactylitis_under_1_year": {
+                "type": "boolean",
+                "description": "Storia di dattilite prima dell'anno di età"
+            },
+            "hemoglobin_f_level": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "description": "Livello di emoglobina fetale (%)"
+            },
+            "genotype": {
+                "type": "string",
+                "enum": ["ss", "sbeta0", "sc", "sbeta+"],
+                "description": "Genotipo: SS, Sβ0, SC o Sβ+"
+            }
+        },
+        "required": ["hemoglobin_level", "wbc_count", "history_of_acs", "pain_events_per_year", "genotype"]
+    }
+), reference=SICKLE_CELL_COMPLICATION_RISK_REFERENCE)
 def _calculate_sickle_cell_complication_risk(args):
     """Calcola rischio di complicanze severe in anemia falciforme pediatrica"""
     hemoglobin_level = args.get('hemoglobin_level', 0)
@@ -2097,7 +2359,8 @@ def _calculate_sickle_cell_complication_risk(args):
     if (history_of_acs or pain_events_per_year >= 3) and genotype in ["ss", "sbeta0"]:
         hydroxyurea_indication = "SÌ"
     
-    result = f"""Valutazione Rischio Complicanze in Anemia Falciforme
+    def render():
+        return f"""Valutazione Rischio Complicanze in Anemia Falciforme
 =================================================
 Livello di rischio: {risk_level}
 Raccomandazione: {recommendation}
@@ -2113,26 +2376,69 @@ Dati del paziente:
 - Eventi dolorosi/anno: {pain_events_per_year}
 - Storia di sindrome toracica acuta: {'Sì' if history_of_acs else 'No'}
 - Dattilite <1 anno: {'Sì' if dactylitis_under_1_year else 'No'}
-- Emoglobina fetale: {hemoglobin_f_level if hemoglobin_f_level > 0 else 'Non specificata'}%
+- Emoglobina fetale: {hemoglobin_f_level if hemoglobin_f_level > 0 else 'Non specificata'}%"""
+
+    return ToolResult({
+        "risk_level": risk_level,
+        "recommendation": recommendation,
+        "hydroxyurea_indication": hydroxyurea_indication,
+        "risk_factors": risk_count
+    }, render)
+PNHS_REFERENCE = """Interpretazione:
+- 0-1: Bassa probabilità di NASH
+- 2: Probabilità intermedia di NASH
+- 3-4: Alta probabilità di NASH
 
-Fattori di rischio per complicanze severe:
-- Emoglobina basale <7 g/dL
-- Leucocitosi >15 x10^3/μL
-- Storia di sindrome toracica acuta
-- ≥3 eventi dolorosi/anno
-- Dattilite <1 anno di età
-- Emoglobina fetale <10%
-- Genotipo SS o Sβ0
+Note cliniche:
+- Score validato per distinguere NASH da semplice steatosi in popolazione pediatrica
+- Non sostituisce la biopsia epatica che rimane il gold standard
+- Utile per identificare pazienti ad alto rischio da candidare a biopsia
+- Sensibilità 74% e specificità 71% per NASH con cutoff ≥2
 
-Indicazioni a idrossiurea (NHLBI):
-- Bambini ≥9 mesi con genotipo SS o Sβ0 e:
-  * ≥3 crisi dolorose moderate-severe nell'ultimo anno
-  * Storia di sindrome toracica acuta
-  * Altre complicanze severe legate alla vasoocclusione
+NAFLD vs NASH:
+- NAFLD (steatosi semplice): Accumulo di grasso epatico senza infiammazione significativa
+- NASH (steatoepatite): Steatosi con infiammazione e danno epatocellulare
+- NASH è associata a maggior rischio di progressione a fibrosi e cirrosi
 
-Fonte: Miller et al., NEJM 2000 e Linee Guida NHLBI 2014
+Fonte: Nobili et al., 2019
 """
-    return [types.TextContent(type="text", text=result)]
+
+@register_tool(types.Tool(
+    name="calculate_pnhs",
+    description="Calcola il Pediatric NAFLD Histological Score (PNHS) per distinguere NASH (steatoepatite) da semplice steatosi",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "bmi_zscore": {
+                "type": "number",
+                "minimum": -3,
+                "maximum": 5,
+                "description": "BMI z-score"
+            },
+            "ast_iu_l": {
+                "type": "number",
+                "minimum": 5,
+                "maximum": 1000,
+                "description": "AST in IU/L"
+            },
+            "alt_iu_l": {
+                "type": "number",
+                "minimum": 5,
+                "maximum": 1000,
+                "description": "ALT in IU/L"
+            },
+            "insulin_resistance": {
+                "type": "boolean",
+                "description": "Presenza di resistenza insulinica (HOMA-IR >2.5 o diagnosi clinica)"
+            },
+            "apnea_obstructive_sleep": {
+                "type": "boolean",
+                "description": "Diagnosi di apnea ostruttiva del sonno"
+            }
+        },
+        "required": ["bmi_zscore", "ast_iu_l", "alt_iu_l", "insulin_resistance"]
+    }
+), reference=PNHS_REFERENCE)
 def _calculate_pnhs(args):
     """Calcola Pediatric NAFLD Histological Score (PNHS)"""
     bmi_zscore = args.get('bmi_zscore', 0)
@@ -2173,7 +2479,8 @@ def _calculate_pnhs(args):
         interpretation = "ALTA PROBABILITÀ DI NASH"
         recommendation = "Valutazione specialistica epatologica, considerare biopsia epatica"
     
-    result = f"""Pediatric NAFLD Histological Score (PNHS)
+    def render():
+        return f"""Pediatric NAFLD Histological Score (PNHS)
 ==========================================
 Punteggio: {score}/4
 
@@ -2189,24 +2496,11 @@ Parametri utilizzati:
 - ALT: {alt_iu_l} IU/L
 - AST/ALT ratio: {ast_alt_ratio:.2f}
 - Resistenza insulinica: {'Sì' if insulin_resistance else 'No'}
-- Apnea ostruttiva del sonno: {'Sì' if apnea_obstructive_sleep else 'No'}
-
-Interpretazione:
-- 0-1: Bassa probabilità di NASH
-- 2: Probabilità intermedia di NASH
-- 3-4: Alta probabilità di NASH
-
-Note cliniche:
-- Score validato per distinguere NASH da semplice steatosi in popolazione pediatrica
-- Non sostituisce la biopsia epatica che rimane il gold standard
-- Utile per identificare pazienti ad alto rischio da candidare a biopsia
-- Sensibilità 74% e specificità 71% per NASH con cutoff ≥2
-
-NAFLD vs NASH:
-- NAFLD (steatosi semplice): Accumulo di grasso epatico senza infiammazione significativa
-- NASH (steatoepatite): Steatosi con infiammazione e danno epatocellulare
-- NASH è associata a maggior rischio di progressione a fibrosi e cirrosi
-
-Fonte: Nobili et al., 2019
-"""
-    return [types.TextContent(type="text", text=result)]
+- Apnea ostruttiva del sonno: {'Sì' if apnea_obstructive_sleep else 'No'}"""
+
+    return ToolResult({
+        "score": score,
+        "interpretation": interpretation,
+        "recommendation": recommendation,
+        "ast_alt_ratio": ast_alt_ratio
+    }, render)
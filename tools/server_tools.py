@@ -0,0 +1,53 @@
+"""
+Tool di servizio del server
+Statistiche di funzionamento (metriche per tool, cache dei risultati, esecutore, registro di audit)
+per il monitoraggio
+"""
+import json
+
+import mcp.types as types
+from tools.audit import get_audit_log
+from tools.executor import get_executor
+from tools.metrics import tool_metrics, uptime
+from tools.registry import cache_stats, get_registered_tools, register_tool
+from utils import config
+
+
+@register_tool(types.Tool(
+    name="server_stats",
+    description="Statistiche di funzionamento del server: chiamate, errori e latenza (p50/p90/p99) per tool, contatori della cache dei risultati (hit, miss, eviction), dell'esecutore (in coda, respinte, timeout) e del registro di audit",
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
+), deterministic=False, report=False)
+def _server_stats(args):
+    """Restituisce le statistiche del server"""
+    # Solo i tool effettivamente interrogati, per non elencare decine di cache vuote
+    per_tool = {name: stats for name, stats in cache_stats().items() if stats["hits"] or stats["misses"]}
+    totals = {counter: sum(stats[counter] for stats in per_tool.values())
+              for counter in ("size", "hits", "misses", "evictions", "expirations")}
+    lookups = totals["hits"] + totals["misses"]
+    audit = get_audit_log()
+    structured = {
+        "uptime_seconds": round(uptime(), 1),
+        "tools": len(get_registered_tools()),
+        # Tool chiamati, dal più oneroso per tempo totale
+        "tool_metrics": tool_metrics(),
+        "result_cache": {
+            "enabled": config.RESULT_CACHE_SIZE > 0,
+            "max_size_per_tool": config.RESULT_CACHE_SIZE,
+            "ttl_seconds": config.RESULT_CACHE_TTL,
+            **totals,
+            "hit_ratio": round(totals["hits"] / lookups, 4) if lookups else None,
+            "per_tool": per_tool
+        },
+        "executor": get_executor().stats(),
+        "audit_log": audit.stats() if audit is not None else None
+    }
+    text = json.dumps(structured, ensure_ascii=False, indent=2)
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=text)],
+        structuredContent=structured
+    )
@@ -0,0 +1,225 @@
+"""
+Validazione compilata degli input dei tool
+Ogni inputSchema viene compilato una sola volta (alla registrazione) in una
+closure che controlla i soli vincoli dichiarati: a runtime nessuna visita del
+dizionario dello schema, solo lookup e confronti già preparati.
+Gli input non validi vengono respinti prima di invocare l'handler con un
+errore strutturato (isError=True) invece di passare dall'eccezione dell'handler.
+"""
+import math
+
+import mcp.types as types
+
+# Tipi JSON Schema -> descrizione italiana usata nei messaggi di errore
+_TYPE_NAMES = {
+    "integer": "un intero",
+    "number": "un numero",
+    "boolean": "un booleano",
+    "string": "una stringa",
+    "array": "una lista",
+    "object": "un oggetto",
+}
+
+# Parole chiave JSON Schema gestite (description e default non richiedono controlli)
+# allOf è ammesso solo come elenco di gruppi {"anyOf": [{"required": [...]}, ...]} (almeno un'alternativa presente)
+_SCHEMA_KEYS = frozenset({"type", "properties", "required", "allOf"})
+_PROPERTY_KEYS = frozenset({"type", "description", "default", "minimum", "maximum", "multipleOf", "enum", "items", "maxItems",
+                            "properties", "required"})
+
+
+class SchemaValidationError(Exception):
+    """Argomenti non conformi all'inputSchema del tool"""
+
+    def __init__(self, tool: str, details: list[dict]):
+        self.tool = tool
+        self.details = details
+        super().__init__("; ".join(detail["message"] for detail in details))
+
+    def to_result(self) -> types.CallToolResult:
+        """Risultato MCP di errore con i dettagli in structuredContent"""
+        text = f"Input non valido per {self.tool}: {self}"
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=text)],
+            structuredContent={"error": "invalid_arguments", "tool": self.tool, "details": self.details},
+            isError=True,
+        )
+
+
+def _error(field: str, message: str) -> dict:
+    return {"field": field, "message": f"{field}: {message}"}
+
+
+def _compile_type(json_type: str):
+    """
+    Restituisce una funzione value -> (valore normalizzato, ok)
+
+    I booleani non sono accettati come numeri (in Python bool è sottoclasse di int)
+    e un float con parte decimale nulla è accettato come intero e convertito.
+    """
+    if json_type == "integer":
+        def check(value):
+            if type(value) is int:
+                return value, True
+            if type(value) is float and value.is_integer():
+                return int(value), True
+            return value, False
+    elif json_type == "number":
+        def check(value):
+            if type(value) is int:
+                return value, True
+            if type(value) is float and math.isfinite(value):
+                return value, True
+            return value, False
+    elif json_type == "boolean":
+        def check(value):
+            return value, type(value) is bool
+    elif json_type == "string":
+        def check(value):
+            return value, isinstance(value, str)
+    elif json_type == "array":
+        def check(value):
+            return value, isinstance(value, list)
+    elif json_type == "object":
+        def check(value):
+            return value, isinstance(value, dict)
+    else:
+        raise ValueError(f"Tipo JSON Schema non supportato: {json_type}")
+    return check
+
+
+def _compile_property(name: str, spec: dict):
+    """Compila i vincoli di una proprietà in una funzione value -> (valore normalizzato, messaggi di errore)"""
+    unsupported = set(spec) - _PROPERTY_KEYS
+    if unsupported:
+        raise ValueError(f"Proprietà {name} con chiavi non supportate: {sorted(unsupported)}")
+    json_type = spec.get("type")
+    if json_type is None:
+        raise ValueError(f"Proprietà senza tipo: {name}")
+    check_type = _compile_type(json_type)
+    type_message = [f"deve essere {_TYPE_NAMES[json_type]}"]
+    minimum = spec.get("minimum")
+    maximum = spec.get("maximum")
+    multiple_of = spec.get("multipleOf")
+    max_items = spec.get("maxItems")
+    enum = frozenset(spec["enum"]) if "enum" in spec else None
+    enum_message = f"valore non ammesso (ammessi: {', '.join(map(str, spec['enum']))})" if enum else None
+    item_check = _compile_property(f"{name}[]", spec["items"]) if json_type == "array" and "items" in spec else None
+    fields_check = _compile_fields(name, spec) if json_type == "object" and "properties" in spec else None
+
+    # Proprietà senza vincoli oltre al tipo: evita i controlli successivi
+    if (enum is None and minimum is None and maximum is None and multiple_of is None and max_items is None
+            and item_check is None and fields_check is None):
+        def check_plain(value):
+            value, ok = check_type(value)
+            return value, (() if ok else type_message)
+        return check_plain
+
+    def check(value):
+        value, ok = check_type(value)
+        if not ok:
+            return value, type_message
+        errors = []
+        if enum is not None and value not in enum:
+            errors.append(enum_message)
+        if minimum is not None and value < minimum:
+            errors.append(f"deve essere ≥ {minimum}")
+        if maximum is not None and value > maximum:
+            errors.append(f"deve essere ≤ {maximum}")
+        if multiple_of is not None and not math.isclose(value / multiple_of, round(value / multiple_of)):
+            errors.append(f"deve essere multiplo di {multiple_of}")
+        if max_items is not None and len(value) > max_items:
+            errors.append(f"al massimo {max_items} elementi")
+        if item_check is not None:
+            items = []
+            for index, item in enumerate(value):
+                item, item_errors = item_check(item)
+                errors.extend(f"elemento {index} {message}" for message in item_errors)
+                items.append(item)
+            value = items
+        if fields_check is not None:
+            value, field_errors = fields_check(value)
+            errors.extend(field_errors)
+        return value, errors
+
+    return check
+
+
+def _compile_fields(name: str, spec: dict):
+    """Campi di un oggetto annidato (es. gli elementi di una lista): obbligatori, sconosciuti e vincoli di ciascuno"""
+    checks = {field: _compile_property(field, field_spec) for field, field_spec in spec["properties"].items()}
+    required = tuple(spec.get("required", ()))
+
+    def check(value: dict):
+        errors = [f"{field}: campo obbligatorio mancante" for field in required if field not in value]
+        normalized = {}
+        for field, field_value in value.items():
+            field_check = checks.get(field)
+            if field_check is None:
+                errors.append(f"{field}: campo non previsto dallo schema")
+                continue
+            field_value, messages = field_check(field_value)
+            errors.extend(f"{field}: {message}" for message in messages)
+            normalized[field] = field_value
+        return normalized, errors
+
+    return check
+
+
+def schema_alternatives(tool: str, schema: dict) -> list[tuple[tuple[str, ...], ...]]:
+    """Gruppi di alternative dell'allOf: per ogni gruppo, i campi richiesti da ciascuna alternativa"""
+    groups = []
+    for group in schema.get("allOf", ()):
+        alternatives = group.get("anyOf") if set(group) == {"anyOf"} else None
+        if not alternatives or any(set(alternative) != {"required"} for alternative in alternatives):
+            raise ValueError(f"Schema di {tool}: allOf ammette solo gruppi anyOf di required")
+        groups.append(tuple(tuple(alternative["required"]) for alternative in alternatives))
+    return groups
+
+
+def compile_validator(definition: types.Tool):
+    """
+    Compila l'inputSchema del tool in una funzione arguments -> arguments normalizzati
+
+    La funzione solleva SchemaValidationError con l'elenco completo degli errori
+    (campi mancanti, alternative dell'allOf non soddisfatte, sconosciuti, tipo o intervallo errati).
+    """
+    schema = definition.inputSchema
+    tool = definition.name
+    unsupported = set(schema) - _SCHEMA_KEYS
+    if unsupported:
+        raise ValueError(f"Schema di {tool} con chiavi non supportate: {sorted(unsupported)}")
+    checks = {name: _compile_property(name, spec) for name, spec in schema.get("properties", {}).items()}
+    required = tuple(schema.get("required", ()))
+    alternatives = [
+        (group, {"field": ", ".join(dict.fromkeys(field for fields in group for field in fields)),
+                 "message": f"indicare almeno uno tra {', '.join(' + '.join(fields) for fields in group)}"})
+        for group in schema_alternatives(tool, schema)
+    ]
+
+    def validate(arguments: dict | None) -> dict:
+        if arguments is None:
+            arguments = {}
+        elif not isinstance(arguments, dict):
+            raise SchemaValidationError(tool, [_error("arguments", "deve essere un oggetto")])
+        errors = []
+        for name in required:
+            if name not in arguments:
+                errors.append(_error(name, "campo obbligatorio mancante"))
+        for group, error in alternatives:
+            if not any(all(name in arguments for name in fields) for fields in group):
+                errors.append(error)
+        normalized = {}
+        for name, value in arguments.items():
+            check = checks.get(name)
+            if check is None:
+                errors.append(_error(name, "campo non previsto dallo schema"))
+                continue
+            value, messages = check(value)
+            for message in messages:
+                errors.append(_error(name, message))
+            normalized[name] = value
+        if errors:
+            raise SchemaValidationError(tool, errors)
+        return normalized
+
+    return validate
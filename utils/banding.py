@@ -0,0 +1,65 @@
+"""
+Motore di banding a soglie per le interpretazioni degli score
+Ogni interpretazione è dichiarata una sola volta come lista ordinata di soglie
+superiori (incluse) e tupla di record di risultato: la fascia si trova con
+bisect in O(log n) e viene restituito sempre lo stesso record in sola lettura,
+senza allocare un dizionario ad ogni chiamata.
+Le stesse tabelle servono i percorsi vettoriali (np.searchsorted) del batch
+"""
+import math
+from bisect import bisect_left
+from types import MappingProxyType
+
+import numpy as np
+
+
+def below(threshold: float) -> float:
+    """Soglia superiore inclusa equivalente a '< threshold' (il float immediatamente precedente)"""
+    return math.nextafter(threshold, -math.inf)
+
+
+class Banding:
+    """Soglie superiori incluse, in ordine crescente, e un record per fascia (l'ultimo senza limite)"""
+    __slots__ = ("breakpoints", "records", "_columns")
+
+    def __init__(self, breakpoints, records):
+        if len(records) != len(breakpoints) + 1:
+            raise ValueError("Serve un record per ogni soglia più quello finale")
+        if any(lower >= upper for lower, upper in zip(breakpoints, breakpoints[1:])):
+            raise ValueError("Le soglie devono essere strettamente crescenti")
+        self.breakpoints = tuple(breakpoints)
+        self.records = tuple(MappingProxyType(dict(record)) for record in records)
+        self._columns = {}
+
+    def __call__(self, value) -> MappingProxyType:
+        """Record della fascia che contiene value (valori finiti)"""
+        return self.records[bisect_left(self.breakpoints, value)]
+
+    def band(self, value) -> int:
+        """Indice della fascia che contiene value"""
+        return bisect_left(self.breakpoints, value)
+
+    def bands(self, values) -> np.ndarray:
+        """Indici di fascia per un array di valori (stessa semantica di bisect_left)"""
+        return np.searchsorted(self.breakpoints, values, side="left")
+
+    def column(self, key: str) -> np.ndarray:
+        """Valori di un campo dei record, indicizzabili con gli indici di fascia"""
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = np.array([record[key] for record in self.records], dtype=object)
+        return column
+
+    def lookup(self, values, key: str) -> np.ndarray:
+        """Campo key del record di ciascun valore dell'array"""
+        return self.column(key)[self.bands(values)]
+
+
+def bands(*steps, otherwise: dict) -> Banding:
+    """
+    Costruisce un Banding da coppie (soglia superiore inclusa, record)
+
+    Es. bands((4, lieve), (7, moderata), otherwise=severa) equivale a
+    'if x <= 4: lieve elif x <= 7: moderata else: severa'; per '<' usare below(soglia).
+    """
+    return Banding([threshold for threshold, _ in steps], [record for _, record in steps] + [otherwise])
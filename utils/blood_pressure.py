@@ -0,0 +1,137 @@
+"""
+Percentili normativi NHBPEP 2004 della pressione arteriosa pediatrica e stadiazione AAP 2017
+Percentili 50°, 90°, 95° e 95° + 12 mmHg di sistolica e diastolica per sesso,
+età (1-17 anni) e percentile di altezza (5°, 10°, 25°, 50°, 75°, 90°, 95°),
+nel formato delle tabelle AAP 2017. I valori sono generati una volta
+all'import dal modello di regressione pubblicato con il Fourth Report NHBPEP
+(Pediatrics 2004;114:555, appendice B): media = α + Σβⱼ(età-10)ʲ + Σγₖ·zₕᵏ,
+percentile = media + z·σ, troncati al mmHg come nelle tabelle stampate.
+Le tabelle AAP 2017 (ricalcolate escludendo i bambini in sovrappeso) non sono
+distribuite con il progetto.
+
+L'array denso ha forma (sesso, età, percentile di altezza, misura, soglia):
+le soglie di una coorte si ottengono con un'interpolazione bilineare in età
+e percentile di altezza (np.searchsorted), senza cicli per paziente.
+
+Classificazione AAP 2017 (Flynn et al., Pediatrics 2017;140:e20171904):
+- 1-12 anni: elevata ≥90° (o ≥120/80), stadio 1 ≥95° (o ≥130/80),
+  stadio 2 ≥95° + 12 mmHg (o ≥140/90), sempre la soglia più bassa
+- ≥13 anni: soglie dell'adulto 120/<80, 130/80, 140/90
+La categoria è la più alta tra sistolica e diastolica.
+"""
+from statistics import NormalDist
+
+import numpy as np
+
+from utils.banding import bands
+
+AGES = np.arange(1, 18, dtype=np.float64)
+HEIGHT_PERCENTILES = np.array([5, 10, 25, 50, 75, 90, 95], dtype=np.float64)
+# Soglie della tabella: percentili di pressione 50°, 90°, 95° e 95° + 12 mmHg
+THRESHOLDS = ("50th", "90th", "95th", "95th_plus_12")
+MEASURES = ("systolic", "diastolic")
+ADULT_THRESHOLDS_AGE = 13
+
+# Sesso (1=M, 2=F), misura -> α, β1-β4 (età - 10), γ1-γ4 (z dell'altezza), σ (Fourth Report, tabella B-1)
+COEFFICIENTS = {
+    (1, "systolic"): (102.19768, (1.82416, 0.12776, 0.00249, -0.00135), (2.73157, -0.19618, -0.04659, 0.00947), 10.7128),
+    (1, "diastolic"): (61.01217, (0.68314, -0.09835, 0.01711, 0.00045), (1.46993, -0.07849, -0.03144, 0.00967), 11.6032),
+    (2, "systolic"): (102.01027, (1.94397, 0.00598, -0.00789, -0.00059), (2.03526, 0.02534, -0.01884, 0.00121), 10.4855),
+    (2, "diastolic"): (60.50510, (1.01301, 0.01157, 0.00424, -0.00137), (1.16641, 0.12795, -0.03869, -0.00079), 10.9573),
+}
+
+# Soglie dell'adulto (AAP 2017, ≥13 anni e tetto per 1-12 anni): elevata, stadio 1, stadio 2
+ADULT_LIMITS = {"systolic": (120, 130, 140), "diastolic": (80, 80, 90)}
+
+STAGES = bands(
+    (0, {'status': 'NORMALE',
+         'recommendation': 'Controllo annuale della pressione'}),
+    (1, {'status': 'PRESSIONE ELEVATA',
+         'recommendation': 'Stile di vita (dieta, attività fisica, peso), ricontrollo a 6 mesi'}),
+    (2, {'status': 'IPERTENSIONE STADIO 1',
+         'recommendation': 'Stile di vita, ricontrollo in 1-2 settimane (arti superiori e inferiore)'}),
+    otherwise={'status': 'IPERTENSIONE STADIO 2',
+               'recommendation': 'Ricontrollo entro 1 settimana o invio specialistico; '
+                                 'invio urgente se sintomatico o >30 mmHg sopra il 95°'}
+)
+
+
+def build_table() -> np.ndarray:
+    """Array denso (2, 17, 7, 2, 4) in mmHg: sesso, età, percentile di altezza, misura, soglia"""
+    normal = NormalDist()
+    height_z = np.array([normal.inv_cdf(p / 100) for p in HEIGHT_PERCENTILES])
+    z90, z95 = normal.inv_cdf(0.90), normal.inv_cdf(0.95)
+    years = (AGES - 10)[:, None]
+    table = np.empty((2, len(AGES), len(HEIGHT_PERCENTILES), len(MEASURES), len(THRESHOLDS)), dtype=np.int16)
+    for (sex, measure), (alpha, betas, gammas, sigma) in COEFFICIENTS.items():
+        mean = (alpha + sum(beta * years ** power for power, beta in enumerate(betas, 1))
+                + sum(gamma * height_z ** power for power, gamma in enumerate(gammas, 1)))
+        # Troncati al mmHg come nelle tabelle stampate (il 95° + 12 parte dal 95° troncato)
+        p95 = np.floor(mean + z95 * sigma)
+        table[sex - 1, :, :, MEASURES.index(measure)] = np.stack(
+            [np.floor(mean), np.floor(mean + z90 * sigma), p95, p95 + 12], axis=-1)
+    return table
+
+
+TABLE = build_table()
+TABLE.flags.writeable = False
+
+
+def _axis(points: np.ndarray, values: np.ndarray) -> tuple:
+    """Riga inferiore e peso di interpolazione lineare di values sull'asse points (valori limitati agli estremi)"""
+    values = np.clip(values, points[0], points[-1])
+    row = np.clip(np.searchsorted(points, values, side="right") - 1, 0, len(points) - 2)
+    return row, (values - points[row]) / (points[row + 1] - points[row])
+
+
+def percentiles(is_male, age_years, height_percentile=50) -> np.ndarray:
+    """
+    Soglie per ogni paziente, interpolate in età e percentile di altezza
+
+    Returns:
+        Array (..., 2, 4) in mmHg con 1 decimale: misura (sistolica, diastolica) x soglia (THRESHOLDS)
+    """
+    is_male, age_years, height_percentile = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (is_male, age_years, height_percentile)))
+    sex = np.where(is_male != 0, 0, 1)
+    age_row, age_t = _axis(AGES, age_years)
+    height_row, height_t = _axis(HEIGHT_PERCENTILES, height_percentile)
+    age_t, height_t = age_t[..., None, None], height_t[..., None, None]
+
+    def corner(age_offset, height_offset):
+        return TABLE[sex, age_row + age_offset, height_row + height_offset].astype(np.float64)
+
+    lower = corner(0, 0) + height_t * (corner(0, 1) - corner(0, 0))
+    upper = corner(1, 0) + height_t * (corner(1, 1) - corner(1, 0))
+    return np.round(lower + age_t * (upper - lower), 1)
+
+
+def classify(is_male, age_years, systolic, diastolic, height_percentile=50) -> dict:
+    """
+    Classificazione AAP 2017 di un vettore di misurazioni (scalari o array con forma comune)
+
+    Returns:
+        {'stage': 0-3 (indice di STAGES), 'status', 'systolic_stage', 'diastolic_stage',
+         'percentiles': array (..., 2, 4) delle soglie della tabella}
+    """
+    age_years, systolic, diastolic = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (age_years, systolic, diastolic)))
+    if np.any(age_years < 1):
+        raise ValueError("Le tabelle della pressione arteriosa valgono dal primo anno di età")
+    table = percentiles(is_male, age_years, height_percentile)
+    adult = (age_years >= ADULT_THRESHOLDS_AGE)[..., None]
+    stages = {}
+    for index, (measure, reading) in enumerate(zip(MEASURES, (systolic, diastolic))):
+        limits = np.array(ADULT_LIMITS[measure], dtype=np.float64)
+        # Soglie di elevata, stadio 1, stadio 2: 90°, 95°, 95° + 12 con il tetto delle soglie dell'adulto
+        child = np.minimum(table[..., index, 1:], limits)
+        thresholds = np.where(adult, limits, child)
+        stages[measure] = np.sum(reading[..., None] >= thresholds, axis=-1)
+    stage = np.maximum(stages["systolic"], stages["diastolic"])
+    return {
+        'stage': stage,
+        'status': STAGES.lookup(stage, 'status'),
+        'systolic_stage': stages["systolic"],
+        'diastolic_stage': stages["diastolic"],
+        'percentiles': table
+    }
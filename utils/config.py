@@ -0,0 +1,107 @@
+"""
+Configurazione del server
+Letta una sola volta all'avvio dalle variabili d'ambiente; il file .env nella
+cartella del progetto, se presente, fornisce i valori non già definiti nell'ambiente
+"""
+import os
+
+from dotenv import load_dotenv
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(PROJECT_DIR, ".env"))
+
+
+def _int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} deve essere un intero, ricevuto: {value!r}")
+
+
+def _float(name: str, default: float) -> float:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} deve essere un numero, ricevuto: {value!r}")
+
+
+def _choice(name: str, choices: tuple[str, ...], default: str) -> str:
+    value = os.environ.get(name, "").strip().lower()
+    if not value:
+        return default
+    if value not in choices:
+        raise ValueError(f"{name} deve essere uno tra {', '.join(choices)}, ricevuto: {value!r}")
+    return value
+
+
+def _names(name: str) -> frozenset[str] | None:
+    """Lista separata da virgole; None (= tutti) se assente o '*'"""
+    value = os.environ.get(name, "").strip()
+    if not value or value == "*":
+        return None
+    return frozenset(item.strip() for item in value.split(",") if item.strip())
+
+
+# Cache dei risultati: voci per tool (0 = disattivata), durata in secondi (0 = nessuna scadenza)
+# e tool per cui è attiva (default: tutti i tool deterministici)
+RESULT_CACHE_SIZE = _int("RESULT_CACHE_SIZE", 0)
+RESULT_CACHE_TTL = _float("RESULT_CACHE_TTL", 0.0)
+RESULT_CACHE_TOOLS = _names("RESULT_CACHE_TOOLS")
+
+# Livello di dettaglio predefinito dei referti (sovrascrivibile per chiamata con l'argomento verbosity):
+# minimal = solo i dati, standard = senza il materiale di riferimento statico, full = referto completo
+VERBOSITY_LEVELS = ("minimal", "standard", "full")
+OUTPUT_VERBOSITY = _choice("OUTPUT_VERBOSITY", VERBOSITY_LEVELS, "full")
+
+# Esecuzione dei tool pesanti (es. batch) fuori dall'event loop: tipo di pool (thread/process),
+# numero di worker, chiamate ammesse tra in coda e in esecuzione (oltre vengono respinte)
+# e tempo massimo di attesa per chiamata in secondi (0 = nessun limite)
+EXECUTOR_POOL = _choice("EXECUTOR_POOL", ("thread", "process"), "thread")
+EXECUTOR_WORKERS = _int("EXECUTOR_WORKERS", min(4, os.cpu_count() or 1))
+EXECUTOR_QUEUE_LIMIT = _int("EXECUTOR_QUEUE_LIMIT", 32)
+EXECUTOR_TIMEOUT = _float("EXECUTOR_TIMEOUT", 0.0)
+# Chiamate identiche (stesso tool e stessi argomenti) già in esecuzione nel pool:
+# 1 = attendono e condividono il risultato della prima invece di ripetere il calcolo
+EXECUTOR_COALESCE = _int("EXECUTOR_COALESCE", 1)
+
+# Trasporto MCP (stdio/http) e parametri del server HTTP (sovrascrivibili da riga di comando)
+MCP_TRANSPORT = _choice("MCP_TRANSPORT", ("stdio", "http"), "stdio")
+HTTP_HOST = os.environ.get("HTTP_HOST", "").strip() or "127.0.0.1"
+HTTP_PORT = _int("HTTP_PORT", 8000)
+HTTP_MAX_CONCURRENCY = _int("HTTP_MAX_CONCURRENCY", 100)
+HTTP_KEEP_ALIVE = _float("HTTP_KEEP_ALIVE", 30.0)
+# Processi worker HTTP (pre-fork, solo POSIX); 1 = processo singolo
+HTTP_WORKERS = _int("HTTP_WORKERS", 1)
+# Endpoint /metrics (formato Prometheus) sul trasporto HTTP; 0 = disattivato
+HTTP_METRICS = _int("HTTP_METRICS", 0)
+
+# Import differito dei moduli dei tool: con un manifest del catalogo aggiornato (.tool_manifest.json)
+# i moduli vengono importati alla prima chiamata di uno dei loro tool (0 = import completo all'avvio)
+LAZY_TOOL_IMPORT = _int("LAZY_TOOL_IMPORT", 1)
+
+# Profilazione delle chiamate (off/cpu/memory/both) per i tool elencati (default: tutti):
+# dump in PROFILE_DIR per le chiamate di almeno PROFILE_MIN_MS, ultime PROFILE_KEEP chiamate per tool
+PROFILE_MODE = _choice("PROFILE_MODE", ("off", "cpu", "memory", "both"), "off")
+PROFILE_TOOLS = _names("PROFILE_TOOLS")
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "").strip() or os.path.join(PROJECT_DIR, "profiles")
+PROFILE_MIN_MS = _float("PROFILE_MIN_MS", 0.0)
+PROFILE_KEEP = _int("PROFILE_KEEP", 20)
+
+# Registro di audit delle chiamate (JSON per riga; vuoto = disattivato): righe per blocco scritto,
+# secondi massimi prima della scrittura, dimensione oltre cui ruotare il file (0 = mai),
+# copie ruotate conservate e righe in attesa oltre cui le chiamate non vengono registrate
+AUDIT_LOG = os.environ.get("AUDIT_LOG", "").strip()
+AUDIT_BATCH_SIZE = _int("AUDIT_BATCH_SIZE", 256)
+AUDIT_FLUSH_INTERVAL = _float("AUDIT_FLUSH_INTERVAL", 1.0)
+AUDIT_MAX_BYTES = _int("AUDIT_MAX_BYTES", 50 * 1024 * 1024)
+AUDIT_BACKUPS = _int("AUDIT_BACKUPS", 10)
+AUDIT_QUEUE_LIMIT = _int("AUDIT_QUEUE_LIMIT", 100000)
+
+# Livello dei log su stderr (anche del server HTTP)
+LOG_LEVEL = _choice("LOG_LEVEL", ("debug", "info", "warning", "error", "critical"), "warning")
@@ -0,0 +1,390 @@
+"""
+Riferimenti di crescita LMS (WHO/CDC)
+Parametri L (Box-Cox), M (mediana) e S (coefficiente di variazione) delle
+curve di crescita, da cui z-score = ((X/M)^L - 1) / (L·S) e percentile = Φ(z):
+- WHO Child Growth Standards 2006, 0-5 anni a granularità giornaliera (età in
+  giorni): peso, lunghezza/altezza, BMI e circonferenza cranica per età;
+  peso per lunghezza (45-110 cm) e per altezza (65-120 cm) ogni 0.5 cm
+- WHO Growth Reference 2007, 5-19 anni per mese: altezza e BMI per età
+  (peso per età fino a 10 anni)
+- CDC 2000, 2-20 anni per mese: peso, statura e BMI per età
+
+Le tabelle sorgente (data/growth/*.csv: sesso 1=M 2=F, x, L, M, S) vengono
+compilate una sola volta in un file binario (.growth_tables.bin) mappato in
+memoria in sola lettura: nessun parsing all'avvio e, con più processi (worker
+HTTP, pool di processi), le pagine sono condivise dalla page cache invece di
+essere copiate in ogni processo. Il file viene rigenerato quando cambiano i CSV.
+
+Ogni tabella è una colonna di x crescenti e le colonne L, M, S: la riga si
+trova con una ricerca binaria (bisect/np.searchsorted) e i parametri sono
+interpolati linearmente tra le due righe vicine. Per gli indicatori di peso
+WHO oltre ±3 z si usa la correzione WHO (distanza tra 2 e 3 DS), perché la
+coda della distribuzione Box-Cox non è affidabile.
+Le classificazioni WHO/CDC degli z-score sono tabelle di banding (utils/banding.py).
+Le versioni vettoriali (una coorte per chiamata) sono in utils/vectorized.py
+"""
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_right
+
+import numpy as np
+
+from utils.banding import below, bands
+from utils.config import PROJECT_DIR
+
+DATA_DIR = os.path.join(PROJECT_DIR, "data", "growth")
+TABLES_PATH = os.path.join(PROJECT_DIR, ".growth_tables.bin")
+_MAGIC = b"PEDGROW1"
+_HEADER = struct.Struct("<8sI")
+
+DAYS_PER_MONTH = 365.25 / 12
+# Ultimo giorno delle tabelle WHO 2006 (60.98 mesi): oltre si passa ai riferimenti 5-19 anni
+WHO_STANDARDS_LAST_DAY = 1856
+# Prima età delle tabelle CDC 2000 (24.5 mesi): prima valgono gli standard WHO 2006
+CDC_FIRST_DAY = 24.5 * DAYS_PER_MONTH
+REFERENCES = ("who", "cdc")
+
+AGE_INDICATORS = ("weight_for_age", "length_for_age", "bmi_for_age", "head_circumference_for_age")
+LENGTH_INDICATORS = ("weight_for_length", "weight_for_height")
+INDICATORS = AGE_INDICATORS + LENGTH_INDICATORS
+
+
+class Segment:
+    """Tabella usata per un intervallo di x (età in giorni o lunghezza in cm) e conversione di x nella sua unità"""
+    __slots__ = ("table", "scale", "lower", "upper", "adjusted")
+
+    def __init__(self, table: str, lower: float, upper: float, scale: float = 1.0, adjusted: bool = False):
+        self.table = table
+        self.lower = lower
+        self.upper = upper
+        # x della tabella = x / scale (giorni -> mesi per le tabelle mensili)
+        self.scale = scale
+        # Correzione WHO oltre ±3 z (indicatori di peso)
+        self.adjusted = adjusted
+
+
+def _who_age(indicator: str, table_2007: str | None, last_month_2007: float, adjusted: bool) -> tuple:
+    segments = [Segment(f"who2006_{indicator}", 0, WHO_STANDARDS_LAST_DAY, adjusted=adjusted)]
+    if table_2007 is not None:
+        segments.append(Segment(table_2007, WHO_STANDARDS_LAST_DAY, last_month_2007 * DAYS_PER_MONTH,
+                                DAYS_PER_MONTH, adjusted))
+    return tuple(segments)
+
+
+def _cdc_age(indicator: str, table_cdc: str, adjusted: bool) -> tuple:
+    # CDC raccomanda gli standard WHO sotto i 2 anni
+    return (Segment(table_cdc, CDC_FIRST_DAY, 240.5 * DAYS_PER_MONTH, DAYS_PER_MONTH),
+            Segment(f"who2006_{indicator}", 0, WHO_STANDARDS_LAST_DAY, adjusted=adjusted))
+
+
+# (indicatore, riferimento) -> segmenti in ordine di priorità (vale il primo che contiene x)
+SEGMENTS = {
+    ("weight_for_age", "who"): _who_age("weight_for_age", "who2007_weight_for_age", 120, True),
+    ("weight_for_age", "cdc"): _cdc_age("weight_for_age", "cdc2000_weight_for_age", True),
+    ("length_for_age", "who"): _who_age("length_for_age", "who2007_height_for_age", 228, False),
+    ("length_for_age", "cdc"): _cdc_age("length_for_age", "cdc2000_height_for_age", False),
+    ("bmi_for_age", "who"): _who_age("bmi_for_age", "who2007_bmi_for_age", 228, True),
+    ("bmi_for_age", "cdc"): _cdc_age("bmi_for_age", "cdc2000_bmi_for_age", True),
+    ("head_circumference_for_age", "who"): _who_age("head_circumference_for_age", None, 0, False),
+    ("head_circumference_for_age", "cdc"): _who_age("head_circumference_for_age", None, 0, False),
+    ("weight_for_length", "who"): (Segment("who2006_weight_for_length", 45, 110, adjusted=True),),
+    ("weight_for_height", "who"): (Segment("who2006_weight_for_height", 65, 120, adjusted=True),),
+}
+SEGMENTS[("weight_for_length", "cdc")] = SEGMENTS[("weight_for_length", "who")]
+SEGMENTS[("weight_for_height", "cdc")] = SEGMENTS[("weight_for_height", "who")]
+
+
+class GrowthTable:
+    """Colonne x, L, M, S di una tabella: array NumPy per le coorti, memoryview per le chiamate singole"""
+    __slots__ = ("x", "L", "M", "S", "columns")
+
+    def __init__(self, block: memoryview, rows: int):
+        values = np.frombuffer(block, dtype="<f8").reshape(4, rows)
+        self.x, self.L, self.M, self.S = values
+        # Indicizzare una memoryview restituisce float Python senza creare scalari NumPy
+        self.columns = tuple(block[index * rows * 8:(index + 1) * rows * 8].cast("d") for index in range(4))
+
+
+def _sources() -> list[str]:
+    return sorted(name for name in os.listdir(DATA_DIR) if name.endswith(".csv"))
+
+
+def fingerprint() -> str:
+    """Impronta delle tabelle sorgente"""
+    digest = hashlib.sha256()
+    for name in _sources():
+        digest.update(name.encode())
+        with open(os.path.join(DATA_DIR, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _read_source(name: str) -> dict[int, list[tuple]]:
+    rows = {1: [], 2: []}
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        next(f)
+        for line in f:
+            sex, x, l, m, s = line.split(",")
+            rows[int(sex)].append((float(x), float(l), float(m), float(s)))
+    return rows
+
+
+def compile_tables() -> bytes:
+    """
+    Tabelle CSV nel formato binario
+
+    Formato: magic, lunghezza e JSON dell'indice ({tabella/sesso: [offset, righe]},
+    impronta dei sorgenti), poi per ogni tabella le colonne x, L, M, S in float64
+    little-endian contigue, allineate a 8 byte
+    """
+    index, blocks, offset = {}, [], 0
+    for name in _sources():
+        for sex, rows in _read_source(name).items():
+            rows.sort()
+            if any(a[0] >= b[0] for a, b in zip(rows, rows[1:])):
+                raise ValueError(f"{name}: x non strettamente crescenti per il sesso {sex}")
+            block = np.array(rows, dtype="<f8").T.tobytes()
+            index[f"{name[:-4]}/{sex}"] = [offset, len(rows)]
+            blocks.append(block)
+            offset += len(block)
+    header = json.dumps({"fingerprint": fingerprint(), "tables": index}).encode("utf-8")
+    header += b" " * (-(_HEADER.size + len(header)) % 8)
+    return b"".join([_HEADER.pack(_MAGIC, len(header)), header, *blocks])
+
+
+def _parse(buffer) -> tuple[dict, memoryview] | None:
+    """Indice e dati di un buffer nel formato binario (None se non valido o non aggiornato)"""
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, length = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC:
+        return None
+    header = json.loads(bytes(buffer[_HEADER.size:_HEADER.size + length]))
+    if header["fingerprint"] != fingerprint():
+        return None
+    return header["tables"], memoryview(buffer)[_HEADER.size + length:]
+
+
+def _map(path: str):
+    """File binario mappato in memoria in sola lettura (None se assente)"""
+    try:
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path: str, data: bytes) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+_tables: dict[tuple[str, int], GrowthTable] | None = None
+_tables_lock = threading.Lock()
+
+
+def _load() -> tuple[dict, memoryview]:
+    buffer = _map(TABLES_PATH)
+    mapped = _parse(buffer) if buffer is not None else None
+    if mapped is not None:
+        return mapped
+    data = compile_tables()
+    try:
+        _write(TABLES_PATH, data)
+        buffer = _map(TABLES_PATH)
+    except OSError:
+        buffer = None
+    # Cartella non scrivibile: le stesse tabelle restano in memoria, senza condivisione tra processi
+    return _parse(buffer if buffer is not None else data)
+
+
+def get_tables() -> dict[tuple[str, int], GrowthTable]:
+    """Tabelle (nome, sesso) -> GrowthTable, dal file binario (compilato alla prima chiamata se serve)"""
+    global _tables
+    if _tables is None:
+        with _tables_lock:
+            if _tables is None:
+                index, data = _load()
+                tables = {}
+                for key, (offset, rows) in index.items():
+                    name, sex = key.rsplit("/", 1)
+                    tables[(name, int(sex))] = GrowthTable(data[offset:offset + rows * 32], rows)
+                _tables = tables
+    return _tables
+
+
+def segments(indicator: str, reference: str) -> tuple:
+    """Segmenti di tabella dell'indicatore per il riferimento"""
+    try:
+        return SEGMENTS[(indicator, reference)]
+    except KeyError:
+        raise ValueError(f"Indicatore o riferimento non supportato: {indicator}, {reference}")
+
+
+def covers(indicator: str, reference: str, x: float) -> bool:
+    """True se x (età in giorni o lunghezza in cm) rientra nelle tabelle dell'indicatore"""
+    return any(segment.lower <= x <= segment.upper for segment in segments(indicator, reference))
+
+
+def _segment(indicator: str, reference: str, x: float) -> Segment:
+    segments_ = segments(indicator, reference)
+    for segment in segments_:
+        if segment.lower <= x <= segment.upper:
+            return segment
+    unit = "giorni" if indicator in AGE_INDICATORS else "cm"
+    lower = min(segment.lower for segment in segments_)
+    upper = max(segment.upper for segment in segments_)
+    raise ValueError(f"{indicator}: {x} {unit} fuori dall'intervallo delle tabelle ({lower:g}-{upper:g} {unit})")
+
+
+def lms(table: GrowthTable, x: float) -> tuple[float, float, float]:
+    """L, M, S interpolati linearmente in x (ricerca binaria della riga)"""
+    xs, ls, ms, ss = table.columns
+    row = min(max(bisect_right(xs, x) - 1, 0), len(xs) - 2)
+    t = (x - xs[row]) / (xs[row + 1] - xs[row])
+    return (ls[row] + t * (ls[row + 1] - ls[row]),
+            ms[row] + t * (ms[row + 1] - ms[row]),
+            ss[row] + t * (ss[row + 1] - ss[row]))
+
+
+def _value_at(l: float, m: float, s: float, z: float) -> float:
+    """Misura corrispondente allo z-score z"""
+    if l == 0:
+        return m * math.exp(s * z)
+    return m * (1 + l * s * z) ** (1 / l)
+
+
+def lms_zscore(value: float, l: float, m: float, s: float, adjusted: bool = False) -> float:
+    """z-score LMS, con la correzione WHO oltre ±3 z se adjusted"""
+    if l == 0:
+        z = math.log(value / m) / s
+    else:
+        z = ((value / m) ** l - 1) / (l * s)
+    if adjusted and z > 3:
+        sd3 = _value_at(l, m, s, 3)
+        z = 3 + (value - sd3) / (sd3 - _value_at(l, m, s, 2))
+    elif adjusted and z < -3:
+        sd3 = _value_at(l, m, s, -3)
+        z = -3 + (value - sd3) / (_value_at(l, m, s, -2) - sd3)
+    return z
+
+
+def zscore(indicator: str, is_male: bool, value: float, x: float, reference: str = "who") -> float:
+    """
+    z-score di una misura rispetto al riferimento
+
+    Args:
+        indicator: Uno di INDICATORS
+        is_male: Sesso del bambino
+        value: Misura (kg, cm o kg/m²)
+        x: Età in giorni per gli indicatori per età, lunghezza/altezza in cm per il peso per lunghezza/altezza
+        reference: "who" (WHO 2006/2007) o "cdc" (CDC 2000 dai 2 anni, WHO prima)
+    """
+    if value <= 0:
+        raise ValueError(f"{indicator}: la misura deve essere maggiore di 0")
+    segment = _segment(indicator, reference, x)
+    return lms_zscore(value, *lms(get_tables()[(segment.table, 1 if is_male else 2)], x / segment.scale),
+                      segment.adjusted)
+
+
+def parameters(indicator: str, is_male: bool, x: float, reference: str = "who") -> tuple[float, float, float]:
+    """L, M, S del riferimento in x (età in giorni o lunghezza in cm)"""
+    segment = _segment(indicator, reference, x)
+    return lms(get_tables()[(segment.table, 1 if is_male else 2)], x / segment.scale)
+
+
+def median(indicator: str, is_male: bool, x: float, reference: str = "who") -> float:
+    """Mediana del riferimento in x (1 decimale)"""
+    return round(parameters(indicator, is_male, x, reference)[1], 1)
+
+
+def percentile(z: float) -> float:
+    """Percentile (0-100) della distribuzione normale standard"""
+    return 50 * (1 + math.erf(z / math.sqrt(2)))
+
+
+def calculate_growth_zscore(indicator: str, is_male: bool, value: float, x: float, reference: str = "who") -> dict:
+    """z-score (2 decimali) e percentile (1 decimale) di una misura"""
+    z = zscore(indicator, is_male, value, x, reference)
+    # + 0.0: -0.0 diventa 0.0
+    return {"zscore": round(z, 2) + 0.0, "percentile": round(percentile(z), 1)}
+
+
+# Classificazioni WHO sugli z-score (soglie '<' per i valori bassi, incluse per quelli alti)
+WEIGHT_FOR_AGE_BANDS = bands(
+    (below(-3), {'status': 'GRAVE SOTTOPESO'}),
+    (below(-2), {'status': 'SOTTOPESO'}),
+    (2, {'status': 'NORMALE'}),
+    otherwise={'status': 'PESO ELEVATO PER L\'ETÀ (valutare peso per lunghezza/BMI)'}
+)
+LENGTH_FOR_AGE_BANDS = bands(
+    (below(-3), {'status': 'BASSA STATURA GRAVE'}),
+    (below(-2), {'status': 'BASSA STATURA'}),
+    (3, {'status': 'NORMALE'}),
+    otherwise={'status': 'ALTA STATURA'}
+)
+# 0-5 anni: BMI, peso per lunghezza e peso per altezza
+WEIGHT_STATUS_UNDER_5_BANDS = bands(
+    (below(-3), {'status': 'MALNUTRIZIONE ACUTA GRAVE'}),
+    (below(-2), {'status': 'MALNUTRIZIONE ACUTA MODERATA'}),
+    (1, {'status': 'NORMALE'}),
+    (2, {'status': 'RISCHIO DI SOVRAPPESO'}),
+    (3, {'status': 'SOVRAPPESO'}),
+    otherwise={'status': 'OBESITÀ'}
+)
+BMI_WHO_OVER_5_BANDS = bands(
+    (below(-3), {'status': 'MAGREZZA GRAVE'}),
+    (below(-2), {'status': 'MAGREZZA'}),
+    (1, {'status': 'NORMALE'}),
+    (2, {'status': 'SOVRAPPESO'}),
+    otherwise={'status': 'OBESITÀ'}
+)
+# CDC 2-20 anni: soglie sul percentile
+BMI_CDC_BANDS = bands(
+    (below(5), {'status': 'SOTTOPESO'}),
+    (below(85), {'status': 'NORMALE'}),
+    (below(95), {'status': 'SOVRAPPESO'}),
+    otherwise={'status': 'OBESITÀ'}
+)
+HEAD_CIRCUMFERENCE_BANDS = bands(
+    (below(-3), {'status': 'MICROCEFALIA GRAVE',
+                 'recommendation': 'Valutazione neurologica e genetica urgente'}),
+    (below(-2), {'status': 'MICROCEFALIA',
+                 'recommendation': 'Valutazione neurologica/genetica, misurazioni seriate'}),
+    (2, {'status': 'NORMALE',
+         'recommendation': 'Controlli di routine'}),
+    (3, {'status': 'MACROCEFALIA',
+         'recommendation': 'Valutare familiarità (CC dei genitori), ecografia transfontanellare/imaging se in crescita'}),
+    otherwise={'status': 'MACROCEFALIA GRAVE',
+               'recommendation': 'Valutazione specialistica e imaging urgenti'}
+)
+
+
+def classification(indicator: str, age_days: float, reference: str = "who") -> tuple:
+    """Banding della classificazione e campo a cui si applica ("zscore" o "percentile")"""
+    if indicator == "weight_for_age":
+        return WEIGHT_FOR_AGE_BANDS, "zscore"
+    if indicator == "length_for_age":
+        return LENGTH_FOR_AGE_BANDS, "zscore"
+    if indicator == "head_circumference_for_age":
+        return HEAD_CIRCUMFERENCE_BANDS, "zscore"
+    if indicator == "bmi_for_age" and reference == "cdc" and age_days >= CDC_FIRST_DAY:
+        return BMI_CDC_BANDS, "percentile"
+    if indicator == "bmi_for_age" and age_days > WHO_STANDARDS_LAST_DAY:
+        return BMI_WHO_OVER_5_BANDS, "zscore"
+    return WEIGHT_STATUS_UNDER_5_BANDS, "zscore"
+
+
+def assess(indicator: str, is_male: bool, value: float, x: float, age_days: float, reference: str = "who") -> dict:
+    """z-score, percentile e classificazione (status) di una misura"""
+    result = calculate_growth_zscore(indicator, is_male, value, x, reference)
+    banding, key = classification(indicator, age_days, reference)
+    result["status"] = banding(result[key])['status']
+    return result
@@ -1,8 +1,24 @@
 """
 Formule mediche reali utilizzate nella pratica clinica pediatrica
+Le interpretazioni a soglie sono dichiarate come tabelle di banding (utils/banding.py)
 """
 import math
-def calculate_pas_asthma_interpretation(total_score: int) -> dict:
+from types import MappingProxyType
+
+from utils.banding import below, bands
+
+PAS_ASTHMA_BANDS = bands(
+    (4, {'severity': 'LIEVE',
+         'recommendation': 'Beta-agonisti a breve durata d\'azione (SABA), considerare dimissione'}),
+    (7, {'severity': 'MODERATA',
+         'recommendation': 'SABA ogni 1-2 ore, considerare steroidi, monitoraggio per 2-4 ore'}),
+    (11, {'severity': 'SEVERA',
+          'recommendation': 'SABA continui, steroidi sistemici, considerare Mg solfato, valutare ricovero'}),
+    otherwise={'severity': 'CRITICA',
+               'recommendation': 'Trattamento intensivo, SABA+anticolinergici continui, steroidi IV, possibile intubazione'}
+)
+
+def calculate_pas_asthma_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta il Pediatric Asthma Score
     
@@ -12,28 +28,18 @@ def calculate_pas_asthma_interpretation(total_score: int) -> dict:
     Returns:
         Dict con severità e raccomandazione
     """
-    if total_score <= 4:
-        return {
-            'severity': 'LIEVE',
-            'recommendation': 'Beta-agonisti a breve durata d\'azione (SABA), considerare dimissione'
-        }
-    elif total_score <= 7:
-        return {
-            'severity': 'MODERATA',
-            'recommendation': 'SABA ogni 1-2 ore, considerare steroidi, monitoraggio per 2-4 ore'
-        }
-    elif total_score <= 11:
-        return {
-            'severity': 'SEVERA',
-            'recommendation': 'SABA continui, steroidi sistemici, considerare Mg solfato, valutare ricovero'
-        }
-    else:
-        return {
-            'severity': 'CRITICA',
-            'recommendation': 'Trattamento intensivo, SABA+anticolinergici continui, steroidi IV, possibile intubazione'
-        }
+    return PAS_ASTHMA_BANDS(total_score)
+
+PASS_ASTHMA_BANDS = bands(
+    (2, {'severity': 'LIEVE',
+         'recommendation': 'Considerare dimissione con follow-up, SABA al bisogno'}),
+    (4, {'severity': 'MODERATA',
+         'recommendation': 'Continuare trattamento in PS, rivalutare dopo 1-2 ore'}),
+    otherwise={'severity': 'SEVERA',
+               'recommendation': 'Trattamento intensivo, possibile ricovero in terapia intensiva'}
+)
 
-def calculate_pass_asthma_interpretation(total_score: int) -> dict:
+def calculate_pass_asthma_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta il Pediatric Asthma Severity Score (PASS)
     
@@ -43,23 +49,19 @@ def calculate_pass_asthma_interpretation(total_score: int) -> dict:
     Returns:
         Dict con severità e raccomandazione
     """
-    if total_score <= 2:
-        return {
-            'severity': 'LIEVE',
-            'recommendation': 'Considerare dimissione con follow-up, SABA al bisogno'
-        }
-    elif total_score <= 4:
-        return {
-            'severity': 'MODERATA',
-            'recommendation': 'Continuare trattamento in PS, rivalutare dopo 1-2 ore'
-        }
-    else:
-        return {
-            'severity': 'SEVERA',
-            'recommendation': 'Trattamento intensivo, possibile ricovero in terapia intensiva'
-        }
+    return PASS_ASTHMA_BANDS(total_score)
+
+# Punteggi interi ≥ 0 (conteggio di criteri): '== 0' e '== 1' diventano le soglie incluse 0 e 1
+BACTERIAL_MENINGITIS_BANDS = bands(
+    (0, {'risk': 'MOLTO BASSO (<0.1%)',
+         'recommendation': 'Considerare dimissione con follow-up, basso rischio di meningite batterica'}),
+    (1, {'risk': 'BASSO (0.4-2.5%)',
+         'recommendation': 'Valutare attentamente, considerare osservazione o ulteriori indagini'}),
+    otherwise={'risk': 'ALTO (>8%)',
+               'recommendation': 'Ricovero e terapia antibiotica empirica raccomandata'}
+)
 
-def calculate_bacterial_meningitis_score_interpretation(total_score: int) -> dict:
+def calculate_bacterial_meningitis_score_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta il Bacterial Meningitis Score for Children
     
@@ -69,23 +71,23 @@ def calculate_bacterial_meningitis_score_interpretation(total_score: int) -> dic
     Returns:
         Dict con rischio e raccomandazione
     """
-    if total_score == 0:
-        return {
-            'risk': 'MOLTO BASSO (<0.1%)',
-            'recommendation': 'Considerare dimissione con follow-up, basso rischio di meningite batterica'
-        }
-    elif total_score == 1:
-        return {
-            'risk': 'BASSO (0.4-2.5%)',
-            'recommendation': 'Valutare attentamente, considerare osservazione o ulteriori indagini'
-        }
-    else:
-        return {
-            'risk': 'ALTO (>8%)',
-            'recommendation': 'Ricovero e terapia antibiotica empirica raccomandata'
-        }
+    return BACTERIAL_MENINGITIS_BANDS(total_score)
 
-def calculate_kocher_criteria_interpretation(total_score: int) -> dict:
+# Numero di criteri positivi (0-4)
+KOCHER_CRITERIA_BANDS = bands(
+    (0, {'probability': '<0.2%',
+         'recommendation': 'Artrite settica estremamente improbabile. Considerare altre diagnosi.'}),
+    (1, {'probability': '3%',
+         'recommendation': 'Bassa probabilità. Considerare osservazione o ulteriori indagini.'}),
+    (2, {'probability': '40%',
+         'recommendation': 'Probabilità intermedia. Considerare aspirazione articolare.'}),
+    (3, {'probability': '93%',
+         'recommendation': 'Alta probabilità. Aspirazione articolare raccomandata.'}),
+    otherwise={'probability': '99%',
+               'recommendation': 'Probabilità molto alta. Aspirazione articolare e intervento fortemente raccomandati.'}
+)
+
+def calculate_kocher_criteria_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta i Kocher Criteria per artrite settica dell'anca
     
@@ -95,33 +97,23 @@ def calculate_kocher_criteria_interpretation(total_score: int) -> dict:
     Returns:
         Dict con probabilità e raccomandazione
     """
-    if total_score == 0:
-        return {
-            'probability': '<0.2%',
-            'recommendation': 'Artrite settica estremamente improbabile. Considerare altre diagnosi.'
-        }
-    elif total_score == 1:
-        return {
-            'probability': '3%',
-            'recommendation': 'Bassa probabilità. Considerare osservazione o ulteriori indagini.'
-        }
-    elif total_score == 2:
-        return {
-            'probability': '40%',
-            'recommendation': 'Probabilità intermedia. Considerare aspirazione articolare.'
-        }
-    elif total_score == 3:
-        return {
-            'probability': '93%',
-            'recommendation': 'Alta probabilità. Aspirazione articolare raccomandata.'
-        }
-    else:  # total_score == 4
-        return {
-            'probability': '99%',
-            'recommendation': 'Probabilità molto alta. Aspirazione articolare e intervento fortemente raccomandati.'
-        }
+    return KOCHER_CRITERIA_BANDS(total_score)
+
+KAWASAKI_NO_FEVER = MappingProxyType({
+    'diagnosis': 'CRITERI NON SODDISFATTI',
+    'recommendation': 'Malattia di Kawasaki improbabile. La febbre per ≥5 giorni è un criterio essenziale.'
+})
+# Con febbre: 0-1 criteri non soddisfatti, 2-3 incompleto, ≥4 classico
+KAWASAKI_CRITERIA_BANDS = bands(
+    (1, {'diagnosis': 'CRITERI NON SODDISFATTI',
+         'recommendation': 'Malattia di Kawasaki improbabile. Considerare diagnosi alternative.'}),
+    (3, {'diagnosis': 'POSSIBILE KAWASAKI INCOMPLETO',
+         'recommendation': 'Sospetto Kawasaki incompleto. Valutare criteri di laboratorio e ecocardiografia.'}),
+    otherwise={'diagnosis': 'KAWASAKI CLASSICO',
+               'recommendation': 'Diagnosi di Kawasaki classico. Iniziare IVIG e ASA ad alte dosi entro 10 giorni dall\'esordio.'}
+)
 
-def calculate_kawasaki_criteria_interpretation(has_fever: bool, criteria_count: int) -> dict:
+def calculate_kawasaki_criteria_interpretation(has_fever: bool, criteria_count: int) -> MappingProxyType:
     """
     Interpreta i criteri diagnostici per la malattia di Kawasaki
     
@@ -133,27 +125,21 @@ def calculate_kawasaki_criteria_interpretation(has_fever: bool, criteria_count:
         Dict con diagnosi e raccomandazione
     """
     if not has_fever:
-        return {
-            'diagnosis': 'CRITERI NON SODDISFATTI',
-            'recommendation': 'Malattia di Kawasaki improbabile. La febbre per ≥5 giorni è un criterio essenziale.'
-        }
-    elif criteria_count >= 4:
-        return {
-            'diagnosis': 'KAWASAKI CLASSICO',
-            'recommendation': 'Diagnosi di Kawasaki classico. Iniziare IVIG e ASA ad alte dosi entro 10 giorni dall\'esordio.'
-        }
-    elif 2 <= criteria_count <= 3:
-        return {
-            'diagnosis': 'POSSIBILE KAWASAKI INCOMPLETO',
-            'recommendation': 'Sospetto Kawasaki incompleto. Valutare criteri di laboratorio e ecocardiografia.'
-        }
-    else:
-        return {
-            'diagnosis': 'CRITERI NON SODDISFATTI',
-            'recommendation': 'Malattia di Kawasaki improbabile. Considerare diagnosi alternative.'
-        }
+        return KAWASAKI_NO_FEVER
+    return KAWASAKI_CRITERIA_BANDS(criteria_count)
+
+BOPS_BANDS = bands(
+    (1, {'pain_level': 'NESSUN DOLORE',
+         'recommendation': 'Nessun intervento analgesico richiesto'}),
+    (3, {'pain_level': 'DOLORE LIEVE',
+         'recommendation': 'Considerare analgesia non farmacologica o paracetamolo'}),
+    (4, {'pain_level': 'DOLORE MODERATO',
+         'recommendation': 'Somministrare analgesici non oppioidi'}),
+    otherwise={'pain_level': 'DOLORE SEVERO',
+               'recommendation': 'Somministrare analgesici oppioidi, valutare cause del dolore'}
+)
 
-def calculate_bops_interpretation(total_score: int) -> dict:
+def calculate_bops_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta il Behavioral Observational Pain Scale (BOPS)
     
@@ -163,26 +149,7 @@ def calculate_bops_interpretation(total_score: int) -> dict:
     Returns:
         Dict con intensità dolore e raccomandazione
     """
-    if total_score <= 1:
-        return {
-            'pain_level': 'NESSUN DOLORE',
-            'recommendation': 'Nessun intervento analgesico richiesto'
-        }
-    elif total_score <= 3:
-        return {
-            'pain_level': 'DOLORE LIEVE',
-            'recommendation': 'Considerare analgesia non farmacologica o paracetamolo'
-        }
-    elif total_score <= 4:
-        return {
-            'pain_level': 'DOLORE MODERATO',
-            'recommendation': 'Somministrare analgesici non oppioidi'
-        }
-    else:
-        return {
-            'pain_level': 'DOLORE SEVERO',
-            'recommendation': 'Somministrare analgesici oppioidi, valutare cause del dolore'
-        }
+    return BOPS_BANDS(total_score)
 
 def calculate_pnfs(alt_iu_l: float, alkaline_phosphatase_iu_l: float, platelets_k_ul: float, ggt_iu_l: float) -> float:
     """
@@ -210,7 +177,16 @@ def calculate_pnfs(alt_iu_l: float, alkaline_phosphatase_iu_l: float, platelets_
     
     return round(probability, 1)
 
-def calculate_pnfs_interpretation(pnfs_score: float) -> dict:
+PNFS_BANDS = bands(
+    (below(30.0), {'interpretation': 'BASSO RISCHIO FIBROSI AVANZATA',
+                   'recommendation': 'Monitoraggio standard, modifiche stile di vita, controllo ogni 6-12 mesi'}),
+    (60.0, {'interpretation': 'RISCHIO INTERMEDIO',
+            'recommendation': 'Monitoraggio più frequente, elastografia, controllo ogni 3-6 mesi'}),
+    otherwise={'interpretation': 'ALTO RISCHIO FIBROSI AVANZATA',
+               'recommendation': 'Considerare biopsia epatica, valutazione specialistica epatologica'}
+)
+
+def calculate_pnfs_interpretation(pnfs_score: float) -> MappingProxyType:
     """
     Interpreta il Pediatric NAFLD Fibrosis Score (PNFS)
     
@@ -220,21 +196,8 @@ def calculate_pnfs_interpretation(pnfs_score: float) -> dict:
     Returns:
         Dict con interpretazione e raccomandazione
     """
-    if pnfs_score < 30.0:
-        return {
-            'interpretation': 'BASSO RISCHIO FIBROSI AVANZATA',
-            'recommendation': 'Monitoraggio standard, modifiche stile di vita, controllo ogni 6-12 mesi'
-        }
-    elif pnfs_score <= 60.0:
-        return {
-            'interpretation': 'RISCHIO INTERMEDIO',
-            'recommendation': 'Monitoraggio più frequente, elastografia, controllo ogni 3-6 mesi'
-        }
-    else:
-        return {
-            'interpretation': 'ALTO RISCHIO FIBROSI AVANZATA',
-            'recommendation': 'Considerare biopsia epatica, valutazione specialistica epatologica'
-        }
+    return PNFS_BANDS(pnfs_score)
+
 def calculate_calcium_corrected(calcium_total_mg_dl: float, albumin_g_dl: float) -> float:
     """
     Calcola il calcio corretto per albumina
@@ -253,7 +216,17 @@ def calculate_calcium_corrected(calcium_total_mg_dl: float, albumin_g_dl: float)
     calcium_corrected = calcium_total_mg_dl + 0.8 * (4.0 - albumin_g_dl)
     return round(calcium_corrected, 2)
 
-def calculate_bone_mineral_density_zscore_interpretation(bmd_zscore: float) -> dict:
+# Z-score crescente: < -2.0 molto bassa, < -1.0 bassa, altrimenti normale
+BONE_MINERAL_DENSITY_BANDS = bands(
+    (below(-2.0), {'interpretation': 'DENSITÀ MINERALE OSSEA MOLTO BASSA',
+                   'recommendation': 'Valutazione endocrinologica, considerare intervento farmacologico, ricerca cause secondarie.'}),
+    (below(-1.0), {'interpretation': 'BASSA DENSITÀ MINERALE OSSEA',
+                   'recommendation': 'Ottimizzare apporto di calcio, vitamina D, attività fisica. Rivalutare in 12 mesi.'}),
+    otherwise={'interpretation': 'NORMALE',
+               'recommendation': 'Nessuna azione specifica richiesta. Mantenere adeguato apporto di calcio e vitamina D.'}
+)
+
+def calculate_bone_mineral_density_zscore_interpretation(bmd_zscore: float) -> MappingProxyType:
     """
     Interpreta Z-score della densità minerale ossea in età pediatrica
     
@@ -263,21 +236,8 @@ def calculate_bone_mineral_density_zscore_interpretation(bmd_zscore: float) -> d
     Returns:
         Dict con interpretazione e raccomandazione
     """
-    if bmd_zscore >= -1.0:
-        return {
-            'interpretation': 'NORMALE',
-            'recommendation': 'Nessuna azione specifica richiesta. Mantenere adeguato apporto di calcio e vitamina D.'
-        }
-    elif bmd_zscore >= -2.0:
-        return {
-            'interpretation': 'BASSA DENSITÀ MINERALE OSSEA',
-            'recommendation': 'Ottimizzare apporto di calcio, vitamina D, attività fisica. Rivalutare in 12 mesi.'
-        }
-    else:
-        return {
-            'interpretation': 'DENSITÀ MINERALE OSSEA MOLTO BASSA',
-            'recommendation': 'Valutazione endocrinologica, considerare intervento farmacologico, ricerca cause secondarie.'
-        }
+    return BONE_MINERAL_DENSITY_BANDS(bmd_zscore)
+
 def calculate_bsa_dubois(weight_kg: float, height_cm: float) -> float:
     """
     Calcola la superficie corporea usando la formula di DuBois
@@ -349,29 +309,35 @@ def calculate_holiday_segar_fluids(weight_kg: float) -> dict:
         'rate_ml_h': round(hourly_ml, 1)
     }
 
-def calculate_pews_interpretation(total_score: int, has_bradycardia: bool = False) -> dict:
+PEWS_BANDS = bands(
+    (below(3), {'risk_level': 'BASSO',
+                'action': 'Monitoraggio standard ogni 4-6 ore'}),
+    (below(5), {'risk_level': 'MODERATO',
+                'action': 'Aumentare frequenza monitoraggio ogni 2 ore - Consulenza medica'}),
+    (below(7), {'risk_level': 'ALTO',
+                'action': 'Considerare terapia intensiva - Monitoraggio continuo - Consulenza medica urgente'}),
+    otherwise={'risk_level': 'CRITICO',
+               'action': 'Intervento immediato - Contattare rianimazione/MET team'}
+)
+
+def calculate_pews_interpretation(total_score: int, has_bradycardia: bool = False) -> MappingProxyType:
     """Interpreta PEWS con considerazione specifica per bradicardia"""
-    if has_bradycardia or total_score >= 7:
-        return {
-            'risk_level': 'CRITICO',
-            'action': 'Intervento immediato - Contattare rianimazione/MET team'
-        }
-    elif total_score >= 5:
-        return {
-            'risk_level': 'ALTO',
-            'action': 'Considerare terapia intensiva - Monitoraggio continuo - Consulenza medica urgente'
-        }
-    elif total_score >= 3:
-        return {
-            'risk_level': 'MODERATO',
-            'action': 'Aumentare frequenza monitoraggio ogni 2 ore - Consulenza medica'
-        }
-    else:
-        return {
-            'risk_level': 'BASSO',
-            'action': 'Monitoraggio standard ogni 4-6 ore'
-        }
-def calculate_pas_interpretation(total_score: int) -> dict:
+    if has_bradycardia:
+        return PEWS_BANDS.records[-1]
+    return PEWS_BANDS(total_score)
+
+PAS_BANDS = bands(
+    (2, {'probability': 'BASSA (2%)',
+         'recommendation': 'Appendicite improbabile - Considerare diagnosi alternative'}),
+    (5, {'probability': 'INTERMEDIA (15-25%)',
+         'recommendation': 'Osservazione clinica - Rivalutazione in 6-12 ore'}),
+    (7, {'probability': 'ALTA (70-80%)',
+         'recommendation': 'Forte sospetto appendicite - Consultazione chirurgica'}),
+    otherwise={'probability': 'MOLTO ALTA (95%+)',
+               'recommendation': 'Appendicite molto probabile - Preparazione per intervento'}
+)
+
+def calculate_pas_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta il punteggio PAS (Pediatric Appendicitis Score)
     
@@ -381,28 +347,18 @@ def calculate_pas_interpretation(total_score: int) -> dict:
     Returns:
         Dict con probabilità di appendicite e raccomandazione
     """
-    if total_score <= 2:
-        return {
-            'probability': 'BASSA (2%)',
-            'recommendation': 'Appendicite improbabile - Considerare diagnosi alternative'
-        }
-    elif total_score <= 5:
-        return {
-            'probability': 'INTERMEDIA (15-25%)',
-            'recommendation': 'Osservazione clinica - Rivalutazione in 6-12 ore'
-        }
-    elif total_score <= 7:
-        return {
-            'probability': 'ALTA (70-80%)',
-            'recommendation': 'Forte sospetto appendicite - Consultazione chirurgica'
-        }
-    else:
-        return {
-            'probability': 'MOLTO ALTA (95%+)',
-            'recommendation': 'Appendicite molto probabile - Preparazione per intervento'
-        }
+    return PAS_BANDS(total_score)
 
-def calculate_apgar_interpretation(total_score: int) -> dict:
+APGAR_BANDS = bands(
+    (below(4), {'condition': 'SEVERAMENTE DEPRESSO',
+                'action': 'Rianimazione immediata - Intubazione e ventilazione'}),
+    (below(8), {'condition': 'MODERATAMENTE DEPRESSO',
+                'action': 'Stimolazione, aspirazione, ossigeno se necessario'}),
+    otherwise={'condition': 'NORMALE',
+               'action': 'Nessun intervento necessario - Cure di routine'}
+)
+
+def calculate_apgar_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta il punteggio APGAR
     
@@ -412,32 +368,19 @@ def calculate_apgar_interpretation(total_score: int) -> dict:
     Returns:
         Dict con condizione del neonato e azioni
     """
-    if total_score >= 8:
-        return {
-            'condition': 'NORMALE',
-            'action': 'Nessun intervento necessario - Cure di routine'
-        }
-    elif total_score >= 4:
-        return {
-            'condition': 'MODERATAMENTE DEPRESSO',
-            'action': 'Stimolazione, aspirazione, ossigeno se necessario'
-        }
-    else:
-        return {
-            'condition': 'SEVERAMENTE DEPRESSO',
-            'action': 'Rianimazione immediata - Intubazione e ventilazione'
-        }
+    return APGAR_BANDS(total_score)
+
+GCS_PEDIATRIC_BANDS = bands(
+    (below(9), {'severity': 'SEVERA', 'prognosis': 'Grave', 'action': 'Terapia intensiva immediata'}),
+    (below(13), {'severity': 'MODERATA', 'prognosis': 'Riservata', 'action': 'Monitoraggio intensivo'}),
+    otherwise={'severity': 'LIEVE', 'prognosis': 'Buona', 'action': 'Osservazione clinica'}
+)
 
-def calculate_gcs_pediatric_interpretation(total_score: int) -> dict:
+def calculate_gcs_pediatric_interpretation(total_score: int) -> MappingProxyType:
     """
     Interpreta Glasgow Coma Scale pediatrica
     """
-    if total_score >= 13:
-        return {'severity': 'LIEVE', 'prognosis': 'Buona', 'action': 'Osservazione clinica'}
-    elif total_score >= 9:
-        return {'severity': 'MODERATA', 'prognosis': 'Riservata', 'action': 'Monitoraggio intensivo'}
-    else:
-        return {'severity': 'SEVERA', 'prognosis': 'Grave', 'action': 'Terapia intensiva immediata'}
+    return GCS_PEDIATRIC_BANDS(total_score)
 
 def calculate_schwartz_creatinine_clearance(creatinine_mg_dl: float, height_cm: float, age_years: float) -> float:
     """
@@ -599,8 +542,15 @@ def calculate_catch_score(vomiting: bool, headache: bool, gcsscore: int,
     
     return score
 
+WESTLEY_CROUP_BANDS = bands(
+    (2, {'severity': "LIEVE", 'management': "Gestione domiciliare - Steroidi singola dose"}),
+    (5, {'severity': "MODERATO", 'management': "Osservazione ospedaliera - Steroidi e adrenalina"}),
+    (11, {'severity': "SEVERO", 'management': "Ricovero urgente - Trattamento intensivo"}),
+    otherwise={'severity': "CRITICO", 'management': "Potenziale intubazione - Terapia intensiva"}
+)
+
 def calculate_westley_croup_score(stridor: int, retraction: int, air_entry: int, 
-                               cyanosis: int, consciousness: int) -> dict:
+                               cyanosis: int, consciousness: int) -> MappingProxyType:
     """
     Calcola Westley Croup Score
     
@@ -618,24 +568,7 @@ def calculate_westley_croup_score(stridor: int, retraction: int, air_entry: int,
     ≥12: Imminente insufficienza respiratoria
     """
     total_score = stridor + retraction + air_entry + cyanosis + consciousness
-    
-    if total_score <= 2:
-        severity = "LIEVE"
-        management = "Gestione domiciliare - Steroidi singola dose"
-    elif total_score <= 5:
-        severity = "MODERATO"
-        management = "Osservazione ospedaliera - Steroidi e adrenalina"
-    elif total_score <= 11:
-        severity = "SEVERO"
-        management = "Ricovero urgente - Trattamento intensivo"
-    else:
-        severity = "CRITICO"
-        management = "Potenziale intubazione - Terapia intensiva"
-    
-    return {
-        'severity': severity,
-        'management': management
-    }
+    return WESTLEY_CROUP_BANDS(total_score)
 
 def calculate_predicted_height(father_height_cm: float, mother_height_cm: float, 
                              is_male: bool) -> float:
@@ -713,6 +646,13 @@ def calculate_burned_surface_area(age_years: float, areas: dict) -> float:
     
     return round(total_bsa * 100, 1)
 
+CENTOR_BANDS = bands(
+    (1, {'probability': "BASSA (<10%)", 'recommendation': "No test rapido, no antibiotici"}),
+    (2, {'probability': "INTERMEDIA-BASSA (10-17%)", 'recommendation': "Considerare test rapido, antibiotici solo se positivo"}),
+    (3, {'probability': "INTERMEDIA-ALTA (30-35%)", 'recommendation': "Test rapido, antibiotici se positivo"}),
+    otherwise={'probability': "ALTA (>50%)", 'recommendation': "Test rapido o trattamento empirico se test non disponibile"}
+)
+
 def calculate_centor_score_pediatric(age_years: float, exudate: bool, tender_nodes: bool,
                                fever: bool, cough: bool) -> dict:
     """
@@ -741,25 +681,13 @@ def calculate_centor_score_pediatric(age_years: float, exudate: bool, tender_nod
     if 3 <= age_years <= 14:
         score += 1
     
-    # Interpretazione
-    if score <= 1:
-        probability = "BASSA (<10%)"
-        recommendation = "No test rapido, no antibiotici"
-    elif score == 2:
-        probability = "INTERMEDIA-BASSA (10-17%)"
-        recommendation = "Considerare test rapido, antibiotici solo se positivo"
-    elif score == 3:
-        probability = "INTERMEDIA-ALTA (30-35%)"
-        recommendation = "Test rapido, antibiotici se positivo"
-    else:
-        probability = "ALTA (>50%)"
-        recommendation = "Test rapido o trattamento empirico se test non disponibile"
-    
-    return {
-        'score': score,
-        'probability': probability,
-        'recommendation': recommendation
-    }
+    return {'score': score, **CENTOR_BANDS(score)}
+
+WELLS_BANDS = bands(
+    (0, {'probability': "BASSA (<5%)", 'recommendation': "D-dimero, considerare stop se negativo"}),
+    (1, {'probability': "MODERATA (~17%)", 'recommendation': "Ecografia, considerare D-dimero"}),
+    otherwise={'probability': "ALTA (>75%)", 'recommendation': "Ecografia + anticoagulante mentre si attende"}
+)
 
 def calculate_wells_score_pediatric(provoked_dvt: bool, alternative_diagnosis: bool, 
                            swelling: bool, unilateral_tenderness: bool, 
@@ -803,22 +731,7 @@ def calculate_wells_score_pediatric(provoked_dvt: bool, alternative_diagnosis: b
     if previous_dvt:
         score += 1
     
-    # Interpretazione
-    if score >= 2:
-        probability = "ALTA (>75%)"
-        recommendation = "Ecografia + anticoagulante mentre si attende"
-    elif score == 1:
-        probability = "MODERATA (~17%)"
-        recommendation = "Ecografia, considerare D-dimero"
-    else:
-        probability = "BASSA (<5%)"
-        recommendation = "D-dimero, considerare stop se negativo"
-    
-    return {
-        'score': score,
-        'probability': probability,
-        'recommendation': recommendation
-    }
+    return {'score': score, **WELLS_BANDS(score)}
 def calculate_anc(wbc_count: float, neutrophil_percent: float, bands_percent: float = 0.0) -> int:
     """
     Calcola il conteggio assoluto dei neutrofili (ANC) in cellule/μL.
@@ -835,268 +748,3 @@ def calculate_anc(wbc_count: float, neutrophil_percent: float, bands_percent: fl
         raise ValueError("Le percentuali devono essere tra 0 e 100")
     anc = wbc_count * (neutrophil_percent + bands_percent) / 100 * 1000
     return int(round(anc))
-
-def calculate_pas_asthma_interpretation(total_score: int) -> dict:
-    """
-    Interpreta il Pediatric Asthma Score
-    
-    Args:
-        total_score: Punteggio PAS totale (0-15)
-        
-    Returns:
-        Dict con severità e raccomandazione
-    """
-    if total_score <= 4:
-        return {
-            'severity': 'LIEVE',
-            'recommendation': 'Beta-agonisti a breve durata d\'azione (SABA), considerare dimissione'
-        }
-    elif total_score <= 7:
-        return {
-            'severity': 'MODERATA',
-            'recommendation': 'SABA ogni 1-2 ore, considerare steroidi, monitoraggio per 2-4 ore'
-        }
-    elif total_score <= 11:
-        return {
-            'severity': 'SEVERA',
-            'recommendation': 'SABA continui, steroidi sistemici, considerare Mg solfato, valutare ricovero'
-        }
-    else:
-        return {
-            'severity': 'CRITICA',
-            'recommendation': 'Trattamento intensivo, SABA+anticolinergici continui, steroidi IV, possibile intubazione'
-        }
-
-def calculate_pass_asthma_interpretation(total_score: int) -> dict:
-    """
-    Interpreta il Pediatric Asthma Severity Score (PASS)
-    
-    Args:
-        total_score: Punteggio PASS totale (0-6)
-        
-    Returns:
-        Dict con severità e raccomandazione
-    """
-    if total_score <= 2:
-        return {
-            'severity': 'LIEVE',
-            'recommendation': 'Considerare dimissione con follow-up, SABA al bisogno'
-        }
-    elif total_score <= 4:
-        return {
-            'severity': 'MODERATA',
-            'recommendation': 'Continuare trattamento in PS, rivalutare dopo 1-2 ore'
-        }
-    else:
-        return {
-            'severity': 'SEVERA',
-            'recommendation': 'Trattamento intensivo, possibile ricovero in terapia intensiva'
-        }
-    
-def calculate_bacterial_meningitis_score_interpretation(total_score: int) -> dict:
-    """
-    Interpreta il Bacterial Meningitis Score for Children
-    
-    Args:
-        total_score: Punteggio totale (0-6)
-        
-    Returns:
-        Dict con rischio e raccomandazione
-    """
-    if total_score == 0:
-        return {
-            'risk': 'MOLTO BASSO (<0.1%)',
-            'recommendation': 'Considerare dimissione con follow-up, basso rischio di meningite batterica'
-        }
-    elif total_score == 1:
-        return {
-            'risk': 'BASSO (0.4-2.5%)',
-            'recommendation': 'Valutare attentamente, considerare osservazione o ulteriori indagini'
-        }
-    else:
-        return {
-            'risk': 'ALTO (>8%)',
-            'recommendation': 'Ricovero e terapia antibiotica empirica raccomandata'
-        }
-    
-def calculate_kocher_criteria_interpretation(total_score: int) -> dict:
-    """
-    Interpreta i Kocher Criteria per artrite settica dell'anca
-    
-    Args:
-        total_score: Numero di criteri positivi (0-4)
-        
-    Returns:
-        Dict con probabilità e raccomandazione
-    """
-    if total_score == 0:
-        return {
-            'probability': '<0.2%',
-            'recommendation': 'Artrite settica estremamente improbabile. Considerare altre diagnosi.'
-        }
-    elif total_score == 1:
-        return {
-            'probability': '3%',
-            'recommendation': 'Bassa probabilità. Considerare osservazione o ulteriori indagini.'
-        }
-    elif total_score == 2:
-        return {
-            'probability': '40%',
-            'recommendation': 'Probabilità intermedia. Considerare aspirazione articolare.'
-        }
-    elif total_score == 3:
-        return {
-            'probability': '93%',
-            'recommendation': 'Alta probabilità. Aspirazione articolare raccomandata.'
-        }
-    else:  # total_score == 4
-        return {
-            'probability': '99%',
-            'recommendation': 'Probabilità molto alta. Aspirazione articolare e intervento fortemente raccomandati.'
-        }
-def calculate_kawasaki_criteria_interpretation(has_fever: bool, criteria_count: int) -> dict:
-    """
-    Interpreta i criteri diagnostici per la malattia di Kawasaki
-    
-    Args:
-        has_fever: Presenza di febbre per ≥5 giorni
-        criteria_count: Numero di criteri clinici positivi (0-5)
-        
-    Returns:
-        Dict con diagnosi e raccomandazione
-    """
-    if not has_fever:
-        return {
-            'diagnosis': 'CRITERI NON SODDISFATTI',
-            'recommendation': 'Malattia di Kawasaki improbabile. La febbre per ≥5 giorni è un criterio essenziale.'
-        }
-    elif criteria_count >= 4:
-        return {
-            'diagnosis': 'KAWASAKI CLASSICO',
-            'recommendation': 'Diagnosi di Kawasaki classico. Iniziare IVIG e ASA ad alte dosi entro 10 giorni dall\'esordio.'
-        }
-    elif 2 <= criteria_count <= 3:
-        return {
-            'diagnosis': 'POSSIBILE KAWASAKI INCOMPLETO',
-            'recommendation': 'Sospetto Kawasaki incompleto. Valutare criteri di laboratorio e ecocardiografia.'
-        }
-    else:
-        return {
-            'diagnosis': 'CRITERI NON SODDISFATTI',
-            'recommendation': 'Malattia di Kawasaki improbabile. Considerare diagnosi alternative.'
-        }
-    
-def calculate_bops_interpretation(total_score: int) -> dict:
-    """Interpreta il Behavioral Observational Pain Scale (BOPS)"""
-    if total_score <= 1:
-        return {
-            'pain_level': 'NESSUN DOLORE',
-            'recommendation': 'Nessun intervento analgesico richiesto'
-        }
-    elif total_score <= 3:
-        return {
-            'pain_level': 'DOLORE LIEVE',
-            'recommendation': 'Considerare analgesia non farmacologica o paracetamolo'
-        }
-    elif total_score <= 4:
-        return {
-            'pain_level': 'DOLORE MODERATO',
-            'recommendation': 'Somministrare analgesici non oppioidi'
-        }
-    else:
-        return {
-            'pain_level': 'DOLORE SEVERO',
-            'recommendation': 'Somministrare analgesici oppioidi, valutare cause del dolore'
-        }
-    
-def calculate_pnfs(age_years: float, waist_circumference_cm: float, triglycerides_mg_dl: float, alt_iu_l: float) -> float:
-    """
-    Calcola il Pediatric NAFLD Fibrosis Score (PNFS)
-    Formula: 1.1 + (0.34 × sqrt(ALT)) + (0.002 × Trigliceridi) - (1.1 × Log(età in anni)) 
-             + (0.02 × Circonferenza vita)
-    
-    Args:
-        age_years: Età in anni
-        waist_circumference_cm: Circonferenza vita in cm
-        triglycerides_mg_dl: Trigliceridi in mg/dL
-        alt_iu_l: ALT in IU/L
-    
-    Returns:
-        PNFS score
-    """
-    import math
-    
-    pnfs = (1.1 + (0.34 * math.sqrt(alt_iu_l)) + (0.002 * triglycerides_mg_dl) - 
-            (1.1 * math.log10(age_years)) + (0.02 * waist_circumference_cm))
-    
-    return round(pnfs, 2)
-
-def calculate_pnfs_interpretation(pnfs_score: float) -> dict:
-    """
-    Interpreta il Pediatric NAFLD Fibrosis Score (PNFS)
-    
-    Args:
-        pnfs_score: PNFS calcolato
-        
-    Returns:
-        Dict con interpretazione e raccomandazione
-    """
-    if pnfs_score < 8.0:
-        return {
-            'interpretation': 'BASSO RISCHIO FIBROSI',
-            'recommendation': 'Monitoraggio standard, modifiche stile di vita, controllo ogni 6-12 mesi'
-        }
-    elif pnfs_score <= 9.0:
-        return {
-            'interpretation': 'RISCHIO INTERMEDIO',
-            'recommendation': 'Monitoraggio più frequente, elastografia, controllo ogni 3-6 mesi'
-        }
-    else:
-        return {
-            'interpretation': 'ALTO RISCHIO FIBROSI',
-            'recommendation': 'Considerare biopsia epatica, valutazione specialistica epatologica'
-        }
-    
-def calculate_calcium_corrected(calcium_total_mg_dl: float, albumin_g_dl: float) -> float:
-    """
-    Calcola il calcio corretto per albumina
-    Formula: Calcio totale + 0.8 × (4 - Albumina)
-    
-    Args:
-        calcium_total_mg_dl: Calcio totale in mg/dL
-        albumin_g_dl: Albumina in g/dL
-    
-    Returns:
-        Calcio corretto in mg/dL
-    """
-    if albumin_g_dl >= 4.0:
-        return calcium_total_mg_dl
-    
-    calcium_corrected = calcium_total_mg_dl + 0.8 * (4.0 - albumin_g_dl)
-    return round(calcium_corrected, 2)
-
-def calculate_bone_mineral_density_zscore_interpretation(bmd_zscore: float) -> dict:
-    """
-    Interpreta Z-score della densità minerale ossea in età pediatrica
-    
-    Args:
-        bmd_zscore: Z-score della densità minerale ossea
-        
-    Returns:
-        Dict con interpretazione e raccomandazione
-    """
-    if bmd_zscore >= -1.0:
-        return {
-            'interpretation': 'NORMALE',
-            'recommendation': 'Nessuna azione specifica richiesta. Mantenere adeguato apporto di calcio e vitamina D.'
-        }
-    elif bmd_zscore >= -2.0:
-        return {
-            'interpretation': 'BASSA DENSITÀ MINERALE OSSEA',
-            'recommendation': 'Ottimizzare apporto di calcio, vitamina D, attività fisica. Rivalutare in 12 mesi.'
-        }
-    else:
-        return {
-            'interpretation': 'DENSITÀ MINERALE OSSEA MOLTO BASSA',
-            'recommendation': 'Valutazione endocrinologica, considerare intervento farmacologico, ricerca cause secondarie.'
-        }
\ No newline at end of file
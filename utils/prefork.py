@@ -0,0 +1,103 @@
+"""
+Supervisore pre-fork per il trasporto HTTP
+Il processo padre importa i tool e carica i dati di riferimento (tabelle degli
+score, catalogo) una sola volta, apre il socket di ascolto e poi crea N worker
+con fork: i worker condividono in copy-on-write le pagine già caricate invece
+di duplicarle, e il kernel distribuisce le connessioni tra i worker che
+accettano sullo stesso socket.
+Prima del fork gli oggetti esistenti vengono esclusi dal garbage collector
+(gc.freeze), altrimenti ogni raccolta nei worker riscriverebbe le loro pagine
+e la memoria condivisa verrebbe copiata in ogni processo.
+Solo sistemi POSIX (os.fork)
+"""
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+
+# Attesa minima prima di riavviare un worker terminato subito dopo l'avvio
+RESTART_DELAY = 1.0
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Socket di ascolto condiviso da tutti i worker"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _spawn(serve) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    # Worker: i segnali tornano ai gestori predefiniti (il server installa i propri)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    code = 0
+    try:
+        serve()
+    except KeyboardInterrupt:
+        pass
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def run_prefork(workers: int, serve) -> None:
+    """
+    Avvia workers processi che eseguono serve() e li mantiene attivi fino a SIGTERM/SIGINT
+
+    Args:
+        workers: Numero di processi worker
+        serve: Funzione eseguita in ogni worker (bloccante, es. il server HTTP sul socket condiviso)
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("La modalità multi-processo richiede os.fork (non disponibile su questo sistema)")
+    if workers < 1:
+        raise ValueError("Serve almeno un worker")
+
+    gc.collect()
+    gc.freeze()
+
+    children: dict[int, float] = {}
+    stopping = False
+
+    def stop(signum, _frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        children[_spawn(serve)] = time.monotonic()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+        # Un worker terminato inaspettatamente viene sostituito
+        print(f"Worker {pid} terminato (stato {status}), riavvio", file=sys.stderr)
+        if time.monotonic() - started < RESTART_DELAY:
+            time.sleep(RESTART_DELAY)
+        if not stopping:
+            children[_spawn(serve)] = time.monotonic()
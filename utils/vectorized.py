@@ -0,0 +1,266 @@
+"""
+Versioni vettoriali (NumPy) delle formule continue di medical_formulas
+Accettano scalari o array (un valore per paziente) e valutano l'intera coorte
+senza cicli Python: i rami su età/peso diventano np.where/np.select.
+I risultati coincidono bit a bit con le versioni scalari, arrotondamenti
+compresi (round() di Python arrotonda il valore binario esatto: i rari casi
+a ridosso di un pareggio vengono ricalcolati con la funzione scalare)
+"""
+import math
+
+import numpy as np
+
+from utils import growth, medical_formulas
+
+# Distanza dal pareggio (in unità dell'ultima cifra conservata) sotto la quale
+# l'arrotondamento vettoriale viene sostituito da quello scalare
+_TIE_TOLERANCE = 1e-6
+
+# erf di Abramowitz-Stegun 7.1.26: errore assoluto ≤ 1.5e-7, cioè ≤ 7.5e-6 sul
+# percentile (7.5e-5 in unità del decimale conservato); i valori entro 1e-4 dal
+# pareggio sono ricalcolati con la funzione scalare (math.erf)
+_ERF_COEFFICIENTS = (1.061405429, -1.453152027, 1.421413741, -0.284496736, 0.254829592)
+_ERF_P = 0.3275911
+_ERF_TIE_TOLERANCE = 1e-4
+
+
+def _as_arrays(*values):
+    """Converte gli input in array float64 con forma comune (broadcast)"""
+    return np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in values))
+
+
+def _round(raw, ndigits: int, scalar, inputs, tolerance: float = _TIE_TOLERANCE):
+    """
+    Arrotonda come round(x, ndigits) delle formule scalari
+
+    Lontano dai pareggi rint(x·10ⁿ)/10ⁿ coincide con round(); vicino al pareggio
+    (dove contano il valore binario esatto e l'ultimo ulp di pow) il risultato
+    è ricalcolato elemento per elemento con la funzione scalare.
+    """
+    if ndigits == 0:
+        return np.rint(raw).astype(np.int64)
+    scaled = raw * 10.0 ** ndigits
+    rounded = np.rint(scaled) / 10.0 ** ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < tolerance
+    for index in zip(*np.nonzero(near_tie)):
+        rounded[index] = scalar(*(float(value[index]) for value in inputs))
+    return rounded
+
+
+def calculate_bsa_dubois(weight_kg, height_cm) -> np.ndarray:
+    """Superficie corporea DuBois (m²) per ogni paziente"""
+    weight_kg, height_cm = _as_arrays(weight_kg, height_cm)
+    if np.any(weight_kg <= 0) or np.any(height_cm <= 0):
+        raise ValueError("Peso e altezza devono essere maggiori di 0")
+    bsa = 0.007184 * (weight_kg ** 0.425) * (height_cm ** 0.725)
+    return _round(bsa, 2, medical_formulas.calculate_bsa_dubois, (weight_kg, height_cm))
+
+
+def calculate_bsa_mosteller(weight_kg, height_cm) -> np.ndarray:
+    """Superficie corporea Mosteller (m²) per ogni paziente"""
+    weight_kg, height_cm = _as_arrays(weight_kg, height_cm)
+    if np.any(weight_kg <= 0) or np.any(height_cm <= 0):
+        raise ValueError("Peso e altezza devono essere maggiori di 0")
+    bsa = np.sqrt((weight_kg * height_cm) / 3600)
+    return _round(bsa, 2, medical_formulas.calculate_bsa_mosteller, (weight_kg, height_cm))
+
+
+def calculate_holiday_segar_fluids(weight_kg) -> dict:
+    """Fluidi di mantenimento Holiday-Segar: dict di array (ml/die, ml/ora, rate)"""
+    weight_kg, = _as_arrays(weight_kg)
+    if np.any(weight_kg <= 0):
+        raise ValueError("Il peso deve essere maggiore di 0")
+    daily_ml = np.select(
+        [weight_kg <= 10, weight_kg <= 20],
+        [weight_kg * 100, (10 * 100) + ((weight_kg - 10) * 50)],
+        (10 * 100) + (10 * 50) + ((weight_kg - 20) * 20)
+    )
+    hourly_ml = daily_ml / 24
+    hourly_rounded = _round(hourly_ml, 1, lambda w: medical_formulas.calculate_holiday_segar_fluids(w)['hourly_ml'], (weight_kg,))
+    return {
+        'daily_ml': _round(daily_ml, 0, None, ()),
+        'hourly_ml': hourly_rounded,
+        'rate_ml_h': hourly_rounded.copy()
+    }
+
+
+def calculate_schwartz_creatinine_clearance(creatinine_mg_dl, height_cm, age_years) -> np.ndarray:
+    """Clearance creatinina (Schwartz) in ml/min/1.73m² per ogni paziente"""
+    creatinine_mg_dl, height_cm, age_years = _as_arrays(creatinine_mg_dl, height_cm, age_years)
+    k = np.select([age_years < 1, age_years < 13], [0.45, 0.55], 0.7)
+    clearance = (k * height_cm) / creatinine_mg_dl
+    return _round(clearance, 1, medical_formulas.calculate_schwartz_creatinine_clearance,
+                  (creatinine_mg_dl, height_cm, age_years))
+
+
+def calculate_bmi_pediatric(weight_kg, height_cm) -> np.ndarray:
+    """BMI (kg/m²) per ogni paziente"""
+    weight_kg, height_cm = _as_arrays(weight_kg, height_cm)
+    height_m = height_cm / 100
+    bmi = weight_kg / (height_m ** 2)
+    return _round(bmi, 1, medical_formulas.calculate_bmi_pediatric, (weight_kg, height_cm))
+
+
+def calculate_daily_calories_pediatric(weight_kg, age_months) -> dict:
+    """Fabbisogno calorico giornaliero: dict di array (kcal/die, kcal/kg)"""
+    weight_kg, age_months = _as_arrays(weight_kg, age_months)
+    calories = np.select(
+        [age_months < 12, age_months < 36, age_months < 120],
+        [weight_kg * 110, weight_kg * 100, weight_kg * 75],
+        weight_kg * 55
+    )
+    return {
+        'daily_calories': _round(calories, 0, None, ()),
+        'calories_per_kg': _round(
+            calories / weight_kg, 1,
+            lambda w, a: medical_formulas.calculate_daily_calories_pediatric(w, a)['calories_per_kg'],
+            (weight_kg, age_months)
+        )
+    }
+
+
+def calculate_normal_bp_pediatric(age_years, height_percentile=50) -> dict:
+    """Pressione arteriosa normale per età (semplificata): dict di array in mmHg"""
+    age_years, = _as_arrays(age_years)
+    infant = age_years < 1
+    systolic = np.where(infant, 70 + (2 * age_years * 12), 90 + (2 * age_years))
+    diastolic = np.where(infant, 40, 50 + (1.5 * age_years))
+    return {
+        'systolic_normal': _round(systolic, 0, None, ()),
+        'diastolic_normal': _round(diastolic, 0, None, ()),
+        'systolic_90th': _round(systolic + 10, 0, None, ()),
+        'diastolic_90th': _round(diastolic + 10, 0, None, ())
+    }
+
+
+def calculate_anc(wbc_count, neutrophil_percent, bands_percent=0.0) -> np.ndarray:
+    """Conteggio assoluto dei neutrofili (cellule/μL) per ogni paziente"""
+    wbc_count, neutrophil_percent, bands_percent = _as_arrays(wbc_count, neutrophil_percent, bands_percent)
+    if (np.any((neutrophil_percent < 0) | (neutrophil_percent > 100))
+            or np.any((bands_percent < 0) | (bands_percent > 100))):
+        raise ValueError("Le percentuali devono essere tra 0 e 100")
+    anc = wbc_count * (neutrophil_percent + bands_percent) / 100 * 1000
+    return _round(anc, 0, None, ())
+
+
+def _value_at(l, m, s, z):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(l == 0, m * np.exp(s * z), m * (1 + l * s * z) ** (1 / l))
+
+
+def _lms(table: growth.GrowthTable, x) -> tuple:
+    """L, M, S interpolati come in growth.lms (np.searchsorted al posto di bisect)"""
+    xs = table.x
+    row = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, len(xs) - 2)
+    t = (x - xs[row]) / (xs[row + 1] - xs[row])
+    return (table.L[row] + t * (table.L[row + 1] - table.L[row]),
+            table.M[row] + t * (table.M[row + 1] - table.M[row]),
+            table.S[row] + t * (table.S[row + 1] - table.S[row]))
+
+
+def _lms_zscore(value, l, m, s, adjusted: bool) -> np.ndarray:
+    """z-score LMS di growth.lms_zscore"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(l == 0, np.log(value / m) / s, ((value / m) ** l - 1) / (l * s))
+    if adjusted:
+        high, low = z > 3, z < -3
+        if high.any():
+            sd3 = _value_at(l, m, s, 3)
+            z = np.where(high, 3 + (value - sd3) / (sd3 - _value_at(l, m, s, 2)), z)
+        if low.any():
+            sd3 = _value_at(l, m, s, -3)
+            z = np.where(low, -3 + (value - sd3) / (_value_at(l, m, s, -2) - sd3), z)
+    return z
+
+
+def _by_segment(indicator: str, reference: str, is_male, x, valid, compute) -> np.ndarray:
+    """
+    Applica compute(righe, l, m, s, segmento) ai bambini di ogni segmento di tabella e sesso
+
+    Come growth._segment vale il primo segmento che contiene x; NaN per le righe non valide o fuori tabella
+    """
+    tables = growth.get_tables()
+    result = np.full(x.shape, np.nan)
+    pending = valid.copy()
+    for segment in growth.segments(indicator, reference):
+        inside = pending & (x >= segment.lower) & (x <= segment.upper)
+        pending &= ~inside
+        for sex, rows in ((1, inside & (is_male != 0)), (2, inside & (is_male == 0))):
+            if rows.any():
+                result[rows] = compute(rows, *_lms(tables[(segment.table, sex)], x[rows] / segment.scale), segment)
+    return result
+
+
+def _erf(x) -> np.ndarray:
+    """erf vettoriale (Abramowitz-Stegun 7.1.26, errore assoluto ≤ 1.5e-7; NaN resta NaN)"""
+    t = 1 / (1 + _ERF_P * np.abs(x))
+    polynomial = np.zeros_like(t)
+    for coefficient in _ERF_COEFFICIENTS:
+        polynomial = (polynomial + coefficient) * t
+    return np.copysign(1 - polynomial * np.exp(-x * x), x)
+
+
+def calculate_growth_zscore(indicator: str, is_male, value, x, reference: str = "who") -> dict:
+    """z-score e percentile di crescita: dict di array (NaN per misure assenti o fuori dalle tabelle)"""
+    is_male, value, x = _as_arrays(is_male, value, x)
+    z = _by_segment(indicator, reference, is_male, x, value > 0,
+                    lambda rows, l, m, s, segment: _lms_zscore(value[rows], l, m, s, segment.adjusted))
+    # Espressione di growth.percentile con erf approssimata: i quasi-pareggi sono ricalcolati da _round
+    percentile = 50 * (1 + _erf(z / math.sqrt(2)))
+
+    def scalar(key):
+        return lambda m, v, xx: growth.calculate_growth_zscore(indicator, bool(m), v, xx, reference)[key]
+
+    inputs = (is_male, value, x)
+    return {
+        'zscore': _round(z, 2, scalar('zscore'), inputs) + 0.0,
+        'percentile': _round(percentile, 1, scalar('percentile'), inputs, _ERF_TIE_TOLERANCE)
+    }
+
+
+def growth_median(indicator: str, is_male, x, reference: str = "who") -> np.ndarray:
+    """Mediana (M) del riferimento per ogni bambino, 1 decimale come growth.median (NaN fuori dalle tabelle)"""
+    is_male, x = _as_arrays(is_male, x)
+    m = _by_segment(indicator, reference, is_male, x, ~np.isnan(x), lambda rows, l, m, s, segment: m)
+    return _round(m, 1, lambda male, xx: growth.median(indicator, bool(male), xx, reference), (is_male, x))
+
+
+def growth_value_at(indicator: str, is_male, z, x, reference: str = "who") -> np.ndarray:
+    """Misura corrispondente allo z-score z in x (la curva di centile), senza arrotondamento (NaN fuori dalle tabelle)"""
+    is_male, z, x = _as_arrays(is_male, z, x)
+    return _by_segment(indicator, reference, is_male, x, ~np.isnan(x) & ~np.isnan(z),
+                       lambda rows, l, m, s, segment: _value_at(l, m, s, z[rows]))
+
+
+def classify_growth(indicator: str, age_days, reference: str, scores: dict) -> np.ndarray:
+    """Classificazione (status) di growth.assess per ogni bambino: l'età sceglie il banding, poi np.searchsorted"""
+    age_days, = _as_arrays(age_days)
+    if indicator != "bmi_for_age":
+        # Banding indipendente dall'età
+        banding, key = growth.classification(indicator, 0, reference)
+        return banding.lookup(scores[key], 'status')
+    # Stesse soglie di growth.classification: CDC dai 24.5 mesi, WHO 5-19 anni oltre gli standard 0-5
+    options = ((growth.BMI_CDC_BANDS, "percentile"), (growth.BMI_WHO_OVER_5_BANDS, "zscore"),
+               (growth.WEIGHT_STATUS_UNDER_5_BANDS, "zscore"))
+    choice = np.select([(reference == "cdc") & (age_days >= growth.CDC_FIRST_DAY),
+                        age_days > growth.WHO_STANDARDS_LAST_DAY], [0, 1], 2)
+    statuses = np.empty(age_days.shape, dtype=object)
+    for index, (banding, key) in enumerate(options):
+        rows = choice == index
+        if rows.any():
+            statuses[rows] = banding.lookup(scores[key][rows], 'status')
+    return statuses
+
+
+def column(items: list[dict], key: str, default=None) -> np.ndarray:
+    """Estrae un campo da una lista di argomenti come array float64 (default per i campi assenti)"""
+    if default is None:
+        return np.fromiter((args[key] for args in items), dtype=np.float64, count=len(items))
+    return np.fromiter((args.get(key, default) for args in items), dtype=np.float64, count=len(items))
+
+
+def records(**columns) -> list[dict]:
+    """Ricompone colonne (array o liste) in una lista di dizionari, uno per paziente"""
+    keys = tuple(columns)
+    values = (value.tolist() if isinstance(value, np.ndarray) else value for value in columns.values())
+    return [dict(zip(keys, row)) for row in zip(*values)]
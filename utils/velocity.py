@@ -0,0 +1,202 @@
+"""
+Velocità di crescita e attraversamento dei centili su serie di visite
+Ogni bambino è una serie di visite datate (età in giorni) con peso, lunghezza/
+altezza e circonferenza cranica, anche parziali. Gli z-score delle visite sono
+calcolati sulle tabelle LMS WHO/CDC di utils/growth.py e la serie è riassunta
+per misura in un solo passaggio vettoriale su tutta la coorte: le visite sono
+ordinate per (bambino, età) e i gruppi di ogni bambino ridotti con
+np.*.reduceat (prima/ultima visita, picco e minimo dello z-score, linee di
+centile attraversate), senza cicli Python per bambino.
+
+Criteri (NICE NG75 per il peso, stessi spazi per lunghezza e circonferenza):
+- spazio di centile = 2/3 di z (distanza tra le linee 0.4°-2°-9°-25°-50°-75°-
+  91°-98°-99.6° delle carte a 9 centili)
+- crescita stentata: perdita di 1 spazio dal picco se il picco è sotto il 9°
+  centile, di 3 se sopra il 91°, altrimenti di 2; ultima visita sotto il 2°
+  centile sempre segnalata
+- accelerazione: guadagno di almeno 2 spazi dal minimo della serie
+
+La velocità dell'ultimo intervallo (g/die per il peso, cm/mese per lunghezza
+e circonferenza) è confrontata con quella attesa per restare sulla curva di
+centile della visita precedente (differenza tra i valori della curva alle due
+età). Le tabelle WHO degli incrementi e le correlazioni tra visite necessarie
+per uno z-score condizionale non sono incluse nei dati: il confronto usa le
+sole curve di distanza.
+"""
+import math
+
+import numpy as np
+
+from utils import growth, vectorized
+
+# Spazio tra due linee di centile consecutive (in z) e linee delle carte a 9 centili
+CENTILE_SPACE = 2 / 3
+CENTILE_LINES = np.arange(-4, 5) * CENTILE_SPACE
+# Gli z-score sono a 2 decimali: tolleranza sul confronto con le soglie in spazi
+_Z_TOLERANCE = 0.005
+
+ACCELERATION_SPACES = 2
+BELOW_2ND = "SOTTO IL 2° CENTILE"
+INSUFFICIENT = "DATI INSUFFICIENTI"
+REGULAR = "REGOLARE"
+UNFLAGGED = (REGULAR, INSUFFICIENT)
+
+
+class Measure:
+    """Misura seriale: indicatore per età, unità della velocità e classificazioni"""
+    __slots__ = ("indicator", "factor", "unit", "faltering", "acceleration", "nice_thresholds")
+
+    def __init__(self, indicator: str, factor: float, unit: str, faltering: str, acceleration: str,
+                 nice_thresholds: bool = False):
+        self.indicator = indicator
+        # Velocità = Δmisura · factor / Δgiorni
+        self.factor = factor
+        self.unit = unit
+        self.faltering = faltering
+        self.acceleration = acceleration
+        self.nice_thresholds = nice_thresholds
+
+    def faltering_spaces(self, peak: np.ndarray) -> np.ndarray:
+        """Spazi di centile persi dal picco oltre i quali la crescita è stentata"""
+        if not self.nice_thresholds:
+            return np.full(peak.shape, 2)
+        return np.select([peak < -2 * CENTILE_SPACE, peak > 2 * CENTILE_SPACE], [1, 3], 2)
+
+
+MEASURES = {
+    "weight_kg": Measure("weight_for_age", 1000.0, "g/die", "CRESCITA STENTATA",
+                         "ACCELERAZIONE PONDERALE", nice_thresholds=True),
+    "length_cm": Measure("length_for_age", growth.DAYS_PER_MONTH, "cm/mese", "RALLENTAMENTO STATURALE",
+                         "ACCELERAZIONE STATURALE"),
+    "head_circumference_cm": Measure("head_circumference_for_age", growth.DAYS_PER_MONTH, "cm/mese",
+                                     "RALLENTAMENTO DELLA CRESCITA CRANICA", "CRESCITA CRANICA ACCELERATA"),
+}
+
+# Campi del riassunto di ogni misura (uno per bambino)
+FIELDS = ("visits", "first_zscore", "last_zscore", "last_percentile", "zscore_change", "lines_crossed",
+          "centile_spaces_lost", "velocity", "expected_velocity", "status")
+
+
+def assess_series(child, is_male, age_days, measurements: dict, reference: str = "who") -> dict:
+    """
+    Riassume le serie di visite di una coorte
+
+    Args:
+        child: Identificativo del bambino per ogni visita (le visite di un bambino possono essere in qualsiasi ordine)
+        is_male: Sesso per ogni visita
+        age_days: Età in giorni per ogni visita
+        measurements: Chiave di MEASURES -> misura per ogni visita (NaN se non rilevata)
+        reference: "who" o "cdc" (vedi utils/growth.py)
+
+    Returns:
+        {'children': identificativi ordinati, 'is_male', 'visits': visite per bambino,
+         misura: {campo di FIELDS: array per bambino (NaN senza dati)}}
+    """
+    child = np.asarray(child)
+    if child.size == 0:
+        raise ValueError("Nessuna visita da valutare")
+    age_days = np.asarray(age_days, dtype=np.float64)
+    is_male = np.asarray(is_male, dtype=np.float64)
+    children, codes = np.unique(child, return_inverse=True)
+    order = np.lexsort((age_days, codes))
+    codes, age_days, is_male = codes[order], age_days[order], is_male[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+
+    result = {
+        'children': children,
+        'is_male': is_male[starts] != 0,
+        'visits': np.diff(np.r_[starts, len(codes)])
+    }
+    for key, values in measurements.items():
+        values = np.asarray(values, dtype=np.float64)[order]
+        result[key] = _assess_measure(MEASURES[key], codes, is_male, age_days, values, len(children), reference)
+    return result
+
+
+def _assess_measure(measure: Measure, codes, is_male, age_days, values, count: int, reference: str) -> dict:
+    """Riassunto di una misura per ogni bambino (visite già ordinate per bambino ed età)"""
+    summary = {field: np.full(count, math.nan) for field in FIELDS}
+    summary['visits'] = np.zeros(count, dtype=np.int64)
+    summary['status'] = np.full(count, INSUFFICIENT, dtype=object)
+    scores = vectorized.calculate_growth_zscore(measure.indicator, is_male, values, age_days, reference)
+    # Visite senza la misura o fuori dalle tabelle: escluse dalla serie
+    valid = ~np.isnan(scores['zscore'])
+    if not valid.any():
+        return summary
+    codes, z, percentile = codes[valid], scores['zscore'][valid], scores['percentile'][valid]
+    is_male, age_days, values = is_male[valid], age_days[valid], values[valid]
+
+    groups, starts, visits = np.unique(codes, return_index=True, return_counts=True)
+    ends = starts + visits - 1
+    first, last = z[starts], z[ends]
+    peak = np.maximum.reduceat(z, starts)
+    trough = np.minimum.reduceat(z, starts)
+    band = np.searchsorted(CENTILE_LINES, z, side="right")
+
+    # Ultimo intervallo: velocità osservata e attesa sulla curva di centile della visita precedente
+    previous = np.maximum(ends - 1, starts)
+    days = age_days[ends] - age_days[previous]
+    interval = days > 0
+    line = np.clip(z[previous], -3, 3)
+    line_before = vectorized.growth_value_at(measure.indicator, is_male[previous], line, age_days[previous], reference)
+    line_after = vectorized.growth_value_at(measure.indicator, is_male[ends], line, age_days[ends], reference)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        velocity = np.where(interval, (values[ends] - values[previous]) * measure.factor / days, math.nan)
+        expected = np.where(interval, (line_after - line_before) * measure.factor / days, math.nan)
+
+    lost = peak - last
+    status = np.select(
+        [last < -2,
+         lost >= measure.faltering_spaces(peak) * CENTILE_SPACE - _Z_TOLERANCE,
+         last - trough >= ACCELERATION_SPACES * CENTILE_SPACE - _Z_TOLERANCE,
+         visits < 2],
+        [BELOW_2ND, measure.faltering, measure.acceleration, INSUFFICIENT],
+        REGULAR
+    )
+
+    summary['visits'][groups] = visits
+    summary['first_zscore'][groups] = first
+    summary['last_zscore'][groups] = last
+    summary['last_percentile'][groups] = percentile[ends]
+    summary['zscore_change'][groups] = np.round(last - first, 2) + 0.0
+    summary['lines_crossed'][groups] = band[ends] - band[starts]
+    summary['centile_spaces_lost'][groups] = np.round(lost / CENTILE_SPACE, 1) + 0.0
+    summary['velocity'][groups] = np.round(velocity, 1) + 0.0
+    summary['expected_velocity'][groups] = np.round(expected, 1) + 0.0
+    summary['status'][groups] = status
+    return summary
+
+
+def records(result: dict) -> list[dict]:
+    """
+    Un dizionario per bambino dal risultato di assess_series
+
+    Le misure senza visite valide sono omesse; NaN diventa None e i conteggi interi.
+    flagged è True se almeno una misura ha una classificazione da segnalare.
+    """
+    measures = [key for key in MEASURES if key in result]
+    columns = {key: {field: result[key][field].tolist() for field in FIELDS} for key in measures}
+    rows = []
+    for index, (child, male, visits) in enumerate(zip(result['children'].tolist(), result['is_male'].tolist(),
+                                                      result['visits'].tolist())):
+        summaries = {}
+        for key in measures:
+            column = columns[key]
+            if not column['visits'][index]:
+                continue
+            summary = {field: column[field][index] for field in FIELDS}
+            for field in ("first_zscore", "last_zscore", "last_percentile", "zscore_change",
+                          "centile_spaces_lost", "velocity", "expected_velocity"):
+                if summary[field] != summary[field]:
+                    summary[field] = None
+            summary['lines_crossed'] = int(summary['lines_crossed'])
+            summary['velocity_unit'] = MEASURES[key].unit
+            summaries[key] = summary
+        rows.append({
+            'child': child,
+            'is_male': male,
+            'visits': visits,
+            'flagged': any(summary['status'] not in UNFLAGGED for summary in summaries.values()),
+            'measures': summaries
+        })
+    return rows
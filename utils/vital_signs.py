@@ -0,0 +1,128 @@
+"""
+Valori di riferimento dei parametri vitali per età
+Range normali di frequenza cardiaca, frequenza respiratoria e pressione
+sistolica per fascia d'età (APLS, Advanced Paediatric Life Support), in una
+tabella di banding caricata una volta all'import: la fascia si trova con
+bisect (np.searchsorted per una coorte). La soglia di ipotensione segue PALS
+(<60 mmHg nel primo mese, <70 entro l'anno, <70 + 2 × età in anni fino a 10
+anni, <90 oltre).
+
+Dai parametri grezzi si ricavano i sotto-punteggi del PEWS (Brighton, versione
+italiana) senza calcoli manuali:
+- cardiovascolare: tachicardia ≥20 bpm sopra il range (2), ≥30 o bradicardia
+  sotto il range (3); refill capillare 3 s (1), 4 s (2), ≥5 s (3)
+- respiratorio: frequenza >10 sopra il range (1), >20 sopra (2), ≥5 sotto (3);
+  ossigeno ≥3 l/min o FiO2 ≥30% (1), ≥6 l/min o ≥40% (2), ≥8 l/min o ≥50% (3)
+Le funzioni accettano scalari o array (NaN = parametro non rilevato).
+"""
+import math
+
+import numpy as np
+
+from utils.banding import below, bands
+
+VITALS = ("heart_rate", "respiratory_rate", "systolic_bp")
+UNITS = {"heart_rate": "bpm", "respiratory_rate": "atti/min", "systolic_bp": "mmHg"}
+
+# Fasce d'età in mesi (limite superiore escluso) -> range normali APLS
+VITAL_SIGNS_BY_AGE = bands(
+    (below(12), {'age_group': '<1 anno', 'heart_rate_low': 110, 'heart_rate_high': 160,
+                 'respiratory_rate_low': 30, 'respiratory_rate_high': 40,
+                 'systolic_bp_low': 70, 'systolic_bp_high': 90}),
+    (below(24), {'age_group': '1-2 anni', 'heart_rate_low': 100, 'heart_rate_high': 150,
+                 'respiratory_rate_low': 25, 'respiratory_rate_high': 35,
+                 'systolic_bp_low': 80, 'systolic_bp_high': 95}),
+    (below(60), {'age_group': '2-5 anni', 'heart_rate_low': 95, 'heart_rate_high': 140,
+                 'respiratory_rate_low': 25, 'respiratory_rate_high': 30,
+                 'systolic_bp_low': 80, 'systolic_bp_high': 100}),
+    (below(144), {'age_group': '5-12 anni', 'heart_rate_low': 80, 'heart_rate_high': 120,
+                  'respiratory_rate_low': 20, 'respiratory_rate_high': 25,
+                  'systolic_bp_low': 90, 'systolic_bp_high': 110}),
+    otherwise={'age_group': '>12 anni', 'heart_rate_low': 60, 'heart_rate_high': 100,
+               'respiratory_rate_low': 15, 'respiratory_rate_high': 20,
+               'systolic_bp_low': 100, 'systolic_bp_high': 120}
+)
+
+# Stato di un parametro rispetto al range (indice: 0 ipotensione, 1 basso, 2 normale, 3 alto)
+STATUSES = np.array(["IPOTENSIONE", "BASSA", "NORMALE", "ALTA"], dtype=object)
+
+
+def _as_arrays(*values):
+    return np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in values))
+
+
+def limits(vital: str, age_months) -> tuple[np.ndarray, np.ndarray]:
+    """Limiti inferiore e superiore del range normale di un parametro per ogni età"""
+    band = VITAL_SIGNS_BY_AGE.bands(np.asarray(age_months, dtype=np.float64))
+    return (np.asarray(VITAL_SIGNS_BY_AGE.column(f'{vital}_low')[band], dtype=np.float64),
+            np.asarray(VITAL_SIGNS_BY_AGE.column(f'{vital}_high')[band], dtype=np.float64))
+
+
+def hypotension_threshold(age_months) -> np.ndarray:
+    """Pressione sistolica sotto la quale c'è ipotensione (PALS) per ogni età"""
+    age_months, = _as_arrays(age_months)
+    return np.select([age_months < 1, age_months < 12, age_months < 132],
+                     [60, 70, 70 + 2 * np.floor(age_months / 12)], 90).astype(np.float64)
+
+
+def assess(age_months, values: dict) -> dict:
+    """
+    Confronto dei parametri con il range per età
+
+    Args:
+        age_months: Età in mesi per ogni paziente
+        values: Parametro di VITALS -> valori (NaN se non rilevato); gli scalari diventano array di un elemento
+
+    Returns:
+        Parametro -> {'value', 'low', 'high', 'status'} di array (status None se il parametro manca)
+    """
+    result = {}
+    for vital, value in values.items():
+        age, value = np.atleast_1d(*_as_arrays(age_months, value))
+        low, high = limits(vital, age)
+        index = np.select([value < low, value > high], [1, 3], 2)
+        if vital == "systolic_bp":
+            index = np.where(value < hypotension_threshold(age), 0, index)
+        status = STATUSES[index]
+        status[np.isnan(value)] = None
+        result[vital] = {'value': value, 'low': low, 'high': high, 'status': status}
+    return result
+
+
+def records(assessed: dict) -> list[dict]:
+    """Un dizionario per paziente dal risultato di assess, con i soli parametri rilevati"""
+    columns = {vital: {key: column.tolist() for key, column in fields.items()} for vital, fields in assessed.items()}
+    count = len(next(iter(columns.values()))['value']) if columns else 0
+    rows = []
+    for index in range(count):
+        row = {}
+        for vital, fields in columns.items():
+            if fields['status'][index] is not None:
+                row[vital] = {
+                    'value': fields['value'][index],
+                    'normal_range': [int(fields['low'][index]), int(fields['high'][index])],
+                    'status': fields['status'][index]
+                }
+        rows.append(row)
+    return rows
+
+
+def pews_cardiovascular(age_months, heart_rate=math.nan, capillary_refill_s=math.nan) -> np.ndarray:
+    """Sotto-punteggio cardiovascolare PEWS (0-3) dai parametri grezzi (0 se nessuno è rilevato)"""
+    age_months, heart_rate, capillary_refill_s = _as_arrays(age_months, heart_rate, capillary_refill_s)
+    low, high = limits("heart_rate", age_months)
+    rate = np.select([heart_rate < low, heart_rate >= high + 30, heart_rate >= high + 20], [3, 3, 2], 0)
+    refill = np.select([capillary_refill_s >= 5, capillary_refill_s >= 4, capillary_refill_s >= 3], [3, 2, 1], 0)
+    return np.maximum(rate, refill)
+
+
+def pews_respiratory(age_months, respiratory_rate=math.nan, oxygen_l_min=math.nan, fio2_percent=math.nan) -> np.ndarray:
+    """Sotto-punteggio respiratorio PEWS (0-3) dai parametri grezzi (0 se nessuno è rilevato)"""
+    age_months, respiratory_rate, oxygen_l_min, fio2_percent = _as_arrays(
+        age_months, respiratory_rate, oxygen_l_min, fio2_percent)
+    low, high = limits("respiratory_rate", age_months)
+    rate = np.select([respiratory_rate <= low - 5, respiratory_rate > high + 20, respiratory_rate > high + 10],
+                     [3, 2, 1], 0)
+    oxygen = np.select([oxygen_l_min >= 8, oxygen_l_min >= 6, oxygen_l_min >= 3], [3, 2, 1], 0)
+    fio2 = np.select([fio2_percent >= 50, fio2_percent >= 40, fio2_percent >= 30], [3, 2, 1], 0)
+    return np.maximum(rate, np.maximum(oxygen, fio2))